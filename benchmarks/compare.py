@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Performans Gerileme Kontrolü
+
+Benchmark paketini çalıştırır (veya hazır bir sonuç dosyasını okur), aşama
+medyanlarını depoda tutulan temel ölçümle (benchmarks/baseline.json)
+karşılaştırır ve gerileme varsa sıfırdan farklı kodla çıkar.
+
+Bir aşama ancak şu üç eşiğin hepsini aştığında gerilemiş sayılır:
+- Göreli tolerans:    medyan, temel medyanın (1 + tolerance) katından büyük
+- Mutlak alt sınır:   fark min_delta_ms değerinden büyük (çok kısa aşamalardaki
+                      mikro saniyelik oynamalar yok sayılır)
+- Gürültü sınırı:     fark, temel ölçümün noise_factor x standart sapmasından büyük
+
+Temel ölçüm hangi parametrelerle alındıysa (sembol, mum, tekrar sayısı)
+karşılaştırma da aynı parametrelerle çalıştırılır.
+
+Kullanım:
+    python benchmarks/compare.py                       # çalıştır ve karşılaştır
+    python benchmarks/compare.py --results bench.json  # hazır sonucu karşılaştır
+    python benchmarks/compare.py --update-baseline     # temel ölçümü yenile
+
+Çıkış kodları: 0 gerileme yok, 1 gerileme var, 2 temel ölçüm bulunamadı
+"""
+import os
+import sys
+import json
+import logging
+import argparse
+
+from run_benchmarks import BENCHMARK_DIR, run_suite, format_table
+
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+
+# Varsayılan eşikler
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA_MS = 5.0
+DEFAULT_NOISE_FACTOR = 3.0
+
+# Temel ölçüm yoksa kullanılacak benchmark parametreleri
+DEFAULT_SUITE = {
+    'symbols': 5,
+    'bars': 500,
+    'timeframes': ['4h'],
+    'repeat': 5,
+    'warmup': 1,
+    'chart_limit': 2,
+    'seed': 0,
+}
+
+def load_results(path):
+    """JSON sonuç dosyasını okur"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def suite_params(baseline):
+    """Temel ölçümün alındığı benchmark parametrelerini döndürür"""
+    if baseline is None:
+        return dict(DEFAULT_SUITE)
+
+    meta = baseline['meta']
+    return {
+        'symbols': meta['symbols'],
+        'bars': meta['bars'],
+        'timeframes': meta['timeframes'],
+        'repeat': meta['repeat'],
+        'warmup': meta['warmup'],
+        'chart_limit': meta['chart_limit'],
+        'seed': meta['seed'],
+    }
+
+def compare_results(baseline, current, tolerance=DEFAULT_TOLERANCE,
+                    min_delta_ms=DEFAULT_MIN_DELTA_MS, noise_factor=DEFAULT_NOISE_FACTOR):
+    """
+    İki benchmark sonucunu aşama bazında karşılaştırır
+
+    Args:
+        baseline (dict): Temel ölçüm
+        current (dict): Yeni ölçüm
+        tolerance (float): Göreli tolerans (0.25 = %25)
+        min_delta_ms (float): Gerileme sayılması için en küçük mutlak fark
+        noise_factor (float): Temel ölçümün standart sapma çarpanı
+
+    Returns:
+        list: Aşama başına {stage, baseline_ms, current_ms, delta_ms, ratio, status}
+    """
+    rows = []
+    base_stages = baseline['stages']
+    current_stages = current['stages']
+
+    for stage in list(base_stages) + [s for s in current_stages if s not in base_stages]:
+        base = base_stages.get(stage)
+        now = current_stages.get(stage)
+
+        if base is None or now is None:
+            rows.append({
+                'stage': stage,
+                'baseline_ms': base['median_ms'] if base else None,
+                'current_ms': now['median_ms'] if now else None,
+                'delta_ms': None,
+                'ratio': None,
+                'status': 'new' if base is None else 'missing',
+            })
+            continue
+
+        delta = now['median_ms'] - base['median_ms']
+        ratio = now['median_ms'] / base['median_ms'] if base['median_ms'] > 0 else float('inf')
+        threshold = max(base['median_ms'] * tolerance, min_delta_ms, base.get('stdev_ms', 0.0) * noise_factor)
+
+        if delta > threshold:
+            status = 'regression'
+        elif -delta > threshold:
+            status = 'improved'
+        else:
+            status = 'ok'
+
+        rows.append({
+            'stage': stage,
+            'baseline_ms': base['median_ms'],
+            'current_ms': now['median_ms'],
+            'delta_ms': round(delta, 3),
+            'ratio': round(ratio, 3),
+            'status': status,
+        })
+
+    return rows
+
+def format_comparison(rows):
+    """Karşılaştırma sonucunu tablo olarak biçimlendirir"""
+    def _ms(value):
+        return f"{value:.2f}" if value is not None else "-"
+
+    lines = [f"{'Aşama':<40} {'Temel ms':>11} {'Şimdi ms':>11} {'Fark ms':>10} {'Oran':>7}  Durum"]
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}x" if row['ratio'] is not None else "-"
+        delta = f"{row['delta_ms']:+.2f}" if row['delta_ms'] is not None else "-"
+        marker = "  <<<" if row['status'] == 'regression' else ""
+        lines.append(
+            f"{row['stage']:<40} {_ms(row['baseline_ms']):>11} {_ms(row['current_ms']):>11} "
+            f"{delta:>10} {ratio:>7}  {row['status']}{marker}"
+        )
+    return "\n".join(lines)
+
+def write_results(path, results):
+    """Sonuçları JSON olarak yazar"""
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sonuçlarını temel ölçümle karşılaştırır")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Temel ölçüm dosyası")
+    parser.add_argument('--results', default=None, help="Çalıştırmak yerine karşılaştırılacak sonuç dosyası")
+    parser.add_argument('--output', default=None, help="Yeni ölçümün yazılacağı dosya")
+    parser.add_argument('--update-baseline', action='store_true', help="Yeni ölçümü temel ölçüm olarak kaydet")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help="Göreli tolerans (0.25 = %%25)")
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS, help="En küçük mutlak fark (ms)")
+    parser.add_argument('--noise-factor', type=float, default=DEFAULT_NOISE_FACTOR, help="Standart sapma çarpanı")
+    parser.add_argument('--repeat', type=int, default=None, help="Temel ölçümdeki tekrar sayısını geçersiz kıl")
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline) if os.path.exists(args.baseline) else None
+
+    if args.results:
+        current = load_results(args.results)
+    else:
+        logging.disable(logging.WARNING)
+        params = suite_params(baseline)
+        if args.repeat is not None:
+            params['repeat'] = args.repeat
+        current = run_suite(**params)
+
+    if args.output:
+        write_results(args.output, current)
+
+    if args.update_baseline:
+        write_results(args.baseline, current)
+        print(format_table(current))
+        print(f"\nTemel ölçüm güncellendi: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"Temel ölçüm bulunamadı: {args.baseline} (--update-baseline ile oluşturun)")
+        return 2
+
+    rows = compare_results(baseline, current, args.tolerance, args.min_delta_ms, args.noise_factor)
+    print(format_comparison(rows))
+
+    base_meta, current_meta = baseline['meta'], current['meta']
+    if base_meta.get('platform') != current_meta.get('platform') or base_meta.get('python') != current_meta.get('python'):
+        print(f"\nUyarı: temel ölçüm farklı bir ortamda alındı "
+              f"({base_meta.get('platform')}, Python {base_meta.get('python')})")
+
+    regressions = [row['stage'] for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"\nGERİLEME: {', '.join(regressions)}")
+        return 1
+
+    print("\nGerileme yok")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Tarama Benchmark Paketi
+
+Tarama hattının her aşamasını sentetik (veya kaydedilmiş) veriler üzerinde ayrı
+ayrı ölçer ve sonuçları makine tarafından okunabilir JSON olarak yazar:
+
+- klines_parse:         Veri kaynağından mum satırlarının DataFrame'e dönüştürülmesi
+- add_all_indicators:   TechnicalIndicators.add_all_indicators
+- quality_scores:       Tüm mumlar için boğa/ayı kalite puanları (signals.quality_scorer)
+- support_resistance:   SupportResistance.find_levels
+- signal.<Modül>:       Her BaseSignal alt sınıfının check_signals çağrısı
+- analyze:              SignalAnalyzer.analyze (indikatörler + tüm modüller)
+- generate_chart:       ChartGenerator.generate_chart (önbellek kapalı)
+- full_scan:            Hacim kontrolü, veri çekme, analiz, sinyal seçimi ve
+                        grafik oluşturma (Telegram gönderimi hariç)
+
+Veriler ReplayDataSource üzerinden okunur, ağ ve rate limit beklemesi yoktur.
+
+Kullanım:
+    python benchmarks/run_benchmarks.py --symbols 15 --bars 500 --repeat 5 --output bench.json
+    python benchmarks/run_benchmarks.py --fixtures data/fixtures --repeat 3
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+import numpy as np
+import pandas as pd
+from synthetic_data import symbol_names, write_fixtures
+
+# Sonuç dosyası biçim sürümü
+RESULTS_VERSION = 1
+
+class StageTimer:
+    """Aşama sürelerini tekrar bazında toplayan zamanlayıcı"""
+
+    def __init__(self):
+        # aşama -> tekrar başına toplam süre listesi (saniye)
+        self.samples = {}
+        # aşama -> tekrar başına çağrı sayısı
+        self.calls = {}
+        self._current = None
+
+    def start_repeat(self):
+        """Yeni bir ölçüm turu başlatır"""
+        self._current = {}
+
+    def end_repeat(self):
+        """Turun toplamlarını örneklere ekler"""
+        for stage, (total, count) in self._current.items():
+            self.samples.setdefault(stage, []).append(total)
+            self.calls[stage] = count
+        self._current = None
+
+    def measure(self, stage, func, *args, **kwargs):
+        """
+        Fonksiyonu çalıştırır ve süresini aşamaya ekler
+
+        Args:
+            stage (str): Aşama adı
+            func (callable): Ölçülecek fonksiyon
+
+        Returns:
+            Fonksiyonun dönüş değeri
+        """
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+
+        if self._current is not None:
+            total, count = self._current.get(stage, (0.0, 0))
+            self._current[stage] = (total + elapsed, count + 1)
+
+        return result
+
+    def summary(self):
+        """
+        Aşama istatistiklerini döndürür
+
+        Returns:
+            dict: aşama -> {samples_ms, median_ms, min_ms, max_ms, stdev_ms, calls, per_call_ms}
+        """
+        stages = {}
+        for stage, samples in self.samples.items():
+            samples_ms = [s * 1000.0 for s in samples]
+            median_ms = statistics.median(samples_ms)
+            calls = self.calls.get(stage, 1)
+            stages[stage] = {
+                'samples_ms': [round(s, 3) for s in samples_ms],
+                'median_ms': round(median_ms, 3),
+                'min_ms': round(min(samples_ms), 3),
+                'max_ms': round(max(samples_ms), 3),
+                'stdev_ms': round(statistics.stdev(samples_ms), 3) if len(samples_ms) > 1 else 0.0,
+                'calls': calls,
+                'per_call_ms': round(median_ms / calls, 3) if calls else 0.0,
+            }
+        return stages
+
+def build_config(fixtures_dir, symbols, timeframes):
+    """Benchmark için replay kaynağı kullanan konfigürasyon oluşturur"""
+    from config import Config
+
+    config = Config()
+    config.DATA_SOURCE = "replay"
+    config.DATA_FIXTURES_DIR = fixtures_dir
+    config.SYMBOLS = symbols
+    config.TIMEFRAMES = timeframes
+    # Grafik aşaması her turda gerçekten çizim yapsın
+    config.CHART_CACHE = dict(config.CHART_CACHE, enabled=False)
+    return config
+
+def discover_symbols(fixtures_dir, timeframe):
+    """Fixture dizinindeki sembolleri bulur"""
+    suffix = f"_{timeframe}.json"
+    names = os.listdir(os.path.join(fixtures_dir, 'klines'))
+    return sorted(name[:-len(suffix)] for name in names if name.endswith(suffix))
+
+def chart_signal(symbol, timeframe, df, signals):
+    """Grafik aşaması için sinyal seçer; sinyal yoksa temsili bir sinyal üretir"""
+    if signals:
+        return signals[0]
+
+    close = float(df['close'].iloc[-1])
+    return {
+        'symbol': symbol,
+        'timeframe': timeframe,
+        'signal_type': 'RSI Bullish Divergence',
+        'entry': close,
+        'stop_loss': close * 0.97,
+        'take_profit': close * 1.06,
+        'timestamp': df.index[-1],
+        'quality_score': 60,
+        'description': 'Benchmark grafiği',
+    }
+
+def remove_chart(path):
+    """Oluşturulan geçici grafik dosyasını siler"""
+    if path and os.path.exists(path):
+        os.remove(path)
+
+def run_repeat(timer, components, symbols, timeframes, bars, chart_limit):
+    """Tek bir ölçüm turunu çalıştırır"""
+    from signals.quality_scorer import add_quality_scores
+
+    fetcher, indicators, support_resistance, analyzer, chart_generator, config = components
+
+    timer.start_repeat()
+
+    for timeframe in timeframes:
+        # Aşama bazlı ölçümler
+        chart_count = 0
+        for symbol in symbols:
+            df = timer.measure('klines_parse', fetcher.get_klines, symbol, timeframe, bars)
+            df_ind = timer.measure('add_all_indicators', indicators.add_all_indicators, df.copy())
+            df_ind = timer.measure('quality_scores', add_quality_scores, df_ind)
+            timer.measure('support_resistance', support_resistance.find_levels, df_ind)
+
+            for module in analyzer.signal_modules:
+                timer.measure(f"signal.{module.__class__.__name__}", module.check_signals, symbol, timeframe, df_ind)
+
+            signals = timer.measure('analyze', analyzer.analyze, symbol, timeframe, df)
+
+            if chart_count < chart_limit:
+                signal = chart_signal(symbol, timeframe, df, signals)
+                remove_chart(timer.measure('generate_chart', chart_generator.generate_chart, signal))
+                chart_count += 1
+
+    # Uçtan uca tarama
+    timer.measure('full_scan', full_scan, components, symbols, timeframes, bars, chart_limit)
+
+    timer.end_repeat()
+
+def full_scan(components, symbols, timeframes, bars, chart_limit):
+    """KriptoMotoru.run_scan akışını Telegram gönderimi olmadan çalıştırır"""
+    fetcher, _, _, analyzer, chart_generator, config = components
+
+    all_signals = []
+    for timeframe in timeframes:
+        for symbol in symbols:
+            if fetcher.get_24h_volume(symbol) < config.MIN_VOLUME_THRESHOLD:
+                continue
+            df = fetcher.get_klines(symbol, timeframe, bars)
+            if df is None or df.empty:
+                continue
+            all_signals.extend(analyzer.analyze(symbol, timeframe, df))
+
+    all_signals.sort(key=lambda x: x['quality_score'], reverse=True)
+
+    best_signals_by_symbol = {}
+    for signal in all_signals:
+        best_signals_by_symbol.setdefault(signal['symbol'], signal)
+
+    to_send = [s for s in best_signals_by_symbol.values() if s['quality_score'] >= config.MIN_SIGNAL_QUALITY]
+    for signal in to_send[:chart_limit]:
+        remove_chart(chart_generator.generate_chart(signal))
+
+    return len(all_signals)
+
+def git_commit():
+    """Çalışma dizininin git commit kimliğini döndürür"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(symbols=15, bars=500, timeframes=('4h',), repeat=5, warmup=1, chart_limit=3,
+              fixtures_dir=None, seed=0):
+    """
+    Benchmark paketini çalıştırır
+
+    Args:
+        symbols (int): Sentetik sembol sayısı (fixtures_dir verilirse yok sayılır)
+        bars (int): Sembol başına mum sayısı
+        timeframes (tuple): Zaman dilimleri
+        repeat (int): Ölçülen tur sayısı
+        warmup (int): Ölçülmeyen ısınma turu sayısı
+        chart_limit (int): Tur başına oluşturulacak en fazla grafik
+        fixtures_dir (str, optional): Kaydedilmiş fixture dizini. Verilmezse sentetik veri üretilir.
+        seed (int): Sentetik veri tohumu
+
+    Returns:
+        dict: {'meta': {...}, 'stages': {...}}
+    """
+    import matplotlib
+
+    from data_sources import ReplayDataSource
+    from data_fetcher import BinanceDataFetcher
+    from technical_indicators import TechnicalIndicators
+    from support_resistance import SupportResistance
+    from signal_analyzer import SignalAnalyzer
+    from chart_generator import ChartGenerator
+
+    timeframes = list(timeframes)
+    temp_dir = None
+    if fixtures_dir is None:
+        temp_dir = tempfile.mkdtemp(prefix="kripto-bench-")
+        fixtures_dir = temp_dir
+        symbol_list = symbol_names(symbols)
+        write_fixtures(fixtures_dir, symbol_list, timeframes, bars, seed=seed)
+    else:
+        symbol_list = discover_symbols(fixtures_dir, timeframes[0])
+
+    try:
+        config = build_config(fixtures_dir, symbol_list, timeframes)
+        components = (
+            BinanceDataFetcher(config, source=ReplayDataSource(fixtures_dir)),
+            TechnicalIndicators(config),
+            SupportResistance(config),
+            SignalAnalyzer(config),
+            ChartGenerator(config),
+            config,
+        )
+
+        warmup_timer = StageTimer()
+        for _ in range(warmup):
+            run_repeat(warmup_timer, components, symbol_list, timeframes, bars, chart_limit)
+
+        timer = StageTimer()
+        for _ in range(repeat):
+            run_repeat(timer, components, symbol_list, timeframes, bars, chart_limit)
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'matplotlib': matplotlib.__version__,
+            'symbols': len(symbol_list),
+            'bars': bars,
+            'timeframes': timeframes,
+            'repeat': repeat,
+            'warmup': warmup,
+            'chart_limit': chart_limit,
+            'synthetic': temp_dir is not None,
+            'seed': seed,
+        },
+        'stages': timer.summary(),
+    }
+
+def format_table(results):
+    """Sonuçları okunabilir tablo olarak biçimlendirir"""
+    lines = [f"{'Aşama':<40} {'Çağrı':>6} {'Medyan ms':>11} {'Min ms':>10} {'Çağrı başı ms':>14}"]
+    for stage, stats in results['stages'].items():
+        lines.append(
+            f"{stage:<40} {stats['calls']:>6} {stats['median_ms']:>11.2f} "
+            f"{stats['min_ms']:>10.2f} {stats['per_call_ms']:>14.3f}"
+        )
+    return "\n".join(lines)
+
+def build_parser():
+    """Komut satırı argümanlarını tanımlar"""
+    parser = argparse.ArgumentParser(description="Tarama hattı benchmark paketi")
+    parser.add_argument('--symbols', type=int, default=15, help="Sentetik sembol sayısı")
+    parser.add_argument('--bars', type=int, default=500, help="Sembol başına mum sayısı")
+    parser.add_argument('--timeframes', default='4h', help="Virgülle ayrılmış zaman dilimleri")
+    parser.add_argument('--repeat', type=int, default=5, help="Ölçülen tur sayısı")
+    parser.add_argument('--warmup', type=int, default=1, help="Ölçülmeyen ısınma turu sayısı")
+    parser.add_argument('--chart-limit', type=int, default=3, help="Tur başına en fazla grafik")
+    parser.add_argument('--fixtures', default=None, help="Sentetik veri yerine kullanılacak fixture dizini")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--verbose', action='store_true', help="Bot loglarını gizleme (hatalar her zaman gösterilir)")
+    return parser
+
+def suite_kwargs(args):
+    """Argümanlardan run_suite parametrelerini oluşturur"""
+    return {
+        'symbols': args.symbols,
+        'bars': args.bars,
+        'timeframes': [t for t in args.timeframes.split(',') if t],
+        'repeat': args.repeat,
+        'warmup': args.warmup,
+        'chart_limit': args.chart_limit,
+        'fixtures_dir': args.fixtures,
+        'seed': args.seed,
+    }
+
+def main():
+    args = build_parser().parse_args()
+
+    if not args.verbose:
+        # Aşama başına yazılan INFO/WARNING logları ölçümleri boğmasın
+        logging.disable(logging.WARNING)
+
+    results = run_suite(**suite_kwargs(args))
+
+    print(format_table(results))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSonuçlar yazıldı: {args.output}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
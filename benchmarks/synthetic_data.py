@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sentetik OHLCV Veri Üreticisi
+
+Benchmark ve çevrimdışı testler için gerçekçi mum verisi üretir. Fiyat, rejim
+değiştiren (yükseliş, düşüş, yatay, yüksek volatilite) bir geometrik rastgele
+yürüyüşle oluşturulur; hacim volatiliteyle birlikte artar. Çıktı Binance REST
+biçimindedir ve ReplayDataSource fixture dizinine yazılabilir.
+
+Kullanım:
+    python benchmarks/synthetic_data.py --output data/fixtures --symbols 15 --bars 1000
+"""
+import os
+import sys
+import json
+import argparse
+import numpy as np
+
+# Zaman dilimlerinin milisaniye karşılıkları
+TIMEFRAME_MS = {
+    '1m': 60 * 1000,
+    '5m': 5 * 60 * 1000,
+    '15m': 15 * 60 * 1000,
+    '30m': 30 * 60 * 1000,
+    '1h': 60 * 60 * 1000,
+    '2h': 2 * 60 * 60 * 1000,
+    '4h': 4 * 60 * 60 * 1000,
+    '1d': 24 * 60 * 60 * 1000,
+}
+
+# Rejimler: (mum başına ortalama getiri, mum başına volatilite, hacim çarpanı)
+REGIMES = {
+    'bull': (0.0020, 0.012, 1.2),
+    'bear': (-0.0020, 0.014, 1.3),
+    'range': (0.0, 0.007, 0.8),
+    'volatile': (0.0, 0.030, 2.0),
+}
+
+# Rejim geçiş olasılıkları (her mumda mevcut rejimde kalma olasılığı)
+REGIME_PERSISTENCE = 0.97
+
+# Benchmark için varsayılan sembol listesi
+DEFAULT_SYMBOLS = [
+    "BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT",
+    "XRPUSDT", "DOTUSDT", "DOGEUSDT", "AVAXUSDT", "MATICUSDT",
+    "LINKUSDT", "LTCUSDT", "UNIUSDT", "ATOMUSDT", "ETCUSDT"
+]
+
+def symbol_names(count):
+    """
+    Benchmark için sembol adları üretir
+
+    Args:
+        count (int): Sembol sayısı
+
+    Returns:
+        list: Sembol adları
+    """
+    names = DEFAULT_SYMBOLS[:count]
+    names += [f"SYN{i:03d}USDT" for i in range(len(names), count)]
+    return names
+
+def generate_klines(bars, timeframe='4h', seed=0, start_price=100.0, end_time_ms=1700000000000):
+    """
+    Rejim değiştiren rastgele yürüyüşle Binance biçiminde mum satırları üretir
+
+    Args:
+        bars (int): Mum sayısı
+        timeframe (str): Zaman dilimi (mum aralığı için)
+        seed (int): Rastgele sayı üreteci tohumu
+        start_price (float): Başlangıç fiyatı
+        end_time_ms (int): Son mumun açılış zamanı (ms)
+
+    Returns:
+        list: Binance /api/v3/klines biçiminde mum satırları
+    """
+    rng = np.random.default_rng(seed)
+    interval_ms = TIMEFRAME_MS[timeframe]
+    regime_names = list(REGIMES)
+
+    # Markov zinciriyle rejim dizisi
+    regimes = np.empty(bars, dtype=int)
+    current = rng.integers(len(regime_names))
+    switches = rng.random(bars) > REGIME_PERSISTENCE
+    choices = rng.integers(len(regime_names), size=bars)
+    for i in range(bars):
+        if switches[i]:
+            current = choices[i]
+        regimes[i] = current
+
+    params = np.array([REGIMES[name] for name in regime_names])
+    drift = params[regimes, 0]
+    sigma = params[regimes, 1]
+    volume_factor = params[regimes, 2]
+
+    # Kapanış fiyatları: log getirilerin kümülatif toplamı (kalın kuyruklu şoklar)
+    shocks = rng.standard_t(df=4, size=bars) / np.sqrt(2.0)
+    log_returns = drift + sigma * shocks
+    close = start_price * np.exp(np.cumsum(log_returns))
+    open_ = np.concatenate(([start_price], close[:-1]))
+
+    # Fitiller: gövdenin üstüne ve altına volatiliteyle orantılı uzantı
+    body_high = np.maximum(open_, close)
+    body_low = np.minimum(open_, close)
+    high = body_high * (1 + np.abs(rng.normal(0, sigma * 0.6)))
+    low = body_low * (1 - np.abs(rng.normal(0, sigma * 0.6)))
+
+    # Hacim: log-normal taban, rejim ve fiyat hareketiyle ölçeklenir
+    base_volume = rng.lognormal(mean=8.0, sigma=0.4, size=bars)
+    volume = base_volume * volume_factor * (1 + 20 * np.abs(log_returns))
+    trades = (volume / 5).astype(int) + 1
+
+    open_times = end_time_ms - (bars - 1 - np.arange(bars)) * interval_ms
+
+    klines = []
+    for i in range(bars):
+        quote_volume = volume[i] * close[i]
+        klines.append([
+            int(open_times[i]),
+            f"{open_[i]:.8f}",
+            f"{high[i]:.8f}",
+            f"{low[i]:.8f}",
+            f"{close[i]:.8f}",
+            f"{volume[i]:.8f}",
+            int(open_times[i] + interval_ms - 1),
+            f"{quote_volume:.8f}",
+            int(trades[i]),
+            f"{volume[i] * 0.5:.8f}",
+            f"{quote_volume * 0.5:.8f}",
+            "0"
+        ])
+
+    return klines
+
+def make_ticker(symbol, klines):
+    """
+    Son 24 saatin mumlarından Binance biçiminde ticker üretir
+
+    Args:
+        symbol (str): Kripto para sembolü
+        klines (list): Mum satırları
+
+    Returns:
+        dict: 24 saatlik ticker
+    """
+    end_time = klines[-1][6]
+    recent = [k for k in klines if k[0] > end_time - TIMEFRAME_MS['1d']] or klines[-1:]
+    volume = sum(float(k[5]) for k in recent)
+    quote_volume = sum(float(k[7]) for k in recent)
+    # Hacim eşiği filtresine takılmaması için en az 10 milyon USDT
+    quote_volume = max(quote_volume, 1e7)
+
+    return {
+        'symbol': symbol,
+        'openPrice': recent[0][1],
+        'highPrice': f"{max(float(k[2]) for k in recent):.8f}",
+        'lowPrice': f"{min(float(k[3]) for k in recent):.8f}",
+        'lastPrice': recent[-1][4],
+        'volume': f"{volume:.8f}",
+        'quoteVolume': f"{quote_volume:.8f}",
+        'openTime': recent[0][0],
+        'closeTime': end_time,
+        'count': sum(k[8] for k in recent),
+    }
+
+def write_fixtures(fixtures_dir, symbols, timeframes, bars, seed=0):
+    """
+    Sentetik verileri ReplayDataSource fixture dizinine yazar
+
+    Args:
+        fixtures_dir (str): Hedef dizin
+        symbols (list): Semboller
+        timeframes (list): Zaman dilimleri
+        bars (int): Sembol ve zaman dilimi başına mum sayısı
+        seed (int): Temel tohum; her sembol için farklı ama tekrarlanabilir seri üretilir
+    """
+    os.makedirs(os.path.join(fixtures_dir, 'klines'), exist_ok=True)
+    os.makedirs(os.path.join(fixtures_dir, 'tickers'), exist_ok=True)
+
+    for s_index, symbol in enumerate(symbols):
+        start_price = 10 ** (1 + (s_index % 4))
+        for t_index, timeframe in enumerate(timeframes):
+            klines = generate_klines(bars, timeframe, seed=seed * 1000 + s_index * 10 + t_index,
+                                     start_price=start_price)
+            with open(os.path.join(fixtures_dir, 'klines', f"{symbol}_{timeframe}.json"), 'w') as f:
+                json.dump(klines, f)
+
+        with open(os.path.join(fixtures_dir, 'tickers', f"{symbol}.json"), 'w') as f:
+            json.dump(make_ticker(symbol, klines), f)
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik OHLCV fixture üreticisi")
+    parser.add_argument('--output', required=True, help="Fixture dizini")
+    parser.add_argument('--symbols', type=int, default=15, help="Sembol sayısı")
+    parser.add_argument('--timeframes', default='4h', help="Virgülle ayrılmış zaman dilimleri")
+    parser.add_argument('--bars', type=int, default=1000, help="Mum sayısı")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    symbols = symbol_names(args.symbols)
+    timeframes = [t for t in args.timeframes.split(',') if t]
+    write_fixtures(args.output, symbols, timeframes, args.bars, seed=args.seed)
+    print(f"{len(symbols)} sembol x {len(timeframes)} zaman dilimi x {args.bars} mum yazıldı: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
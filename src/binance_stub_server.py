@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Yerel Binance REST Sahte Sunucusu
+
+Kaydedilmiş fixture dosyalarını Binance REST API biçiminde sunan yerel HTTP
+sunucusu. DATA_SOURCE=http ile bot, tarama hattı ağa çıkmadan ve her
+çalıştırmada aynı verilerle profillenebilir.
+
+Kullanım:
+    # Canlı API'den fixture kaydet
+    python src/binance_stub_server.py --record --symbols BTCUSDT,ETHUSDT --timeframes 4h --limit 1000
+
+    # Fixture'ları sun
+    python src/binance_stub_server.py --port 8082 --latency-ms 30
+    DATA_SOURCE=http DATA_SOURCE_URL=http://127.0.0.1:8082 python src/main.py
+"""
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from data_sources import ReplayDataSource, DataSourceError, record_fixtures
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("binance_stub_server")
+
+# Binance uç noktalarının istek ağırlıkları
+ENDPOINT_WEIGHTS = {
+    '/api/v3/ping': 1,
+    '/api/v3/time': 1,
+    '/api/v3/klines': 2,
+    '/api/v3/ticker/24hr': 2,
+    '/api/v3/exchangeInfo': 20,
+}
+
+# Sembol parametresi verilmeden tüm semboller istendiğinde uygulanan ağırlıklar
+BULK_ENDPOINT_WEIGHTS = {
+    '/api/v3/ticker/24hr': 80,
+}
+
+class BinanceStubServer:
+    """Fixture dosyalarını Binance REST API gibi sunan yerel sunucu"""
+
+    def __init__(self, fixtures_dir, host="127.0.0.1", port=0, latency_ms=0):
+        """
+        Args:
+            fixtures_dir (str): ReplayDataSource dizin yapısındaki fixture dizini
+            host (str): Dinlenecek adres
+            port (int): Dinlenecek port (0 ise boş bir port seçilir)
+            latency_ms (float): Her yanıta eklenecek gecikme
+        """
+        self.source = ReplayDataSource(fixtures_dir)
+        self.latency_ms = latency_ms
+        self._lock = threading.Lock()
+        self._used_weight = 0
+        self._weight_window = int(time.time() // 60)
+        self.stats = {'requests': {}, 'errors': 0}
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        """Sunucunun temel adresi (DATA_SOURCE_URL olarak kullanılır)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Sunucuyu arka plan iş parçacığında başlatır"""
+        threading.Thread(target=self.httpd.serve_forever, name="binance-stub", daemon=True).start()
+        logger.info("Binance sahte sunucusu başlatıldı: %s", self.url)
+        return self
+
+    def stop(self):
+        """Sunucuyu durdurur"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def serve_forever(self):
+        """Sunucuyu ön planda çalıştırır"""
+        logger.info("Binance sahte sunucusu dinleniyor: %s", self.url)
+        self.httpd.serve_forever()
+
+    def _make_handler(self):
+        """Sunucu örneğine bağlı istek işleyiciyi oluşturur"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _add_weight(self, path, bulk=False):
+        """Dakikalık kullanılan ağırlığı günceller"""
+        with self._lock:
+            window = int(time.time() // 60)
+            if window != self._weight_window:
+                self._weight_window = window
+                self._used_weight = 0
+            if bulk and path in BULK_ENDPOINT_WEIGHTS:
+                self._used_weight += BULK_ENDPOINT_WEIGHTS[path]
+            else:
+                self._used_weight += ENDPOINT_WEIGHTS.get(path, 1)
+            self.stats['requests'][path] = self.stats['requests'].get(path, 0) + 1
+            return self._used_weight
+
+    def _handle(self, handler):
+        """Gelen isteği ilgili uç noktaya yönlendirir"""
+        parsed = urlparse(handler.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        path = parsed.path.rstrip('/')
+        used_weight = self._add_weight(path, bulk='symbol' not in params)
+
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000.0)
+
+        try:
+            if path == '/api/v3/ping':
+                payload = {}
+            elif path == '/api/v3/time':
+                payload = {'serverTime': int(time.time() * 1000)}
+            elif path == '/api/v3/klines':
+                payload = self._klines(params)
+            elif path == '/api/v3/ticker/24hr':
+                if 'symbol' in params:
+                    payload = self.source.get_ticker(params['symbol'])
+                else:
+                    payload = self.source.get_tickers()
+            elif path == '/api/v3/exchangeInfo':
+                payload = self.source.get_exchange_info()
+            else:
+                self._respond(handler, 404, {'code': -1, 'msg': 'Not Found'}, used_weight)
+                return
+        except KeyError as e:
+            self._error(handler, 400, -1102, f"Mandatory parameter {e} was not sent.", used_weight)
+            return
+        except DataSourceError:
+            self._error(handler, 400, -1121, "Invalid symbol.", used_weight)
+            return
+
+        self._respond(handler, 200, payload, used_weight)
+
+    def _klines(self, params):
+        """Mum verilerini Binance parametrelerine göre döndürür"""
+        limit = min(int(params.get('limit', 500)), 1000)
+        klines = self.source.get_klines(params['symbol'], params['interval'], limit=0)
+
+        if 'startTime' in params:
+            start_time = int(params['startTime'])
+            klines = [k for k in klines if k[0] >= start_time]
+            return klines[:limit]
+        if 'endTime' in params:
+            end_time = int(params['endTime'])
+            klines = [k for k in klines if k[0] <= end_time]
+
+        return klines[-limit:]
+
+    def _error(self, handler, status, code, message, used_weight):
+        with self._lock:
+            self.stats['errors'] += 1
+        self._respond(handler, status, {'code': code, 'msg': message}, used_weight)
+
+    def _respond(self, handler, status, payload, used_weight):
+        """JSON yanıtı Binance ağırlık başlıklarıyla gönderir"""
+        data = json.dumps(payload).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(data)))
+        handler.send_header('X-MBX-USED-WEIGHT-1M', str(used_weight))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+def main():
+    from config import Config
+
+    config = Config()
+    parser = argparse.ArgumentParser(description="Yerel Binance REST sahte sunucusu")
+    parser.add_argument('--fixtures', default=config.DATA_FIXTURES_DIR, help="Fixture dizini")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8082)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--record', action='store_true', help="Canlı API'den fixture kaydet ve çık")
+    parser.add_argument('--symbols', default=','.join(config.SYMBOLS))
+    parser.add_argument('--timeframes', default=','.join(config.TIMEFRAMES))
+    parser.add_argument('--limit', type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.record:
+        from data_sources import BinanceDataSource
+        record_fixtures(
+            BinanceDataSource(config),
+            args.fixtures,
+            [s for s in args.symbols.split(',') if s],
+            [t for t in args.timeframes.split(',') if t],
+            limit=args.limit
+        )
+        return 0
+
+    server = BinanceStubServer(args.fixtures, host=args.host, port=args.port, latency_ms=args.latency_ms)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
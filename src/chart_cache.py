@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Grafik Önbelleği Modülü
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+import pandas as pd
+from timeframe_resampler import TIMEFRAME_MS
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("chart_cache")
+
+def closed_candle_time(candle_timestamp, timeframe, now=None):
+    """
+    Sinyal mumuna göre son kapanmış mumun açılış zamanı
+
+    Canlı veride sinyal zaman damgası (df.index[-1]) henüz kapanmamış mumdur;
+    bu mum kapanana kadar grafiği değişir. Önbellek anahtarı bu yüzden son
+    kapanmış muma dayanır.
+
+    Args:
+        candle_timestamp (pandas.Timestamp): Sinyal mumunun açılış zamanı (UTC)
+        timeframe (str): Zaman dilimi
+        now (pandas.Timestamp, optional): Şu anki zaman (UTC)
+
+    Returns:
+        pandas.Timestamp: Mum kapanmışsa kendisi, açıksa bir önceki mumun açılış zamanı
+    """
+    period = TIMEFRAME_MS.get(timeframe)
+    if candle_timestamp is None or period is None:
+        return candle_timestamp
+    candle_timestamp = pd.Timestamp(candle_timestamp)
+    now = now if now is not None else pd.Timestamp.now(tz='UTC').tz_localize(None)
+    period = pd.Timedelta(milliseconds=period)
+    if candle_timestamp + period > now:
+        return candle_timestamp - period
+    return candle_timestamp
+
+class ChartCache:
+    """Oluşturulan grafik görüntülerini bellekte ve diskte saklayan LRU önbellek"""
+
+    def __init__(self, config, cache_dir=None):
+        """
+        Önbellek sınırlarını ayarlar
+
+        Args:
+            config (Config): Bot konfigürasyonu
+            cache_dir (str, optional): Disk önbelleği dizini. Belirtilmezse data/chart_cache kullanılır.
+        """
+        self.config = config
+        self.settings = config.CHART_CACHE
+        self.enabled = self.settings.get('enabled', True)
+        self.memory_max_entries = self.settings.get('memory_max_entries', 32)
+        self.memory_max_bytes = self.settings.get('memory_max_bytes', 64 * 1024 * 1024)
+        self.disk_max_bytes = self.settings.get('disk_max_bytes', 256 * 1024 * 1024)
+        self.max_age = self.settings.get('max_age', 4 * 3600)
+
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'chart_cache')
+        self.cache_dir = cache_dir
+
+        # key -> (png_bytes, oluşturulma zamanı)
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            logger.info("Grafik önbelleği başlatıldı: %s", self.cache_dir)
+
+    def make_key(self, symbol, timeframe, candle_timestamp, signal_type):
+        """
+        Grafik isteği için içerik adresli önbellek anahtarı üretir
+
+        Args:
+            symbol (str): Kripto para sembolü
+            timeframe (str): Zaman dilimi
+            candle_timestamp: Grafiğin dayandığı son kapanmış mumun açılış zamanı (closed_candle_time)
+            signal_type (str): Sinyal türü
+
+        Returns:
+            str: SHA-256 anahtar (zaman damgası yoksa None)
+        """
+        if candle_timestamp is None:
+            return None
+
+        payload = json.dumps({
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'candle': str(candle_timestamp),
+            'signal_type': signal_type,
+            'chart_settings': self.config.CHART_SETTINGS,
+            'ta_params': self.config.TA_PARAMS,
+        }, sort_keys=True, default=str)
+
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Önbellekteki grafiği döndürür
+
+        Args:
+            key (str): Önbellek anahtarı
+
+        Returns:
+            bytes: PNG içeriği (bulunamazsa None)
+        """
+        if not self.enabled or key is None:
+            return None
+
+        now = time.time()
+
+        with self._lock:
+            # Önce bellek önbelleğine bak
+            entry = self._memory.get(key)
+            if entry is not None:
+                data, created_at = entry
+                if now - created_at <= self.max_age:
+                    self._memory.move_to_end(key)
+                    logger.info("Grafik bellek önbelleğinden alındı: %s", key[:12])
+                    return data
+                self._drop_memory(key)
+
+            # Sonra disk önbelleğine bak
+            path = self._disk_path(key)
+            try:
+                created_at = os.path.getmtime(path)
+            except OSError:
+                return None
+
+            if now - created_at > self.max_age:
+                self._remove_file(path)
+                return None
+
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError as e:
+                logger.warning("Önbellek dosyası okunamadı: %s", str(e))
+                return None
+
+            self._store_memory(key, data, created_at)
+            logger.info("Grafik disk önbelleğinden alındı: %s", key[:12])
+            return data
+
+    def put(self, key, data):
+        """
+        Grafiği bellek ve disk önbelleğine yazar
+
+        Args:
+            key (str): Önbellek anahtarı
+            data (bytes): PNG içeriği
+        """
+        if not self.enabled or key is None or not data:
+            return
+
+        with self._lock:
+            self._store_memory(key, data, time.time())
+
+            try:
+                # Yarım kalmış dosya bırakmamak için önce geçici dosyaya yaz
+                path = self._disk_path(key)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                self._evict_disk()
+            except OSError as e:
+                logger.warning("Grafik diske önbelleklenemedi: %s", str(e))
+
+    def _store_memory(self, key, data, created_at):
+        """Bellek önbelleğine ekler ve sınırları aşan eski kayıtları çıkarır"""
+        if key in self._memory:
+            self._drop_memory(key)
+
+        # Tek başına bellek sınırını aşan görüntüler sadece diskte tutulur
+        if len(data) > self.memory_max_bytes:
+            return
+
+        self._memory[key] = (data, created_at)
+        self._memory_bytes += len(data)
+
+        while self._memory and (len(self._memory) > self.memory_max_entries or
+                                self._memory_bytes > self.memory_max_bytes):
+            oldest_key = next(iter(self._memory))
+            self._drop_memory(oldest_key)
+
+    def _drop_memory(self, key):
+        """Bellek önbelleğinden bir kaydı çıkarır"""
+        data, _ = self._memory.pop(key)
+        self._memory_bytes -= len(data)
+
+    def _evict_disk(self):
+        """Süresi dolan ve boyut sınırını aşan disk kayıtlarını siler"""
+        now = time.time()
+        entries = []
+        total_bytes = 0
+
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.png'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            if now - stat.st_mtime > self.max_age:
+                self._remove_file(path)
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_bytes += stat.st_size
+
+        # En eski kayıtlardan başlayarak sil
+        entries.sort()
+        for _, size, path in entries:
+            if total_bytes <= self.disk_max_bytes:
+                break
+            self._remove_file(path)
+            total_bytes -= size
+
+    def _disk_path(self, key):
+        """Anahtarın disk üzerindeki dosya yolunu döndürür"""
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def _remove_file(self, path):
+        """Önbellek dosyasını sessizce siler"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
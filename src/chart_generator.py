@@ -3,13 +3,17 @@
 Kripto Teknik Analiz Botu - Grafik Oluşturma Modülü
 """
 import os
+import time
 import tempfile
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import mplfinance as mpf
 import numpy as np
 import pandas as pd
+from chart_cache import ChartCache, closed_candle_time
 from utils.logger import setup_logger
+from utils.instrumentation import profiler, timed
+from utils.metrics import STAGE_DURATION
 import matplotlib.image as mpimg
 
 # Logger kurulumu
@@ -22,8 +26,10 @@ class ChartGenerator:
         """Grafik oluşturma parametrelerini ayarlar"""
         self.config = config
         self.chart_settings = config.CHART_SETTINGS
+        self.chart_cache = ChartCache(config)
         logger.info("Grafik oluşturucu başlatıldı")
     
+    @timed("chart.generate")
     def generate_chart(self, signal):
         """
         Sinyal için teknik analiz grafiği oluşturur
@@ -35,32 +41,44 @@ class ChartGenerator:
             str: Oluşturulan grafik dosyasının yolu
         """
         try:
+            # Sinyal bilgilerini al
+            symbol = signal['symbol']
+            timeframe = signal['timeframe']
+            signal_type = signal['signal_type']
+            
+            # Aynı kapanmış mum ve sinyal için daha önce oluşturulan grafik varsa onu kullan
+            candle_time = closed_candle_time(signal.get('timestamp'), timeframe)
+            cache_key = self.chart_cache.make_key(symbol, timeframe, candle_time, signal_type)
+            cached_chart = self.chart_cache.get(cache_key)
+            
             # Geçici dosya oluştur
             temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
             chart_path = temp_file.name
+            
+            if cached_chart is not None:
+                temp_file.write(cached_chart)
+                temp_file.close()
+                profiler.count("chart.cache_hit")
+                logger.info("Grafik önbellekten kullanıldı: %s %s %s", symbol, timeframe, signal_type)
+                return chart_path
+            
             temp_file.close()
+            render_start = time.perf_counter()
             
             # Veri çekici oluştur
-            from data_fetcher import BinanceDataFetcher
+            from data_fetcher import BinanceDataFetcher, history_limit
+            from technical_indicators import TechnicalIndicators
             data_fetcher = BinanceDataFetcher(self.config)
+            indicators = TechnicalIndicators(self.config)
             
-            # Sinyal bilgilerini al
-            symbol = signal['symbol']
-            timeframe = signal['timeframe']
-            signal_type = signal['signal_type']
-            
-            # Veri çek - daha fazla mum için limit artırıldı
-            df = data_fetcher.get_klines(symbol, timeframe, limit=400)
+            # Veri çek - gösterilecek mumlar ve indikatörlerin ısınma süresi kadar
+            limit = history_limit(self.config, self.chart_settings['candle_count'] + indicators.warmup_bars())
+            df = data_fetcher.get_klines(symbol, timeframe, limit=limit)
             
             if df is None or df.empty:
-                logger.error(f"Grafik için veri alınamadı: {symbol} {timeframe}")
+                logger.error("Grafik için veri alınamadı: %s %s", symbol, timeframe)
                 return None
             
-            # Teknik indikatörleri hesapla
-            from technical_indicators import TechnicalIndicators
-            indicators = TechnicalIndicators(self.config)
-            df = indicators.add_all_indicators(df)
-            
             # Destek ve direnç seviyelerini hesapla
             from support_resistance import SupportResistance
             sr = SupportResistance(self.config)
@@ -71,10 +89,6 @@ class ChartGenerator:
             fig_height = self.chart_settings['chart_height']
             dpi = self.chart_settings['dpi']
             
-            # Gösterilecek mum sayısını ayarla
-            display_count = min(self.chart_settings['candle_count'], len(df))
-            df_display = df.iloc[-display_count:]
-            
             # Açık tema için grafik stilini ayarla
             mc = mpf.make_marketcolors(
                 up='black', down='black',  # Yükseliş ve düşüş rengi: Siyah
@@ -119,6 +133,33 @@ class ChartGenerator:
             else:
                 show_ema = self.chart_settings.get('show_ema', False)
             
+            show_ema = show_ema or "EMA" in signal_type or "Moving Average" in signal_type or "Trend" in signal_type
+            show_psar = "Parabolic" in signal_type or "SAR" in signal_type
+            show_bollinger = "Bollinger" in signal_type
+            
+            # Yalnızca gösterilecek indikatörleri hesapla
+            chart_columns = []
+            if show_ema:
+                chart_columns.extend(('ema_short', 'ema_medium', 'ema_long'))
+            if show_psar:
+                chart_columns.append('psar')
+            if is_ichimoku_signal or show_ichimoku:
+                chart_columns.extend(('ichimoku_tenkan', 'ichimoku_kijun', 'ichimoku_senkou_span_a',
+                                      'ichimoku_senkou_span_b', 'ichimoku_chikou'))
+            if show_bollinger:
+                chart_columns.extend(('bb_upper', 'bb_middle', 'bb_lower'))
+            if show_rsi:
+                chart_columns.append('rsi')
+            if show_macd:
+                chart_columns.extend(('macd', 'macd_signal', 'macd_hist'))
+            if show_adx:
+                chart_columns.extend(('adx', 'plus_di', 'minus_di'))
+            df = indicators.ensure(df, chart_columns)
+            
+            # Gösterilecek mum sayısını ayarla
+            display_count = min(self.chart_settings['candle_count'], len(df))
+            df_display = df.iloc[-display_count:]
+            
             # Panel oranlarını ayarla - volume=True olduğunda panel sayısı +1 olur
             if show_rsi and show_macd and show_adx:
                 panel_ratios = (6, 1, 2, 2, 2)  # Ana grafik, Volume, RSI, MACD, ADX
@@ -149,14 +190,14 @@ class ChartGenerator:
             apds = []
             
             # EMA'ları sadece gerektiğinde ekle
-            if "EMA" in signal_type or "Moving Average" in signal_type or "Trend" in signal_type or show_ema:
+            if show_ema:
                 ema_short = mpf.make_addplot(df_display['ema_short'], color='#4fc3f7', width=1, label=f"EMA{self.config.TA_PARAMS['ema_short']}")
                 ema_medium = mpf.make_addplot(df_display['ema_medium'], color='#ffb74d', width=1, label=f"EMA{self.config.TA_PARAMS['ema_medium']}")
                 ema_long = mpf.make_addplot(df_display['ema_long'], color='#ce93d8', width=1, label=f"EMA{self.config.TA_PARAMS['ema_long']}")
                 apds.extend([ema_short, ema_medium, ema_long])
             
             # Parabolic SAR ekle
-            if "Parabolic" in signal_type or "SAR" in signal_type:
+            if show_psar:
                 psar = mpf.make_addplot(df_display['psar'], type='scatter', markersize=50, marker='.', color='#757575')
                 apds.append(psar)
             
@@ -237,7 +278,7 @@ class ChartGenerator:
                 apds.extend([adx, plus_di, minus_di, adx_strong, adx_very_strong])
             
             # Bollinger Bantları
-            if "Bollinger" in signal_type:
+            if show_bollinger:
                 # Bollinger Bantları ekle
                 bb_upper = mpf.make_addplot(df_display['bb_upper'], color='#ef5350', width=0.8, alpha=0.7)
                 bb_middle = mpf.make_addplot(df_display['bb_middle'], color='#757575', width=0.8, alpha=0.7)
@@ -380,9 +421,9 @@ class ChartGenerator:
                     fig_center = fig.add_axes([0.3, 0.3, 0.4, 0.4], zorder=-1)
                     fig_center.imshow(logo, alpha=self.chart_settings['watermark_alpha'])
                     fig_center.axis('off')  # Eksen çizgilerini gizle
-                    logger.info(f"Logo başarıyla eklendi: {logo_path}")
+                    logger.info("Logo başarıyla eklendi: %s", logo_path)
                 else:
-                    logger.warning(f"Logo dosyası bulunamadı: {logo_path}")
+                    logger.warning("Logo dosyası bulunamadı: %s", logo_path)
                     # Alternatif watermark ekle
                     fig.text(
                         0.5, 0.5,
@@ -395,7 +436,7 @@ class ChartGenerator:
                         rotation=30
                     )
             except Exception as e:
-                logger.error(f"Logo eklenirken hata: {str(e)}", exc_info=True)
+                logger.error("Logo eklenirken hata: %s", e, exc_info=True)
                 # Alternatif watermark ekle
                 fig.text(
                     0.5, 0.5,
@@ -409,13 +450,22 @@ class ChartGenerator:
                 )
             
             # Grafiği kaydet
-            plt.savefig(chart_path, dpi=dpi, bbox_inches='tight')
+            with profiler.stage("chart.savefig"):
+                plt.savefig(chart_path, dpi=dpi, bbox_inches='tight')
             plt.close(fig)
             
-            logger.info(f"Grafik başarıyla oluşturuldu: {chart_path}")
+            # Oluşturulan grafiği önbelleğe al
+            with open(chart_path, 'rb') as f:
+                chart_bytes = f.read()
+            self.chart_cache.put(cache_key, chart_bytes)
+            profiler.count("chart.rendered")
+            profiler.add_bytes("chart", bytes_out=len(chart_bytes))
+            STAGE_DURATION.labels("chart_render").observe(time.perf_counter() - render_start)
+            
+            logger.info("Grafik başarıyla oluşturuldu: %s", chart_path)
             
             return chart_path
             
         except Exception as e:
-            logger.error(f"Grafik oluşturulurken hata: {str(e)}", exc_info=True)
+            logger.error("Grafik oluşturulurken hata: %s", e, exc_info=True)
             return None
\ No newline at end of file
@@ -3,6 +3,7 @@
 Kripto Teknik Analiz Botu - Konfigürasyon Modülü
 """
 import os
+import json
 from dotenv import load_dotenv
 
 # .env dosyasını yükle (eğer varsa)
@@ -19,6 +20,43 @@ class Config:
         self.TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
         self.TELEGRAM_SIGNALS_CHAT_ID = os.getenv("TELEGRAM_SIGNALS_CHAT_ID", "")
         
+        # Piyasa Veri Kaynağı - binance (canlı), http (Binance uyumlu sunucu) veya replay (fixture dosyaları)
+        self.DATA_SOURCE = os.getenv("DATA_SOURCE", "binance")
+        self.DATA_SOURCE_URL = os.getenv("DATA_SOURCE_URL", "http://127.0.0.1:8082")
+        self.DATA_FIXTURES_DIR = os.getenv(
+            "DATA_FIXTURES_DIR",
+            os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'fixtures')
+        )
+        
+        # Telegram Bot API adresi (yük testleri için yerel sahte sunucuya yönlendirilebilir)
+        self.TELEGRAM_API_BASE_URL = os.getenv("TELEGRAM_API_BASE_URL", "https://api.telegram.org")
+        # Başlangıçta bağlantı ve chat ID testlerini yap
+        self.TELEGRAM_TEST_ON_START = os.getenv("TELEGRAM_TEST_ON_START", "true").lower() == "true"
+        
+        # Telegram HTTP Ayarları - paylaşılan oturum, zaman aşımları ve yeniden denemeler
+        self.TELEGRAM_HTTP = {
+            "connect_timeout": 5,      # saniye
+            "read_timeout": 30,        # saniye
+            "max_retries": 3,          # 429, bağlantı hatası ve 5xx için en fazla yeniden deneme (gönderimlerde yalnızca 429 ve kurulamayan bağlantı)
+            "backoff_factor": 1.0,     # Üstel bekleme çarpanı (1, 2, 4... saniye)
+            "max_retry_after": 60,     # Bundan uzun flood beklemeleri yeniden denenmez
+            "pool_connections": 4,
+            "pool_maxsize": 8,
+        }
+        
+        # Telegram Hız Sınırları - gönderim kuyruğunun token kovaları
+        self.TELEGRAM_RATE_LIMITS = {
+            "global_per_second": 30,        # Bot genelinde saniyede en fazla mesaj
+            "private_chat_per_second": 1,   # Özel sohbet başına saniyede en fazla mesaj
+            "group_per_minute": 20,         # Grup/kanal başına dakikada en fazla mesaj
+            "group_burst": 3,               # Grup/kanal için art arda gönderilebilecek mesaj
+            "workers": 4,                   # Eşzamanlı gönderim iş parçacığı sayısı
+            "send_timeout": 600,            # Taramanın gönderimleri en fazla bu kadar beklenir (saniye)
+        }
+        
+        # Yüklenen grafiklerin file_id değerlerinden tutulacak en fazla kayıt
+        self.TELEGRAM_FILE_ID_CACHE_SIZE = 256
+        
         # Tarama Ayarları
         self.SYMBOLS = [
             "BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT", 
@@ -26,13 +64,113 @@ class Config:
             "LINKUSDT", "LTCUSDT", "UNIUSDT", "ATOMUSDT", "ETCUSDT"
         ]
         
+        # Otomatik sembol evreni - etkinse SYMBOLS yerine borsadaki tüm USDT çiftleri
+        # toplu 24 saatlik hacme göre sıralanıp katmanlara ayrılır (src/symbol_universe.py)
+        self.SYMBOL_UNIVERSE = {
+            "enabled": os.getenv("SYMBOL_UNIVERSE_ENABLED", "false").lower() == "true",
+            "quote_asset": os.getenv("SYMBOL_UNIVERSE_QUOTE", "USDT"),
+            "cache_path": os.getenv("SYMBOL_UNIVERSE_CACHE", ""),   # Boşsa data/exchange_info.json
+            "exchange_info_ttl": 24 * 3600,   # Borsa bilgisi önbelleğinin yenilenme aralığı (saniye)
+            "ranking_ttl": 6 * 3600,          # Hacim sıralamasının ve katmanların yenilenme aralığı (saniye)
+            "volume_ttl": 15 * 60,            # Hacim eşiği kontrolünde kullanılan toplu ticker verisinin ömrü (saniye)
+            "max_symbols": int(os.getenv("SYMBOL_UNIVERSE_MAX", "300")),
+            # Sabit değerli varlıklar taranmaz
+            "exclude_bases": ["USDC", "FDUSD", "TUSD", "BUSD", "USDP", "DAI", "EUR", "AEUR", "EURI", "USD1"],
+            # Hacim sırasına göre katmanlar: ilk "size" sembol her "every" taramada bir taranır
+            # (size None: kalan tüm semboller)
+            "tiers": [
+                {"name": "core", "size": 20, "every": 1},
+                {"name": "mid", "size": 80, "every": 2},
+                {"name": "tail", "size": None, "every": 4},
+            ],
+        }
+        
         self.TIMEFRAMES = ["4h"]
         
+        # Çoklu zaman dilimi - her sembol için tek bir temel çözünürlük çekilir,
+        # diğer zaman dilimleri yerelde türetilir (src/timeframe_resampler.py)
+        self.MULTI_TIMEFRAME = {
+            "enabled": os.getenv("MULTI_TIMEFRAME_ENABLED", "false").lower() == "true",
+            "base_timeframe": os.getenv("BASE_TIMEFRAME", "4h"),
+            "base_limit": None,   # Temel çözünürlükte çekilecek mum sayısı (None: gereken geçmişten hesaplanır)
+            # Sinyallerin trend uyumunun kontrol edildiği üst zaman dilimleri
+            "confluence_timeframes": [tf for tf in os.getenv("CONFLUENCE_TIMEFRAMES", "1d").split(",") if tf],
+            "confluence_bonus": 10,       # Uyumlu her üst zaman dilimi için kalite artışı
+            "confluence_max_bonus": 15,   # Uyumdan gelen toplam kalite artışının üst sınırı
+            # Trend oylaması yalnızca işaretlere baktığından EMA ısınması daha gevşek toleransla hesaplanır
+            # (%1 ile 1d trendi için 117 gün = 707 adet 4h mumu, tek istekteki 1000 mum sınırının altında)
+            "trend_warmup_tolerance": 0.01,
+        }
+        
+        # Çalıştırılacak sinyal modülleri (sınıf adları; boşsa tümü)
+        self.ENABLED_SIGNAL_MODULES = [name for name in os.getenv("SIGNAL_MODULES", "").split(",") if name]
+        
+        # Sinyal modüllerinin çalıştırılması - paralel modda bir sembolün modülleri
+        # iş parçacığı havuzunda çalışır, zaman aşımına uğrayan modülün sinyalleri atlanır
+        self.SIGNAL_EXECUTION = {
+            "parallel": os.getenv("SIGNAL_PARALLEL", "false").lower() == "true",
+            "workers": int(os.getenv("SIGNAL_WORKERS", "4")),
+            "module_timeout": float(os.getenv("SIGNAL_MODULE_TIMEOUT", "10")),  # saniye
+        }
+        
+        # Çekilecek mum geçmişi - modüllerin bildirdiği geriye bakış ve indikatör
+        # ısınma sürelerinden hesaplanır (SignalAnalyzer.min_history)
+        self.HISTORY = {
+            "auto": os.getenv("AUTO_HISTORY", "true").lower() == "true",
+            "default_limit": 500,        # auto kapalıyken çekilecek mum sayısı
+            "max_limit": 1000,           # Binance tek istekte en fazla 1000 mum döndürür
+            "warmup_tolerance": 0.001,   # EMA tabanlı indikatörlerde kabul edilen başlangıç değeri etkisi
+        }
+        
+        # Parçalı tarama - sembol evreni tutarlı özetleme ile işçi süreçlere bölünür,
+        # tek bir toplayıcı semboller arası sıralama ve gönderimi yapar (src/sharding.py)
+        self.SHARDING = {
+            "role": os.getenv("SCAN_ROLE", "standalone"),   # standalone, aggregator veya worker
+            "worker_id": os.getenv("WORKER_ID", ""),        # Boşsa makine adı ve süreç numarası
+            "workers": [name for name in os.getenv("SCAN_WORKERS", "").split(",") if name],  # Boşsa canlı işçiler
+            "queue_path": os.getenv("SCAN_QUEUE_DB", ""),   # Boşsa data/scan_queue.db
+            "virtual_nodes": 256,        # İşçi başına halkadaki sanal düğüm (fazlası daha dengeli dağıtır)
+            "result_timeout": 600,       # Toplayıcının parçaları bekleyeceği en uzun süre (saniye)
+            "poll_interval": 1.0,        # Kuyruk kontrol aralığı (saniye)
+            "claim_lease": 30,           # Yenilenmeyen parça sahiplenmesi bu süreden sonra başka işçiye geçer (saniye)
+            "worker_ttl": 120,           # Bu süredir canlılık bildirmeyen işçi halkaya alınmaz (saniye)
+            "retention": 24 * 3600,      # Kuyruktaki eski taramaların tutulacağı süre (saniye)
+        }
+        
         # Sinyal Ayarları
         self.SIGNAL_COOLDOWN = 4 * 3600  # 4 saat (saniye cinsinden)
         self.MIN_SIGNAL_QUALITY = 50  # 0-100 arası kalite puanı (daha düşük eşik değeri)
         self.MIN_VOLUME_THRESHOLD = 1000000  # 1 milyon USDT (daha düşük hacim eşiği)
         
+        # Bekleme süresi deposu - son gönderim zamanları (SQLite, WAL modu)
+        self.COOLDOWN_STORE = {
+            "path": os.getenv("COOLDOWN_DB", ""),   # Boşsa data/cooldowns.db
+            "ttl": self.SIGNAL_COOLDOWN,            # Bu süreden eski kayıtlar silinir
+        }
+        
+        # Sinyal geçmişi - tespit edilen/gönderilen tüm sinyaller (SQLite)
+        self.SIGNAL_HISTORY = {
+            "enabled": os.getenv("SIGNAL_HISTORY_ENABLED", "true").lower() == "true",
+            "path": os.getenv("SIGNAL_HISTORY_DB", ""),   # Boşsa data/signal_history.db
+        }
+        
+        # Sinyal sonuç takibi - gönderilen sinyallerin TP/SL sonuçları tarama mumlarından çözülür
+        self.OUTCOME_TRACKER = {
+            "enabled": True,
+            "background": True,   # Kontroller arka plan iş parçacığında yapılır (tarama beklemez)
+            "max_bars": 120,      # Bu kadar mum içinde TP/SL olmazsa "expired" sayılır
+        }
+        
+        # Kalite kalibrasyonu - geçmiş sonuçlardan öğrenilen puan tablosu (src/quality_calibration.py)
+        self.QUALITY_CALIBRATION = {
+            "enabled": os.getenv("QUALITY_CALIBRATION_ENABLED", "true").lower() == "true",
+            "path": os.getenv("QUALITY_CALIBRATION_FILE", ""),   # Boşsa data/quality_calibration.json
+            "min_samples": 30,      # Tabloya girmek için gereken en az sonuçlanmış sinyal
+            "prior_strength": 20,   # Az örnekli koşulların sinyal türü ortalamasına çekilme gücü
+            "max_bars": self.OUTCOME_TRACKER["max_bars"],
+            "walk_bars": 300,       # Kural dışı modüllerin adım adım test edildiği son mum sayısı
+        }
+        
         # Teknik Analiz Parametreleri
         self.TA_PARAMS = {
             "rsi_period": 14,
@@ -51,6 +189,113 @@ class Config:
             "ichimoku_senkou_span_b": 52,
         }
         
+        # Bildirimsel sinyal kuralları (biçim için signals/rule_engine.py)
+        # "module" değeri kuralı çalıştıran sinyal modülünü belirtir; modülü olmayan kurallar RuleSignals tarafından çalıştırılır
+        self.SIGNAL_RULES = [
+            {
+                "name": "EMA Golden Cross",
+                "module": "moving_average",
+                "direction": "long",
+                "condition": {"cross_above": ["ema_short", "ema_long"]},
+                "stop_loss": {"type": "swing", "bars": 5, "buffer": 0.01},
+                "take_profit": {"type": "risk_reward", "ratio": 2},
+                "description": "Kısa EMA ({ema_short}) uzun EMA'yı ({ema_long}) yukarı kesti. Olası bir yükseliş sinyali.",
+            },
+            {
+                "name": "EMA Death Cross",
+                "module": "moving_average",
+                "direction": "short",
+                "condition": {"cross_below": ["ema_short", "ema_long"]},
+                "stop_loss": {"type": "swing", "bars": 5, "buffer": 0.01},
+                "take_profit": {"type": "risk_reward", "ratio": 2},
+                "description": "Kısa EMA ({ema_short}) uzun EMA'yı ({ema_long}) aşağı kesti. Olası bir düşüş sinyali.",
+            },
+            {
+                "name": "MACD Bullish Crossover",
+                "module": "macd",
+                "direction": "long",
+                "condition": {"cross_above": ["macd", "macd_signal"]},
+                "stop_loss": {"type": "swing", "bars": 5, "buffer": 0.01},
+                "take_profit": {"type": "risk_reward", "ratio": 2},
+                "boosts": [
+                    # MACD histogramı negatiften pozitife geçti
+                    {"when": {"all": [{"prev": {"lt": ["macd_hist", 0]}}, {"gt": ["macd_hist", 0]}]}, "points": 10},
+                ],
+                "description": "MACD çizgisi sinyal çizgisini yukarı kesti. Olası bir yükseliş sinyali.",
+            },
+            {
+                "name": "MACD Bearish Crossover",
+                "module": "macd",
+                "direction": "short",
+                "condition": {"cross_below": ["macd", "macd_signal"]},
+                "stop_loss": {"type": "swing", "bars": 5, "buffer": 0.01},
+                "take_profit": {"type": "risk_reward", "ratio": 2},
+                "boosts": [
+                    # MACD histogramı pozitiften negatife geçti
+                    {"when": {"all": [{"prev": {"gt": ["macd_hist", 0]}}, {"lt": ["macd_hist", 0]}]}, "points": 10},
+                ],
+                "description": "MACD çizgisi sinyal çizgisini aşağı kesti. Olası bir düşüş sinyali.",
+            },
+            {
+                "name": "Ichimoku TK Cross (Bullish)",
+                "module": "ichimoku",
+                "direction": "long",
+                "condition": {"cross_above": ["ichimoku_tenkan", "ichimoku_kijun"]},
+                "stop_loss": {"type": "swing", "bars": 5, "buffer": 0.01},
+                "take_profit": {"type": "risk_reward", "ratio": 2},
+                "boosts": [
+                    # Fiyat bulutun üstünde
+                    {"when": {"gt": ["close", {"max": ["ichimoku_senkou_span_a", "ichimoku_senkou_span_b"]}]}, "points": 15},
+                ],
+                "description": "Tenkan-sen Kijun-sen'i yukarı kesti. Olası bir yükseliş sinyali.",
+            },
+            {
+                "name": "Ichimoku TK Cross (Bearish)",
+                "module": "ichimoku",
+                "direction": "short",
+                "condition": {"cross_below": ["ichimoku_tenkan", "ichimoku_kijun"]},
+                "stop_loss": {"type": "swing", "bars": 5, "buffer": 0.01},
+                "take_profit": {"type": "risk_reward", "ratio": 2},
+                "boosts": [
+                    # Fiyat bulutun altında
+                    {"when": {"lt": ["close", {"min": ["ichimoku_senkou_span_a", "ichimoku_senkou_span_b"]}]}, "points": 15},
+                ],
+                "description": "Tenkan-sen Kijun-sen'i aşağı kesti. Olası bir düşüş sinyali.",
+            },
+            {
+                "name": "Bollinger Band Bounce (Lower)",
+                "module": "bollinger",
+                "direction": "long",
+                # Önceki mumda alt bandın altına indi, son mum bandın üstünde kapandı
+                "condition": {"all": [{"prev": {"lt": ["low", "bb_lower"]}}, {"gt": ["close", "bb_lower"]}]},
+                "stop_loss": {"type": "swing", "bars": 3, "buffer": 0.01},
+                "take_profit": {"type": "column", "column": "bb_middle"},
+                "boosts": [
+                    {"when": {"lt": ["rsi", {"param": "rsi_oversold"}]}, "points": 15},
+                ],
+                "description": "Fiyat alt Bollinger bandından sekti. Olası bir yükseliş sinyali.",
+            },
+            {
+                "name": "Bollinger Band Bounce (Upper)",
+                "module": "bollinger",
+                "direction": "short",
+                # Önceki mumda üst bandın üstüne çıktı, son mum bandın altında kapandı
+                "condition": {"all": [{"prev": {"gt": ["high", "bb_upper"]}}, {"lt": ["close", "bb_upper"]}]},
+                "stop_loss": {"type": "swing", "bars": 3, "buffer": 0.01},
+                "take_profit": {"type": "column", "column": "bb_middle"},
+                "boosts": [
+                    {"when": {"gt": ["rsi", {"param": "rsi_overbought"}]}, "points": 15},
+                ],
+                "description": "Fiyat üst Bollinger bandından sekti. Olası bir düşüş sinyali.",
+            },
+        ]
+        
+        # Ek kurallar JSON dosyasından yüklenebilir (kod değişikliği gerekmeden yeni sinyal eklemek için)
+        rules_file = os.getenv("SIGNAL_RULES_FILE", "")
+        if rules_file and os.path.exists(rules_file):
+            with open(rules_file, "r", encoding="utf-8") as f:
+                self.SIGNAL_RULES.extend(json.load(f))
+        
         # Grafik Ayarları - Daha temiz ve estetik görünüm için güncellendi
         self.CHART_SETTINGS = {
             "candle_count": 300,  # Grafikte gösterilecek mum sayısı
@@ -69,12 +314,52 @@ class Config:
             "grid_alpha": 0.0,  # Klavuz Çizgileri opacity
         }
         
+        # Grafik Önbelleği Ayarları - aynı mum ve sinyal için grafik tekrar çizilmez
+        self.CHART_CACHE = {
+            "enabled": True,
+            "memory_max_entries": 32,                # Bellekte tutulacak en fazla grafik
+            "memory_max_bytes": 64 * 1024 * 1024,    # 64 MB
+            "disk_max_bytes": 256 * 1024 * 1024,     # 256 MB
+            "max_age": 4 * 3600,                     # 4 saat (saniye cinsinden)
+        }
+        
         # API Rate Limiting
         self.API_RATE_LIMIT_WAIT = 1  # saniye
         
+        # Performans Ölçümü - aşama süreleri, çağrı sayıları ve bayt trafiği tarama bazında loglanır
+        self.PROFILING = {
+            "enabled": os.getenv("PROFILING_ENABLED", "false").lower() == "true",
+            "history_size": 50,     # Bellekte tutulacak tarama özeti sayısı
+            "summary_stages": 8,    # Özet satırında gösterilecek en yavaş aşama sayısı
+        }
+        
+        # Metrikler - Prometheus metin biçiminde HTTP /metrics uç noktası ve/veya textfile collector dosyası
+        self.METRICS = {
+            "enabled": os.getenv("METRICS_ENABLED", "false").lower() == "true",
+            "host": os.getenv("METRICS_HOST", "127.0.0.1"),
+            "http_port": int(os.getenv("METRICS_PORT", "9108")),   # 0 ise HTTP sunucusu başlatılmaz
+            "textfile": os.getenv("METRICS_TEXTFILE", ""),          # Her tarama sonunda yazılacak .prom dosyası
+        }
+        
         # Loglama Ayarları
-        self.LOG_LEVEL = "INFO"
-        self.LOG_FILE = "kripto_motoru.log"
+        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+        # Modül bazında log seviyeleri (örn. {"rsi_signals": "WARNING"}), LOG_LEVELS=ad=SEVİYE,... ile de ayarlanabilir
+        self.LOG_LEVELS = {
+            name.strip(): level.strip()
+            for name, level in (item.split("=", 1) for item in os.getenv("LOG_LEVELS", "").split(",") if "=" in item)
+        }
+        # Tüm modüllerin yazdığı tek log dosyası (logs/ altında)
+        self.LOG_FILE = os.getenv("LOG_FILE", "kripto_motoru.log")
+        
+        # Tarama günlüğü - her tarama olayı için JSON-lines kaydı (scan_id, symbol, timeframe, stage, duration_ms, outcome)
+        self.JOURNAL = {
+            "enabled": os.getenv("JOURNAL_ENABLED", "true").lower() == "true",
+            "path": os.getenv("JOURNAL_FILE", os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs", "scan_journal.jsonl")),
+            "max_bytes": 50 * 1024 * 1024,  # Bu boyutta dosya döndürülür
+            "backup_count": 5,
+            "buffer_events": 256,           # Bu kadar olay birikince toplu yazılır
+            "flush_interval": 2.0,          # Tampon en geç bu kadar saniyede bir yazılır
+        }
         
         # Debug Modu - RSI ve Divergence sinyallerini daha detaylı loglamak için
         self.DEBUG_MODE = True
\ No newline at end of file
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Çoklu Zaman Dilimi Uyum Modülü
+
+Bir zaman diliminde tespit edilen sinyali üst zaman dilimlerinin trendiyle
+karşılaştırır (örn. 4h destek sinyali + 1d yükselen trend). Üst zaman
+dilimi verileri TimeframeResampler ile temel çözünürlükten türetildiği için
+ek API çağrısı gerekmez.
+
+Üst zaman dilimi trendi üç oyla belirlenir: kısa EMA'nın uzun EMA'ya göre
+konumu, kapanışın uzun EMA'ya göre konumu ve MACD histogramının işareti.
+En az iki oy aynı yöndeyse trend o yöndedir. Oylar yalnızca işaretlere
+baktığı için EMA ısınması daha gevşek bir toleransla (trend_warmup_tolerance,
+varsayılan %1) hesaplanır; böylece 4h -> 1d gibi varsayılan eşleşmenin temel
+verisi tek istekteki 1000 mum sınırına sığar. Sinyalle aynı yönde trendi olan
+ve ters yönde trendi olmayan sinyal ayrı bir sinyal üretilmeden işaretlenir:
+'confluence' alanına uyumlu zaman dilimleri yazılır ve kalite puanı sınırlı
+bir miktar artırılır. Sinyal türü değişmediği için bekleme süresi, grafik
+paneli seçimi ve gönderim önceliği aynı kalır.
+"""
+import numpy as np
+from technical_indicators import TechnicalIndicators
+from signals.signal_record import signal_direction
+from timeframe_resampler import TIMEFRAME_MS
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("confluence")
+
+TREND_BULLISH = 1
+TREND_BEARISH = -1
+TREND_NEUTRAL = 0
+
+# Trend oylamasının okuduğu indikatör sütunları
+TREND_COLUMNS = ('ema_short', 'ema_long', 'macd_hist')
+
+class ConfluenceAnalyzer:
+    """Sinyalleri üst zaman dilimi trendleriyle karşılaştıran sınıf"""
+
+    def __init__(self, config):
+        """
+        Args:
+            config (Config): Bot konfigürasyonu
+        """
+        self.config = config
+        self.settings = config.MULTI_TIMEFRAME
+        self.enabled = self.settings.get('enabled', True) and bool(self.settings.get('confluence_timeframes'))
+        self.indicators = TechnicalIndicators(config)
+        self.params = config.TA_PARAMS
+
+    def higher_timeframes(self, timeframe):
+        """Verilen zaman diliminden büyük uyum zaman dilimleri (devre dışıysa boş)"""
+        if not self.enabled:
+            return []
+        period = TIMEFRAME_MS.get(timeframe, 0)
+        return [tf for tf in self.settings.get('confluence_timeframes', []) if TIMEFRAME_MS.get(tf, 0) > period]
+
+    def min_history(self):
+        """Trend kararı için gereken en az üst zaman dilimi mum sayısı"""
+        tolerance = self.settings.get('trend_warmup_tolerance')
+        return max(self.params['ema_long'], 1 + self.indicators.warmup_bars(TREND_COLUMNS, tolerance))
+
+    def trend(self, df):
+        """
+        Zaman diliminin trend yönünü belirler
+
+        Args:
+            df (pandas.DataFrame): Mum verileri
+
+        Returns:
+            int: TREND_BULLISH, TREND_BEARISH veya TREND_NEUTRAL
+        """
+        # Isınması tamamlanmamış veride (örn. istek limiti nedeniyle kısa kalan
+        # geçmişte) trend kararı verilmez
+        if df is None or len(df) < self.min_history():
+            return TREND_NEUTRAL
+
+        df = self.indicators.ensure(df[['close']].copy(), TREND_COLUMNS)
+
+        last = df.iloc[-1]
+        votes = np.sign([last['ema_short'] - last['ema_long'],
+                         last['close'] - last['ema_long'],
+                         last['macd_hist']])
+        if np.isnan(votes).any():
+            return TREND_NEUTRAL
+        if (votes > 0).sum() >= 2:
+            return TREND_BULLISH
+        if (votes < 0).sum() >= 2:
+            return TREND_BEARISH
+        return TREND_NEUTRAL
+
+    def analyze(self, symbol, timeframe, signals, frames):
+        """
+        Üst zaman dilimi trendiyle uyumlu sinyalleri işaretler ve kalite puanlarını artırır
+
+        Args:
+            symbol (str): Kripto para sembolü
+            timeframe (str): Sinyallerin zaman dilimi
+            signals (list): SignalAnalyzer'ın seçtiği sinyaller (yerinde güncellenir)
+            frames (dict): Üst zaman dilimi -> mum verileri
+
+        Returns:
+            int: İşaretlenen sinyal sayısı
+        """
+        if not self.enabled or not signals or not frames:
+            return 0
+
+        try:
+            trends = {tf: self.trend(df) for tf, df in frames.items()}
+            bonus = self.settings.get('confluence_bonus', 10)
+            max_bonus = self.settings.get('confluence_max_bonus', bonus)
+
+            annotated = 0
+            for signal in signals:
+                is_bullish = signal_direction(signal)
+                if is_bullish is None:
+                    continue
+                direction = TREND_BULLISH if is_bullish else TREND_BEARISH
+
+                aligned = [tf for tf, trend in trends.items() if trend == direction]
+                opposed = [tf for tf, trend in trends.items() if trend == -direction]
+                if not aligned or opposed:
+                    continue
+
+                label = "Yükseliş" if is_bullish else "Düşüş"
+                signal['confluence'] = {tf: label for tf in aligned}
+                signal['quality_score'] = min(100, signal['quality_score'] + min(max_bonus, bonus * len(aligned)))
+                annotated += 1
+
+            if annotated:
+                logger.info("%s %s: %s sinyal üst zaman dilimi trendiyle uyumlu", symbol, timeframe, annotated)
+            return annotated
+
+        except Exception as e:
+            logger.error("%s %s zaman dilimi uyumu hesaplanırken hata: %s", symbol, timeframe, e, exc_info=True)
+            return 0
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sinyal Bekleme Süresi Deposu Modülü
+"""
+import os
+import json
+import math
+import time
+import sqlite3
+import threading
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("cooldown_store")
+
+class CooldownStore:
+    """Gönderilen sinyallerin son gönderim zamanlarını SQLite (WAL) üzerinde saklayan depo"""
+
+    def __init__(self, config, db_path=None):
+        """
+        Veritabanını açar, eski JSON dosyasını taşır ve süresi dolmuş kayıtları siler
+
+        Args:
+            config (Config): Bot konfigürasyonu
+            db_path (str, optional): Veritabanı dosyası. Belirtilmezse data/cooldowns.db kullanılır.
+        """
+        self.config = config
+        self.settings = config.COOLDOWN_STORE
+        self.ttl = self.settings.get('ttl', config.SIGNAL_COOLDOWN)
+
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+        if db_path is None:
+            db_path = self.settings.get('path') or os.path.join(data_dir, 'cooldowns.db')
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cooldowns ("
+            " key TEXT PRIMARY KEY,"
+            " symbol TEXT NOT NULL,"
+            " signal_type TEXT NOT NULL,"
+            " sent_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cooldowns_sent_at ON cooldowns (sent_at)")
+
+        legacy_file = self.settings.get('legacy_json') or os.path.join(data_dir, 'sent_signals.json')
+        self.migrate_json(legacy_file)
+        self.purge_expired()
+
+        # Sorgular bellekteki kopyadan yapılır; yazmalar veritabanına da işlenir
+        self._last_sent = dict(self._conn.execute("SELECT key, sent_at FROM cooldowns"))
+
+        logger.info("Bekleme süresi deposu başlatıldı: %s (%s kayıt)", self.db_path, len(self._last_sent))
+
+    @staticmethod
+    def make_key(symbol, signal_type):
+        """Sembol ve sinyal türü için depo anahtarı"""
+        return f"{symbol}_{signal_type}"
+
+    def last_sent(self, symbol, signal_type):
+        """
+        Sinyalin son gönderim zamanını döndürür
+
+        Args:
+            symbol (str): Kripto para sembolü
+            signal_type (str): Sinyal türü
+
+        Returns:
+            float: Unix zamanı (hiç gönderilmediyse None)
+        """
+        return self._last_sent.get(self.make_key(symbol, signal_type))
+
+    def is_cooling_down(self, symbol, signal_type, now=None):
+        """
+        Sinyal bekleme süresi içinde mi?
+
+        Args:
+            symbol (str): Kripto para sembolü
+            signal_type (str): Sinyal türü
+            now (float, optional): Şimdiki zaman
+
+        Returns:
+            bool: Bekleme süresi dolmadıysa True
+        """
+        last_sent_time = self.last_sent(symbol, signal_type)
+        if last_sent_time is None:
+            return False
+        if now is None:
+            now = time.time()
+        return now - last_sent_time < self.config.SIGNAL_COOLDOWN
+
+    def mark_sent(self, symbol, signal_type, sent_at=None):
+        """
+        Gönderim zamanını kaydeder (tek satırlık atomik yazma)
+
+        Args:
+            symbol (str): Kripto para sembolü
+            signal_type (str): Sinyal türü
+            sent_at (float, optional): Gönderim zamanı
+        """
+        if sent_at is None:
+            sent_at = time.time()
+        key = self.make_key(symbol, signal_type)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO cooldowns (key, symbol, signal_type, sent_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET sent_at = excluded.sent_at",
+                (key, symbol, signal_type, sent_at)
+            )
+            self._last_sent[key] = sent_at
+
+    def purge_expired(self, now=None):
+        """
+        Bekleme süresi dolmuş kayıtları siler
+
+        Args:
+            now (float, optional): Şimdiki zaman
+
+        Returns:
+            int: Silinen kayıt sayısı
+        """
+        if now is None:
+            now = time.time()
+        cutoff = now - self.ttl
+
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM cooldowns WHERE sent_at < ?", (cutoff,)).rowcount
+            if hasattr(self, '_last_sent'):
+                self._last_sent = {key: sent_at for key, sent_at in self._last_sent.items() if sent_at >= cutoff}
+
+        if deleted:
+            logger.info("%s süresi dolmuş bekleme kaydı silindi", deleted)
+        return deleted
+
+    def migrate_json(self, json_file):
+        """
+        Eski sent_signals.json dosyasındaki kayıtları veritabanına aktarır
+
+        Dosya {"<sembol>_<sinyal türü>": zaman} sözlüğü ya da [anahtar, zaman]
+        çiftlerinden oluşan liste olabilir; hatalı kayıtlar atlanır. Aktarılan
+        dosya <ad>.migrated olarak yeniden adlandırılır. Okunamayan dosya veya
+        veritabanı hatası başlangıcı durdurmaz: hata loglanır, dosya yerinde
+        bırakılır.
+
+        Args:
+            json_file (str): Eski JSON dosyası
+
+        Returns:
+            int: Aktarılan kayıt sayısı
+        """
+        if not os.path.exists(json_file) or os.path.getsize(json_file) == 0:
+            return 0
+
+        try:
+            with open(json_file, 'r') as f:
+                sent_signals = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error("Eski gönderim dosyası okunamadı: %s", e)
+            return 0
+
+        if isinstance(sent_signals, dict):
+            entries = list(sent_signals.items())
+        elif isinstance(sent_signals, list):
+            entries = sent_signals
+        else:
+            logger.error("Eski gönderim dosyasının biçimi tanınmadı (%s): %s", type(sent_signals).__name__, json_file)
+            return 0
+
+        rows = []
+        skipped = 0
+        for entry in entries:
+            try:
+                key, sent_at = entry
+                sent_at = float(sent_at)
+                if not isinstance(key, str) or '_' not in key or not math.isfinite(sent_at):
+                    raise ValueError(key)
+            except (TypeError, ValueError):
+                skipped += 1
+                continue
+            symbol, _, signal_type = key.partition('_')
+            rows.append((key, symbol, signal_type, sent_at))
+        if skipped:
+            logger.warning("Eski gönderim dosyasında %s hatalı kayıt atlandı", skipped)
+
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT INTO cooldowns (key, symbol, signal_type, sent_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET sent_at = max(sent_at, excluded.sent_at)",
+                    rows
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                logger.error("Eski gönderim kayıtları aktarılamadı: %s", e, exc_info=True)
+                return 0
+
+        try:
+            os.replace(json_file, json_file + '.migrated')
+        except OSError as e:
+            # Kayıtlar aktarıldı; dosya bir sonraki başlangıçta yeniden aktarılır (çakışmada yeni zaman korunur)
+            logger.error("Eski gönderim dosyası yeniden adlandırılamadı: %s", e)
+        logger.info("%s kayıt %s dosyasından aktarıldı", len(rows), json_file)
+        return len(rows)
+
+    def __len__(self):
+        return len(self._last_sent)
+
+    def close(self):
+        """Veritabanı bağlantısını kapatır"""
+        with self._lock:
+            self._conn.close()
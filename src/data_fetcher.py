@@ -5,31 +5,59 @@ Kripto Teknik Analiz Botu - Veri Çekme Modülü
 import time
 import logging
 import pandas as pd
-from binance.client import Client
-from binance.exceptions import BinanceAPIException
+from data_sources import create_data_source, DataSourceError
 from utils.logger import setup_logger
+from utils.instrumentation import profiler
+from utils.metrics import RATE_LIMIT_WAIT
 
 # Logger kurulumu
 logger = setup_logger("data_fetcher")
 
+def history_limit(config, required):
+    """
+    Çekilecek mum sayısını gereken geçmişten hesaplar
+
+    Args:
+        config (Config): Bot konfigürasyonu
+        required (int): Gereken en az mum sayısı
+
+    Returns:
+        int: İstekte kullanılacak limit (Config.HISTORY'ye göre)
+    """
+    settings = config.HISTORY
+    if not settings.get('auto', True):
+        return settings['default_limit']
+    return max(1, min(settings['max_limit'], int(required)))
+
 class BinanceDataFetcher:
     """Binance API'den veri çeken sınıf"""
     
-    def __init__(self, config):
-        """Binance API istemcisini başlatır"""
+    def __init__(self, config, source=None):
+        """
+        Veri kaynağını başlatır
+        
+        Args:
+            config (Config): Bot konfigürasyonu
+            source (BaseDataSource, optional): Kullanılacak veri kaynağı. Belirtilmezse config.DATA_SOURCE kullanılır.
+        """
         self.config = config
-        self.client = Client(config.BINANCE_API_KEY, config.BINANCE_API_SECRET)
+        self.source = source if source is not None else create_data_source(config)
         self.last_request_time = 0
-        logger.info("Binance veri çekici başlatıldı")
+        logger.info("Binance veri çekici başlatıldı (kaynak: %s)", self.source.name)
     
     def _respect_rate_limit(self):
         """API rate limit aşımını önlemek için bekleme yapar"""
+        if not self.source.rate_limited:
+            return
+        
         current_time = time.time()
         elapsed = current_time - self.last_request_time
         
         if elapsed < self.config.API_RATE_LIMIT_WAIT:
             wait_time = self.config.API_RATE_LIMIT_WAIT - elapsed
-            time.sleep(wait_time)
+            with profiler.stage("fetch.rate_limit_wait"):
+                time.sleep(wait_time)
+            RATE_LIMIT_WAIT.labels("binance").inc(wait_time)
         
         self.last_request_time = time.time()
     
@@ -48,42 +76,42 @@ class BinanceDataFetcher:
         try:
             self._respect_rate_limit()
             
-            logger.info(f"{symbol} için {timeframe} zaman diliminde veri çekiliyor")
+            logger.info("%s için %s zaman diliminde veri çekiliyor", symbol, timeframe)
             
-            # Binance API'den veri çek
-            klines = self.client.get_klines(
-                symbol=symbol,
-                interval=timeframe,
-                limit=limit
-            )
+            # Veri kaynağından mum verilerini çek
+            with profiler.stage("fetch.klines"):
+                klines = self.source.get_klines(symbol, timeframe, limit)
             
-            # Veriyi DataFrame'e dönüştür
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-            ])
+            with profiler.stage("klines.parse"):
+                # Veriyi DataFrame'e dönüştür
+                df = pd.DataFrame(klines, columns=[
+                    'timestamp', 'open', 'high', 'low', 'close', 'volume',
+                    'close_time', 'quote_asset_volume', 'number_of_trades',
+                    'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
+                ])
+                
+                # Veri tiplerini dönüştür
+                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+                df['open'] = df['open'].astype(float)
+                df['high'] = df['high'].astype(float)
+                df['low'] = df['low'].astype(float)
+                df['close'] = df['close'].astype(float)
+                df['volume'] = df['volume'].astype(float)
+                
+                # Timestamp'i index olarak ayarla
+                df.set_index('timestamp', inplace=True)
             
-            # Veri tiplerini dönüştür
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
+            profiler.count("klines.rows", len(df))
             
-            # Timestamp'i index olarak ayarla
-            df.set_index('timestamp', inplace=True)
-            
-            logger.info(f"{symbol} için {len(df)} adet mum verisi alındı")
+            logger.info("%s için %s adet mum verisi alındı", symbol, len(df))
             
             return df
             
-        except BinanceAPIException as e:
-            logger.error(f"Binance API hatası: {str(e)}")
+        except DataSourceError as e:
+            logger.error("Binance API hatası: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Veri çekerken beklenmeyen hata: {str(e)}", exc_info=True)
+            logger.error("Veri çekerken beklenmeyen hata: %s", e, exc_info=True)
             return None
     
     def get_24h_volume(self, symbol):
@@ -99,16 +127,67 @@ class BinanceDataFetcher:
         try:
             self._respect_rate_limit()
             
-            ticker = self.client.get_ticker(symbol=symbol)
+            with profiler.stage("fetch.ticker"):
+                ticker = self.source.get_ticker(symbol)
             volume = float(ticker['quoteVolume'])
             
-            logger.info(f"{symbol} için 24 saatlik hacim: {volume} USDT")
+            logger.info("%s için 24 saatlik hacim: %s USDT", symbol, volume)
             
             return volume
             
-        except BinanceAPIException as e:
-            logger.error(f"Binance API hatası: {str(e)}")
+        except DataSourceError as e:
+            logger.error("Binance API hatası: %s", e)
             return 0
         except Exception as e:
-            logger.error(f"Hacim verisi çekerken beklenmeyen hata: {str(e)}", exc_info=True)
-            return 0
\ No newline at end of file
+            logger.error("Hacim verisi çekerken beklenmeyen hata: %s", e, exc_info=True)
+            return 0
+    
+    def get_all_24h_volumes(self):
+        """
+        Tüm sembollerin 24 saatlik hacmini tek istekte çeker
+        
+        Returns:
+            dict: Sembol -> 24 saatlik hacim (karşı varlık cinsinden); hata durumunda None
+        """
+        try:
+            self._respect_rate_limit()
+            
+            with profiler.stage("fetch.tickers"):
+                tickers = self.source.get_tickers()
+            volumes = {ticker['symbol']: float(ticker['quoteVolume']) for ticker in tickers}
+            
+            logger.info("%s sembolün 24 saatlik hacmi alındı", len(volumes))
+            
+            return volumes
+            
+        except DataSourceError as e:
+            logger.error("Binance API hatası: %s", e)
+            return None
+        except Exception as e:
+            logger.error("Toplu hacim verisi çekerken beklenmeyen hata: %s", e, exc_info=True)
+            return None
+    
+    def get_exchange_info(self):
+        """
+        Borsa bilgisini (işlem gören semboller) çeker
+        
+        Returns:
+            list: Binance biçiminde sembol sözlükleri; hata durumunda None
+        """
+        try:
+            self._respect_rate_limit()
+            
+            with profiler.stage("fetch.exchange_info"):
+                exchange_info = self.source.get_exchange_info()
+            symbols = exchange_info.get('symbols', [])
+            
+            logger.info("Borsa bilgisi alındı: %s sembol", len(symbols))
+            
+            return symbols
+            
+        except DataSourceError as e:
+            logger.error("Binance API hatası: %s", e)
+            return None
+        except Exception as e:
+            logger.error("Borsa bilgisi çekerken beklenmeyen hata: %s", e, exc_info=True)
+            return None
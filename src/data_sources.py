@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Veri Kaynakları Modülü
+
+BinanceDataFetcher'ın kullandığı ham veri kaynakları. Tüm kaynaklar Binance
+REST API biçiminde mum satırları, 24 saatlik ticker sözlükleri ve borsa
+bilgisi (exchangeInfo) döndürür, böylece ayrıştırma kodu kaynaktan bağımsızdır.
+
+- binance: python-binance istemcisi ile canlı API
+- http:    Binance REST uyumlu herhangi bir sunucu (örn. binance_stub_server.py)
+- replay:  Kaydedilmiş JSON fixture dosyalarından çevrimdışı okuma
+"""
+import os
+import json
+import threading
+from urllib.parse import urlparse
+import requests
+from utils.logger import setup_logger
+from utils.instrumentation import profiler
+from utils.metrics import API_REQUESTS, BINANCE_USED_WEIGHT
+
+# Logger kurulumu
+logger = setup_logger("data_sources")
+
+class DataSourceError(Exception):
+    """Veri kaynağından veri alınamadığında fırlatılan hata"""
+
+def record_binance_response(endpoint, response):
+    """
+    Binance yanıtını ölçüm ve metriklere ekler
+
+    Args:
+        endpoint (str): Uç nokta adı (klines, ticker)
+        response (requests.Response): HTTP yanıtı
+    """
+    API_REQUESTS.labels("binance", endpoint, response.status_code).inc()
+    profiler.add_bytes("binance", bytes_in=len(response.content))
+
+    used_weight = response.headers.get('X-MBX-USED-WEIGHT-1M')
+    if used_weight is not None:
+        try:
+            BINANCE_USED_WEIGHT.set(float(used_weight))
+        except ValueError:
+            pass
+
+class BaseDataSource:
+    """Tüm veri kaynakları için temel sınıf"""
+
+    name = "base"
+    # API rate limit beklemesi uygulanmalı mı?
+    rate_limited = True
+
+    def get_klines(self, symbol, interval, limit=500):
+        """
+        Ham mum verilerini döndürür
+
+        Args:
+            symbol (str): Kripto para sembolü (örn. BTCUSDT)
+            interval (str): Zaman dilimi (örn. 4h)
+            limit (int): Çekilecek mum sayısı
+
+        Returns:
+            list: Binance biçiminde mum satırları
+        """
+        raise NotImplementedError
+
+    def get_ticker(self, symbol):
+        """
+        24 saatlik ticker verisini döndürür
+
+        Args:
+            symbol (str): Kripto para sembolü
+
+        Returns:
+            dict: Binance biçiminde ticker (quoteVolume alanı içerir)
+        """
+        raise NotImplementedError
+
+    def get_tickers(self):
+        """
+        Tüm sembollerin 24 saatlik ticker verisini tek istekte döndürür
+
+        Returns:
+            list: Binance biçiminde ticker sözlükleri
+        """
+        raise NotImplementedError
+
+    def get_exchange_info(self):
+        """
+        Borsa bilgisini (semboller, durumları ve varlıkları) döndürür
+
+        Returns:
+            dict: Binance exchangeInfo yanıtı ('symbols' listesi içerir)
+        """
+        raise NotImplementedError
+
+class BinanceDataSource(BaseDataSource):
+    """python-binance istemcisi üzerinden canlı Binance API"""
+
+    name = "binance"
+
+    def __init__(self, config):
+        """Binance API istemcisini başlatır"""
+        from binance.client import Client
+        from binance.exceptions import BinanceAPIException
+
+        self._api_exception = BinanceAPIException
+        self.client = Client(config.BINANCE_API_KEY, config.BINANCE_API_SECRET)
+
+    def get_klines(self, symbol, interval, limit=500):
+        try:
+            klines = self.client.get_klines(symbol=symbol, interval=interval, limit=limit)
+        except self._api_exception as e:
+            self._record_response("klines")
+            raise DataSourceError(str(e)) from e
+        self._record_response("klines")
+        return klines
+
+    def get_ticker(self, symbol):
+        try:
+            ticker = self.client.get_ticker(symbol=symbol)
+        except self._api_exception as e:
+            self._record_response("ticker")
+            raise DataSourceError(str(e)) from e
+        self._record_response("ticker")
+        return ticker
+
+    def get_tickers(self):
+        try:
+            tickers = self.client.get_ticker()
+        except self._api_exception as e:
+            self._record_response("tickers")
+            raise DataSourceError(str(e)) from e
+        self._record_response("tickers")
+        return tickers
+
+    def get_exchange_info(self):
+        try:
+            exchange_info = self.client.get_exchange_info()
+        except self._api_exception as e:
+            self._record_response("exchange_info")
+            raise DataSourceError(str(e)) from e
+        self._record_response("exchange_info")
+        return exchange_info
+
+    def _record_response(self, endpoint):
+        """İstemcinin son yanıtını ölçüm ve metriklere ekler"""
+        response = getattr(self.client, 'response', None)
+        if response is not None:
+            record_binance_response(endpoint, response)
+
+class HttpDataSource(BaseDataSource):
+    """Binance REST uyumlu bir HTTP sunucusundan veri okur"""
+
+    name = "http"
+
+    def __init__(self, base_url, timeout=10):
+        """
+        Args:
+            base_url (str): Sunucu adresi (örn. http://127.0.0.1:8082)
+            timeout (float): İstek zaman aşımı (saniye)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        # Yerel sahte sunucu için rate limit beklemesine gerek yok
+        self.rate_limited = urlparse(self.base_url).hostname not in ('127.0.0.1', 'localhost')
+
+    def _get(self, path, endpoint, params):
+        """GET isteği yapar ve JSON yanıtı döndürür"""
+        try:
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+        except requests.RequestException as e:
+            API_REQUESTS.labels("binance", endpoint, "error").inc()
+            raise DataSourceError(str(e)) from e
+
+        record_binance_response(endpoint, response)
+
+        if response.status_code != 200:
+            try:
+                error = response.json()
+                message = f"APIError(code={error.get('code')}): {error.get('msg')}"
+            except ValueError:
+                message = f"HTTP {response.status_code}: {response.text[:200]}"
+            raise DataSourceError(message)
+
+        return response.json()
+
+    def get_klines(self, symbol, interval, limit=500):
+        return self._get("/api/v3/klines", "klines", {'symbol': symbol, 'interval': interval, 'limit': limit})
+
+    def get_ticker(self, symbol):
+        return self._get("/api/v3/ticker/24hr", "ticker", {'symbol': symbol})
+
+    def get_tickers(self):
+        return self._get("/api/v3/ticker/24hr", "tickers", {})
+
+    def get_exchange_info(self):
+        return self._get("/api/v3/exchangeInfo", "exchange_info", {})
+
+# Borsa bilgisi kaydedilmemiş fixture'larda sembol adından çıkarılan karşı varlıklar
+FIXTURE_QUOTE_ASSETS = ('USDT', 'USDC', 'FDUSD', 'BTC', 'ETH', 'BNB')
+
+class ReplayDataSource(BaseDataSource):
+    """
+    Kaydedilmiş fixture dosyalarından veri okuyan çevrimdışı kaynak
+
+    Dizin yapısı:
+        <fixtures_dir>/klines/<SYMBOL>_<interval>.json   Binance mum satırları
+        <fixtures_dir>/tickers/<SYMBOL>.json             24 saatlik ticker
+        <fixtures_dir>/exchange_info.json                Borsa bilgisi (yoksa tickerlardan türetilir)
+    """
+
+    name = "replay"
+    rate_limited = False
+
+    def __init__(self, fixtures_dir):
+        """
+        Args:
+            fixtures_dir (str): Fixture dizini
+        """
+        self.fixtures_dir = fixtures_dir
+        # Açık zaman (ms) - ayarlanırsa yalnızca bu zamana kadar açılmış mumlar döndürülür
+        self.cursor = None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _load(self, relative_path):
+        """JSON dosyasını bir kez okuyup bellekte tutar"""
+        with self._lock:
+            if relative_path not in self._cache:
+                path = os.path.join(self.fixtures_dir, relative_path)
+                if not os.path.exists(path):
+                    raise DataSourceError(f"Fixture bulunamadı: {path}")
+                with open(path, 'r') as f:
+                    self._cache[relative_path] = json.load(f)
+            return self._cache[relative_path]
+
+    def get_klines(self, symbol, interval, limit=500):
+        klines = self._load(os.path.join('klines', f"{symbol}_{interval}.json"))
+
+        if self.cursor is not None:
+            # Mumlar zamana göre sıralı; imleçten sonraki mumları at
+            end = len(klines)
+            while end > 0 and klines[end - 1][0] > self.cursor:
+                end -= 1
+            klines = klines[:end]
+
+        return klines[-limit:] if limit else klines
+
+    def get_ticker(self, symbol):
+        return self._load(os.path.join('tickers', f"{symbol}.json"))
+
+    def _ticker_symbols(self):
+        """Fixture'ı bulunan semboller"""
+        tickers_dir = os.path.join(self.fixtures_dir, 'tickers')
+        if not os.path.isdir(tickers_dir):
+            return []
+        return sorted(name[:-len('.json')] for name in os.listdir(tickers_dir) if name.endswith('.json'))
+
+    def get_tickers(self):
+        return [self.get_ticker(symbol) for symbol in self._ticker_symbols()]
+
+    def get_exchange_info(self):
+        if os.path.exists(os.path.join(self.fixtures_dir, 'exchange_info.json')):
+            return self._load('exchange_info.json')
+
+        # Kayıtlı borsa bilgisi yoksa fixture sembolleri işlemde kabul edilir
+        symbols = []
+        for symbol in self._ticker_symbols():
+            quote = next((quote for quote in FIXTURE_QUOTE_ASSETS if symbol.endswith(quote) and symbol != quote), None)
+            if quote is None:
+                continue
+            symbols.append({
+                'symbol': symbol,
+                'status': 'TRADING',
+                'baseAsset': symbol[:-len(quote)],
+                'quoteAsset': quote,
+                'isSpotTradingAllowed': True,
+            })
+        return {'symbols': symbols}
+
+def record_fixtures(source, fixtures_dir, symbols, intervals, limit=1000):
+    """
+    Bir veri kaynağından fixture dosyaları kaydeder
+
+    Args:
+        source (BaseDataSource): Kaydedilecek kaynak (genellikle canlı Binance)
+        fixtures_dir (str): Hedef dizin
+        symbols (list): Semboller
+        intervals (list): Zaman dilimleri
+        limit (int): Zaman dilimi başına mum sayısı
+    """
+    os.makedirs(os.path.join(fixtures_dir, 'klines'), exist_ok=True)
+    os.makedirs(os.path.join(fixtures_dir, 'tickers'), exist_ok=True)
+
+    for symbol in symbols:
+        for interval in intervals:
+            klines = source.get_klines(symbol, interval, limit)
+            with open(os.path.join(fixtures_dir, 'klines', f"{symbol}_{interval}.json"), 'w') as f:
+                json.dump(klines, f)
+
+        ticker = source.get_ticker(symbol)
+        with open(os.path.join(fixtures_dir, 'tickers', f"{symbol}.json"), 'w') as f:
+            json.dump(ticker, f)
+
+        logger.info("%s için fixture kaydedildi", symbol)
+
+    # Borsa bilgisinden yalnızca kaydedilen semboller tutulur
+    recorded = set(symbols)
+    exchange_info = source.get_exchange_info()
+    exchange_info = dict(exchange_info, symbols=[item for item in exchange_info.get('symbols', [])
+                                                 if item.get('symbol') in recorded])
+    with open(os.path.join(fixtures_dir, 'exchange_info.json'), 'w') as f:
+        json.dump(exchange_info, f)
+
+def create_data_source(config):
+    """
+    Konfigürasyona göre veri kaynağı oluşturur
+
+    Args:
+        config (Config): Bot konfigürasyonu
+
+    Returns:
+        BaseDataSource: Veri kaynağı
+    """
+    source_type = config.DATA_SOURCE.lower()
+
+    if source_type == "binance":
+        return BinanceDataSource(config)
+    if source_type == "http":
+        return HttpDataSource(config.DATA_SOURCE_URL)
+    if source_type == "replay":
+        return ReplayDataSource(config.DATA_FIXTURES_DIR)
+
+    raise ValueError(f"Bilinmeyen veri kaynağı: {config.DATA_SOURCE}")
@@ -3,16 +3,28 @@
 Kripto Teknik Analiz Botu - Ana Modül
 """
 import time
+import socket
 import logging
 import schedule
-import json
 import os
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
 from config import Config
-from data_fetcher import BinanceDataFetcher
+from data_fetcher import BinanceDataFetcher, history_limit
 from signal_analyzer import SignalAnalyzer
 from signal_sender import TelegramSender
-from utils.logger import setup_logger
+from cooldown_store import CooldownStore
+from signal_history import SignalHistory
+from outcome_tracker import OutcomeTracker
+from timeframe_resampler import TimeframeResampler
+from confluence import ConfluenceAnalyzer
+from sharding import HashRing, ScanQueue
+from symbol_universe import SymbolUniverse
+from utils.logger import setup_logger, configure_logging
+from utils.instrumentation import profiler
+from utils.journal import journal
+from utils import metrics
 
 # Logger kurulumu
 logger = setup_logger("main")
@@ -23,88 +35,86 @@ class KriptoMotoru:
     def __init__(self):
         """Bot bileşenlerini başlatır"""
         self.config = Config()
+        configure_logging(self.config)
+        profiler.configure(self.config)
+        journal.configure(self.config)
+        self.metrics_server = metrics.start_metrics(self.config)
         self.data_fetcher = BinanceDataFetcher(self.config)
+        
+        # Taranacak semboller: sabit liste veya borsadan keşfedilen hacim katmanları
+        self.symbol_universe = SymbolUniverse(self.config, self.data_fetcher)
+        
+        # Üst zaman dilimleri temel çözünürlükten türetilir (sembol başına tek API çağrısı)
+        self.market_data = TimeframeResampler(self.config, self.data_fetcher)
+        self.confluence = ConfluenceAnalyzer(self.config)
         self.signal_analyzer = SignalAnalyzer(self.config)
-        self.signal_sender = TelegramSender(self.config)
+        
+        # Çekilecek mum sayısı etkin modüllerin bildirdiği ihtiyaçtan hesaplanır
+        self.history_limit = history_limit(self.config, self.signal_analyzer.min_history())
+        for timeframe in self.config.TIMEFRAMES:
+            self.market_data.require(timeframe, self.history_limit)
+            for higher_timeframe in self.confluence.higher_timeframes(timeframe):
+                self.market_data.require(higher_timeframe, self.confluence.min_history())
+        
+        # Parçalı tarama: işçiler sembol parçalarını tarar, toplayıcı sıralar ve gönderir
+        self.sharding = self.config.SHARDING
+        self.role = self.sharding.get('role', 'standalone')
+        self.worker_id = self.sharding.get('worker_id') or f"{socket.gethostname()}-{os.getpid()}"
+        self.scan_queue = ScanQueue(self.config) if self.role in ('worker', 'aggregator') else None
+        
+        # İşçiler Telegram'a gönderim yapmaz
+        self.signal_sender = TelegramSender(self.config) if self.role != 'worker' else None
         
         # Gönderilen sinyalleri takip etmek için
-        self.sent_signals_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'sent_signals.json')
-        self.sent_signals = self.load_sent_signals()
+        self.cooldown_store = CooldownStore(self.config)
         
-        # Veri dizinini oluştur
-        os.makedirs(os.path.dirname(self.sent_signals_file), exist_ok=True)
+        # Tespit edilen ve gönderilen sinyallerin geçmişi
+        self.signal_history = SignalHistory(self.config)
+        self.outcome_tracker = OutcomeTracker(self.config, self.signal_history)
         
         # Log dizinini oluştur
         log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
         os.makedirs(log_dir, exist_ok=True)
         
-        logger.info("Kripto Motoru başlatıldı")
-        logger.info(f"Takip edilen semboller: {', '.join(self.config.SYMBOLS)}")
-        logger.info(f"Takip edilen zaman dilimleri: {', '.join(self.config.TIMEFRAMES)}")
-        logger.info(f"Minimum sinyal kalitesi: {self.config.MIN_SIGNAL_QUALITY}")
-        logger.info(f"Minimum hacim eşiği: {self.config.MIN_VOLUME_THRESHOLD} USDT")
-    
-    def load_sent_signals(self):
-        """Gönderilen sinyalleri dosyadan yükler"""
-        try:
-            if os.path.exists(self.sent_signals_file):
-                with open(self.sent_signals_file, 'r') as f:
-                    return json.load(f)
-            return {}
-        except Exception as e:
-            logger.error(f"Gönderilen sinyaller yüklenirken hata: {str(e)}", exc_info=True)
-            return {}
-    
-    def save_sent_signals(self):
-        """Gönderilen sinyalleri dosyaya kaydeder"""
-        try:
-            with open(self.sent_signals_file, 'w') as f:
-                json.dump(self.sent_signals, f)
-            logger.info("Gönderilen sinyaller başarıyla kaydedildi")
-        except Exception as e:
-            logger.error(f"Gönderilen sinyaller kaydedilirken hata: {str(e)}", exc_info=True)
+        logger.info("Kripto Motoru başlatıldı (rol: %s)", self.role)
+        if self.symbol_universe.enabled:
+            logger.info("Takip edilen semboller: borsadaki %s çiftleri (en fazla %s, hacim katmanlarına göre)",
+                        self.symbol_universe.quote_asset, self.config.SYMBOL_UNIVERSE['max_symbols'])
+        else:
+            logger.info("Takip edilen semboller: %s", ', '.join(self.config.SYMBOLS))
+        logger.info("Takip edilen zaman dilimleri: %s", ', '.join(self.config.TIMEFRAMES))
+        logger.info("Minimum sinyal kalitesi: %s", self.config.MIN_SIGNAL_QUALITY)
+        if self.market_data.enabled and self.market_data.required_base_bars():
+            logger.info("Çekilecek mum sayısı: %s adet %s mumu (analizde son %s mum, üst zaman dilimleri bu veriden türetilir)",
+                        self.market_data.base_limit, self.market_data.base_timeframe, self.history_limit)
+        else:
+            logger.info("Çekilecek mum sayısı: %s", self.history_limit)
+        logger.info("Minimum hacim eşiği: %s USDT", self.config.MIN_VOLUME_THRESHOLD)
     
     def run_scan(self):
-        """Tüm sembolleri tarar ve sinyalleri analiz eder"""
+        """Tüm sembolleri tarar (toplayıcıda işçilerden toplar), sinyalleri seçer ve gönderir"""
+        profiler.start_scan()
+        scan_id = journal.start_scan()
+        scan_start = time.perf_counter()
+        scan_outcome = "error"
+        signals_found = signals_sent = 0
         try:
-            logger.info("[SCAN] Tarama başlatılıyor...")
+            logger.info("[SCAN] Tarama başlatılıyor... (%s)", scan_id)
             
-            all_signals = []  # Tüm zaman dilimleri için sinyalleri topla
+            # Bu taramaya düşen semboller (evren devre dışıysa config.SYMBOLS)
+            symbols = self.symbol_universe.symbols_for_scan()
             
-            # Desteklenen tüm zaman dilimleri için tarama yap
-            for timeframe in self.config.TIMEFRAMES:
-                logger.info(f"[SCAN] {timeframe} zaman dilimi için tarama başlatılıyor")
-                
-                # Tüm sembolleri tara
-                for symbol in self.config.SYMBOLS:
-                    # Hacim kontrolü
-                    if not self.check_volume_threshold(symbol):
-                        logger.info(f"[X] {symbol} hacim eşiğinin altında, atlanıyor")
-                        continue
-                    
-                    # Veri çek
-                    df = self.data_fetcher.get_klines(symbol, timeframe)
-                    if df is None or df.empty:
-                        logger.warning(f"[X] {symbol} için veri alınamadı, atlanıyor")
-                        continue
-                    
-                    # Sinyalleri analiz et
-                    logger.info(f"[SCAN] {symbol} {timeframe} için sinyal analizi yapılıyor...")
-                    signals = self.signal_analyzer.analyze(symbol, timeframe, df)
-                    
-                    if signals:
-                        logger.info(f"[OK] {symbol} {timeframe} için {len(signals)} sinyal tespit edildi")
-                        all_signals.extend(signals)
-                    else:
-                        logger.info(f"[X] {symbol} {timeframe} için sinyal tespit edilemedi")
-                
-                # API rate limit aşımını önlemek için kısa bir bekleme
-                time.sleep(1)
+            if self.role == 'aggregator':
+                all_signals = self.collect_shards(scan_id, symbols)
+            else:
+                self.market_data.start_scan()
+                all_signals = self.scan_symbols(symbols)
             
             # Tüm sinyalleri kalite puanına göre sırala
             all_signals.sort(key=lambda x: x['quality_score'], reverse=True)
             
-            logger.info(f"[OK] Toplam {len(all_signals)} sinyal tespit edildi")
+            logger.info("[OK] Toplam %s sinyal tespit edildi", len(all_signals))
+            signals_found = len(all_signals)
             
             # Her sembol için en iyi sinyali seç
             best_signals_by_symbol = {}
@@ -113,7 +123,7 @@ class KriptoMotoru:
                 if symbol not in best_signals_by_symbol:
                     best_signals_by_symbol[symbol] = signal
             
-            logger.info(f"[OK] {len(best_signals_by_symbol)} sembol için en iyi sinyaller seçildi")
+            logger.info("[OK] %s sembol için en iyi sinyaller seçildi", len(best_signals_by_symbol))
             
             # Gönderilecek sinyalleri filtrele
             signals_to_send = []
@@ -122,7 +132,7 @@ class KriptoMotoru:
                 if self.should_send_signal(symbol, signal):
                     signals_to_send.append(signal)
             
-            logger.info(f"[OK] Toplam {len(signals_to_send)} sinyal gönderilecek")
+            logger.info("[OK] Toplam %s sinyal gönderilecek", len(signals_to_send))
             
             # Sinyal türlerine göre dağılımı logla
             self.log_signal_distribution(signals_to_send)
@@ -130,16 +140,211 @@ class KriptoMotoru:
             # Diğer tespit edilen sinyalleri de logla
             self.log_other_signals(all_signals, signals_to_send)
             
-            # Sinyalleri 2 dakika arayla gönder
-            self.send_signals_with_delay(signals_to_send, delay_seconds=120)
+            # Sinyalleri hız sınırlı gönderim kuyruğu üzerinden gönder
+            sent_signals = self.send_signals(signals_to_send)
+            signals_sent = len(sent_signals)
+            
+            # Tüm tespit edilen sinyalleri gönderim durumlarıyla geçmişe kaydet
+            self.signal_history.record_signals(all_signals, scan_id, sent_signals)
+            
+            # Yeni gönderilen sinyaller sonraki taramalarda takip edilsin
+            self.outcome_tracker.add(sent_signals)
             
-            # Gönderilen sinyalleri kaydet
-            self.save_sent_signals()
+            # Bekleme süresi dolmuş kayıtları temizle
+            self.cooldown_store.purge_expired()
             
             logger.info("[OK] Tarama tamamlandı")
+            scan_outcome = "ok"
             
         except Exception as e:
-            logger.error(f"Tarama sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Tarama sırasında hata: %s", e, exc_info=True)
+        finally:
+            profiler.end_scan()
+            metrics.SCAN_DURATION.observe(time.perf_counter() - scan_start)
+            metrics.SCANS.labels(scan_outcome).inc()
+            metrics.export_textfile(self.config)
+            journal.event("scan", duration=time.perf_counter() - scan_start, outcome=scan_outcome,
+                          signals=signals_found, sent=signals_sent)
+            journal.flush()
+    
+    def scan_symbols(self, symbols):
+        """
+        Sembolleri tüm zaman dilimlerinde tarar
+        
+        Args:
+            symbols (list): Taranacak semboller
+            
+        Returns:
+            list: Tespit edilen sinyaller (zaman dilimi ve sembol sırasıyla)
+        """
+        all_signals = []  # Tüm zaman dilimleri için sinyalleri topla
+        
+        # Desteklenen tüm zaman dilimleri için tarama yap
+        for timeframe in self.config.TIMEFRAMES:
+            logger.info("[SCAN] %s zaman dilimi için tarama başlatılıyor", timeframe)
+            
+            # Tüm sembolleri tara
+            for symbol in symbols:
+                # Hacim kontrolü
+                if not self.check_volume_threshold(symbol, timeframe):
+                    logger.info("[X] %s hacim eşiğinin altında, atlanıyor", symbol)
+                    continue
+                
+                # Veri çek
+                stage_start = time.perf_counter()
+                df = self.market_data.get_klines(symbol, timeframe, self.history_limit)
+                if df is None or df.empty:
+                    journal.event("fetch", symbol, timeframe, time.perf_counter() - stage_start, "empty")
+                    logger.warning("[X] %s için veri alınamadı, atlanıyor", symbol)
+                    continue
+                journal.event("fetch", symbol, timeframe, time.perf_counter() - stage_start, rows=len(df))
+                
+                # Açık sinyallerin TP/SL sonuçları aynı mumlarla arka planda kontrol edilir
+                self.outcome_tracker.submit(symbol, timeframe, df)
+                
+                # Sinyalleri analiz et
+                logger.info("[SCAN] %s %s için sinyal analizi yapılıyor...", symbol, timeframe)
+                stage_start = time.perf_counter()
+                signals = self.signal_analyzer.analyze(symbol, timeframe, df)
+                journal.event("analyze", symbol, timeframe, time.perf_counter() - stage_start,
+                              "signal" if signals else "none", signals=len(signals),
+                              best_quality=max((s['quality_score'] for s in signals), default=None))
+                
+                if signals:
+                    logger.info("[OK] %s %s için %s sinyal tespit edildi", symbol, timeframe, len(signals))
+                    
+                    # Üst zaman dilimi trendiyle uyumlu sinyalleri işaretle (türetilmiş veriden)
+                    higher_timeframes = self.confluence.higher_timeframes(timeframe)
+                    if higher_timeframes:
+                        frames = {tf: self.market_data.get_klines(symbol, tf, self.confluence.min_history())
+                                  for tf in higher_timeframes}
+                        self.confluence.analyze(symbol, timeframe, signals, frames)
+                    
+                    # Sinyal mumunun tespit anındaki uçları (sonuç takibi aynı mumda bunların ötesine bakar)
+                    candle_time, candle_high, candle_low = df.index[-1], float(df['high'].iat[-1]), float(df['low'].iat[-1])
+                    for signal in signals:
+                        if signal.get('timestamp') == candle_time:
+                            signal['candle_high'] = candle_high
+                            signal['candle_low'] = candle_low
+                    
+                    all_signals.extend(signals)
+                    for signal in signals:
+                        metrics.SIGNALS_EMITTED.labels(signal['signal_type'], timeframe).inc()
+                else:
+                    logger.info("[X] %s %s için sinyal tespit edilemedi", symbol, timeframe)
+            
+            # API rate limit aşımını önlemek için kısa bir bekleme
+            with profiler.stage("scan.timeframe_pause"):
+                time.sleep(1)
+        
+        return all_signals
+    
+    def collect_shards(self, scan_id, symbols):
+        """
+        Taramayı işçilere dağıtır ve parçaların sinyallerini toplar (toplayıcı rolü)
+        
+        Canlı işçi yoksa semboller yerelde taranır. Süresinde tamamlanmayan
+        parçaların sinyalleri bu taramada atlanır.
+        
+        Args:
+            scan_id (str): Tarama kimliği
+            symbols (list): Taranacak semboller
+            
+        Returns:
+            list: Tüm parçaların sinyalleri (tekli taramayla aynı sırada)
+        """
+        workers = self.sharding['workers'] or self.scan_queue.live_workers(self.sharding['worker_ttl'])
+        if not workers:
+            logger.warning("[X] Canlı işçi bulunamadı, semboller yerelde taranıyor")
+            self.market_data.start_scan()
+            return self.scan_symbols(symbols)
+        
+        self.scan_queue.publish_scan(scan_id, symbols, workers)
+        logger.info("[SCAN] %s sembol %s işçiye dağıtıldı: %s", len(symbols), len(workers), ', '.join(workers))
+        
+        with profiler.stage("shards.wait"):
+            results = self.scan_queue.wait_results(scan_id, workers, self.sharding['result_timeout'],
+                                                   self.sharding['poll_interval'])
+        
+        missing = sorted(set(workers) - set(results))
+        if missing:
+            logger.warning("[X] %s işçisinin parçası süresinde tamamlanmadı, sinyalleri atlandı", ', '.join(missing))
+        journal.event("shards", outcome="partial" if missing else "ok", workers=len(workers), missing=missing)
+        
+        # Tekli taramayla aynı sıra: zaman dilimi, sonra sembol listesindeki konum
+        timeframe_order = {timeframe: index for index, timeframe in enumerate(self.config.TIMEFRAMES)}
+        symbol_order = {symbol: index for index, symbol in enumerate(symbols)}
+        all_signals = [signal for worker in sorted(results) for signal in results[worker]]
+        all_signals.sort(key=lambda s: (timeframe_order.get(s['timeframe'], 0), symbol_order.get(s['symbol'], 0)))
+        
+        self.scan_queue.purge(self.sharding['retention'])
+        return all_signals
+    
+    def scan_shard(self, scan_id, symbols, workers, shard_owner=None):
+        """
+        Toplayıcının taramasında bir parçanın sembollerini tarar ve sonuçları kuyruğa yazar
+        
+        Args:
+            scan_id (str): Toplayıcının tarama kimliği
+            symbols (list): Taramanın tüm sembolleri
+            workers (list): Taramadaki işçiler
+            shard_owner (str, optional): Parçanın halkadaki sahibi. Belirtilmezse bu işçi.
+        """
+        shard_owner = shard_owner or self.worker_id
+        ring = HashRing(workers, self.sharding['virtual_nodes'])
+        shard = ring.assign(symbols).get(shard_owner, [])
+        
+        profiler.start_scan()
+        journal.start_scan(scan_id)
+        self.market_data.start_scan()
+        scan_start = time.perf_counter()
+        signals = []
+        try:
+            if shard_owner != self.worker_id:
+                logger.warning("[SCAN] %s işçisinin kiralaması dolan parçası devralındı (%s)", shard_owner, scan_id)
+            logger.info("[SCAN] %s taramasında %s/%s sembol taranıyor", scan_id, len(shard), len(symbols))
+            # Toplayıcının gönderdiği yeni sinyaller sonuç takibine alınsın
+            self.outcome_tracker.refresh()
+            signals = self.scan_symbols(shard)
+        except Exception as e:
+            logger.error("Parça taranırken hata: %s", e, exc_info=True)
+        finally:
+            # Hata durumunda da boş sonuç yazılır; toplayıcı zaman aşımını beklemez
+            self.scan_queue.submit_results(scan_id, shard_owner, signals)
+            profiler.end_scan()
+            journal.event("shard", duration=time.perf_counter() - scan_start, symbols=len(shard), signals=len(signals))
+            journal.flush()
+    
+    def run_worker(self):
+        """İşçi döngüsü: kuyruktaki taramaları bekler ve kendi parçasını (veya sahibi çökmüş parçaları) tarar"""
+        logger.info("[START] İşçi başlatıldı: %s", self.worker_id)
+        lease = self.sharding['claim_lease']
+        
+        # Uzun parçalar sırasında da canlılık bildir ve sahiplenilen parçaların kiralamasını uzat
+        def heartbeat_loop():
+            while True:
+                try:
+                    self.scan_queue.heartbeat(self.worker_id)
+                    self.scan_queue.renew_leases(self.worker_id, lease)
+                except Exception as e:
+                    logger.warning("İşçi canlılık kaydı yazılamadı: %s", e)
+                time.sleep(self.sharding['poll_interval'])
+        
+        threading.Thread(target=heartbeat_loop, name="shard-heartbeat", daemon=True).start()
+        
+        while True:
+            try:
+                for scan_id, symbols, workers, shard_owner in self.scan_queue.pending_shards(
+                        self.worker_id, self.sharding['result_timeout'], lease):
+                    if self.scan_queue.claim(scan_id, shard_owner, self.worker_id, lease):
+                        self.scan_shard(scan_id, symbols, workers, shard_owner)
+                time.sleep(self.sharding['poll_interval'])
+            except KeyboardInterrupt:
+                logger.info("[STOP] İşçi kullanıcı tarafından durduruldu")
+                break
+            except Exception as e:
+                logger.error("[X] İşçi döngüsünde beklenmeyen hata: %s", e, exc_info=True)
+                time.sleep(60)
     
     def log_signal_distribution(self, signals):
         """Sinyal türlerine göre dağılımı loglar"""
@@ -158,10 +363,10 @@ class KriptoMotoru:
             # Sinyal türlerini logla
             logger.info("[STATS] Sinyal Türlerine Göre Dağılım:")
             for signal_type, count in signal_types.items():
-                logger.info(f"   {signal_type}: {count} adet")
+                logger.info("   %s: %s adet", signal_type, count)
         
         except Exception as e:
-            logger.error(f"Sinyal dağılımı loglanırken hata: {str(e)}", exc_info=True)
+            logger.error("Sinyal dağılımı loglanırken hata: %s", e, exc_info=True)
     
     def log_other_signals(self, all_signals, signals_to_send):
         """Gönderilmeyen diğer sinyalleri loglar"""
@@ -179,77 +384,110 @@ class KriptoMotoru:
             if other_signals:
                 logger.info("[SCAN] Diğer Tespit Edilen Sinyaller:")
                 for i, signal in enumerate(other_signals[:10]):
-                    logger.info(f"   [{signal['symbol']}] {signal['signal_type']} ({signal['timeframe']}) - Kalite: {signal['quality_score']}/100")
+                    logger.info("   [%s] %s (%s) - Kalite: %s/100", signal['symbol'], signal['signal_type'], signal['timeframe'], signal['quality_score'])
         
         except Exception as e:
-            logger.error(f"Diğer sinyaller loglanırken hata: {str(e)}", exc_info=True)
+            logger.error("Diğer sinyaller loglanırken hata: %s", e, exc_info=True)
     
-    def send_signals_with_delay(self, signals, delay_seconds=120):
-        """Sinyalleri belirli bir gecikmeyle gönderir"""
-        signals_sent = 0
+    def send_signals(self, signals):
+        """
+        Sinyalleri gönderim kuyruğuna ekler ve sonuçlarını bekler
+        
+        Mesajlar Telegram'ın sohbet ve genel hız sınırlarına göre gönderim
+        kuyruğu tarafından aralıklandırılır; uyarılar rutin sinyallerden önce gider.
+        Gönderimler en fazla send_timeout saniye beklenir; süresinde gönderilemeyen
+        sinyaller iptal edilir ve gönderilmemiş sayılır.
         
-        for signal in signals:
+        Returns:
+            list: Başarıyla gönderilen sinyaller
+        """
+        sent_signals = []
+        
+        # Öncelikli sinyallerin grafikleri önce hazırlansın
+        ordered_signals = sorted(signals, key=self.signal_sender.get_priority)
+        
+        # Grafikler sırayla hazırlanırken önceki sinyaller gönderilmeye devam eder
+        with profiler.stage("telegram.submit"):
+            pending = [(signal, self.signal_sender.submit_signal(signal)) for signal in ordered_signals]
+        
+        deadline = time.monotonic() + self.config.TELEGRAM_RATE_LIMITS['send_timeout']
+        for signal, future in pending:
             symbol = signal['symbol']
             signal_type = signal['signal_type']
             
-            # Sinyali gönder
-            success = self.signal_sender.send_signal(signal)
+            with profiler.stage("telegram.wait"):
+                try:
+                    sent = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    # Kuyrukta bekleyen mesajlar gönderilmez
+                    future.cancel()
+                    logger.warning("[X] %s için %s sinyali gönderim süresinde gönderilemedi", symbol, signal_type)
+                    sent = False
+                except Exception as e:
+                    logger.error("[X] %s için %s sinyali gönderilemedi: %s", symbol, signal_type, e)
+                    sent = False
+            
+            metrics.SIGNALS_SENT.labels("success" if sent else "failure").inc()
+            journal.event("send", symbol, signal['timeframe'], outcome="sent" if sent else "failed",
+                          signal_type=signal_type, quality=signal['quality_score'])
             
-            if success:
-                signals_sent += 1
+            if sent:
+                sent_signals.append(signal)
                 self.update_sent_signals(symbol, signal)
-                logger.info(f"[OK] {symbol} için {signal_type} sinyali başarıyla gönderildi")
+                logger.info("[OK] %s için %s sinyali başarıyla gönderildi", symbol, signal_type)
             else:
-                logger.error(f"[X] {symbol} için {signal_type} sinyali gönderilirken hata oluştu")
-            
-            # Son sinyal değilse bekle
-            if signals_sent < len(signals):
-                logger.info(f"[TIME] Bir sonraki sinyal için {delay_seconds} saniye bekleniyor...")
-                time.sleep(delay_seconds)
+                logger.error("[X] %s için %s sinyali gönderilirken hata oluştu", symbol, signal_type)
         
-        logger.info(f"[OK] Toplam {signals_sent} sinyal Telegram'a gönderildi")
+        logger.info("[OK] Toplam %s sinyal Telegram'a gönderildi", len(sent_signals))
+        return sent_signals
     
-    def check_volume_threshold(self, symbol):
+    def check_volume_threshold(self, symbol, timeframe=None):
         """Sembolün yeterli hacme sahip olup olmadığını kontrol eder"""
         try:
-            volume_data = self.data_fetcher.get_24h_volume(symbol)
+            stage_start = time.perf_counter()
+            # Evren etkinse hacim toplu ticker verisinden okunur (sembol başına istek yapılmaz)
+            volume_data = self.symbol_universe.volume(symbol)
+            if volume_data is None:
+                volume_data = self.data_fetcher.get_24h_volume(symbol)
             is_above_threshold = volume_data >= self.config.MIN_VOLUME_THRESHOLD
+            journal.event("volume", symbol, timeframe, time.perf_counter() - stage_start,
+                          "pass" if is_above_threshold else "below_threshold", volume=volume_data)
             
             if is_above_threshold:
-                logger.info(f"[OK] {symbol} hacim kontrolü başarılı: {volume_data:.2f} USDT")
+                logger.info("[OK] %s hacim kontrolü başarılı: %.2f USDT", symbol, volume_data)
             else:
-                logger.info(f"[X] {symbol} hacim kontrolü başarısız: {volume_data:.2f} USDT < {self.config.MIN_VOLUME_THRESHOLD} USDT")
+                logger.info("[X] %s hacim kontrolü başarısız: %.2f USDT < %s USDT", symbol, volume_data, self.config.MIN_VOLUME_THRESHOLD)
                 
             return is_above_threshold
         except Exception as e:
-            logger.error(f"[X] {symbol} için hacim kontrolü sırasında hata: {str(e)}")
+            journal.event("volume", symbol, timeframe, outcome="error", error=str(e))
+            logger.error("[X] %s için hacim kontrolü sırasında hata: %s", symbol, e)
             return False
     
     def should_send_signal(self, symbol, signal):
         """Sinyalin gönderilip gönderilmeyeceğini belirler (spam önleme)"""
         signal_type = signal['signal_type']
-        current_time = time.time()
         
-        # Sembol ve sinyal türü için son gönderim zamanını kontrol et
-        key = f"{symbol}_{signal_type}"
-        if key in self.sent_signals:
-            last_sent_time = self.sent_signals[key]
-            # Belirli süre içinde (config'de tanımlı) aynı sinyali tekrar gönderme
-            if current_time - last_sent_time < self.config.SIGNAL_COOLDOWN:
-                logger.info(f"[X] {symbol} için {signal_type} sinyali yakın zamanda gönderildi, atlanıyor")
-                return False
+        # Belirli süre içinde (config'de tanımlı) aynı sinyali tekrar gönderme
+        if self.cooldown_store.is_cooling_down(symbol, signal_type):
+            logger.info("[X] %s için %s sinyali yakın zamanda gönderildi, atlanıyor", symbol, signal_type)
+            journal.event("select", symbol, signal['timeframe'], outcome="cooldown", signal_type=signal_type)
+            return False
         
         # Sinyal kalitesini kontrol et
         if signal['quality_score'] < self.config.MIN_SIGNAL_QUALITY:
-            logger.info(f"[X] {symbol} için {signal_type} sinyali kalite eşiğinin altında ({signal['quality_score']}), atlanıyor")
+            logger.info("[X] %s için %s sinyali kalite eşiğinin altında (%s), atlanıyor", symbol, signal_type, signal['quality_score'])
+            journal.event("select", symbol, signal['timeframe'], outcome="low_quality",
+                          signal_type=signal_type, quality=signal['quality_score'])
             return False
-            
+        
+        journal.event("select", symbol, signal['timeframe'], outcome="selected",
+                      signal_type=signal_type, quality=signal['quality_score'])
         return True
     
     def update_sent_signals(self, symbol, signal):
         """Gönderilen sinyalleri günceller"""
-        key = f"{symbol}_{signal['signal_type']}"
-        self.sent_signals[key] = time.time()
+        self.cooldown_store.mark_sent(symbol, signal['signal_type'])
     
     def schedule_tasks(self):
         """Zamanlanmış görevleri ayarlar"""
@@ -267,7 +505,7 @@ class KriptoMotoru:
                 logger.info("[STOP] Bot kullanıcı tarafından durduruldu")
                 break
             except Exception as e:
-                logger.error(f"[X] Beklenmeyen hata: {str(e)}", exc_info=True)
+                logger.error("[X] Beklenmeyen hata: %s", e, exc_info=True)
                 time.sleep(60)  # Hata durumunda 1 dakika bekle ve tekrar dene
 
 def main():
@@ -275,12 +513,16 @@ def main():
     try:
         logger.info("[START] Kripto Teknik Analiz Botu başlatılıyor...")
         bot = KriptoMotoru()
+        # İşçiler toplayıcının taramalarını bekler
+        if bot.role == 'worker':
+            bot.run_worker()
+            return
         # İlk taramayı hemen yap
         bot.run_scan()
         # Zamanlanmış görevleri başlat
         bot.schedule_tasks()
     except Exception as e:
-        logger.critical(f"[X] Kritik hata: {str(e)}", exc_info=True)
+        logger.critical("[X] Kritik hata: %s", e, exc_info=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
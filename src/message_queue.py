@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Mesaj Gönderim Kuyruğu Modülü
+"""
+import time
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from utils.logger import setup_logger
+from utils.metrics import QUEUE_DEPTH
+
+# Logger kurulumu
+logger = setup_logger("message_queue")
+
+# Gönderim öncelikleri (küçük değer önce gönderilir)
+PRIORITY_ALERT = 0
+PRIORITY_SIGNAL = 10
+
+class TokenBucket:
+    """Belirli bir hızda dolan ve ani gönderimlere izin veren token kovası"""
+
+    def __init__(self, rate, capacity):
+        """
+        Args:
+            rate (float): Saniyede eklenen token sayısı
+            capacity (float): Kovanın alabileceği en fazla token
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        """Geçen süreye göre tokenları yeniler"""
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def wait_time(self, now):
+        """
+        Bir token alınabilmesi için beklenmesi gereken süreyi döndürür
+
+        Returns:
+            float: Saniye (0 ise hemen alınabilir)
+        """
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self, now):
+        """Bir token harcar"""
+        self._refill(now)
+        self.tokens -= 1
+
+class _Job:
+    """Kuyruktaki tek bir gönderim işi"""
+
+    __slots__ = ('chat_id', 'func', 'args', 'future')
+
+    def __init__(self, chat_id, func, args, future):
+        self.chat_id = chat_id
+        self.func = func
+        self.args = args
+        self.future = future
+
+class DeliveryQueue:
+    """
+    Telegram mesajlarını sohbet bazlı ve genel hız sınırlarına uyarak gönderen kuyruk
+
+    Her sohbet için ayrı bir token kovası tutulur ve aynı sohbete aynı anda tek
+    mesaj gönderilir (sıra korunur). Farklı sohbetlere giden mesajlar iş
+    parçacığı havuzunda eşzamanlı gönderilir. Bekleyen işler önceliğe, sonra
+    ekleniş sırasına göre seçilir.
+    """
+
+    def __init__(self, config):
+        """Hız sınırlarını ve gönderim iş parçacıklarını ayarlar"""
+        self.limits = config.TELEGRAM_RATE_LIMITS
+        self.global_bucket = TokenBucket(self.limits['global_per_second'], self.limits['global_per_second'])
+        self._chat_buckets = {}
+        self._busy_chats = set()
+        self._pending = []  # (öncelik, sıra, iş) heap
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self._executor = ThreadPoolExecutor(max_workers=self.limits['workers'], thread_name_prefix="telegram-send")
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="telegram-dispatch", daemon=True)
+        self._dispatcher.start()
+
+        QUEUE_DEPTH.set_function(self.pending_count)
+
+        logger.info("Mesaj gönderim kuyruğu başlatıldı")
+
+    def submit(self, chat_id, func, *args, priority=PRIORITY_SIGNAL):
+        """
+        Gönderim işini kuyruğa ekler
+
+        Args:
+            chat_id (str): Hedef chat ID
+            func (callable): Gönderimi yapan fonksiyon
+            *args: Fonksiyon argümanları
+            priority (int): Gönderim önceliği
+
+        Returns:
+            concurrent.futures.Future: Fonksiyonun dönüş değerini taşıyan future
+        """
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Mesaj gönderim kuyruğu kapatıldı")
+            heapq.heappush(self._pending, (priority, next(self._sequence), _Job(str(chat_id), func, args, future)))
+            self._condition.notify()
+        return future
+
+    def pending_count(self):
+        """Kuyrukta bekleyen iş sayısını döndürür"""
+        with self._condition:
+            return len(self._pending)
+
+    def shutdown(self, wait=True):
+        """
+        Kuyruğu kapatır
+
+        wait=True ise bekleyen işlerin bitmesini bekler; aksi halde henüz
+        başlamamış işlerin future'ları hatayla sonlandırılır (sonucunu bekleyen
+        kalmaz).
+        """
+        with self._condition:
+            if wait:
+                while self._pending or self._busy_chats:
+                    self._condition.wait(timeout=0.5)
+            self._closed = True
+            abandoned = [job for _, _, job in self._pending]
+            self._pending = []
+            self._condition.notify_all()
+
+        for job in abandoned:
+            # İptal edilmiş future'a sonuç yazılamaz
+            if job.future.set_running_or_notify_cancel():
+                job.future.set_exception(RuntimeError("Mesaj gönderim kuyruğu kapatıldı"))
+        if abandoned:
+            logger.warning("Gönderim kuyruğu kapatıldı, %s mesaj gönderilmedi", len(abandoned))
+        self._executor.shutdown(wait=wait)
+
+    def _chat_bucket(self, chat_id):
+        """Sohbete ait token kovasını döndürür"""
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            # Grup ve kanallar (negatif ID veya @kullanıcı adı) için dakikalık sınır uygulanır
+            if chat_id.startswith('-') or chat_id.startswith('@'):
+                bucket = TokenBucket(self.limits['group_per_minute'] / 60.0, self.limits['group_burst'])
+            else:
+                bucket = TokenBucket(self.limits['private_chat_per_second'], 1)
+            self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    def _next_ready_job(self, now):
+        """
+        Şu anda gönderilebilecek en öncelikli işi seçer
+
+        Returns:
+            tuple: (iş girdisi veya None, bir sonraki kontrol için bekleme süresi)
+        """
+        global_wait = self.global_bucket.wait_time(now)
+        if global_wait > 0:
+            return None, global_wait
+
+        wait = None
+        blocked_chats = set()
+        for entry in sorted(self._pending):
+            chat_id = entry[2].chat_id
+            if chat_id in blocked_chats or chat_id in self._busy_chats:
+                continue
+
+            chat_wait = self._chat_bucket(chat_id).wait_time(now)
+            if chat_wait > 0:
+                # Aynı sohbetin sonraki işleri de bu işi beklemeli
+                blocked_chats.add(chat_id)
+                wait = chat_wait if wait is None else min(wait, chat_wait)
+                continue
+
+            return entry, 0.0
+
+        return None, wait
+
+    def _dispatch_loop(self):
+        """Hazır işleri seçip gönderim havuzuna aktarır"""
+        with self._condition:
+            while not self._closed:
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+
+                now = time.monotonic()
+                entry, wait = self._next_ready_job(now)
+                if entry is None:
+                    # Bekleme süresi yoksa meşgul bir sohbetin bitmesi beklenir
+                    self._condition.wait(timeout=wait)
+                    continue
+
+                self._pending.remove(entry)
+                heapq.heapify(self._pending)
+
+                job = entry[2]
+                self.global_bucket.consume(now)
+                self._chat_bucket(job.chat_id).consume(now)
+                self._busy_chats.add(job.chat_id)
+                self._executor.submit(self._run_job, job)
+
+    def _run_job(self, job):
+        """İşi çalıştırır ve sonucunu future'a yazar"""
+        try:
+            if job.future.set_running_or_notify_cancel():
+                try:
+                    job.future.set_result(job.func(*job.args))
+                except Exception as e:
+                    logger.error("Mesaj gönderim işi hata verdi (%s): %s", job.chat_id, e, exc_info=True)
+                    job.future.set_exception(e)
+        finally:
+            with self._condition:
+                self._busy_chats.discard(job.chat_id)
+                self._condition.notify_all()
+
+def gather_results(futures):
+    """
+    Birden fazla gönderim future'ını tek bir future'da toplar
+
+    İptal edilen veya hata veren gönderim başarısız sayılır. Toplu future iptal
+    edilirse henüz başlamamış gönderimler de iptal edilir.
+
+    Args:
+        futures (list): Sonucu bool olan future listesi
+
+    Returns:
+        concurrent.futures.Future: Tüm gönderimler başarılıysa True
+    """
+    combined = Future()
+    if not futures:
+        combined.set_result(True)
+        return combined
+
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def _on_done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] > 0:
+                return
+        results = [not f.cancelled() and f.exception() is None and bool(f.result()) for f in futures]
+        # Toplu future iptal edildiyse sonuç yazılmaz
+        if combined.set_running_or_notify_cancel():
+            combined.set_result(all(results))
+
+    def _on_combined_done(_):
+        if combined.cancelled():
+            for future in futures:
+                future.cancel()
+
+    for future in futures:
+        future.add_done_callback(_on_done)
+    combined.add_done_callback(_on_combined_done)
+
+    return combined
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sinyal Sonuç Takip Modülü
+
+Gönderilen sinyallerin take profit veya stop loss seviyesine ulaşıp
+ulaşmadığını, tarama sırasında zaten çekilmiş mumlar üzerinden izler.
+Ek API çağrısı yapılmaz: her sembol/zaman dilimi için açık sinyaller
+NumPy dizilerinde tutulur ve yeni mumların high/low değerleriyle tek bir
+vektörel karşılaştırmada kontrol edilir. Tarama mumları kuyruğa bırakır,
+kontrol ve veritabanı yazımı arka plan iş parçacığında yapılır.
+
+Sinyal, mumu henüz kapanmamışken tespit edilir. Mumun o andaki en yüksek ve
+en düşük değeri sinyalle birlikte saklanır (candle_high, candle_low); aynı
+mumda yalnızca bu değerlerin ötesine geçen fiyatlar sinyalden sonra oluşmuş
+sayılır. Mumun tespit öncesi aralığının içinde kalan bir seviyeye sonradan
+dokunulması mum verisinden ayırt edilemez; bu durumda sonuç sonraki mumlardan
+çözülür.
+"""
+import queue
+import threading
+import numpy as np
+import pandas as pd
+from utils.logger import setup_logger
+from utils.instrumentation import timed
+
+# Logger kurulumu
+logger = setup_logger("outcome_tracker")
+
+OUTCOME_TAKE_PROFIT = "take_profit"
+OUTCOME_STOP_LOSS = "stop_loss"
+OUTCOME_EXPIRED = "expired"
+
+def resolve_outcomes(times, highs, lows, start, is_long, stop_loss, take_profit, max_bars,
+                     start_high=None, start_low=None):
+    """
+    Sinyallerin TP/SL sonuçlarını tek bir (sinyal x mum) karşılaştırmasıyla çözer
+
+    Sinyal mumundan sonraki her mumda long sinyaller için high >= TP veya
+    low <= SL, short sinyaller için low <= TP veya high >= SL aranır. Aynı
+    mumda iki seviyeye de dokunulduysa hangisinin önce geldiği bilinemez;
+    temkinli davranılıp stop loss sayılır.
+
+    Sinyal mumunun kendisi yalnızca tespit anındaki değerleri (start_high,
+    start_low) verildiyse kontrol edilir: mumun high değeri start_high'ın,
+    low değeri start_low'un ötesine geçtiyse bu uç sinyalden sonra oluşmuştur.
+    Değer bilinmiyorsa (NaN) sinyal mumu atlanır.
+
+    Args:
+        times (numpy.ndarray): Mum açılış zamanları (artan)
+        highs (numpy.ndarray): En yüksek fiyatlar
+        lows (numpy.ndarray): En düşük fiyatlar
+        start (numpy.ndarray): Sinyal mumlarının zamanları
+        is_long (numpy.ndarray): Alış sinyali mi?
+        stop_loss (numpy.ndarray): Stop loss seviyeleri
+        take_profit (numpy.ndarray): Take profit seviyeleri
+        max_bars (int): Bu kadar mumda sonuçlanmayan sinyal "expired" sayılır
+        start_high (numpy.ndarray, optional): Sinyal mumunun tespit anındaki en yüksek değeri
+        start_low (numpy.ndarray, optional): Sinyal mumunun tespit anındaki en düşük değeri
+
+    Returns:
+        tuple: (sonuç dizisi - OUTCOME_* veya None, sonuç mumunun indeksi, sinyalden sonra geçen mum sayısı)
+    """
+    count = len(start)
+    outcomes = np.full(count, None, dtype=object)
+    hit_bar = np.full(count, len(times) - 1)
+    bars = np.zeros(count, dtype=int)
+    if count == 0 or len(times) == 0:
+        return outcomes, hit_bar, bars
+
+    long = is_long[:, None]
+    tp = take_profit[:, None]
+    sl = stop_loss[:, None]
+
+    after = times[None, :] > start[:, None]
+    high = np.broadcast_to(highs[None, :], after.shape)
+    low = np.broadcast_to(lows[None, :], after.shape)
+    if start_high is not None and start_low is not None:
+        # Sinyal mumunda yalnızca tespit anındaki aralığın dışına taşan uçlar
+        # (NaN karşılaştırmaları False olduğu için değeri bilinmeyen mum atlanır)
+        own = times[None, :] == start[:, None]
+        high = np.where(own & ~(highs[None, :] > start_high[:, None]), -np.inf, high)
+        low = np.where(own & ~(lows[None, :] < start_low[:, None]), np.inf, low)
+        eligible = after | own
+    else:
+        eligible = after
+    hit_tp = eligible & np.where(long, high >= tp, low <= tp)
+    hit_sl = eligible & np.where(long, low <= sl, high >= sl)
+
+    no_hit = len(times)
+    first_tp = np.where(hit_tp.any(axis=1), hit_tp.argmax(axis=1), no_hit)
+    first_sl = np.where(hit_sl.any(axis=1), hit_sl.argmax(axis=1), no_hit)
+    bars_since = after.sum(axis=1)
+
+    resolved_tp = first_tp < first_sl
+    resolved_sl = (first_sl <= first_tp) & (first_sl < no_hit)
+    expired = ~(resolved_tp | resolved_sl) & (bars_since >= max_bars)
+
+    outcomes[resolved_tp] = OUTCOME_TAKE_PROFIT
+    outcomes[resolved_sl] = OUTCOME_STOP_LOSS
+    outcomes[expired] = OUTCOME_EXPIRED
+
+    hit = resolved_tp | resolved_sl
+    hit_bar[hit] = np.minimum(first_tp, first_sl)[hit]
+    first_bar = np.searchsorted(times, start, side='right')
+    bars = np.where(hit, hit_bar - first_bar + 1, bars_since)
+    return outcomes, hit_bar, bars
+
+class OutcomeTracker:
+    """Açık sinyallerin TP/SL sonuçlarını mum verisinden çözen sınıf"""
+
+    def __init__(self, config, history):
+        """
+        Açık sinyalleri geçmiş veritabanından yükler ve arka plan iş parçacığını başlatır
+
+        Args:
+            config (Config): Bot konfigürasyonu
+            history (SignalHistory): Sinyal geçmişi (açık sinyaller ve sonuçların yazıldığı yer)
+        """
+        self.config = config
+        self.history = history
+        self.settings = config.OUTCOME_TRACKER
+        self.enabled = self.settings.get('enabled', True) and history.enabled
+        self.max_bars = self.settings.get('max_bars', 120)
+
+        # (symbol, timeframe) -> açık sinyal dizileri
+        self._open = {}
+        # İndekse alınmış en büyük sinyal kimliği (refresh yalnızca sonrakileri okur)
+        self._last_id = 0
+        # İndeksin okunup yazıldığı her işlem (yeniden yükleme, çözüm) bu kilidi tutar
+        self._lock = threading.Lock()
+
+        # Taramanın bıraktığı (symbol, timeframe, mumlar) işleri
+        self._queue = queue.Queue()
+        self._thread = None
+
+        if self.enabled:
+            self.reload()
+            if self.settings.get('background', True):
+                self._thread = threading.Thread(target=self._worker, name="outcome-tracker", daemon=True)
+                self._thread.start()
+
+    def reload(self):
+        """Açık sinyal indeksini veritabanından baştan oluşturur (başlangıçta)"""
+        if not self.enabled:
+            return
+
+        # Sorgu ve değişim aynı kilit altında: eşzamanlı bir çözümün sonucu kaybolmaz
+        with self._lock:
+            open_signals = self.history.get_open_signals()
+            self._open = {}
+            self._last_id = 0
+            self._append(open_signals)
+
+        logger.info("%s açık sinyal takip ediliyor", len(open_signals))
+
+    def add(self, signals):
+        """
+        Yeni gönderilen sinyalleri veritabanını okumadan indekse ekler
+
+        Args:
+            signals (list): Geçmişe kaydedilmiş (history_id alanı yazılmış) gönderilen sinyaller
+
+        Returns:
+            int: İndekse eklenen sinyal sayısı
+        """
+        if not self.enabled or not signals:
+            return 0
+
+        # get_open_signals ile aynı koşul: seviyeleri ve mumu bilinen kayıtlı sinyaller
+        rows = [(signal['history_id'], signal['symbol'], signal['timeframe'], signal['stop_loss'],
+                 signal['take_profit'], int(pd.Timestamp(signal['timestamp']).timestamp() * 1000),
+                 signal.get('candle_high'), signal.get('candle_low'))
+                for signal in signals
+                if signal.get('history_id') is not None and not pd.isna(signal.get('timestamp'))
+                and not pd.isna(signal.get('stop_loss')) and not pd.isna(signal.get('take_profit'))]
+        if not rows:
+            return 0
+
+        frame = pd.DataFrame(rows, columns=['id', 'symbol', 'timeframe', 'stop_loss', 'take_profit',
+                                            'candle_time', 'candle_high', 'candle_low'])
+        with self._lock:
+            self._append(frame)
+        logger.info("%s yeni sinyal sonuç takibine alındı", len(rows))
+        return len(rows)
+
+    def refresh(self):
+        """
+        Başka bir süreçte kaydedilen yeni açık sinyalleri indekse ekler
+
+        Parçalı taramada sinyalleri toplayıcı gönderir; işçiler yalnızca son
+        bilinen kimlikten sonraki kayıtları okur.
+
+        Returns:
+            int: İndekse eklenen sinyal sayısı
+        """
+        if not self.enabled:
+            return 0
+
+        with self._lock:
+            new_signals = self.history.get_open_signals(after_id=self._last_id)
+            self._append(new_signals)
+
+        if len(new_signals):
+            logger.info("%s yeni sinyal sonuç takibine alındı", len(new_signals))
+        return len(new_signals)
+
+    def _append(self, signals):
+        """Sinyal satırlarını (symbol, timeframe) dizilerinin sonuna ekler (kilit çağıranda)"""
+        for key, group in signals.groupby(['symbol', 'timeframe'], sort=False):
+            new = self._build_entry(group)
+            entry = self._open.get(key)
+            self._open[key] = new if entry is None else {
+                name: np.concatenate((entry[name], new[name])) for name in entry
+            }
+            self._last_id = max(self._last_id, int(new['id'].max()))
+
+    @staticmethod
+    def _build_entry(group):
+        """DataFrame grubundan vektörel kontrol için diziler oluşturur"""
+        stop_loss = group['stop_loss'].to_numpy(dtype=float)
+        take_profit = group['take_profit'].to_numpy(dtype=float)
+        return {
+            'id': group['id'].to_numpy(dtype=np.int64),
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+            # TP, SL'nin üstündeyse alış (long) sinyali
+            'long': take_profit > stop_loss,
+            'start': group['candle_time'].to_numpy(dtype=np.int64),
+            # Sinyal mumunun tespit anındaki uçları (eski kayıtlarda NaN)
+            'start_high': group['candle_high'].to_numpy(dtype=float),
+            'start_low': group['candle_low'].to_numpy(dtype=float),
+        }
+
+    def open_count(self):
+        """Takip edilen açık sinyal sayısı"""
+        with self._lock:
+            return sum(len(entry['id']) for entry in self._open.values())
+
+    def submit(self, symbol, timeframe, df):
+        """
+        Sembolün mumlarını arka planda kontrol edilmek üzere kuyruğa bırakır
+
+        Yalnızca zaman, high ve low dizileri kopyalanır; tarama DataFrame'i
+        kullanmaya devam edebilir. Arka plan kapalıysa kontrol hemen yapılır.
+
+        Args:
+            symbol (str): Kripto para sembolü
+            timeframe (str): Zaman dilimi
+            df (pandas.DataFrame): Fiyat verileri (zaman damgası indeksli)
+        """
+        if not self.enabled or df is None or df.empty:
+            return
+
+        with self._lock:
+            if (symbol, timeframe) not in self._open:
+                return
+
+        candles = (df.index.as_unit('ms').asi8.copy(),
+                   df['high'].to_numpy(dtype=float, copy=True),
+                   df['low'].to_numpy(dtype=float, copy=True))
+        if self._thread is None:
+            self._resolve(symbol, timeframe, *candles)
+        else:
+            self._queue.put((symbol, timeframe) + candles)
+
+    def join(self):
+        """Kuyruktaki tüm kontrollerin bitmesini bekler"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _worker(self):
+        """Arka plan döngüsü: kuyruktaki mumları sırayla kontrol eder"""
+        while True:
+            item = self._queue.get()
+            try:
+                self._resolve(*item)
+            finally:
+                self._queue.task_done()
+
+    def update(self, symbol, timeframe, df):
+        """
+        Sembolün açık sinyallerini verilen mumlara göre hemen çözer
+
+        Args:
+            symbol (str): Kripto para sembolü
+            timeframe (str): Zaman dilimi
+            df (pandas.DataFrame): Fiyat verileri (zaman damgası indeksli)
+
+        Returns:
+            int: Sonuçlanan sinyal sayısı
+        """
+        if not self.enabled or df is None or df.empty:
+            return 0
+        return self._resolve(symbol, timeframe, df.index.as_unit('ms').asi8,
+                             df['high'].to_numpy(dtype=float), df['low'].to_numpy(dtype=float))
+
+    @timed("outcome.update")
+    def _resolve(self, symbol, timeframe, times, highs, lows):
+        """
+        Açık sinyalleri mumlara göre tek adımda çözer (indeksin okunması ve yazılması tek kilit altında)
+
+        Args:
+            symbol (str): Kripto para sembolü
+            timeframe (str): Zaman dilimi
+            times (numpy.ndarray): Mum açılış zamanları (ms)
+            highs (numpy.ndarray): En yüksek fiyatlar
+            lows (numpy.ndarray): En düşük fiyatlar
+
+        Returns:
+            int: Sonuçlanan sinyal sayısı
+        """
+        try:
+            with self._lock:
+                entry = self._open.get((symbol, timeframe))
+                if entry is None:
+                    return 0
+
+                # Yalnızca en eski açık sinyalin mumu ve sonrası
+                first = np.searchsorted(times, entry['start'].min(), side='left')
+                times, highs, lows = times[first:], highs[first:], lows[first:]
+                if len(times) == 0:
+                    return 0
+
+                outcomes, hit_bar, bars = resolve_outcomes(
+                    times, highs, lows, entry['start'], entry['long'],
+                    entry['stop_loss'], entry['take_profit'], self.max_bars,
+                    entry['start_high'], entry['start_low']
+                )
+                resolved = outcomes.astype(bool)
+                if not resolved.any():
+                    return 0
+
+                self.history.record_outcomes([
+                    (int(entry['id'][i]), outcomes[i], int(times[hit_bar[i]]), int(bars[i]))
+                    for i in np.flatnonzero(resolved)
+                ])
+
+                # Çözülen sinyalleri indeksten çıkar
+                keep = ~resolved
+                if keep.any():
+                    self._open[(symbol, timeframe)] = {key: values[keep] for key, values in entry.items()}
+                else:
+                    self._open.pop((symbol, timeframe), None)
+
+            logger.info("%s %s: %s sinyal sonuçlandı (TP: %s, SL: %s, süresi doldu: %s)", symbol, timeframe,
+                        int(resolved.sum()), int((outcomes == OUTCOME_TAKE_PROFIT).sum()),
+                        int((outcomes == OUTCOME_STOP_LOSS).sum()), int((outcomes == OUTCOME_EXPIRED).sum()))
+            return int(resolved.sum())
+
+        except Exception as e:
+            logger.error("%s %s sinyal sonuçları kontrol edilirken hata: %s", symbol, timeframe, e, exc_info=True)
+            return 0
@@ -58,12 +58,12 @@ class PatternDetector:
             if three_candles:
                 patterns.append(three_candles)
             
-            logger.info(f"{len(patterns)} adet mum formasyonu tespit edildi")
+            logger.info("%s adet mum formasyonu tespit edildi", len(patterns))
             
             return patterns
             
         except Exception as e:
-            logger.error(f"Mum formasyonları tespit edilirken hata: {str(e)}", exc_info=True)
+            logger.error("Mum formasyonları tespit edilirken hata: %s", e, exc_info=True)
             return patterns
     
     def detect_pin_bar(self, df):
@@ -112,7 +112,7 @@ class PatternDetector:
             return None
             
         except Exception as e:
-            logger.error(f"Pin Bar tespiti sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Pin Bar tespiti sırasında hata: %s", e, exc_info=True)
             return None
     
     def detect_engulfing(self, df):
@@ -171,7 +171,7 @@ class PatternDetector:
             return None
             
         except Exception as e:
-            logger.error(f"Engulfing tespiti sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Engulfing tespiti sırasında hata: %s", e, exc_info=True)
             return None
     
     def detect_doji(self, df):
@@ -215,7 +215,7 @@ class PatternDetector:
             return None
             
         except Exception as e:
-            logger.error(f"Doji tespiti sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Doji tespiti sırasında hata: %s", e, exc_info=True)
             return None
     
     def detect_star(self, df):
@@ -275,7 +275,7 @@ class PatternDetector:
             return None
             
         except Exception as e:
-            logger.error(f"Star formasyonu tespiti sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Star formasyonu tespiti sırasında hata: %s", e, exc_info=True)
             return None
     
     def detect_three_candles(self, df):
@@ -336,5 +336,5 @@ class PatternDetector:
             return None
             
         except Exception as e:
-            logger.error(f"Three Candles formasyonu tespiti sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Three Candles formasyonu tespiti sırasında hata: %s", e, exc_info=True)
             return None
\ No newline at end of file
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Kalite Kalibrasyonu Modülü
+
+Sinyal kalite puanlarını sabit artışlar (+15 RSI aşırı satım, +10 hacim
+artışı ...) yerine geçmiş sonuçlardan öğrenilen bir tablodan okur.
+
+Çevrimdışı iş, her sembol için geçmiş mumlarda sinyalleri yeniden üretir,
+her sinyalin TP/SL sonucunu çözer ve sinyal türü x koşul kodu (trend, RSI
+bölgesi, MACD, Bollinger, hacim - signals.quality_scorer) kombinasyonları
+için R cinsinden beklenen getiriyi hesaplar. Az örnekli kombinasyonlar sinyal
+türünün, sinyal türleri de genel ortalamanın değerine doğru çekilir.
+Beklenen getiri kalite ölçeğine 50 + 25 * E olarak dönüştürülür (E = 0 başa
+baş, E = +1R için 75, E = +2R ve üstü için 100).
+
+Kullanım:
+    python src/quality_calibration.py --fixtures data/fixtures --output data/quality_calibration.json
+    python src/quality_calibration.py --symbols BTCUSDT,ETHUSDT --timeframes 4h --limit 1000
+
+Canlı analizde SignalAnalyzer tabloyu yükler ve her sinyalin puanını tek bir
+sözlük aramasıyla belirler; tabloda olmayan sinyaller eski puanını korur.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from outcome_tracker import resolve_outcomes, OUTCOME_TAKE_PROFIT, OUTCOME_STOP_LOSS
+from signals.quality_scorer import CONDITION_COLUMNS, CONDITION_BITS, add_quality_scores
+from signals.signal_record import signal_direction
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("quality_calibration")
+
+# Tablo dosyası biçim sürümü
+TABLE_VERSION = 1
+
+def table_path(config):
+    """Kalibrasyon tablosunun yolu (ayarlanmamışsa data/quality_calibration.json)"""
+    data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+    return config.QUALITY_CALIBRATION.get('path') or os.path.join(data_dir, 'quality_calibration.json')
+
+def expectancy_to_score(expectancy):
+    """R cinsinden beklenen getiriyi 0-100 kalite puanına dönüştürür"""
+    return int(max(0, min(100, round(50 + 25 * expectancy))))
+
+class QualityCalibration:
+    """Kalibrasyon tablosundan sinyal kalite puanı okuyan sınıf"""
+
+    def __init__(self, config, path=None):
+        """
+        Tabloyu yükler (dosya yoksa kalibrasyon devre dışı kalır)
+
+        Args:
+            config (Config): Bot konfigürasyonu
+            path (str, optional): Tablo dosyası. Belirtilmezse data/quality_calibration.json kullanılır.
+        """
+        self.config = config
+        self.settings = config.QUALITY_CALIBRATION
+        self.path = path or table_path(config)
+        self.enabled = False
+
+        # (sinyal türü, koşul kodu) -> puan ve sinyal türü -> puan
+        self._condition_scores = {}
+        self._type_scores = {}
+
+        if self.settings.get('enabled', True) and os.path.exists(self.path):
+            self.load(self.path)
+
+    def load(self, path):
+        """
+        Tabloyu dosyadan yükler
+
+        Args:
+            path (str): Tablo dosyası
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                table = json.load(f)
+
+            self._type_scores = {}
+            self._condition_scores = {}
+            for signal_type, entry in table.get('types', {}).items():
+                self._type_scores[signal_type] = entry['score']
+                for code, condition in entry.get('conditions', {}).items():
+                    self._condition_scores[(signal_type, int(code))] = condition['score']
+
+            self.enabled = True
+            logger.info("Kalite kalibrasyon tablosu yüklendi: %s (%s sinyal türü, %s koşul)",
+                        path, len(self._type_scores), len(self._condition_scores))
+        except (OSError, ValueError, KeyError) as e:
+            logger.error("Kalite kalibrasyon tablosu yüklenemedi: %s", e)
+            self.enabled = False
+
+    def lookup(self, signal_type, condition_code):
+        """
+        Sinyal türü ve koşul kodu için kalibre edilmiş puan
+
+        Args:
+            signal_type (str): Sinyal türü
+            condition_code (int): Koşul bit kodu
+
+        Returns:
+            int: Kalite puanı (tabloda yoksa None)
+        """
+        score = self._condition_scores.get((signal_type, condition_code))
+        if score is None:
+            score = self._type_scores.get(signal_type)
+        return score
+
+    def apply(self, signals, df):
+        """
+        Sinyallerin kalite puanlarını tablodan günceller
+
+        Önceki puan base_quality_score alanında saklanır.
+
+        Args:
+            signals (list): Aynı sembol/zaman dilimi için sinyaller
+            df (pandas.DataFrame): Kalite sütunları eklenmiş fiyat verileri
+        """
+        if not self.enabled or not signals:
+            return
+
+        codes = {}
+        for is_bullish, column in CONDITION_COLUMNS.items():
+            if column in df.columns:
+                codes[is_bullish] = int(df[column].iloc[-1])
+
+        for signal in signals:
+            is_bullish = signal_direction(signal)
+            if is_bullish is None or is_bullish not in codes:
+                continue
+            score = self.lookup(signal['signal_type'], codes[is_bullish])
+            if score is not None:
+                signal['base_quality_score'] = signal['quality_score']
+                signal['quality_score'] = score
+
+def _rule_samples(rules, df):
+    """Kural tabanlı sinyalleri tüm geçmiş üzerinde tek geçişte üretir"""
+    from signals.rule_engine import evaluate_rules
+
+    fired = evaluate_rules(rules, df)
+    if fired.empty:
+        return []
+    return [
+        (row.signal_type, row.Index, row.entry, row.stop_loss, row.take_profit)
+        for row in fired.itertuples()
+    ]
+
+def _module_samples(modules, symbol, timeframe, df, walk_bars):
+    """Diğer modülleri son mumlar üzerinde adım adım çalıştırarak sinyal üretir"""
+    samples = []
+    for end in range(max(1, len(df) - walk_bars), len(df)):
+        window = df.iloc[:end + 1]
+        for module in modules:
+            for signal in module.check_signals(symbol, timeframe, window):
+                samples.append((signal['signal_type'], window.index[-1], signal.get('entry'),
+                                signal.get('stop_loss'), signal.get('take_profit')))
+    return samples
+
+def backtest_symbol(analyzer, symbol, timeframe, df, walk_bars, max_bars):
+    """
+    Bir sembolün geçmişindeki sinyalleri üretir ve sonuçlarını çözer
+
+    Args:
+        analyzer (SignalAnalyzer): Sinyal modüllerini ve indikatörleri sağlayan analizör
+        symbol (str): Kripto para sembolü
+        timeframe (str): Zaman dilimi
+        df (pandas.DataFrame): Ham fiyat verileri
+        walk_bars (int): Kural dışı modüllerin çalıştırılacağı son mum sayısı
+        max_bars (int): Sonuçlanmayan sinyallerin "expired" sayılacağı mum sayısı
+
+    Returns:
+        pandas.DataFrame: signal_type, is_bullish, condition_code, outcome, r_multiple sütunları
+    """
+    from signals.rule_engine import RuleSignals
+
+    df = add_quality_scores(analyzer.indicators.ensure(df.copy(), analyzer.required_columns))
+
+    rule_modules = [m for m in analyzer.signal_modules if isinstance(m, RuleSignals)]
+    other_modules = [m for m in analyzer.signal_modules if not isinstance(m, RuleSignals)]
+
+    samples = _rule_samples([rule for m in rule_modules for rule in m.rules], df)
+    if walk_bars:
+        samples.extend(_module_samples(other_modules, symbol, timeframe, df, walk_bars))
+
+    rows = []
+    for signal_type, timestamp, entry, stop_loss, take_profit in samples:
+        is_bullish = signal_direction({'stop_loss': stop_loss, 'take_profit': take_profit})
+        if is_bullish is None or entry is None or entry == stop_loss:
+            continue
+        rows.append((signal_type, is_bullish, timestamp, float(entry), float(stop_loss), float(take_profit)))
+
+    if not rows:
+        return pd.DataFrame(columns=['signal_type', 'is_bullish', 'condition_code', 'outcome', 'r_multiple'])
+
+    samples = pd.DataFrame(rows, columns=['signal_type', 'is_bullish', 'timestamp', 'entry', 'stop_loss', 'take_profit'])
+
+    times = df.index.as_unit('ms').asi8
+    start = pd.DatetimeIndex(samples['timestamp']).as_unit('ms').asi8
+    is_long = samples['is_bullish'].to_numpy(dtype=bool)
+    outcomes, _, _ = resolve_outcomes(
+        times, df['high'].to_numpy(dtype=float), df['low'].to_numpy(dtype=float), start, is_long,
+        samples['stop_loss'].to_numpy(dtype=float), samples['take_profit'].to_numpy(dtype=float), max_bars
+    )
+
+    # Sinyal mumundaki koşul kodu
+    positions = np.searchsorted(times, start)
+    samples['condition_code'] = np.where(
+        is_long,
+        df[CONDITION_COLUMNS[True]].to_numpy()[positions],
+        df[CONDITION_COLUMNS[False]].to_numpy()[positions]
+    )
+
+    # TP: +ödül/risk, SL: -1R, süresi dolan: 0R
+    risk = (samples['entry'] - samples['stop_loss']).abs()
+    reward = (samples['take_profit'] - samples['entry']).abs()
+    samples['outcome'] = outcomes
+    samples['r_multiple'] = np.select(
+        [outcomes == OUTCOME_TAKE_PROFIT, outcomes == OUTCOME_STOP_LOSS],
+        [reward / risk, -1.0],
+        0.0
+    )
+
+    # Henüz sonuçlanmamış sinyaller kalibrasyona katılmaz
+    samples = samples[outcomes.astype(bool)]
+    return samples[['signal_type', 'is_bullish', 'condition_code', 'outcome', 'r_multiple']]
+
+def build_table(samples, min_samples=30, prior_strength=20):
+    """
+    Sonuçlanmış sinyal örneklerinden kalibrasyon tablosu oluşturur
+
+    Args:
+        samples (pandas.DataFrame): backtest_symbol çıktılarının birleşimi
+        min_samples (int): Tabloya girmek için gereken en az örnek
+        prior_strength (int): Üst seviye ortalamaya doğru çekme gücü (örnek cinsinden)
+
+    Returns:
+        dict: Kalibrasyon tablosu
+    """
+    total = len(samples)
+    global_expectancy = float(samples['r_multiple'].mean()) if total else 0.0
+
+    def summarize(group, prior):
+        count = len(group)
+        r_sum = float(group['r_multiple'].sum())
+        resolved = group['outcome'].isin((OUTCOME_TAKE_PROFIT, OUTCOME_STOP_LOSS))
+        hits = int((group['outcome'] == OUTCOME_TAKE_PROFIT).sum())
+        expectancy = (r_sum + prior_strength * prior) / (count + prior_strength)
+        return {
+            'n': count,
+            'hit_rate': round(hits / int(resolved.sum()), 4) if resolved.any() else None,
+            'expectancy': round(expectancy, 4),
+            'score': expectancy_to_score(expectancy),
+        }
+
+    types = {}
+    for signal_type, group in samples.groupby('signal_type', sort=True):
+        if len(group) < min_samples:
+            continue
+        entry = summarize(group, global_expectancy)
+        conditions = {}
+        for code, condition_group in group.groupby('condition_code', sort=True):
+            if len(condition_group) >= min_samples:
+                conditions[str(int(code))] = summarize(condition_group, entry['expectancy'])
+        entry['conditions'] = conditions
+        types[signal_type] = entry
+
+    return {
+        'version': TABLE_VERSION,
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'condition_bits': list(CONDITION_BITS),
+        'samples': total,
+        'global_expectancy': round(global_expectancy, 4),
+        'min_samples': min_samples,
+        'prior_strength': prior_strength,
+        'types': types,
+    }
+
+def run_calibration(config, fetcher, symbols, timeframes, limit, walk_bars=None):
+    """
+    Tüm semboller için geriye dönük test yapıp kalibrasyon tablosunu oluşturur
+
+    Args:
+        config (Config): Bot konfigürasyonu
+        fetcher (BinanceDataFetcher): Veri çekici
+        symbols (list): Semboller
+        timeframes (list): Zaman dilimleri
+        limit (int): Sembol başına mum sayısı
+        walk_bars (int, optional): Kural dışı modüller için adım adım test edilecek son mum sayısı
+
+    Returns:
+        dict: Kalibrasyon tablosu
+    """
+    from signal_analyzer import SignalAnalyzer
+
+    settings = config.QUALITY_CALIBRATION
+    if walk_bars is None:
+        walk_bars = settings.get('walk_bars', 300)
+
+    analyzer = SignalAnalyzer(config)
+    frames = []
+    for timeframe in timeframes:
+        for symbol in symbols:
+            df = fetcher.get_klines(symbol, timeframe, limit)
+            if df is None or df.empty:
+                logger.warning("%s %s için veri alınamadı, atlanıyor", symbol, timeframe)
+                continue
+            samples = backtest_symbol(analyzer, symbol, timeframe, df, walk_bars, settings.get('max_bars', 120))
+            logger.info("%s %s: %s sonuçlanmış sinyal", symbol, timeframe, len(samples))
+            frames.append(samples)
+
+    samples = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+        columns=['signal_type', 'is_bullish', 'condition_code', 'outcome', 'r_multiple'])
+
+    return build_table(samples, settings.get('min_samples', 30), settings.get('prior_strength', 20))
+
+def main():
+    from config import Config
+    from data_fetcher import BinanceDataFetcher
+    from data_sources import ReplayDataSource, create_data_source
+
+    config = Config()
+    parser = argparse.ArgumentParser(description="Geçmiş sinyal sonuçlarından kalite kalibrasyon tablosu oluşturur")
+    parser.add_argument('--fixtures', help="Kaydedilmiş fixture dizini (belirtilmezse DATA_SOURCE kullanılır)")
+    parser.add_argument('--symbols', default=','.join(config.SYMBOLS))
+    parser.add_argument('--timeframes', default=','.join(config.TIMEFRAMES))
+    parser.add_argument('--limit', type=int, default=1000, help="Sembol başına mum sayısı")
+    parser.add_argument('--walk-bars', type=int, default=None,
+                        help="Kural dışı modüllerin adım adım test edileceği son mum sayısı (0: yalnızca kurallar)")
+    parser.add_argument('--output', default=table_path(config))
+    args = parser.parse_args()
+
+    source = ReplayDataSource(args.fixtures) if args.fixtures else create_data_source(config)
+    fetcher = BinanceDataFetcher(config, source=source)
+
+    table = run_calibration(
+        config, fetcher,
+        [s for s in args.symbols.split(',') if s],
+        [t for t in args.timeframes.split(',') if t],
+        args.limit, args.walk_bars
+    )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(table, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+    logger.info("Kalibrasyon tablosu yazıldı: %s (%s örnek, %s sinyal türü)",
+                args.output, table['samples'], len(table['types']))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Parçalı Tarama Modülü
+
+Sembol evrenini birden fazla işçi süreç (veya makine) arasında bölmek için
+tutarlı özetleme halkası (consistent hash ring) ve işçilerle toplayıcı
+arasındaki tarama kuyruğu.
+
+Akış:
+    1. Toplayıcı (SCAN_ROLE=aggregator) her taramada kuyruğa bir tarama
+       kaydı yazar: tarama kimliği, sembol listesi ve halkadaki işçiler.
+    2. Her işçi (SCAN_ROLE=worker) kaydı görür, kendi parçasını süreli bir
+       kiralamayla sahiplenir, halkada kendisine düşen sembolleri tarar ve
+       sinyalleri kuyruğa yazar. Kiralama, işçinin canlılık döngüsünde
+       uzatılır.
+    3. Kiralaması dolan (işçi çöktü) veya halkadaki sahibi tarafından süresinde
+       sahiplenilmeyen parçayı canlı başka bir işçi devralır ve aynı parça
+       adına sonuç yazar; toplayıcı zaman aşımını beklemez.
+    4. Toplayıcı tüm parçaları (veya zaman aşımına kadar gelenleri) birleştirir;
+       semboller arası sıralama, bekleme süresi ve Telegram gönderimi tek
+       yerde yapılır.
+
+Halka her işçiyi virtual_nodes kez yerleştirir; bir işçi eklenip çıkarıldığında
+yalnızca o işçinin sembolleri yer değiştirir. Kuyruk yerel geliştirme ve tek
+makine kurulumları için SQLite (WAL) dosyasıdır; birden fazla makinede aynı
+arayüzü (publish_scan, pending_shards, claim, renew_leases, submit_results, wait_results)
+uygulayan ağ üzerindeki bir kuyruk kullanılabilir.
+"""
+import os
+import json
+import time
+import bisect
+import hashlib
+import sqlite3
+import threading
+from signals.signal_record import Signal
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("sharding")
+
+def _hash(key):
+    """Anahtarın halkadaki konumu (64 bit, süreçten bağımsız)"""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+class HashRing:
+    """Sembolleri işçilere tutarlı özetleme ile dağıtan halka"""
+
+    def __init__(self, nodes=(), virtual_nodes=256):
+        """
+        Args:
+            nodes (iterable): İşçi kimlikleri
+            virtual_nodes (int): Her işçinin halkadaki sanal düğüm sayısı
+        """
+        self.virtual_nodes = virtual_nodes
+        self._positions = []
+        self._owners = []
+        self.nodes = set()
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node):
+        """İşçiyi halkaya ekler"""
+        if node in self.nodes:
+            return
+        self.nodes.add(node)
+        for replica in range(self.virtual_nodes):
+            position = _hash(f"{node}#{replica}")
+            index = bisect.bisect(self._positions, position)
+            self._positions.insert(index, position)
+            self._owners.insert(index, node)
+
+    def remove(self, node):
+        """İşçiyi halkadan çıkarır"""
+        if node not in self.nodes:
+            return
+        self.nodes.discard(node)
+        kept = [(position, owner) for position, owner in zip(self._positions, self._owners) if owner != node]
+        self._positions = [position for position, _ in kept]
+        self._owners = [owner for _, owner in kept]
+
+    def node_for(self, key):
+        """
+        Anahtarın sahibi olan işçi
+
+        Args:
+            key (str): Sembol
+
+        Returns:
+            str: İşçi kimliği (halka boşsa None)
+        """
+        if not self._positions:
+            return None
+        index = bisect.bisect(self._positions, _hash(key)) % len(self._positions)
+        return self._owners[index]
+
+    def assign(self, keys):
+        """
+        Anahtarları işçilere böler
+
+        Args:
+            keys (iterable): Semboller
+
+        Returns:
+            dict: İşçi kimliği -> sembol listesi (girdi sırası korunur)
+        """
+        shards = {node: [] for node in sorted(self.nodes)}
+        for key in keys:
+            node = self.node_for(key)
+            if node is not None:
+                shards[node].append(key)
+        return shards
+
+class ScanQueue:
+    """Toplayıcı ile işçiler arasındaki tarama kuyruğu (SQLite, WAL modu)"""
+
+    def __init__(self, config, db_path=None):
+        """
+        Args:
+            config (Config): Bot konfigürasyonu
+            db_path (str, optional): Veritabanı dosyası. Belirtilmezse data/scan_queue.db kullanılır.
+        """
+        self.config = config
+        self.settings = config.SHARDING
+
+        if db_path is None:
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+            db_path = self.settings.get('queue_path') or os.path.join(data_dir, 'scan_queue.db')
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS scans ("
+            " scan_id TEXT PRIMARY KEY,"
+            " created_at REAL NOT NULL,"
+            " symbols TEXT NOT NULL,"
+            " workers TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS shards ("
+            " scan_id TEXT NOT NULL,"
+            " worker TEXT NOT NULL,"
+            " claimed_at REAL NOT NULL,"
+            " finished_at REAL,"
+            " signals TEXT,"
+            " claimed_by TEXT,"
+            " lease_until REAL,"
+            " PRIMARY KEY (scan_id, worker));"
+            "CREATE TABLE IF NOT EXISTS workers ("
+            " worker TEXT PRIMARY KEY,"
+            " seen_at REAL NOT NULL);"
+        )
+
+        logger.info("Tarama kuyruğu açıldı: %s", self.db_path)
+
+    def heartbeat(self, worker, now=None):
+        """İşçinin canlı olduğunu kaydeder"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO workers (worker, seen_at) VALUES (?, ?) "
+                "ON CONFLICT(worker) DO UPDATE SET seen_at = excluded.seen_at",
+                (worker, now if now is not None else time.time())
+            )
+
+    def live_workers(self, max_age, now=None):
+        """
+        Son max_age saniyede canlılık bildiren işçiler
+
+        Returns:
+            list: İşçi kimlikleri (sıralı)
+        """
+        since = (now if now is not None else time.time()) - max_age
+        with self._lock:
+            rows = self._conn.execute("SELECT worker FROM workers WHERE seen_at >= ? ORDER BY worker", (since,))
+            return [row[0] for row in rows]
+
+    def publish_scan(self, scan_id, symbols, workers):
+        """
+        Yeni tarama kaydı yazar
+
+        Args:
+            scan_id (str): Tarama kimliği
+            symbols (list): Taranacak semboller
+            workers (list): Halkadaki işçiler (işçiler aynı halkayı kurar)
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scans (scan_id, created_at, symbols, workers) VALUES (?, ?, ?, ?)",
+                (scan_id, time.time(), json.dumps(list(symbols)), json.dumps(sorted(workers)))
+            )
+
+    def pending_shards(self, worker, max_age, lease, now=None):
+        """
+        İşçinin tarayabileceği parçalar
+
+        İşçinin kendi parçası henüz sahiplenilmemişse, başka bir parçanın
+        kiralaması dolmuşsa veya sahibi tarama yayınlandıktan sonra lease
+        süresi içinde sahiplenmediyse parça döndürülür.
+
+        Args:
+            worker (str): İşçi kimliği
+            max_age (float): Bundan eski taramalar atlanır (saniye)
+            lease (float): Kiralama süresi (saniye)
+            now (float, optional): Şu anki zaman
+
+        Returns:
+            list: (scan_id, symbols, workers, shard) dörtlüleri; önce kendi parçaları, eskiden yeniye
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            scans = self._conn.execute(
+                "SELECT scan_id, created_at, symbols, workers FROM scans WHERE created_at >= ? ORDER BY created_at",
+                (now - max_age,)
+            ).fetchall()
+            claims = {
+                (scan_id, shard): (finished_at, lease_until)
+                for scan_id, shard, finished_at, lease_until in self._conn.execute(
+                    "SELECT scan_id, worker, finished_at, lease_until FROM shards WHERE scan_id IN "
+                    "(SELECT scan_id FROM scans WHERE created_at >= ?)",
+                    (now - max_age,)
+                )
+            }
+
+        own, takeovers = [], []
+        for scan_id, created_at, symbols, workers in scans:
+            workers = json.loads(workers)
+            if worker not in workers:
+                continue
+            for shard in workers:
+                claim = claims.get((scan_id, shard))
+                if claim is None:
+                    available = shard == worker or created_at + lease < now
+                else:
+                    finished_at, lease_until = claim
+                    available = finished_at is None and (lease_until or 0) < now
+                if available:
+                    (own if shard == worker else takeovers).append((scan_id, json.loads(symbols), workers, shard))
+        return own + takeovers
+
+    def claim(self, scan_id, shard, worker, lease, now=None):
+        """
+        Parçayı süreli olarak sahiplenir; kiralaması dolmamış parça sahiplenilemez
+
+        Args:
+            scan_id (str): Tarama kimliği
+            shard (str): Parçanın halkadaki sahibi
+            worker (str): Sahiplenen işçi
+            lease (float): Kiralama süresi (saniye)
+            now (float, optional): Şu anki zaman
+
+        Returns:
+            bool: Sahiplenildiyse True
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO shards (scan_id, worker, claimed_at, claimed_by, lease_until) VALUES (?, ?, ?, ?, ?)",
+                (scan_id, shard, now, worker, now + lease)
+            )
+            if cursor.rowcount == 1:
+                return True
+            # Kiralaması dolmuş (sahibi çökmüş) parçayı devral
+            cursor = self._conn.execute(
+                "UPDATE shards SET claimed_at = ?, claimed_by = ?, lease_until = ? "
+                "WHERE scan_id = ? AND worker = ? AND finished_at IS NULL AND COALESCE(lease_until, 0) < ?",
+                (now, worker, now + lease, scan_id, shard, now)
+            )
+            return cursor.rowcount == 1
+
+    def renew_leases(self, worker, lease, now=None):
+        """
+        İşçinin tamamlanmamış parçalarının kiralamasını uzatır
+
+        Args:
+            worker (str): İşçi kimliği
+            lease (float): Kiralama süresi (saniye)
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE shards SET lease_until = ? WHERE claimed_by = ? AND finished_at IS NULL",
+                (now + lease, worker)
+            )
+
+    def submit_results(self, scan_id, shard, signals):
+        """
+        Parçanın sinyallerini yazar (parça devralındıysa ilk tamamlanan sonuç geçerlidir)
+
+        Args:
+            scan_id (str): Tarama kimliği
+            shard (str): Parçanın halkadaki sahibi
+            signals (list): Parçada tespit edilen sinyaller
+        """
+        payload = "[" + ",".join(signal.to_json() for signal in signals) + "]"
+        with self._lock:
+            self._conn.execute(
+                "UPDATE shards SET finished_at = ?, signals = ? WHERE scan_id = ? AND worker = ? AND finished_at IS NULL",
+                (time.time(), payload, scan_id, shard)
+            )
+
+    def wait_results(self, scan_id, workers, timeout, poll_interval=1.0):
+        """
+        Parçaların tamamlanmasını bekler
+
+        Args:
+            scan_id (str): Tarama kimliği
+            workers (list): Beklenen işçiler
+            timeout (float): En fazla bekleme süresi (saniye)
+            poll_interval (float): Kontrol aralığı (saniye)
+
+        Returns:
+            dict: İşçi kimliği -> sinyal listesi (yalnızca tamamlanan parçalar)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT worker, signals FROM shards WHERE scan_id = ? AND finished_at IS NOT NULL",
+                    (scan_id,)
+                ).fetchall()
+            finished = {worker: payload for worker, payload in rows if worker in workers}
+            if len(finished) == len(workers) or time.monotonic() >= deadline:
+                return {worker: [Signal.from_json(data) for data in json.loads(payload)]
+                        for worker, payload in finished.items()}
+            time.sleep(poll_interval)
+
+    def purge(self, max_age, now=None):
+        """
+        Eski tarama kayıtlarını siler
+
+        Args:
+            max_age (float): Bundan eski kayıtlar silinir (saniye)
+        """
+        cutoff = (now if now is not None else time.time()) - max_age
+        with self._lock:
+            self._conn.execute("DELETE FROM shards WHERE scan_id IN (SELECT scan_id FROM scans WHERE created_at < ?)", (cutoff,))
+            self._conn.execute("DELETE FROM scans WHERE created_at < ?", (cutoff,))
+            self._conn.execute("DELETE FROM workers WHERE seen_at < ?", (cutoff,))
+
+    def close(self):
+        """Veritabanı bağlantısını kapatır"""
+        with self._lock:
+            self._conn.close()
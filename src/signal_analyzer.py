@@ -2,11 +2,16 @@
 """
 Kripto Teknik Analiz Botu - Sinyal Analiz Modülü
 """
+import time
 import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from operator import attrgetter
 from technical_indicators import TechnicalIndicators
-from support_resistance import SupportResistance
+from support_resistance import SupportResistance, LEVEL_LOOKBACK
 from utils.logger import setup_logger
+from utils.instrumentation import profiler, timed
+from utils.metrics import STAGE_DURATION, SIGNAL_MODULE_TIMEOUTS
 
 # Sinyal modüllerini içe aktar
 from signals.rsi_signals import RSISignals
@@ -19,10 +24,20 @@ from signals.support_resistance_signals import SupportResistanceSignals
 from signals.fibonacci_signals import FibonacciSignals
 from signals.volatility_signals import VolatilitySignals
 from signals.trend_signals import TrendSignals
+from signals.rule_engine import RuleSignals
+from signals.quality_scorer import add_quality_scores, QUALITY_LOOKBACK, REQUIRED_COLUMNS as QUALITY_REQUIRED_COLUMNS
+from signals.signal_record import Signal
+from quality_calibration import QualityCalibration
 
 # Logger kurulumu
 logger = setup_logger("signal_analyzer")
 
+# Sinyalleri kalite puanına göre sıralama anahtarı
+by_quality = attrgetter('quality_score')
+
+# En iyi sinyale eklenen ADX trend bilgisinin okuduğu sütunlar
+ADX_TREND_COLUMNS = ('adx', 'plus_di', 'minus_di')
+
 class SignalAnalyzer:
     """Teknik analiz sinyallerini tespit eden sınıf"""
     
@@ -46,8 +61,117 @@ class SignalAnalyzer:
             TrendSignals(config)
         ]
         
-        logger.info("Sinyal analizörü başlatıldı")
+        # Modül belirtilmeden konfigürasyona eklenen kurallar
+        if any(spec.get('module') is None for spec in config.SIGNAL_RULES):
+            self.signal_modules.append(RuleSignals(config))
+        
+        # Yalnızca etkin modülleri çalıştır
+        if config.ENABLED_SIGNAL_MODULES:
+            enabled = set(config.ENABLED_SIGNAL_MODULES)
+            self.signal_modules = [m for m in self.signal_modules if m.__class__.__name__ in enabled]
+        
+        # Geçmiş sonuçlardan kalibre edilmiş kalite puanları (tablo yoksa devre dışı)
+        self.calibration = QualityCalibration(config)
+        
+        # Etkin modüllerin, kalite puanlarının ve ADX trend bilgisinin okuduğu indikatör sütunları
+        self.required_columns = tuple(sorted(set(QUALITY_REQUIRED_COLUMNS).union(
+            ADX_TREND_COLUMNS, *(module.required_columns for module in self.signal_modules))))
+        
+        # Ölçümlerde kullanılan modül aşama adları
+        self.module_stage_names = [f"signal.{module.__class__.__name__}" for module in self.signal_modules]
+        
+        # İsteğe bağlı paralel çalıştırma: modüller indikatörler hesaplandıktan sonra
+        # birbirinden bağımsızdır ve DataFrame'i yalnızca okur
+        self.execution = config.SIGNAL_EXECUTION
+        self._executor = None
+        if self.execution.get('parallel') and len(self.signal_modules) > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.execution['workers'], thread_name_prefix="signal-module")
+        
+        logger.info("Sinyal analizörü başlatıldı (%s modül, %s indikatör, gereken geçmiş: %s mum)",
+                    len(self.signal_modules), len(self.indicators.required_indicators(self.required_columns)),
+                    self.min_history())
+    
+    def min_history(self):
+        """
+        Etkin modüllerin ve analizörün ihtiyaç duyduğu en az mum sayısı
+        
+        Modüllerin bildirdiği geriye bakış ve indikatör ısınma sürelerinin en
+        büyüğüdür; kalite puanları ve en iyi sinyale eklenen destek/direnç
+        seviyeleri de hesaba katılır.
+        
+        Returns:
+            int: Mum sayısı
+        """
+        requirements = [module.min_history(self.indicators) for module in self.signal_modules]
+        requirements.append(QUALITY_LOOKBACK + self.indicators.warmup_bars(QUALITY_REQUIRED_COLUMNS))
+        requirements.append(LEVEL_LOOKBACK)
+        return max(requirements)
+    
+    def _run_module(self, module, stage_name, symbol, timeframe, df, started=None, index=None):
+        """Tek bir modülü çalıştırır ve kalibre edilmiş kalite puanlarını uygular"""
+        if started is not None:
+            started[index] = time.perf_counter()
+        with profiler.stage(stage_name), STAGE_DURATION.labels(stage_name).time():
+            signals = module.check_signals(symbol, timeframe, df)
+            self.calibration.apply(signals, df)
+        return signals
+    
+    def _module_result(self, future, started, index, timeout):
+        """Modül sonucunu, modülün çalışmaya başladığı andan itibaren en fazla timeout saniye bekler"""
+        while True:
+            start = started[index]
+            remaining = timeout if start is None else start + timeout - time.perf_counter()
+            try:
+                return future.result(timeout=max(remaining, 0))
+            except FuturesTimeout:
+                # Beklerken sıradan çıkıp çalışmaya başladıysa kendi süresi kadar beklenir
+                if start is None and started[index] is not None:
+                    continue
+                raise
+    
+    def run_modules(self, symbol, timeframe, df):
+        """
+        Sinyal modüllerini çalıştırır
+        
+        Paralel modda modüller iş parçacığı havuzunda çalışır; sonuçlar yine modül
+        sırasıyla döner. module_timeout süresini aşan modülün sinyalleri atlanır
+        (çalışan iş parçacığı durdurulamaz, sonucu yok sayılır).
+        
+        Args:
+            symbol (str): Kripto para sembolü
+            timeframe (str): Zaman dilimi
+            df (pandas.DataFrame): İndikatörleri hesaplanmış fiyat verileri
+            
+        Returns:
+            list: Modül başına sinyal listeleri (modül sırasıyla)
+        """
+        modules = list(zip(self.signal_modules, self.module_stage_names))
+        if self._executor is None:
+            return [self._run_module(module, stage_name, symbol, timeframe, df) for module, stage_name in modules]
+        
+        timeout = self.execution['module_timeout']
+        started = [None] * len(modules)
+        futures = [self._executor.submit(self._run_module, module, stage_name, symbol, timeframe, df, started, index)
+                   for index, (module, stage_name) in enumerate(modules)]
+        
+        results = []
+        for index, (module, future) in enumerate(zip(self.signal_modules, futures)):
+            try:
+                results.append(self._module_result(future, started, index, timeout))
+            except FuturesTimeout:
+                future.cancel()
+                name = module.__class__.__name__
+                logger.warning("%s %s: %s modülü %.1f saniyede tamamlanmadı, sinyalleri atlandı",
+                               symbol, timeframe, name, timeout)
+                SIGNAL_MODULE_TIMEOUTS.labels(name).inc()
+                profiler.count("signals.module_timeouts")
+                results.append([])
+            except Exception as e:
+                logger.error("%s %s %s modülü çalışırken hata: %s", symbol, timeframe, module.__class__.__name__, e, exc_info=True)
+                results.append([])
+        return results
     
+    @timed("analyze")
     def analyze(self, symbol, timeframe, df):
         """
         Verilen veri için tüm sinyal türlerini analiz eder
@@ -61,21 +185,26 @@ class SignalAnalyzer:
             list: Tespit edilen sinyaller listesi
         """
         try:
-            logger.info(f"{symbol} için {timeframe} zaman diliminde sinyal analizi başlatılıyor")
+            logger.info("%s için %s zaman diliminde sinyal analizi başlatılıyor", symbol, timeframe)
+            
+            # Yalnızca etkin modüllerin okuduğu teknik indikatörleri hesapla
+            with STAGE_DURATION.labels("indicators").time():
+                df = self.indicators.ensure(df, self.required_columns)
             
-            # Teknik indikatörleri hesapla
-            df = self.indicators.add_all_indicators(df)
+            # Boğa/ayı temel kalite puanları tüm mumlar için bir kez hesaplanır
+            with profiler.stage("quality.scores"):
+                df = add_quality_scores(df)
             
             # Tüm sinyal modüllerini çalıştır ve sinyalleri topla
             all_signals = []
             pattern_signals = []
             
-            for module in self.signal_modules:
-                signals = module.check_signals(symbol, timeframe, df)
+            for signals in self.run_modules(symbol, timeframe, df):
+                profiler.count("signals.raw", len(signals))
                 
                 # Mum formasyonu sinyallerini ayır
                 for signal in signals:
-                    if "Pattern:" in signal['signal_type'] or signal.get('is_pattern', False):
+                    if signal.is_pattern:
                         pattern_signals.append(signal)
                     else:
                         all_signals.append(signal)
@@ -83,25 +212,25 @@ class SignalAnalyzer:
             # Eğer hiç normal sinyal yoksa ve sadece mum formasyonu sinyalleri varsa
             if not all_signals and pattern_signals:
                 # En iyi mum formasyonu sinyalini seç
-                pattern_signals.sort(key=lambda x: x['quality_score'], reverse=True)
+                pattern_signals.sort(key=by_quality, reverse=True)
                 best_pattern = pattern_signals[0]
                 
                 # Yeni bir sinyal oluştur (mum formasyonu değil)
-                fallback_signal = {
-                    'symbol': symbol,
-                    'timeframe': timeframe,
-                    'signal_type': 'Technical Analysis Alert',
-                    'entry': best_pattern.get('entry'),
-                    'stop_loss': best_pattern.get('stop_loss'),
-                    'take_profit': best_pattern.get('take_profit'),
-                    'timestamp': df.index[-1],
-                    'quality_score': best_pattern['quality_score'],
-                    'description': f"Teknik analiz uyarısı: {best_pattern['description']}"
-                }
+                fallback_signal = Signal(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    signal_type='Technical Analysis Alert',
+                    entry=best_pattern.get('entry'),
+                    stop_loss=best_pattern.get('stop_loss'),
+                    take_profit=best_pattern.get('take_profit'),
+                    timestamp=df.index[-1],
+                    quality_score=best_pattern['quality_score'],
+                    description=f"Teknik analiz uyarısı: {best_pattern['description']}"
+                )
                 all_signals.append(fallback_signal)
             
             # Sinyalleri kalite puanına göre sırala
-            all_signals.sort(key=lambda x: x['quality_score'], reverse=True)
+            all_signals.sort(key=by_quality, reverse=True)
             
             # Her sembol ve zaman dilimi için sadece en iyi sinyali seç
             best_signals = self.filter_best_signals(all_signals)
@@ -109,24 +238,26 @@ class SignalAnalyzer:
             # En iyi sinyale diğer sinyalleri ve mum formasyonlarını ekle
             for signal in best_signals:
                 # Aynı sembol ve timeframe için diğer sinyalleri bul
-                other_signals = [s for s in all_signals if s['symbol'] == signal['symbol'] and 
-                                s['timeframe'] == signal['timeframe'] and 
-                                s['signal_type'] != signal['signal_type']]
+                other_signals = [s for s in all_signals if s.symbol == signal.symbol and 
+                                s.timeframe == signal.timeframe and 
+                                s.signal_type != signal.signal_type]
                 
                 # Mum formasyonu sinyallerini ekle
-                matching_patterns = [p for p in pattern_signals if p['symbol'] == signal['symbol'] and 
-                                    p['timeframe'] == signal['timeframe']]
+                matching_patterns = [p for p in pattern_signals if p.symbol == signal.symbol and 
+                                    p.timeframe == signal.timeframe]
                 
                 # Diğer sinyalleri kalite puanına göre sırala
-                other_signals.sort(key=lambda x: x['quality_score'], reverse=True)
-                matching_patterns.sort(key=lambda x: x['quality_score'], reverse=True)
+                other_signals.sort(key=by_quality, reverse=True)
+                matching_patterns.sort(key=by_quality, reverse=True)
                 
                 # En iyi 3 alternatif sinyali ekle
                 signal['alternative_signals'] = other_signals[:3]
+                alternative_keys = {alt.key for alt in signal['alternative_signals']}
                 
                 # Mum formasyonu sinyallerini alternative_signals'a ekle
                 for pattern in matching_patterns[:2]:  # En iyi 2 mum formasyonu
-                    if pattern not in signal['alternative_signals']:
+                    if pattern.key not in alternative_keys:
+                        alternative_keys.add(pattern.key)
                         signal['alternative_signals'].append(pattern)
                 
                 # Destek ve direnç seviyelerini ekle
@@ -160,24 +291,24 @@ class SignalAnalyzer:
                     }
                     
                     # ADX trend sinyalini alternative_signals'a ekle
-                    adx_signal = {
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'signal_type': f"{trend_strength} {trend_direction} Trend (ADX: {adx_value:.1f})",
-                        'quality_score': min(80, int(adx_value)),
-                        'description': f"ADX {adx_value:.1f} değeri ile {trend_strength.lower()} bir {trend_direction.lower()} trend gösteriyor."
-                    }
+                    adx_signal = Signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_type=f"{trend_strength} {trend_direction} Trend (ADX: {adx_value:.1f})",
+                        quality_score=min(80, int(adx_value)),
+                        description=f"ADX {adx_value:.1f} değeri ile {trend_strength.lower()} bir {trend_direction.lower()} trend gösteriyor."
+                    )
                     
                     # ADX sinyalini alternative_signals'ın başına ekle
-                    if adx_signal not in signal['alternative_signals']:
+                    if adx_signal.key not in alternative_keys:
                         signal['alternative_signals'] = [adx_signal] + signal['alternative_signals']
             
-            logger.info(f"{symbol} için {timeframe} zaman diliminde {len(all_signals)} sinyal tespit edildi, en iyi {len(best_signals)} sinyal seçildi")
+            logger.info("%s için %s zaman diliminde %s sinyal tespit edildi, en iyi %s sinyal seçildi", symbol, timeframe, len(all_signals), len(best_signals))
             
             return best_signals
             
         except Exception as e:
-            logger.error(f"Sinyal analizi sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Sinyal analizi sırasında hata: %s", e, exc_info=True)
             return []
     
     def filter_best_signals(self, signals):
@@ -196,7 +327,7 @@ class SignalAnalyzer:
         # Sembol bazında grupla
         symbol_groups = {}
         for signal in signals:
-            symbol = signal['symbol']
+            symbol = signal.symbol
             if symbol not in symbol_groups:
                 symbol_groups[symbol] = []
             symbol_groups[symbol].append(signal)
@@ -205,10 +336,10 @@ class SignalAnalyzer:
         best_signals = []
         for symbol, symbol_signals in symbol_groups.items():
             # Kalite puanına göre sırala
-            symbol_signals.sort(key=lambda x: x['quality_score'], reverse=True)
+            symbol_signals.sort(key=by_quality, reverse=True)
             
             # Mum formasyonu sinyallerini filtrele
-            non_pattern_signals = [s for s in symbol_signals if "Pattern:" not in s['signal_type'] and not s.get('is_pattern', False)]
+            non_pattern_signals = [s for s in symbol_signals if not s.is_pattern]
             
             # Eğer mum formasyonu olmayan sinyal varsa, onu seç
             if non_pattern_signals:
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sinyal Geçmişi Modülü
+
+Tespit edilen ve gönderilen tüm sinyalleri SQLite veritabanında saklar ve
+analiz sorguları için yardımcılar sunar:
+
+    history = SignalHistory(config)
+    history.signals_per_type_per_day(days=7)
+    history.quality_distribution(bin_size=10)
+    history.repeat_rate(window_hours=24)
+    history.outcome_stats(days=90)
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+import pandas as pd
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("signal_history")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS signals (
+    id INTEGER PRIMARY KEY,
+    scan_id TEXT,
+    detected_at REAL NOT NULL,
+    candle_time INTEGER,
+    candle_high REAL,
+    candle_low REAL,
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    signal_type TEXT NOT NULL,
+    entry REAL,
+    stop_loss REAL,
+    take_profit REAL,
+    quality_score INTEGER,
+    sent INTEGER NOT NULL DEFAULT 0,
+    description TEXT,
+    payload TEXT,
+    outcome TEXT,
+    resolved_at INTEGER,
+    bars_to_resolution INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_signals_symbol_tf_time ON signals (symbol, timeframe, detected_at);
+CREATE INDEX IF NOT EXISTS idx_signals_type_time ON signals (signal_type, detected_at);
+CREATE INDEX IF NOT EXISTS idx_signals_time ON signals (detected_at);
+CREATE INDEX IF NOT EXISTS idx_signals_open ON signals (symbol, timeframe) WHERE sent = 1 AND outcome IS NULL;
+"""
+
+# Sütun olarak saklanan ek alanlar (payload'a yazılmaz)
+_COLUMN_EXTRAS = ('candle_high', 'candle_low', 'history_id')
+
+def _to_float(value):
+    """numpy/pandas sayılarını veritabanına uygun float'a çevirir"""
+    try:
+        return None if value is None or pd.isna(value) else float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _to_epoch_ms(value):
+    """Mum zaman damgasını milisaniye cinsinden Unix zamanına çevirir"""
+    if value is None:
+        return None
+    try:
+        return int(pd.Timestamp(value).timestamp() * 1000)
+    except (TypeError, ValueError):
+        return None
+
+class SignalHistory:
+    """Sinyalleri indeksli SQLite tablosunda saklayan ve sorgulayan sınıf"""
+
+    def __init__(self, config, db_path=None):
+        """
+        Veritabanını açar ve şemayı oluşturur
+
+        Args:
+            config (Config): Bot konfigürasyonu
+            db_path (str, optional): Veritabanı dosyası. Belirtilmezse data/signal_history.db kullanılır.
+        """
+        self.config = config
+        self.settings = config.SIGNAL_HISTORY
+        self.enabled = self.settings.get('enabled', True)
+
+        if db_path is None:
+            db_path = self.settings.get('path') or os.path.join(
+                os.path.dirname(os.path.dirname(__file__)), 'data', 'signal_history.db')
+        self.db_path = db_path
+
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            logger.info("Sinyal geçmişi veritabanı: %s", self.db_path)
+
+    def record_signals(self, signals, scan_id=None, sent_signals=None, detected_at=None):
+        """
+        Taramada tespit edilen sinyalleri tek işlemde kaydeder
+
+        Kaydedilen sinyallere veritabanındaki kimlikleri 'history_id' alanıyla
+        yazılır (sonuç takibi yeni sinyalleri bu kimlikle indeksine ekler).
+
+        Args:
+            signals (list): Tespit edilen sinyaller
+            scan_id (str, optional): Tarama kimliği
+            sent_signals (list, optional): Bu sinyallerden gönderilenler
+            detected_at (float, optional): Kayıt zamanı
+
+        Returns:
+            int: Kaydedilen sinyal sayısı
+        """
+        if not self.enabled or not signals:
+            return 0
+
+        if detected_at is None:
+            detected_at = time.time()
+        sent_ids = {id(signal) for signal in sent_signals or []}
+
+        rows = []
+        for signal in signals:
+            # Alternatif sinyaller, destek/direnç seviyeleri ve diğer ek alanlar
+            extra = {key: value for key, value in signal.extra_dict().items() if key not in _COLUMN_EXTRAS}
+            payload = json.dumps(extra, ensure_ascii=False, separators=(',', ':'), default=str) if extra else None
+
+            rows.append((
+                scan_id,
+                detected_at,
+                _to_epoch_ms(signal.get('timestamp')),
+                _to_float(signal.get('candle_high')),
+                _to_float(signal.get('candle_low')),
+                signal['symbol'],
+                signal['timeframe'],
+                signal['signal_type'],
+                _to_float(signal.get('entry')),
+                _to_float(signal.get('stop_loss')),
+                _to_float(signal.get('take_profit')),
+                int(signal.get('quality_score', 0)),
+                1 if id(signal) in sent_ids else 0,
+                signal.get('description'),
+                payload,
+            ))
+
+        try:
+            with self._lock, self._conn:
+                cursor = self._conn.cursor()
+                ids = []
+                for row in rows:
+                    cursor.execute(
+                        "INSERT INTO signals (scan_id, detected_at, candle_time, candle_high, candle_low, symbol, timeframe, "
+                        "signal_type, entry, stop_loss, take_profit, quality_score, sent, description, payload) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        row
+                    )
+                    ids.append(cursor.lastrowid)
+            for signal, signal_id in zip(signals, ids):
+                signal['history_id'] = signal_id
+            logger.info("%s sinyal geçmişe kaydedildi (%s gönderildi)", len(rows), len(sent_ids))
+            return len(rows)
+        except sqlite3.Error as e:
+            logger.error("Sinyal geçmişi kaydedilirken hata: %s", e, exc_info=True)
+            return 0
+
+    def query(self, sql, params=()):
+        """
+        Geçmiş veritabanında sorgu çalıştırır
+
+        Args:
+            sql (str): SQL sorgusu
+            params (tuple): Sorgu parametreleri
+
+        Returns:
+            pandas.DataFrame: Sorgu sonucu
+        """
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def _since(self, days):
+        return time.time() - days * 86400 if days else 0
+
+    def get_signals(self, symbol=None, timeframe=None, signal_type=None, days=None, sent_only=False):
+        """
+        Filtrelenmiş sinyal kayıtlarını döndürür
+
+        Args:
+            symbol (str, optional): Sembol
+            timeframe (str, optional): Zaman dilimi
+            signal_type (str, optional): Sinyal türü
+            days (int, optional): Son kaç günün kayıtları
+            sent_only (bool): Yalnızca gönderilen sinyaller
+
+        Returns:
+            pandas.DataFrame: Sinyal kayıtları (payload JSON metni olarak)
+        """
+        conditions = ["detected_at >= ?"]
+        params = [self._since(days)]
+        for column, value in (('symbol', symbol), ('timeframe', timeframe), ('signal_type', signal_type)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if sent_only:
+            conditions.append("sent = 1")
+
+        return self.query(
+            f"SELECT * FROM signals WHERE {' AND '.join(conditions)} ORDER BY detected_at",
+            tuple(params)
+        )
+
+    def signals_per_type_per_day(self, days=30, sent_only=False):
+        """
+        Gün ve sinyal türü bazında sinyal sayıları
+
+        Args:
+            days (int): Son kaç gün
+            sent_only (bool): Yalnızca gönderilen sinyaller
+
+        Returns:
+            pandas.DataFrame: day, signal_type, detected, sent sütunları
+        """
+        return self.query(
+            "SELECT date(detected_at, 'unixepoch') AS day, signal_type, "
+            "COUNT(*) AS detected, SUM(sent) AS sent "
+            "FROM signals WHERE detected_at >= ? AND (? = 0 OR sent = 1) "
+            "GROUP BY day, signal_type ORDER BY day, detected DESC",
+            (self._since(days), 1 if sent_only else 0)
+        )
+
+    def quality_distribution(self, bin_size=10, days=30):
+        """
+        Kalite puanı dağılımı
+
+        Args:
+            bin_size (int): Aralık genişliği
+            days (int): Son kaç gün
+
+        Returns:
+            pandas.DataFrame: quality_bin (aralık alt sınırı), detected, sent sütunları
+        """
+        return self.query(
+            "SELECT (quality_score / ?) * ? AS quality_bin, COUNT(*) AS detected, SUM(sent) AS sent "
+            "FROM signals WHERE detected_at >= ? GROUP BY quality_bin ORDER BY quality_bin",
+            (int(bin_size), int(bin_size), self._since(days))
+        )
+
+    def repeat_rate(self, window_hours=24, days=30):
+        """
+        Aynı sembol ve sinyal türünün belirli süre içinde tekrar tespit edilme oranı
+
+        Args:
+            window_hours (float): Tekrar sayılma penceresi (saat)
+            days (int): Son kaç gün
+
+        Returns:
+            pandas.DataFrame: signal_type, detected, repeats, repeat_rate sütunları
+        """
+        return self.query(
+            "SELECT signal_type, COUNT(*) AS detected, "
+            "SUM(CASE WHEN detected_at - previous <= ? THEN 1 ELSE 0 END) AS repeats, "
+            "ROUND(AVG(CASE WHEN detected_at - previous <= ? THEN 1.0 ELSE 0.0 END), 4) AS repeat_rate "
+            "FROM (SELECT signal_type, detected_at, LAG(detected_at) OVER "
+            "      (PARTITION BY symbol, timeframe, signal_type ORDER BY detected_at) AS previous "
+            "      FROM signals WHERE detected_at >= ?) "
+            "GROUP BY signal_type ORDER BY repeat_rate DESC, detected DESC",
+            (window_hours * 3600, window_hours * 3600, self._since(days))
+        )
+
+    def get_open_signals(self, after_id=None):
+        """
+        Gönderilmiş ve sonucu henüz belli olmayan sinyalleri döndürür
+
+        Args:
+            after_id (int, optional): Yalnızca kimliği bundan büyük (daha sonra kaydedilmiş) sinyaller
+
+        Returns:
+            pandas.DataFrame: id, symbol, timeframe, entry, stop_loss, take_profit, candle_time,
+            candle_high, candle_low sütunları
+        """
+        if not self.enabled:
+            return pd.DataFrame(columns=['id', 'symbol', 'timeframe', 'entry', 'stop_loss', 'take_profit',
+                                         'candle_time', 'candle_high', 'candle_low'])
+
+        return self.query(
+            "SELECT id, symbol, timeframe, entry, stop_loss, take_profit, candle_time, candle_high, candle_low FROM signals "
+            "WHERE sent = 1 AND outcome IS NULL AND stop_loss IS NOT NULL AND take_profit IS NOT NULL "
+            "AND candle_time IS NOT NULL AND id > ?",
+            (after_id or 0,)
+        )
+
+    def record_outcomes(self, outcomes):
+        """
+        Sonuçlanan sinyallerin sonuçlarını tek işlemde yazar
+
+        Args:
+            outcomes (list): (id, outcome, resolved_at, bars_to_resolution) demetleri
+        """
+        if not self.enabled or not outcomes:
+            return
+
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "UPDATE signals SET outcome = ?, resolved_at = ?, bars_to_resolution = ? WHERE id = ? AND outcome IS NULL",
+                    [(outcome, resolved_at, bars, signal_id) for signal_id, outcome, resolved_at, bars in outcomes]
+                )
+        except sqlite3.Error as e:
+            logger.error("Sinyal sonuçları kaydedilirken hata: %s", e, exc_info=True)
+
+    def outcome_stats(self, days=90):
+        """
+        Sinyal türü bazında TP/SL isabet oranları ve ortalama sonuçlanma süresi
+
+        Args:
+            days (int): Son kaç gün
+
+        Returns:
+            pandas.DataFrame: signal_type, resolved, take_profit, stop_loss, expired, hit_rate, avg_hours sütunları
+        """
+        return self.query(
+            "SELECT signal_type, COUNT(*) AS resolved, "
+            "SUM(outcome = 'take_profit') AS take_profit, SUM(outcome = 'stop_loss') AS stop_loss, "
+            "SUM(outcome = 'expired') AS expired, "
+            "ROUND(AVG(CASE WHEN outcome = 'take_profit' THEN 1.0 WHEN outcome = 'stop_loss' THEN 0.0 END), 4) AS hit_rate, "
+            "ROUND(AVG(CASE WHEN outcome != 'expired' THEN (resolved_at - candle_time) / 3600000.0 END), 2) AS avg_hours "
+            "FROM signals WHERE sent = 1 AND outcome IS NOT NULL AND detected_at >= ? "
+            "GROUP BY signal_type ORDER BY resolved DESC",
+            (self._since(days),)
+        )
+
+    def close(self):
+        """Veritabanı bağlantısını kapatır"""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
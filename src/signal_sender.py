@@ -3,14 +3,147 @@
 Kripto Teknik Analiz Botu - Sinyal Gönderme Modülü
 """
 import os
+import json
 import time
+import hashlib
+import threading
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from concurrent.futures import Future
 from chart_generator import ChartGenerator
+from message_queue import DeliveryQueue, gather_results, PRIORITY_ALERT, PRIORITY_SIGNAL
 from utils.logger import setup_logger
+from utils.instrumentation import profiler
+from utils.metrics import API_REQUESTS, RATE_LIMIT_WAIT
 
 # Logger kurulumu
 logger = setup_logger("signal_sender")
 
+# Tüm gönderici örneklerinin paylaştığı HTTP oturumu
+_session = None
+_session_lock = threading.Lock()
+
+def is_idempotent(api_method):
+    """Telegram metodunun tekrar çağrılmasının yan etkisi olmadığı (getMe, getFile ...) durum"""
+    return api_method.startswith("get")
+
+def request_not_sent(error):
+    """
+    Bağlantı hatasının istek sunucuya ulaşmadan oluşup oluşmadığı
+    
+    Bağlantı zaman aşımı ve reddedilen bağlantıda istek gönderilmemiştir.
+    Okuma zaman aşımı veya bağlantının yanıt beklenirken kopmasında Telegram
+    isteği işlemiş olabilir.
+    
+    Args:
+        error (requests.RequestException): Bağlantı hatası
+        
+    Returns:
+        bool: İstek kesinlikle gönderilmediyse True
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if isinstance(error, requests.ReadTimeout):
+        return False
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+def get_telegram_session(http_settings):
+    """
+    Telegram API için paylaşılan, bağlantı havuzlu HTTP oturumunu döndürür
+    
+    Args:
+        http_settings (dict): Config.TELEGRAM_HTTP ayarları
+        
+    Returns:
+        requests.Session: Keep-alive destekli oturum
+    """
+    global _session
+    
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            # Yeniden denemeler _api_request içinde yapılır, adaptör tek deneme yapar
+            adapter = HTTPAdapter(
+                pool_connections=http_settings.get('pool_connections', 4),
+                pool_maxsize=http_settings.get('pool_maxsize', 8),
+                max_retries=0
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+class FileIdCache:
+    """Yüklenen görüntülerin Telegram file_id değerlerini içerik özetine göre saklayan küçük LRU önbellek"""
+    
+    def __init__(self, max_entries=256, cache_file=None):
+        """
+        Önbelleği başlatır ve varsa diskteki kayıtları yükler
+        
+        Args:
+            max_entries (int): Tutulacak en fazla kayıt
+            cache_file (str, optional): Kayıtların saklanacağı JSON dosyası
+        """
+        self.max_entries = max_entries
+        self.cache_file = cache_file
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+    
+    @staticmethod
+    def digest(data):
+        """Görüntü içeriğinin özetini döndürür"""
+        return hashlib.sha256(data).hexdigest()
+    
+    def get(self, digest):
+        """Özete ait file_id değerini döndürür (yoksa None)"""
+        with self._lock:
+            file_id = self._entries.get(digest)
+            if file_id is not None:
+                self._entries.move_to_end(digest)
+            return file_id
+    
+    def put(self, digest, file_id):
+        """Özet için file_id kaydeder"""
+        with self._lock:
+            self._entries[digest] = file_id
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._save()
+    
+    def discard(self, digest):
+        """Geçersiz hale gelen kaydı siler"""
+        with self._lock:
+            if self._entries.pop(digest, None) is not None:
+                self._save()
+    
+    def _load(self):
+        """Kayıtları dosyadan yükler"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                for digest, file_id in json.load(f).items():
+                    self._entries[digest] = file_id
+        except Exception as e:
+            logger.warning("file_id önbelleği yüklenemedi: %s", e)
+    
+    def _save(self):
+        """Kayıtları dosyaya atomik olarak yazar"""
+        if not self.cache_file:
+            return
+        try:
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.warning("file_id önbelleği kaydedilemedi: %s", e)
+
 class TelegramSender:
     """Telegram üzerinden sinyal gönderen sınıf"""
     
@@ -22,6 +155,22 @@ class TelegramSender:
         self.signals_chat_id = config.TELEGRAM_SIGNALS_CHAT_ID  # Sadece işlem sinyalleri için kanal
         self.chart_generator = ChartGenerator(config)
         
+        # HTTP oturumu ve yeniden deneme ayarları
+        self.http_settings = config.TELEGRAM_HTTP
+        self.session = get_telegram_session(self.http_settings)
+        self.api_url = f"{config.TELEGRAM_API_BASE_URL.rstrip('/')}/bot{self.bot_token}"
+        
+        # Sohbet bazlı hız sınırlı gönderim kuyruğu
+        self.delivery_queue = DeliveryQueue(config)
+        
+        # Aynı görüntüyü her sohbete yeniden yüklememek için file_id önbelleği
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+        os.makedirs(data_dir, exist_ok=True)
+        self.file_id_cache = FileIdCache(
+            max_entries=config.TELEGRAM_FILE_ID_CACHE_SIZE,
+            cache_file=os.path.join(data_dir, 'telegram_file_ids.json')
+        )
+        
         # API anahtarlarını kontrol et
         if not self.bot_token or not self.chart_chat_id:
             logger.warning("Telegram API anahtarları eksik! .env dosyasını kontrol edin.")
@@ -37,40 +186,125 @@ class TelegramSender:
         else:
             logger.info("Telegram sinyal gönderici başlatıldı")
             # API bağlantısını test et
-            self._test_connection()
+            if config.TELEGRAM_TEST_ON_START:
+                self._test_connection()
+    
+    def _api_request(self, api_method, data=None, files=None, http_method="post"):
+        """
+        Telegram Bot API çağrısı yapar
+        
+        429 yanıtları Telegram'ın bildirdiği retry_after süresi kadar beklenerek
+        sınırlı sayıda yeniden denenir. Okuma metotları (getMe, getFile ...)
+        bağlantı hatalarında ve 5xx yanıtlarında üstel bekleme ile yeniden
+        denenir. Gönderim metotları (sendMessage, sendPhoto ...) aynı mesajın iki
+        kez gönderilmemesi için yalnızca istek sunucuya ulaşmadıysa (bağlantı
+        zaman aşımı, reddedilen bağlantı) yeniden denenir.
+        
+        Args:
+            api_method (str): API metodu (örn. sendMessage)
+            data (dict, optional): Form verileri
+            files (dict, optional): Yüklenecek dosyalar (içerik bytes olmalı)
+            http_method (str): HTTP metodu
+            
+        Returns:
+            requests.Response: Son alınan yanıt
+        """
+        url = f"{self.api_url}/{api_method}"
+        timeout = (self.http_settings.get('connect_timeout', 5), self.http_settings.get('read_timeout', 30))
+        max_retries = self.http_settings.get('max_retries', 3)
+        backoff_factor = self.http_settings.get('backoff_factor', 1.0)
+        max_retry_after = self.http_settings.get('max_retry_after', 60)
+        idempotent = is_idempotent(api_method)
+        
+        # Yüklenen dosyaların boyutu (ölçümler için)
+        upload_bytes = sum(len(f[1]) for f in files.values()) if files else 0
+        
+        attempt = 0
+        while True:
+            try:
+                with profiler.stage(f"telegram.{api_method}"):
+                    response = self.session.request(http_method, url, data=data, files=files, timeout=timeout)
+                profiler.add_bytes("telegram", bytes_in=len(response.content), bytes_out=upload_bytes)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                API_REQUESTS.labels("telegram", api_method, "error").inc()
+                if attempt >= max_retries or not (idempotent or request_not_sent(e)):
+                    raise
+                wait_time = backoff_factor * (2 ** attempt)
+                logger.warning("Telegram %s bağlantı hatası, %.1f saniye sonra tekrar denenecek: %s", api_method, wait_time, e)
+                time.sleep(wait_time)
+                attempt += 1
+                continue
+            
+            API_REQUESTS.labels("telegram", api_method, response.status_code).inc()
+            
+            if response.status_code == 429 and attempt < max_retries:
+                retry_after = self._get_retry_after(response, backoff_factor * (2 ** attempt))
+                if retry_after > max_retry_after:
+                    logger.error("Telegram %s flood kontrolü çok uzun (%s saniye), yeniden denenmeyecek", api_method, retry_after)
+                    return response
+                logger.warning("Telegram %s flood kontrolü (429), %s saniye bekleniyor", api_method, retry_after)
+                time.sleep(retry_after)
+                RATE_LIMIT_WAIT.labels("telegram").inc(retry_after)
+                attempt += 1
+                continue
+            
+            if response.status_code >= 500 and idempotent and attempt < max_retries:
+                wait_time = backoff_factor * (2 ** attempt)
+                logger.warning("Telegram %s sunucu hatası (%s), %.1f saniye sonra tekrar denenecek", api_method, response.status_code, wait_time)
+                time.sleep(wait_time)
+                attempt += 1
+                continue
+            
+            return response
+    
+    def _get_retry_after(self, response, default):
+        """429 yanıtından beklenecek süreyi (saniye) çıkarır"""
+        try:
+            retry_after = response.json().get('parameters', {}).get('retry_after')
+            if retry_after is not None:
+                return float(retry_after)
+        except ValueError:
+            pass
+        
+        header_value = response.headers.get('Retry-After')
+        if header_value:
+            try:
+                return float(header_value)
+            except ValueError:
+                pass
+        
+        return default
     
     def _test_connection(self):
         """Telegram API bağlantısını test eder"""
         try:
-            url = f"https://api.telegram.org/bot{self.bot_token}/getMe"
-            response = requests.get(url)
+            response = self._api_request("getMe", http_method="get")
             
             if response.status_code == 200:
                 bot_info = response.json()
                 if bot_info.get("ok"):
                     bot_name = bot_info["result"].get("first_name")
                     bot_username = bot_info["result"].get("username")
-                    logger.info(f"Telegram bot bağlantısı başarılı: {bot_name} (@{bot_username})")
+                    logger.info("Telegram bot bağlantısı başarılı: %s (@%s)", bot_name, bot_username)
                     
                     # Chat ID'leri test et
                     self._test_chat_id(self.chart_chat_id, "Grafik kanalı")
                     if self.signals_chat_id:
                         self._test_chat_id(self.signals_chat_id, "Sinyal kanalı")
                 else:
-                    logger.error(f"Bot bilgileri alınamadı: {bot_info}")
+                    logger.error("Bot bilgileri alınamadı: %s", bot_info)
             else:
-                logger.error(f"Telegram API bağlantı hatası: {response.text}")
+                logger.error("Telegram API bağlantı hatası: %s", response.text)
         except Exception as e:
-            logger.error(f"Telegram bağlantı testi sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Telegram bağlantı testi sırasında hata: %s", e, exc_info=True)
     
     def _test_chat_id(self, chat_id, chat_name):
         """Chat ID'nin geçerliliğini test eder"""
         try:
             if not chat_id:
-                logger.warning(f"{chat_name} ID'si tanımlanmamış, atlanıyor.")
+                logger.warning("%s ID'si tanımlanmamış, atlanıyor.", chat_name)
                 return
                 
-            url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
             data = {
                 "chat_id": chat_id,
                 "text": f"🔄 NAPOLYON CRYPTO SCANNER {chat_name} bağlantı testi başarılı! Bot aktif ve çalışıyor.",
@@ -78,26 +312,26 @@ class TelegramSender:
                 "disable_notification": True
             }
             
-            response = requests.post(url, data=data)
+            response = self._api_request("sendMessage", data=data)
             
             if response.status_code == 200:
-                logger.info(f"{chat_name} bağlantısı başarılı: {chat_id}")
+                logger.info("%s bağlantısı başarılı: %s", chat_name, chat_id)
             else:
                 error_data = response.json()
-                logger.error(f"{chat_name} ID hatası: {error_data.get('description', 'Bilinmeyen hata')}")
+                logger.error("%s ID hatası: %s", chat_name, error_data.get('description', 'Bilinmeyen hata'))
                 
                 if "chat not found" in response.text.lower():
-                    logger.error(f"{chat_name} ID bulunamadı. Lütfen şunları kontrol edin:")
+                    logger.error("%s ID bulunamadı. Lütfen şunları kontrol edin:", chat_name)
                     logger.error("1. Bot, hedef kanala/gruba eklenmiş mi?")
                     logger.error("2. Kanal/grup için doğru ID kullanılıyor mu?")
                     logger.error("3. Kanal ID'si için @ işareti kullanılıyor mu? (örn: @kanal_adi)")
                     logger.error("4. Grup ID'si için - işareti ile başlıyor mu? (örn: -1001234567890)")
         except Exception as e:
-            logger.error(f"{chat_name} ID testi sırasında hata: {str(e)}", exc_info=True)
+            logger.error("%s ID testi sırasında hata: %s", chat_name, e, exc_info=True)
     
     def send_signal(self, signal):
         """
-        Sinyali Telegram kanallarına gönderir
+        Sinyali Telegram kanallarına gönderir ve gönderimin bitmesini bekler
         
         Args:
             signal (dict): Gönderilecek sinyal bilgileri
@@ -105,58 +339,90 @@ class TelegramSender:
         Returns:
             bool: Gönderim başarılı mı?
         """
+        return self.submit_signal(signal).result()
+    
+    def submit_signal(self, signal):
+        """
+        Sinyalin grafiğini hazırlar ve mesajlarını gönderim kuyruğuna ekler
+        
+        Args:
+            signal (dict): Gönderilecek sinyal bilgileri
+            
+        Returns:
+            concurrent.futures.Future: Tüm mesajlar gönderildiğinde başarı durumunu (bool) taşır
+        """
         try:
             # API anahtarlarını kontrol et
             if not self.bot_token or not self.chart_chat_id:
                 logger.error("Telegram API anahtarları eksik! Sinyal gönderilemiyor.")
-                return False
+                return self._completed(False)
                 
             symbol = signal['symbol']
-            timeframe = signal['timeframe']
             signal_type = signal['signal_type']
+            priority = self.get_priority(signal)
             
-            logger.info(f"{symbol} için {signal_type} sinyali gönderiliyor")
+            logger.info("%s için %s sinyali gönderim kuyruğuna ekleniyor", symbol, signal_type)
             
             # Grafik oluştur
             chart_path = self.chart_generator.generate_chart(signal)
             
-            if not chart_path or not os.path.exists(chart_path):
-                logger.error(f"Grafik oluşturulamadı: {chart_path}")
-                # Grafik olmadan mesajı gönder
-                chart_message = self._format_chart_message(signal)
-                signals_message = self._format_signals_message(signal)
-                
-                chart_success = self._send_text_message(chart_message, self.chart_chat_id)
-                signals_success = True
-                
-                if self.signals_chat_id:
-                    signals_success = self._send_text_message(signals_message, self.signals_chat_id)
-                
-                return chart_success and signals_success
-            
             # Mesajları hazırla
             chart_message = self._format_chart_message(signal)
             signals_message = self._format_signals_message(signal)
             
-            # Fotoğraf ve mesajı birlikte gönder
-            chart_success = self._send_photo_with_caption(chart_path, chart_message, self.chart_chat_id)
+            futures = []
+            
+            if not chart_path or not os.path.exists(chart_path):
+                logger.error("Grafik oluşturulamadı: %s", chart_path)
+                # Grafik olmadan mesajı gönder
+                futures.append(self.delivery_queue.submit(
+                    self.chart_chat_id, self._send_text_message, chart_message, self.chart_chat_id, priority=priority))
+            else:
+                # Fotoğraf ve mesajı birlikte gönder
+                chart_future = self.delivery_queue.submit(
+                    self.chart_chat_id, self._send_photo_with_caption, chart_path, chart_message, self.chart_chat_id,
+                    priority=priority)
+                # Gönderim bittiğinde geçici grafik dosyasını temizle
+                chart_future.add_done_callback(lambda _: self._remove_chart_file(chart_path))
+                futures.append(chart_future)
             
             # Sinyal kanalına işlem detaylarını gönder (eğer ikinci kanal tanımlanmışsa)
-            signals_success = True
             if self.signals_chat_id:
-                signals_success = self._send_text_message(signals_message, self.signals_chat_id)
+                futures.append(self.delivery_queue.submit(
+                    self.signals_chat_id, self._send_text_message, signals_message, self.signals_chat_id, priority=priority))
             
-            # Geçici grafik dosyasını temizle
-            try:
-                os.remove(chart_path)
-            except Exception as e:
-                logger.warning(f"Geçici grafik dosyası temizlenirken hata: {str(e)}")
+            return gather_results(futures)
             
-            return chart_success and signals_success
+        except Exception as e:
+            logger.error("Sinyal gönderilirken hata: %s", e, exc_info=True)
+            return self._completed(False)
+    
+    def get_priority(self, signal):
+        """
+        Sinyalin gönderim önceliğini döndürür (uyarılar rutin sinyallerden önce gider)
+        
+        Args:
+            signal (dict): Sinyal bilgileri
             
+        Returns:
+            int: Öncelik değeri (küçük olan önce gönderilir)
+        """
+        if "Volatility Alert" in signal['signal_type']:
+            return PRIORITY_ALERT
+        return PRIORITY_SIGNAL
+    
+    def _completed(self, result):
+        """Sonucu hazır bir future döndürür"""
+        future = Future()
+        future.set_result(result)
+        return future
+    
+    def _remove_chart_file(self, chart_path):
+        """Geçici grafik dosyasını temizler"""
+        try:
+            os.remove(chart_path)
         except Exception as e:
-            logger.error(f"Sinyal gönderilirken hata: {str(e)}", exc_info=True)
-            return False
+            logger.warning("Geçici grafik dosyası temizlenirken hata: %s", e)
     
     def _format_chart_message(self, signal):
         """
@@ -189,6 +455,11 @@ class TelegramSender:
             if quality_score > 0:
                 message += f"⭐️ Kalite: {quality_score}/100\n"
             
+            # Üst zaman dilimi trend uyumu
+            confluence = signal.get('confluence')
+            if confluence:
+                message += f"🧭 Üst zaman dilimi uyumu: {', '.join(f'{tf} {label}' for tf, label in confluence.items())}\n"
+            
             # Açıklama - ADX ve Trend bilgilerini içermiyorsa ekle
             if description and not any(keyword in description for keyword in ["ADX", "trend gösteriyor", "Trend takibi"]):
                 message += f"\n<b>📝 {description}</b>\n"
@@ -290,7 +561,7 @@ class TelegramSender:
             return message
             
         except Exception as e:
-            logger.error(f"Grafik mesajı formatlanırken hata: {str(e)}", exc_info=True)
+            logger.error("Grafik mesajı formatlanırken hata: %s", e, exc_info=True)
             return f"NAPOLYON CRYPTO SCANNER: {signal['symbol']} - {signal['signal_type']}"
     
     def _format_signals_message(self, signal):
@@ -348,7 +619,7 @@ class TelegramSender:
             return message
             
         except Exception as e:
-            logger.error(f"Sinyal mesajı formatlanırken hata: {str(e)}", exc_info=True)
+            logger.error("Sinyal mesajı formatlanırken hata: %s", e, exc_info=True)
             return f"NAPOLYON CRYPTO SCANNER: {signal['symbol']} - {signal['signal_type']}"
     
     def _send_text_message(self, message, chat_id):
@@ -367,24 +638,23 @@ class TelegramSender:
                 logger.warning("Chat ID tanımlanmamış, mesaj gönderilemiyor.")
                 return False
                 
-            url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
             data = {
                 "chat_id": chat_id,
                 "text": message,
                 "parse_mode": "HTML"  # Markdown yerine HTML kullan
             }
             
-            response = requests.post(url, data=data)
+            response = self._api_request("sendMessage", data=data)
             
             if response.status_code == 200:
-                logger.info(f"Metin mesajı başarıyla gönderildi: {chat_id}")
+                logger.info("Metin mesajı başarıyla gönderildi: %s", chat_id)
                 return True
             else:
-                logger.error(f"Metin mesajı gönderilirken hata: { response.text}")
+                logger.error("Metin mesajı gönderilirken hata: %s", response.text)
                 return False
                 
         except Exception as e:
-            logger.error(f"Metin mesajı gönderilirken hata: {str(e)}", exc_info=True)
+            logger.error("Metin mesajı gönderilirken hata: %s", e, exc_info=True)
             return False
     
     def _send_photo_with_caption(self, photo_path, caption, chat_id):
@@ -407,6 +677,10 @@ class TelegramSender:
             # Telegram API'nin caption uzunluk sınırı (1024 karakter)
             max_caption_length = 1024
             
+            # Yeniden denemelerde tekrar okunabilmesi için fotoğrafı belleğe al
+            with open(photo_path, 'rb') as photo:
+                photo_bytes = photo.read()
+            
             # HTML etiketlerini temizle
             clean_caption = caption
             
@@ -416,20 +690,10 @@ class TelegramSender:
                 short_caption = clean_caption[:max_caption_length-50] + "...\n(Devamı için bir sonraki mesaja bakın)"
                 
                 # Fotoğrafı kısaltılmış açıklamayla gönder
-                url = f"https://api.telegram.org/bot{self.bot_token}/sendPhoto"
-                
-                with open(photo_path, 'rb') as photo:
-                    files = {'photo': photo}
-                    data = {
-                        "chat_id": chat_id,
-                        "caption": short_caption,
-                        "parse_mode": "HTML"
-                    }
-                    
-                    response = requests.post(url, data=data, files=files)
+                response = self._send_photo(photo_bytes, os.path.basename(photo_path), short_caption, chat_id)
                 
                 if response.status_code == 200:
-                    logger.info(f"Fotoğraf mesajı başarıyla gönderildi: {chat_id}")
+                    logger.info("Fotoğraf mesajı başarıyla gönderildi: %s", chat_id)
                     
                     # Kalan açıklamayı ayrı bir metin mesajı olarak gönder
                     remaining_text = clean_caption[max_caption_length-50:]
@@ -437,28 +701,61 @@ class TelegramSender:
                     
                     return True
                 else:
-                    logger.error(f"Fotoğraf mesajı gönderilirken hata: {response.text}")
+                    logger.error("Fotoğraf mesajı gönderilirken hata: %s", response.text)
                     return False
             else:
                 # Açıklama kısa ise, doğrudan gönder
-                url = f"https://api.telegram.org/bot{self.bot_token}/sendPhoto"
-                
-                with open(photo_path, 'rb') as photo:
-                    files = {'photo': photo}
-                    data = {
-                        "chat_id": chat_id,
-                        "caption": clean_caption,
-                        "parse_mode": "HTML"
-                    }
-                    
-                    response = requests.post(url, data=data, files=files)
+                response = self._send_photo(photo_bytes, os.path.basename(photo_path), clean_caption, chat_id)
                 
                 if response.status_code == 200:
-                    logger.info(f"Fotoğraf ve açıklama başarıyla gönderildi: {chat_id}")
+                    logger.info("Fotoğraf ve açıklama başarıyla gönderildi: %s", chat_id)
                     return True
                 else:
-                    logger.error(f"Fotoğraf ve açıklama gönderilirken hata: {response.text}")
+                    logger.error("Fotoğraf ve açıklama gönderilirken hata: %s", response.text)
                     return False
         except Exception as e:
-            logger.error(f"Fotoğraf ve açıklama gönderilirken hata: {str(e)}", exc_info=True)
-            return False
\ No newline at end of file
+            logger.error("Fotoğraf ve açıklama gönderilirken hata: %s", e, exc_info=True)
+            return False
+    
+    def _send_photo(self, photo_bytes, filename, caption, chat_id):
+        """
+        Fotoğrafı gönderir; aynı görüntü daha önce yüklendiyse file_id ile referans verir
+        
+        Args:
+            photo_bytes (bytes): PNG içeriği
+            filename (str): Yükleme için dosya adı
+            caption (str): Fotoğraf açıklaması
+            chat_id (str): Hedef chat ID
+            
+        Returns:
+            requests.Response: sendPhoto yanıtı
+        """
+        digest = self.file_id_cache.digest(photo_bytes)
+        data = {
+            "chat_id": chat_id,
+            "caption": caption,
+            "parse_mode": "HTML"
+        }
+        
+        file_id = self.file_id_cache.get(digest)
+        if file_id:
+            response = self._api_request("sendPhoto", data=dict(data, photo=file_id))
+            if response.status_code == 200:
+                logger.info("Fotoğraf yeniden yüklenmeden file_id ile gönderildi: %s", chat_id)
+                return response
+            # file_id artık geçerli değilse dosyayı yeniden yükle
+            logger.warning("file_id ile gönderim başarısız, fotoğraf yeniden yüklenecek: %s", response.text)
+            self.file_id_cache.discard(digest)
+        
+        files = {'photo': (filename, photo_bytes, 'image/png')}
+        response = self._api_request("sendPhoto", data=data, files=files)
+        
+        if response.status_code == 200:
+            try:
+                # En büyük çözünürlüğün file_id değeri tekrar kullanılır
+                sizes = response.json()['result']['photo']
+                self.file_id_cache.put(digest, sizes[-1]['file_id'])
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                logger.warning("Yanıttan file_id alınamadı: %s", e)
+        
+        return response
\ No newline at end of file
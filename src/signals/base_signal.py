@@ -2,6 +2,7 @@
 """
 Kripto Teknik Analiz Botu - Temel Sinyal Sınıfı
 """
+from signals.quality_scorer import QUALITY_COLUMNS, QUALITY_LOOKBACK, score_arrays
 from utils.logger import setup_logger
 
 # Logger kurulumu
@@ -10,11 +11,15 @@ logger = setup_logger("base_signal")
 class BaseSignal:
     """Tüm sinyal türleri için temel sınıf"""
     
+    # Modülün okuduğu son mum sayısı ve kullandığı indikatör sütunları (gereken geçmiş hesabı için)
+    lookback = 1
+    required_columns = ()
+    
     def __init__(self, config):
         """Sinyal tespit parametrelerini ayarlar"""
         self.config = config
         self.name = "Base Signal"
-        logger.info(f"{self.name} sinyal modülü başlatıldı")
+        logger.info("%s sinyal modülü başlatıldı", self.name)
     
     def check_signals(self, symbol, timeframe, df):
         """
@@ -30,10 +35,26 @@ class BaseSignal:
         """
         return []
     
+    def min_history(self, indicators):
+        """
+        Modülün tam geçmişle aynı sonucu vermesi için gereken en az mum sayısı
+        
+        Args:
+            indicators (TechnicalIndicators): Isınma sürelerini sağlayan indikatör hesaplayıcı
+            
+        Returns:
+            int: Mum sayısı
+        """
+        return self.lookback + indicators.warmup_bars(self.required_columns)
+    
     def calculate_signal_quality(self, df, is_bullish):
         """
         Sinyal kalitesini hesaplar (0-100 arası)
         
+        SignalAnalyzer puanları tüm mumlar için bir kez hesaplayıp DataFrame'e
+        ekler (signals.quality_scorer); bu durumda son mumun puanı okunur.
+        Sütunlar yoksa puan yalnızca son mumlar üzerinden hesaplanır.
+        
         Args:
             df (pandas.DataFrame): Fiyat verileri
             is_bullish (bool): Sinyal boğa sinyali mi?
@@ -41,64 +62,16 @@ class BaseSignal:
         Returns:
             int: Kalite puanı (0-100)
         """
-        quality = 50  # Başlangıç puanı
+        column = QUALITY_COLUMNS[bool(is_bullish)]
         
         try:
-            # Trend gücü
-            ema_short = df['ema_short'].iloc[-1]
-            ema_long = df['ema_long'].iloc[-1]
-            
-            if is_bullish:
-                # Boğa sinyali için trend kontrolü
-                if ema_short > ema_long:
-                    quality += 10  # Yükselen trend
-                else:
-                    quality -= 10  # Düşen trend
-                
-                # RSI kontrolü
-                if df['rsi'].iloc[-1] < 30:
-                    quality += 15  # Aşırı satım bölgesi
-                elif df['rsi'].iloc[-1] < 50:
-                    quality += 5  # Nötr bölge
-                
-                # MACD kontrolü
-                if df['macd'].iloc[-1] > df['macd_signal'].iloc[-1]:
-                    quality += 10  # MACD pozitif
-                
-                # Bollinger Bantları kontrolü
-                if df['close'].iloc[-1] < df['bb_lower'].iloc[-1]:
-                    quality += 10  # Fiyat alt bandın altında
-            else:
-                # Ayı sinyali için trend kontrolü
-                if ema_short < ema_long:
-                    quality += 10  # Düşen trend
-                else:
-                    quality -= 10  # Yükselen trend
-                
-                # RSI kontrolü
-                if df['rsi'].iloc[-1] > 70:
-                    quality += 15  # Aşırı alım bölgesi
-                elif df['rsi'].iloc[-1] > 50:
-                    quality += 5  # Nötr bölge
-                
-                # MACD kontrolü
-                if df['macd'].iloc[-1] < df['macd_signal'].iloc[-1]:
-                    quality += 10  # MACD negatif
-                
-                # Bollinger Bantları kontrolü
-                if df['close'].iloc[-1] > df['bb_upper'].iloc[-1]:
-                    quality += 10  # Fiyat üst bandın üstünde
-            
-            # Hacim kontrolü
-            avg_volume = df['volume'].iloc[-5:].mean()
-            if df['volume'].iloc[-1] > 1.5 * avg_volume:
-                quality += 10  # Hacim artışı
+            if column in df.columns:
+                return int(df[column].iloc[-1])
             
-            # Kaliteyi 0-100 arasında sınırla
-            quality = max(0, min(100, quality))
-            
-        except Exception as e:
-            logger.error(f"Sinyal kalitesi hesaplanırken hata: {str(e)}", exc_info=True)
-            quality = 50  # Hata durumunda orta kalite
+            # Hacim ortalaması için son QUALITY_LOOKBACK mum yeterli
+            bullish, bearish = score_arrays(df.iloc[-QUALITY_LOOKBACK:])
+            return int(bullish[-1] if is_bullish else bearish[-1])
         
-        return quality
\ No newline at end of file
+        except Exception as e:
+            logger.error("Sinyal kalitesi hesaplanırken hata: %s", e, exc_info=True)
+            return 50  # Hata durumunda orta kalite
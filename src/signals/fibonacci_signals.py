@@ -3,6 +3,7 @@
 Kripto Teknik Analiz Botu - Fibonacci Sinyalleri Modülü
 """
 from signals.base_signal import BaseSignal
+from signals.signal_record import Signal
 from utils.logger import setup_logger
 
 # Logger kurulumu
@@ -11,6 +12,9 @@ logger = setup_logger("fibonacci_signals")
 class FibonacciSignals(BaseSignal):
     """Fibonacci tabanlı sinyalleri tespit eden sınıf"""
     
+    # Fibonacci seviyeleri son 100 mumun en yüksek/en düşük değerinden çizilir
+    lookback = 100
+    
     def __init__(self, config):
         """Fibonacci sinyal tespit parametrelerini ayarlar"""
         super().__init__(config)
@@ -111,23 +115,23 @@ class FibonacciSignals(BaseSignal):
                     # Eğer bu seviye daha iyi bir kaliteye sahipse, en iyi sinyal olarak kaydet
                     if quality > best_fib_quality:
                         best_fib_quality = quality
-                        best_fib_signal = {
-                            'symbol': symbol,
-                            'timeframe': timeframe,
-                            'signal_type': signal_type,
-                            'entry': entry,
-                            'stop_loss': stop_loss,
-                            'take_profit': take_profit,
-                            'timestamp': df.index[-1],
-                            'quality_score': quality,
-                            'description': description
-                        }
+                        best_fib_signal = Signal(
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            signal_type=signal_type,
+                            entry=entry,
+                            stop_loss=stop_loss,
+                            take_profit=take_profit,
+                            timestamp=df.index[-1],
+                            quality_score=quality,
+                            description=description
+                        )
             
             # Eğer bir Fibonacci sinyali bulunduysa, listeye ekle
             if best_fib_signal:
                 signals.append(best_fib_signal)
         
         except Exception as e:
-            logger.error(f"Fibonacci seviyeleri kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Fibonacci seviyeleri kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
\ No newline at end of file
@@ -3,6 +3,7 @@
 Kripto Teknik Analiz Botu - Mum Formasyonları Sinyalleri Modülü
 """
 from signals.base_signal import BaseSignal
+from signals.signal_record import Signal
 from utils.logger import setup_logger
 
 # Logger kurulumu
@@ -11,6 +12,9 @@ logger = setup_logger("pattern_signals")
 class PatternSignals(BaseSignal):
     """Mum formasyonları tabanlı sinyalleri tespit eden sınıf"""
     
+    # Formasyonlar son 10 muma kadar bakar (doji öncesi trend)
+    lookback = 10
+    
     def __init__(self, config):
         """Mum formasyonları sinyal tespit parametrelerini ayarlar"""
         super().__init__(config)
@@ -67,20 +71,20 @@ class PatternSignals(BaseSignal):
                 
                 # Mum formasyonu sinyalini oluştur
                 # Bu sinyaller artık "Diğer Tespit Edilen Sinyaller" bölümünde gösterilecek
-                signals.append({
-                    'symbol': symbol,
-                    'timeframe': timeframe,
-                    'signal_type': f'Pattern: {pattern_type}',
-                    'entry': entry,
-                    'stop_loss': stop_loss,
-                    'take_profit': take_profit,
-                    'timestamp': df.index[-1],
-                    'quality_score': quality,
-                    'description': pattern['description'],
-                    'is_pattern': True  # Bu bir mum formasyonu sinyali olduğunu belirtmek için
-                })
+                signals.append(Signal(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    signal_type=f'Pattern: {pattern_type}',
+                    entry=entry,
+                    stop_loss=stop_loss,
+                    take_profit=take_profit,
+                    timestamp=df.index[-1],
+                    quality_score=quality,
+                    description=pattern['description'],
+                    is_pattern=True  # Bu bir mum formasyonu sinyali olduğunu belirtmek için
+                ))
         
         except Exception as e:
-            logger.error(f"Mum formasyonları kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Mum formasyonları kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
\ No newline at end of file
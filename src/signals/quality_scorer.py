@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sinyal Kalite Puanlama Modülü
+
+Boğa ve ayı sinyalleri için temel kalite puanını tüm mumlar için dizi olarak
+bir kez hesaplar. Sonuçlar DataFrame'e quality_bullish / quality_bearish
+sütunları (ve puana katkı yapan koşulların bit kodları) olarak eklenir; sinyal
+modülleri her aday sinyal için bu sütunların son değerini okur. Aynı sütunlar
+geriye dönük test ve kalibrasyon için geçmiş kalite serisi olarak da
+kullanılabilir.
+
+Puanlama (50 başlangıç, 0-100 arası sınırlanır):
+    Trend (EMA kısa/uzun)          +10 / -10
+    RSI aşırı satım/alım (30/70)   +15, nötr bölge (50) +5
+    MACD sinyal çizgisine göre     +10
+    Fiyat Bollinger bandı dışında  +10
+    Hacim son 5 mum ortalamasının 1.5 katından fazla  +10
+"""
+import numpy as np
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("quality_scorer")
+
+QUALITY_COLUMNS = {True: 'quality_bullish', False: 'quality_bearish'}
+
+# Koşul kodu sütunları: her bit bir koşulun sağlandığını gösterir (kalite kalibrasyonu için)
+CONDITION_COLUMNS = {True: 'conditions_bullish', False: 'conditions_bearish'}
+CONDITION_BITS = ('trend', 'rsi_extreme', 'rsi_neutral', 'macd', 'bollinger', 'volume')
+
+# Puanlamada kullanılan indikatör sütunları
+REQUIRED_COLUMNS = ('close', 'volume', 'ema_short', 'ema_long', 'rsi', 'macd', 'macd_signal', 'bb_lower', 'bb_upper')
+
+# Hacim ortalaması için okunan son mum sayısı
+QUALITY_LOOKBACK = 5
+
+def _rolling_mean(values, window):
+    """Son N değerin ortalaması (ilk mumlarda mevcut değerler kullanılır)"""
+    padded = np.concatenate((np.full(window - 1, np.nan), values))
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window)
+    with np.errstate(invalid='ignore'):
+        return np.nanmean(windows, axis=1)
+
+def condition_flags(df):
+    """
+    Kalite puanına katkı yapan koşulları tüm mumlar için hesaplar
+
+    Args:
+        df (pandas.DataFrame): İndikatörleri hesaplanmış fiyat verileri
+
+    Returns:
+        dict: {True: boğa koşulları, False: ayı koşulları}; her biri CONDITION_BITS adlarıyla boolean diziler
+    """
+    columns = {name: df[name].to_numpy(dtype=float) for name in REQUIRED_COLUMNS}
+    close, volume, rsi = columns['close'], columns['volume'], columns['rsi']
+    macd, macd_signal = columns['macd'], columns['macd_signal']
+    ema_short, ema_long = columns['ema_short'], columns['ema_long']
+
+    # Yön bağımsız koşul: hacim artışı
+    volume_spike = volume > 1.5 * _rolling_mean(volume, QUALITY_LOOKBACK)
+
+    # NaN karşılaştırmaları False döner; skaler hesaplamayla aynı davranış
+    return {
+        True: {
+            'trend': ema_short > ema_long,
+            'rsi_extreme': rsi < 30,
+            'rsi_neutral': (rsi >= 30) & (rsi < 50),
+            'macd': macd > macd_signal,
+            'bollinger': close < columns['bb_lower'],
+            'volume': volume_spike,
+        },
+        False: {
+            'trend': ema_short < ema_long,
+            'rsi_extreme': rsi > 70,
+            'rsi_neutral': (rsi <= 70) & (rsi > 50),
+            'macd': macd < macd_signal,
+            'bollinger': close > columns['bb_upper'],
+            'volume': volume_spike,
+        },
+    }
+
+def _score(flags):
+    """
+    Koşullardan temel kalite puanını hesaplar
+
+    Args:
+        flags (dict): Tek yön için CONDITION_BITS adlarıyla boolean diziler
+
+    Returns:
+        numpy.ndarray: 0-100 arası kalite puanları
+    """
+    quality = (50
+               + np.where(flags['trend'], 10, -10)
+               + np.where(flags['rsi_extreme'], 15, np.where(flags['rsi_neutral'], 5, 0))
+               + np.where(flags['macd'], 10, 0)
+               + np.where(flags['bollinger'], 10, 0)
+               + np.where(flags['volume'], 10, 0))
+    return np.clip(quality, 0, 100)
+
+def _condition_code(flags):
+    """
+    Koşulları tek tamsayıda bit kodu olarak birleştirir (bit sırası CONDITION_BITS)
+
+    Args:
+        flags (dict): Tek yön için CONDITION_BITS adlarıyla boolean diziler
+
+    Returns:
+        numpy.ndarray: Koşul kodları
+    """
+    code = np.zeros(len(flags['trend']), dtype=int)
+    for bit, name in enumerate(CONDITION_BITS):
+        code |= flags[name].astype(int) << bit
+    return code
+
+def score_arrays(df):
+    """
+    Tüm mumlar için boğa ve ayı temel kalite puanlarını hesaplar
+
+    Args:
+        df (pandas.DataFrame): İndikatörleri hesaplanmış fiyat verileri
+
+    Returns:
+        tuple: (boğa puanları, ayı puanları) - numpy.ndarray[int]
+    """
+    flags = condition_flags(df)
+    return _score(flags[True]), _score(flags[False])
+
+def add_quality_scores(df):
+    """
+    Kalite puanı sütunlarını DataFrame'e ekler
+
+    TechnicalIndicators.ensure gibi sütunları verilen DataFrame'e yerinde
+    ekler (kopya oluşturulmaz); çağıranın verisi korunacaksa df.copy()
+    verilmelidir.
+
+    Args:
+        df (pandas.DataFrame): İndikatörleri hesaplanmış fiyat verileri (yerinde değiştirilir)
+
+    Returns:
+        pandas.DataFrame: Kalite puanı ve koşul kodu sütunları eklenmiş aynı DataFrame
+    """
+    try:
+        flags = condition_flags(df)
+        for is_bullish in (True, False):
+            df[QUALITY_COLUMNS[is_bullish]] = _score(flags[is_bullish])
+            df[CONDITION_COLUMNS[is_bullish]] = _condition_code(flags[is_bullish])
+    except Exception as e:
+        logger.error("Kalite puanları hesaplanırken hata: %s", e, exc_info=True)
+    return df
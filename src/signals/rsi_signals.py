@@ -5,6 +5,8 @@ Kripto Teknik Analiz Botu - RSI Sinyalleri Modülü
 import numpy as np
 import pandas as pd
 from signals.base_signal import BaseSignal
+from signals.signal_record import Signal
+from support_resistance import local_extrema
 from utils.logger import setup_logger
 
 # Logger kurulumu
@@ -13,6 +15,10 @@ logger = setup_logger("rsi_signals")
 class RSISignals(BaseSignal):
     """RSI tabanlı sinyalleri tespit eden sınıf"""
     
+    # Uyumsuzluk kontrolü son 50 mumdaki RSI dip/tepelerini kullanır
+    lookback = 51
+    required_columns = ('rsi',)
+    
     def __init__(self, config):
         """RSI sinyal tespit parametrelerini ayarlar"""
         super().__init__(config)
@@ -35,37 +41,37 @@ class RSISignals(BaseSignal):
         
         # RSI değerlerini kontrol et
         if 'rsi' not in df.columns:
-            logger.warning(f"[X] {symbol} {timeframe} için RSI sütunu bulunamadı!")
+            logger.warning("[X] %s %s için RSI sütunu bulunamadı!", symbol, timeframe)
             return signals
             
         if df['rsi'].isnull().all():
-            logger.warning(f"[X] {symbol} {timeframe} için RSI değerleri hesaplanmamış veya hepsi NaN")
+            logger.warning("[X] %s %s için RSI değerleri hesaplanmamış veya hepsi NaN", symbol, timeframe)
             return signals
         
         # Son RSI değerini logla
         last_rsi = df['rsi'].iloc[-1]
-        logger.info(f"[SCAN] {symbol} {timeframe} için son RSI değeri: {last_rsi:.2f}")
+        logger.info("[SCAN] %s %s için son RSI değeri: %.2f", symbol, timeframe, last_rsi)
         
         # RSI Aşırı Alım/Satım Bölgeleri
-        logger.info(f"[SCAN] {symbol} {timeframe} için RSI aşırı alım/satım kontrolü yapılıyor...")
+        logger.info("[SCAN] %s %s için RSI aşırı alım/satım kontrolü yapılıyor...", symbol, timeframe)
         extreme_signals = self.check_rsi_extreme(symbol, timeframe, df)
         signals.extend(extreme_signals)
         
         # RSI Uyumsuzlukları
-        logger.info(f"[SCAN] {symbol} {timeframe} için RSI uyumsuzluk (Divergence) kontrolü yapılıyor...")
+        logger.info("[SCAN] %s %s için RSI uyumsuzluk (Divergence) kontrolü yapılıyor...", symbol, timeframe)
         divergence_signals = self.check_rsi_divergence(symbol, timeframe, df)
         signals.extend(divergence_signals)
         
         # Sonuçları logla
         if extreme_signals:
-            logger.info(f"[OK] {symbol} {timeframe} için {len(extreme_signals)} adet RSI aşırı alım/satım sinyali bulundu")
+            logger.info("[OK] %s %s için %s adet RSI aşırı alım/satım sinyali bulundu", symbol, timeframe, len(extreme_signals))
         else:
-            logger.info(f"[X] {symbol} {timeframe} için RSI aşırı alım/satım sinyali bulunamadı")
+            logger.info("[X] %s %s için RSI aşırı alım/satım sinyali bulunamadı", symbol, timeframe)
             
         if divergence_signals:
-            logger.info(f"[OK] {symbol} {timeframe} için {len(divergence_signals)} adet RSI uyumsuzluk sinyali bulundu")
+            logger.info("[OK] %s %s için %s adet RSI uyumsuzluk sinyali bulundu", symbol, timeframe, len(divergence_signals))
         else:
-            logger.info(f"[X] {symbol} {timeframe} için RSI uyumsuzluk sinyali bulunamadı")
+            logger.info("[X] %s %s için RSI uyumsuzluk sinyali bulunamadı", symbol, timeframe)
         
         return signals
     
@@ -78,36 +84,23 @@ class RSISignals(BaseSignal):
             lookback = min(50, len(df) - 1)
             
             if lookback < 10:
-                logger.warning(f"[X] {symbol} {timeframe} için yeterli veri yok (en az 10 mum gerekli)")
+                logger.warning("[X] %s %s için yeterli veri yok (en az 10 mum gerekli)", symbol, timeframe)
                 return signals
             
-            # Fiyat ve RSI için yerel minimum ve maksimumları bul
-            price_lows = []
-            price_highs = []
-            rsi_lows = []
-            rsi_highs = []
+            # Son 50 mumda fiyat ve RSI için yerel minimum ve maksimumları bul (önceki ve sonraki 5 mum)
+            recent = df.iloc[-lookback:]
+            lows = recent['low'].to_numpy(dtype=float)
+            highs = recent['high'].to_numpy(dtype=float)
+            rsi = recent['rsi'].to_numpy(dtype=float)
             
-            # Son 50 mumda yerel minimum ve maksimumları bul
-            for i in range(5, lookback - 5):
-                # Yerel minimum (dip) kontrolü
-                if (df['low'].iloc[i-5:i].min() > df['low'].iloc[i]) and (df['low'].iloc[i+1:i+6].min() > df['low'].iloc[i]):
-                    price_lows.append((i, df['low'].iloc[i]))
-                
-                # Yerel maksimum (tepe) kontrolü
-                if (df['high'].iloc[i-5:i].max() < df['high'].iloc[i]) and (df['high'].iloc[i+1:i+6].max() < df['high'].iloc[i]):
-                    price_highs.append((i, df['high'].iloc[i]))
-                
-                # RSI yerel minimum kontrolü
-                if (df['rsi'].iloc[i-5:i].min() > df['rsi'].iloc[i]) and (df['rsi'].iloc[i+1:i+6].min() > df['rsi'].iloc[i]):
-                    rsi_lows.append((i, df['rsi'].iloc[i]))
-                
-                # RSI yerel maksimum kontrolü
-                if (df['rsi'].iloc[i-5:i].max() < df['rsi'].iloc[i]) and (df['rsi'].iloc[i+1:i+6].max() < df['rsi'].iloc[i]):
-                    rsi_highs.append((i, df['rsi'].iloc[i]))
+            price_lows = [(i, lows[i]) for i in local_extrema(lows, 5, find_max=False)]
+            price_highs = [(i, highs[i]) for i in local_extrema(highs, 5, find_max=True)]
+            rsi_lows = [(i, rsi[i]) for i in local_extrema(rsi, 5, find_max=False)]
+            rsi_highs = [(i, rsi[i]) for i in local_extrema(rsi, 5, find_max=True)]
             
             # Bulunan dip ve tepe noktalarını logla
-            logger.info(f"[SCAN] {symbol} {timeframe} için {len(price_lows)} fiyat dibi, {len(price_highs)} fiyat tepesi bulundu")
-            logger.info(f"[SCAN] {symbol} {timeframe} için {len(rsi_lows)} RSI dibi, {len(rsi_highs)} RSI tepesi bulundu")
+            logger.info("[SCAN] %s %s için %s fiyat dibi, %s fiyat tepesi bulundu", symbol, timeframe, len(price_lows), len(price_highs))
+            logger.info("[SCAN] %s %s için %s RSI dibi, %s RSI tepesi bulundu", symbol, timeframe, len(rsi_lows), len(rsi_highs))
             
             # En son 2 dip ve tepe noktasını al
             if len(price_lows) >= 2 and len(rsi_lows) >= 2:
@@ -124,12 +117,12 @@ class RSISignals(BaseSignal):
                 price_trend = "düşüyor" if last_price_lows[1][1] < last_price_lows[0][1] else "yükseliyor"
                 rsi_trend = "yükseliyor" if last_rsi_lows[1][1] > last_rsi_lows[0][1] else "düşüyor"
                 
-                logger.info(f"[SCAN] {symbol} {timeframe} için fiyat {price_trend}, RSI {rsi_trend}")
+                logger.info("[SCAN] %s %s için fiyat %s, RSI %s", symbol, timeframe, price_trend, rsi_trend)
                 
                 if (last_price_lows[1][1] < last_price_lows[0][1]) and (last_rsi_lows[1][1] > last_rsi_lows[0][1]):
-                    logger.info(f"[OK] {symbol} {timeframe} için Bullish Divergence tespit edildi!")
-                    logger.info(f"   Fiyat dipleri: {last_price_lows[0][1]:.8g} -> {last_price_lows[1][1]:.8g}")
-                    logger.info(f"   RSI dipleri: {last_rsi_lows[0][1]:.2f} -> {last_rsi_lows[1][1]:.2f}")
+                    logger.info("[OK] %s %s için Bullish Divergence tespit edildi!", symbol, timeframe)
+                    logger.info("   Fiyat dipleri: %.8g -> %.8g", last_price_lows[0][1], last_price_lows[1][1])
+                    logger.info("   RSI dipleri: %.2f -> %.2f", last_rsi_lows[0][1], last_rsi_lows[1][1])
                     
                     # Entry, Stop Loss ve Take Profit hesapla
                     entry = df['close'].iloc[-1]
@@ -139,19 +132,19 @@ class RSISignals(BaseSignal):
                     # Sinyal kalitesini hesapla
                     quality = self.calculate_signal_quality(df, is_bullish=True)
                     
-                    signals.append({
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'signal_type': 'RSI Bullish Divergence',
-                        'entry': entry,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'timestamp': df.index[-1],
-                        'quality_score': quality,
-                        'description': 'Fiyat düşük yaparken RSI yükseliyor. Olası bir yükseliş sinyali.'
-                    })
+                    signals.append(Signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_type='RSI Bullish Divergence',
+                        entry=entry,
+                        stop_loss=stop_loss,
+                        take_profit=take_profit,
+                        timestamp=df.index[-1],
+                        quality_score=quality,
+                        description='Fiyat düşük yaparken RSI yükseliyor. Olası bir yükseliş sinyali.'
+                    ))
                 else:
-                    logger.info(f"[X] {symbol} {timeframe} için Bullish Divergence tespit edilemedi")
+                    logger.info("[X] %s %s için Bullish Divergence tespit edilemedi", symbol, timeframe)
             
             # En son 2 tepe noktasını kontrol et
             if len(price_highs) >= 2 and len(rsi_highs) >= 2:
@@ -168,12 +161,12 @@ class RSISignals(BaseSignal):
                 price_trend = "yükseliyor" if last_price_highs[1][1] > last_price_highs[0][1] else "düşüyor"
                 rsi_trend = "düşüyor" if last_rsi_highs[1][1] < last_rsi_highs[0][1] else "yükseliyor"
                 
-                logger.info(f"[SCAN] {symbol} {timeframe} için fiyat {price_trend}, RSI {rsi_trend}")
+                logger.info("[SCAN] %s %s için fiyat %s, RSI %s", symbol, timeframe, price_trend, rsi_trend)
                 
                 if (last_price_highs[1][1] > last_price_highs[0][1]) and (last_rsi_highs[1][1] < last_rsi_highs[0][1]):
-                    logger.info(f"[OK] {symbol} {timeframe} için Bearish Divergence tespit edildi!")
-                    logger.info(f"   Fiyat tepeleri: {last_price_highs[0][1]:.8g} -> {last_price_highs[1][1]:.8g}")
-                    logger.info(f"   RSI tepeleri: {last_rsi_highs[0][1]:.2f} -> {last_rsi_highs[1][1]:.2f}")
+                    logger.info("[OK] %s %s için Bearish Divergence tespit edildi!", symbol, timeframe)
+                    logger.info("   Fiyat tepeleri: %.8g -> %.8g", last_price_highs[0][1], last_price_highs[1][1])
+                    logger.info("   RSI tepeleri: %.2f -> %.2f", last_rsi_highs[0][1], last_rsi_highs[1][1])
                     
                     # Entry, Stop Loss ve Take Profit hesapla
                     entry = df['close'].iloc[-1]
@@ -183,22 +176,22 @@ class RSISignals(BaseSignal):
                     # Sinyal kalitesini hesapla
                     quality = self.calculate_signal_quality(df, is_bullish=False)
                     
-                    signals.append({
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'signal_type': 'RSI Bearish Divergence',
-                        'entry': entry,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'timestamp': df.index[-1],
-                        'quality_score': quality,
-                        'description': 'Fiyat yüksek yaparken RSI düşüyor. Olası bir düşüş sinyali.'
-                    })
+                    signals.append(Signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_type='RSI Bearish Divergence',
+                        entry=entry,
+                        stop_loss=stop_loss,
+                        take_profit=take_profit,
+                        timestamp=df.index[-1],
+                        quality_score=quality,
+                        description='Fiyat yüksek yaparken RSI düşüyor. Olası bir düşüş sinyali.'
+                    ))
                 else:
-                    logger.info(f"[X] {symbol} {timeframe} için Bearish Divergence tespit edilemedi")
+                    logger.info("[X] %s %s için Bearish Divergence tespit edilemedi", symbol, timeframe)
         
         except Exception as e:
-            logger.error(f"RSI uyumsuzluğu kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("RSI uyumsuzluğu kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
     
@@ -209,19 +202,19 @@ class RSISignals(BaseSignal):
         try:
             # Son 5 mumu kontrol et
             if len(df) < 5:
-                logger.warning(f"[X] {symbol} {timeframe} için yeterli veri yok (en az 5 mum gerekli)")
+                logger.warning("[X] %s %s için yeterli veri yok (en az 5 mum gerekli)", symbol, timeframe)
                 return signals
             
             # Son RSI değeri
             last_rsi = df['rsi'].iloc[-1]
             
             # RSI değerini logla
-            logger.info(f"[SCAN] {symbol} {timeframe} için son RSI değeri: {last_rsi:.2f}")
-            logger.info(f"[SCAN] Aşırı satım eşiği: {self.config.TA_PARAMS['rsi_oversold']}, Aşırı alım eşiği: {self.config.TA_PARAMS['rsi_overbought']}")
+            logger.info("[SCAN] %s %s için son RSI değeri: %.2f", symbol, timeframe, last_rsi)
+            logger.info("[SCAN] Aşırı satım eşiği: %s, Aşırı alım eşiği: %s", self.config.TA_PARAMS['rsi_oversold'], self.config.TA_PARAMS['rsi_overbought'])
             
             # Aşırı satım bölgesi (RSI < 30)
             if last_rsi < self.config.TA_PARAMS['rsi_oversold']:
-                logger.info(f"[OK] {symbol} {timeframe} için RSI aşırı satım bölgesinde: {last_rsi:.2f} < {self.config.TA_PARAMS['rsi_oversold']}")
+                logger.info("[OK] %s %s için RSI aşırı satım bölgesinde: %.2f < %s", symbol, timeframe, last_rsi, self.config.TA_PARAMS['rsi_oversold'])
                 
                 # Entry, Stop Loss ve Take Profit hesapla
                 entry = df['close'].iloc[-1]
@@ -240,23 +233,23 @@ class RSISignals(BaseSignal):
                     signal_type = "RSI Oversold"
                     description = f'RSI aşırı satım bölgesinde ({last_rsi:.1f} < 30). Olası bir yükseliş sinyali.'
                 
-                signals.append({
-                    'symbol': symbol,
-                    'timeframe': timeframe,
-                    'signal_type': signal_type,
-                    'entry': entry,
-                    'stop_loss': stop_loss,
-                    'take_profit': take_profit,
-                    'timestamp': df.index[-1],
-                    'quality_score': quality,
-                    'description': description
-                })
+                signals.append(Signal(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    signal_type=signal_type,
+                    entry=entry,
+                    stop_loss=stop_loss,
+                    take_profit=take_profit,
+                    timestamp=df.index[-1],
+                    quality_score=quality,
+                    description=description
+                ))
             else:
-                logger.info(f"[X] {symbol} {timeframe} için RSI aşırı satım bölgesinde değil: {last_rsi:.2f} >= {self.config.TA_PARAMS['rsi_oversold']}")
+                logger.info("[X] %s %s için RSI aşırı satım bölgesinde değil: %.2f >= %s", symbol, timeframe, last_rsi, self.config.TA_PARAMS['rsi_oversold'])
             
             # Aşırı alım bölgesi (RSI > 70)
             if last_rsi > self.config.TA_PARAMS['rsi_overbought']:
-                logger.info(f"[OK] {symbol} {timeframe} için RSI aşırı alım bölgesinde: {last_rsi:.2f} > {self.config.TA_PARAMS['rsi_overbought']}")
+                logger.info("[OK] %s %s için RSI aşırı alım bölgesinde: %.2f > %s", symbol, timeframe, last_rsi, self.config.TA_PARAMS['rsi_overbought'])
                 
                 # Entry, Stop Loss ve Take Profit hesapla
                 entry = df['close'].iloc[-1]
@@ -275,21 +268,21 @@ class RSISignals(BaseSignal):
                     signal_type = "RSI Overbought"
                     description = f'RSI aşırı alım bölgesinde ({last_rsi:.1f} > 70). Olası bir düşüş sinyali.'
                 
-                signals.append({
-                    'symbol': symbol,
-                    'timeframe': timeframe,
-                    'signal_type': signal_type,
-                    'entry': entry,
-                    'stop_loss': stop_loss,
-                    'take_profit': take_profit,
-                    'timestamp': df.index[-1],
-                    'quality_score': quality,
-                    'description': description
-                })
+                signals.append(Signal(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    signal_type=signal_type,
+                    entry=entry,
+                    stop_loss=stop_loss,
+                    take_profit=take_profit,
+                    timestamp=df.index[-1],
+                    quality_score=quality,
+                    description=description
+                ))
             else:
-                logger.info(f"[X] {symbol} {timeframe} için RSI aşırı alım bölgesinde değil: {last_rsi:.2f} <= {self.config.TA_PARAMS['rsi_overbought']}")
+                logger.info("[X] %s %s için RSI aşırı alım bölgesinde değil: %.2f <= %s", symbol, timeframe, last_rsi, self.config.TA_PARAMS['rsi_overbought'])
         
         except Exception as e:
-            logger.error(f"RSI aşırı alım/satım kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("RSI aşırı alım/satım kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
\ No newline at end of file
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Kural Motoru Modülü
+
+Konfigürasyondaki (Config.SIGNAL_RULES) bildirimsel sinyal kurallarını NumPy
+maske ifadelerine derler. Derlenen bir kural tüm mum geçmişi üzerinde tek
+geçişte değerlendirilir; canlı taramada yalnızca kuralın ihtiyaç duyduğu son
+mumlar değerlendirilir.
+
+Kural biçimi:
+    {
+        "name": "MACD Bullish Crossover",        # Sinyal türü
+        "module": "macd",                        # Kuralı çalıştıran modül (yoksa RuleSignals)
+        "direction": "long",                     # long / short
+        "condition": {"cross_above": ["macd", "macd_signal"]},
+        "stop_loss": {"type": "swing", "bars": 5, "buffer": 0.01},
+        "take_profit": {"type": "risk_reward", "ratio": 2},
+        "boosts": [{"when": {"gt": ["macd_hist", 0]}, "points": 10}],
+        "description": "MACD çizgisi sinyal çizgisini yukarı kesti."
+    }
+
+Koşullar:
+    {"cross_above": [a, b]}, {"cross_below": [a, b]}
+    {"gt": [a, b]}, {"ge": [a, b]}, {"lt": [a, b]}, {"le": [a, b]}
+    {"all": [koşul, ...]}, {"any": [koşul, ...]}, {"not": koşul}
+    {"prev": koşul}                             # Koşul bir önceki mumda sağlanıyor
+
+Değerler: sütun adı, sayı, {"param": "rsi_oversold"} (TA_PARAMS),
+{"max": [a, b]}, {"min": [a, b]}
+
+Stop loss / take profit: {"type": "swing", "bars": N, "buffer": 0.01},
+{"type": "percent", "value": 0.02}, {"type": "column", "column": "bb_middle"},
+{"type": "risk_reward", "ratio": 2} (yalnızca take profit)
+
+Açıklamalar TA_PARAMS değerleriyle biçimlendirilir ("EMA ({ema_short})").
+"""
+import numpy as np
+import pandas as pd
+from signals.base_signal import BaseSignal
+from signals.signal_record import Signal
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("rule_engine")
+
+_COMPARISONS = {
+    'gt': np.greater,
+    'ge': np.greater_equal,
+    'lt': np.less,
+    'le': np.less_equal,
+}
+
+class RuleCompileError(ValueError):
+    """Geçersiz kural tanımı"""
+
+class _Columns:
+    """DataFrame sütunlarını float dizisi olarak bir kez dönüştüren önbellek"""
+
+    def __init__(self, df, tail=None):
+        """
+        Args:
+            df (pandas.DataFrame): Fiyat verileri
+            tail (int, optional): Yalnızca son N mum kullanılır (canlı değerlendirme)
+        """
+        self.df = df
+        self.start = -tail if tail else None
+        self.length = min(tail, len(df)) if tail else len(df)
+        self._arrays = {}
+
+    def __getitem__(self, name):
+        array = self._arrays.get(name)
+        if array is None:
+            if name not in self.df.columns:
+                raise KeyError(f"Kural için gerekli sütun bulunamadı: {name}")
+            array = self.df[name].to_numpy(dtype=float)[self.start:]
+            self._arrays[name] = array
+        return array
+
+def _shift(values, bars=1, fill=np.nan):
+    """Diziyi geçmişe doğru kaydırır (values[t - bars])"""
+    shifted = np.full_like(values, fill)
+    if bars < len(values):
+        shifted[bars:] = values[:-bars]
+    return shifted
+
+def _rolling_extreme(values, bars, use_min):
+    """Son N değerin en küçüğü/en büyüğü (ilk mumlarda mevcut değerler kullanılır)"""
+    fill = np.inf if use_min else -np.inf
+    padded = np.concatenate((np.full(bars - 1, fill), values))
+    windows = np.lib.stride_tricks.sliding_window_view(padded, bars)
+    return windows.min(axis=1) if use_min else windows.max(axis=1)
+
+def compile_operand(spec, params):
+    """
+    Değer tanımını diziye dönüştüren fonksiyona derler
+
+    Args:
+        spec: Sütun adı, sayı veya {"param"|"max"|"min": ...}
+        params (dict): TA_PARAMS
+
+    Returns:
+        callable: columns -> numpy.ndarray veya float
+    """
+    if isinstance(spec, bool):
+        raise RuleCompileError(f"Geçersiz değer: {spec!r}")
+    if isinstance(spec, (int, float)):
+        value = float(spec)
+        return lambda columns: value
+    if isinstance(spec, str):
+        return lambda columns: columns[spec]
+    if isinstance(spec, dict) and len(spec) == 1:
+        op, args = next(iter(spec.items()))
+        if op == 'param':
+            if args not in params:
+                raise RuleCompileError(f"Bilinmeyen parametre: {args}")
+            value = float(params[args])
+            return lambda columns: value
+        if op in ('max', 'min'):
+            funcs = [compile_operand(arg, params) for arg in args]
+            better = np.greater if op == 'max' else np.less
+            def reduce_operands(columns):
+                # Python max/min ile aynı: yalnızca daha büyük/küçük olan değer öncekinin yerini alır
+                result = funcs[0](columns)
+                for func in funcs[1:]:
+                    value = func(columns)
+                    result = np.where(better(value, result), value, result)
+                return result
+            return reduce_operands
+    raise RuleCompileError(f"Geçersiz değer: {spec!r}")
+
+def compile_condition(spec, params):
+    """
+    Koşul tanımını boolean maske üreten fonksiyona derler
+
+    Args:
+        spec (dict): Koşul tanımı
+        params (dict): TA_PARAMS
+
+    Returns:
+        tuple: (columns -> numpy.ndarray[bool], gereken mum sayısı)
+    """
+    if not isinstance(spec, dict) or len(spec) != 1:
+        raise RuleCompileError(f"Geçersiz koşul: {spec!r}")
+
+    op, args = next(iter(spec.items()))
+
+    if op in _COMPARISONS:
+        left, right = (compile_operand(arg, params) for arg in args)
+        compare = _COMPARISONS[op]
+        def comparison(columns):
+            return np.broadcast_to(compare(left(columns), right(columns)), (columns.length,))
+        return comparison, 1
+
+    if op in ('cross_above', 'cross_below'):
+        left, right = (compile_operand(arg, params) for arg in args)
+        above = op == 'cross_above'
+        def cross(columns):
+            a = np.broadcast_to(left(columns), (columns.length,)).astype(float)
+            b = np.broadcast_to(right(columns), (columns.length,)).astype(float)
+            prev_a, prev_b = _shift(a), _shift(b)
+            if above:
+                return (prev_a <= prev_b) & (a > b)
+            return (prev_a >= prev_b) & (a < b)
+        return cross, 2
+
+    if op in ('all', 'any'):
+        compiled = [compile_condition(arg, params) for arg in args]
+        funcs = [func for func, _ in compiled]
+        combine = np.logical_and if op == 'all' else np.logical_or
+        def combined(columns):
+            result = funcs[0](columns)
+            for func in funcs[1:]:
+                result = combine(result, func(columns))
+            return result
+        return combined, max(lookback for _, lookback in compiled)
+
+    if op == 'not':
+        func, lookback = compile_condition(args, params)
+        return (lambda columns: ~func(columns)), lookback
+
+    if op == 'prev':
+        func, lookback = compile_condition(args, params)
+        return (lambda columns: _shift(func(columns), 1, False)), lookback + 1
+
+    raise RuleCompileError(f"Bilinmeyen koşul: {op}")
+
+def condition_columns(spec):
+    """
+    Koşul tanımında kullanılan sütun adları
+
+    Args:
+        spec: Koşul veya değer tanımı
+
+    Returns:
+        set: Sütun adları
+    """
+    if isinstance(spec, str):
+        return {spec}
+    if isinstance(spec, list):
+        return set().union(*(condition_columns(item) for item in spec))
+    if isinstance(spec, dict) and 'param' not in spec:
+        return set().union(*(condition_columns(value) for value in spec.values()))
+    return set()
+
+def _level_columns(spec):
+    """Stop loss / take profit politikasının okuduğu sütunlar"""
+    if spec.get('type') == 'swing':
+        return {'low', 'high'}
+    if spec.get('type') == 'column':
+        return {spec['column']}
+    return set()
+
+def _compile_level(spec, is_stop_loss):
+    """
+    Stop loss / take profit politikasını derler
+
+    Returns:
+        tuple: (fonksiyon(columns, entry, is_long, stop_loss) -> numpy.ndarray, gereken mum sayısı)
+    """
+    level_type = spec.get('type')
+
+    if level_type == 'swing':
+        bars = int(spec.get('bars', 5))
+        buffer = float(spec.get('buffer', 0.01))
+        below_factor, above_factor = round(1 - buffer, 12), round(1 + buffer, 12)
+        def swing(columns, entry, is_long, stop_loss):
+            # Stop loss için long sinyalde son N mumun en düşüğü, short sinyalde en yükseği
+            use_low = is_long == is_stop_loss
+            extreme = _rolling_extreme(columns['low' if use_low else 'high'], bars, use_low)
+            return extreme * (below_factor if use_low else above_factor)
+        return swing, bars
+
+    if level_type == 'percent':
+        value = float(spec['value'])
+        below_factor, above_factor = round(1 - value, 12), round(1 + value, 12)
+        def percent(columns, entry, is_long, stop_loss):
+            below = is_long == is_stop_loss
+            return entry * (below_factor if below else above_factor)
+        return percent, 1
+
+    if level_type == 'column':
+        column = spec['column']
+        return (lambda columns, entry, is_long, stop_loss: columns[column]), 1
+
+    if level_type == 'risk_reward' and not is_stop_loss:
+        ratio = float(spec.get('ratio', 2))
+        def risk_reward(columns, entry, is_long, stop_loss):
+            if is_long:
+                return entry + (entry - stop_loss) * ratio
+            return entry - (stop_loss - entry) * ratio
+        return risk_reward, 1
+
+    raise RuleCompileError(f"Geçersiz seviye tanımı: {spec!r}")
+
+class CompiledRule:
+    """Tek bir sinyal kuralının derlenmiş hali"""
+
+    def __init__(self, spec, params):
+        """
+        Args:
+            spec (dict): Kural tanımı
+            params (dict): TA_PARAMS
+        """
+        try:
+            self.name = spec['name']
+            self.module = spec.get('module')
+            self.is_long = spec.get('direction', 'long') == 'long'
+            stop_loss_spec = spec.get('stop_loss', {'type': 'swing', 'bars': 5, 'buffer': 0.01})
+            take_profit_spec = spec.get('take_profit', {'type': 'risk_reward', 'ratio': 2})
+            self.condition, lookback = compile_condition(spec['condition'], params)
+            self.stop_loss, sl_lookback = _compile_level(stop_loss_spec, True)
+            self.take_profit, tp_lookback = _compile_level(take_profit_spec, False)
+            self.boosts = []
+            for boost in spec.get('boosts', []):
+                func, boost_lookback = compile_condition(boost['when'], params)
+                self.boosts.append((func, int(boost['points'])))
+                lookback = max(lookback, boost_lookback)
+
+            # Kuralın okuduğu sütunlar (giriş fiyatı kapanıştır)
+            self.columns = (condition_columns(spec['condition'])
+                            | set().union(*(condition_columns(boost['when']) for boost in spec.get('boosts', [])))
+                            | _level_columns(stop_loss_spec) | _level_columns(take_profit_spec) | {'close'})
+            self.description = spec.get('description', '').format(**params)
+        except (KeyError, TypeError, ValueError) as e:
+            raise RuleCompileError(f"Kural derlenemedi ({spec.get('name', '?')}): {e}") from e
+
+        # Canlı değerlendirmede gereken son mum sayısı
+        self.lookback = max(lookback, sl_lookback, tp_lookback)
+
+    def fired(self, columns):
+        """
+        Koşulun sağlandığı mumların maskesi
+
+        Args:
+            columns (_Columns): Sütun önbelleği
+
+        Returns:
+            numpy.ndarray: Boolean maske
+        """
+        return np.asarray(self.condition(columns), dtype=bool)
+
+    def levels(self, columns):
+        """
+        Tüm mumlar için giriş, stop loss, take profit ve kalite artışı
+
+        Args:
+            columns (_Columns): Sütun önbelleği
+
+        Returns:
+            dict: entry, stop_loss, take_profit, boost dizileri
+        """
+        shape = (columns.length,)
+        entry = columns['close']
+        stop_loss = np.broadcast_to(self.stop_loss(columns, entry, self.is_long, None), shape)
+        take_profit = np.broadcast_to(self.take_profit(columns, entry, self.is_long, stop_loss), shape)
+
+        boost = np.zeros(shape, dtype=int)
+        for func, points in self.boosts:
+            boost += np.where(func(columns), points, 0)
+
+        return {
+            'entry': entry,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+            'boost': boost,
+        }
+
+def compile_rules(rule_specs, params):
+    """
+    Kural listesini derler; hatalı kurallar loglanıp atlanır
+
+    Args:
+        rule_specs (list): Kural tanımları
+        params (dict): TA_PARAMS
+
+    Returns:
+        list: CompiledRule listesi
+    """
+    rules = []
+    for spec in rule_specs:
+        try:
+            rules.append(CompiledRule(spec, params))
+        except RuleCompileError as e:
+            logger.error(str(e))
+    return rules
+
+def evaluate_rules(rules, df):
+    """
+    Kuralları tüm geçmiş üzerinde değerlendirir (geriye dönük test için)
+
+    Args:
+        rules (list): CompiledRule listesi
+        df (pandas.DataFrame): İndikatörleri hesaplanmış fiyat verileri
+
+    Returns:
+        pandas.DataFrame: Kuralın tetiklendiği her mum için bir satır
+            (timestamp indeksli; signal_type, is_bullish, entry, stop_loss, take_profit, boost)
+    """
+    columns = _Columns(df)
+    frames = []
+    for rule in rules:
+        fired = rule.fired(columns)
+        if not fired.any():
+            continue
+        result = rule.levels(columns)
+        frames.append(pd.DataFrame({
+            'signal_type': rule.name,
+            'is_bullish': rule.is_long,
+            'entry': result['entry'][fired],
+            'stop_loss': result['stop_loss'][fired],
+            'take_profit': result['take_profit'][fired],
+            'boost': result['boost'][fired],
+        }, index=df.index[fired]))
+
+    if not frames:
+        return pd.DataFrame(columns=['signal_type', 'is_bullish', 'entry', 'stop_loss', 'take_profit', 'boost'])
+    return pd.concat(frames).sort_index(kind='stable')
+
+class RuleSignals(BaseSignal):
+    """Konfigürasyondaki kurallardan sinyal üreten modül"""
+
+    # Bu modülün çalıştırdığı kuralların "module" değeri (None: modülü belirtilmemiş kurallar)
+    rule_module = None
+
+    def __init__(self, config):
+        """Modüle ait kuralları derler"""
+        super().__init__(config)
+        self.name = "Rule Signals"
+        specs = [spec for spec in config.SIGNAL_RULES if spec.get('module') == self.rule_module]
+        self.rules = compile_rules(specs, config.TA_PARAMS)
+        self.lookback = max((rule.lookback for rule in self.rules), default=0)
+        self.required_columns = tuple(sorted(set().union(*(rule.columns for rule in self.rules))))
+        logger.info("%s: %s kural derlendi", self.__class__.__name__, len(self.rules))
+
+    def check_signals(self, symbol, timeframe, df):
+        """
+        Kuralları son mum için değerlendirir
+
+        Args:
+            symbol (str): Kripto para sembolü
+            timeframe (str): Zaman dilimi
+            df (pandas.DataFrame): Fiyat verileri
+
+        Returns:
+            list: Tespit edilen sinyaller listesi
+        """
+        signals = []
+
+        if not self.rules or len(df) < self.lookback + 1:
+            return signals
+
+        # Yalnızca kuralların ihtiyaç duyduğu son mumlar
+        columns = _Columns(df, tail=self.lookback)
+
+        for rule in self.rules:
+            try:
+                if not rule.fired(columns)[-1]:
+                    continue
+                result = rule.levels(columns)
+
+                quality = self.calculate_signal_quality(df, is_bullish=rule.is_long) + int(result['boost'][-1])
+
+                signals.append(Signal(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    signal_type=rule.name,
+                    entry=result['entry'][-1],
+                    stop_loss=result['stop_loss'][-1],
+                    take_profit=result['take_profit'][-1],
+                    timestamp=df.index[-1],
+                    quality_score=quality,
+                    description=rule.description
+                ))
+            except Exception as e:
+                logger.error("%s kuralı değerlendirilirken hata: %s", rule.name, e, exc_info=True)
+
+        return signals
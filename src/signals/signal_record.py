@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sinyal Kaydı Modülü
+
+Sinyal modüllerinin ürettiği adayları sözlük yerine __slots__ kullanan küçük
+bir kayıt olarak tutar. Sinyal türü adları sys.intern ile paylaşılır; eşitlik
+yalnızca sinyalin kimliğine (sembol, zaman dilimi, tür, mum, seviyeler) bakar,
+böylece tekrarlar küme/sözlük ile ayıklanabilir. Seviyeler (stop_loss,
+take_profit) ayıklamadan sonra değiştirilebildiği için hash'e katılmaz; kayıt
+kümedeyken seviyeleri değişse de kümedeki yeri bozulmaz.
+
+Kayıt sözlük arayüzünü de destekler (signal['entry'], signal.get('is_pattern'),
+signal['alternative_signals'] = ...); sabit alanların dışındaki alanlar küçük
+bir ek sözlükte tutulur. Mevcut tüketiciler (gönderici, grafik, geçmiş
+veritabanı) değişmeden çalışır.
+"""
+import sys
+import json
+import pandas as pd
+
+# Her sinyalde bulunan alanlar (slot olarak saklanır)
+SIGNAL_FIELDS = ('symbol', 'timeframe', 'signal_type', 'entry', 'stop_loss', 'take_profit',
+                 'timestamp', 'quality_score', 'description')
+
+_FIELD_SET = frozenset(SIGNAL_FIELDS)
+
+def signal_direction(signal):
+    """
+    Sinyalin yönünü seviyelerinden çıkarır
+
+    Args:
+        signal (dict): Sinyal
+
+    Returns:
+        bool: Alış sinyaliyse True, satış sinyaliyse False, belirlenemezse None
+    """
+    stop_loss, take_profit = signal.get('stop_loss'), signal.get('take_profit')
+    if stop_loss is None or take_profit is None or pd.isna(stop_loss) or pd.isna(take_profit):
+        return None
+    if take_profit == stop_loss:
+        return None
+    return bool(take_profit > stop_loss)
+
+class Signal:
+    """Tespit edilen tek bir sinyal"""
+
+    __slots__ = SIGNAL_FIELDS + ('extra',)
+
+    def __init__(self, symbol, timeframe, signal_type, entry=None, stop_loss=None, take_profit=None,
+                 timestamp=None, quality_score=0, description=None, **extra):
+        """
+        Args:
+            symbol (str): Kripto para sembolü
+            timeframe (str): Zaman dilimi
+            signal_type (str): Sinyal türü
+            entry (float, optional): Giriş fiyatı
+            stop_loss (float, optional): Stop loss seviyesi
+            take_profit (float, optional): Take profit seviyesi
+            timestamp (pandas.Timestamp, optional): Sinyal mumunun zamanı
+            quality_score (int): Kalite puanı (0-100)
+            description (str, optional): Açıklama
+            **extra: Ek alanlar (is_pattern, alternative_signals, support_levels ...)
+        """
+        self.symbol = sys.intern(symbol)
+        self.timeframe = sys.intern(timeframe)
+        self.signal_type = sys.intern(signal_type)
+        self.entry = entry
+        self.stop_loss = stop_loss
+        self.take_profit = take_profit
+        self.timestamp = timestamp
+        self.quality_score = quality_score
+        self.description = description
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Sözlükten sinyal oluşturur (iç içe alternatif sinyaller dahil)
+
+        Args:
+            data (dict): Sinyal alanları
+
+        Returns:
+            Signal: Sinyal kaydı
+        """
+        if isinstance(data, cls):
+            return data
+        fields = dict(data)
+        if 'alternative_signals' in fields:
+            fields['alternative_signals'] = [cls.from_dict(alt) for alt in fields['alternative_signals']]
+        return cls(**fields)
+
+    @property
+    def key(self):
+        """
+        Sinyalin kimliği: aynı mumda aynı seviyelerle üretilen aynı tür sinyal
+
+        Seviyeler değiştirilebilir alanlardır; kimlik o anki değerlerden hesaplanır,
+        bu yüzden ayıklama (dedupe) seviyeler son halini aldıktan sonra yapılır.
+        """
+        return (self.symbol, self.timeframe, self.signal_type, self.timestamp, self.stop_loss, self.take_profit)
+
+    @property
+    def is_pattern(self):
+        """Mum formasyonu sinyali mi?"""
+        return self.signal_type.startswith("Pattern:") or bool(self.extra and self.extra.get('is_pattern'))
+
+    def __eq__(self, other):
+        if not isinstance(other, Signal):
+            return NotImplemented
+        return self is other or self.key == other.key
+
+    def __hash__(self):
+        # Eşit sinyallerin bu alanları da eşittir; değişebilen seviyeler hash'e katılmaz
+        return hash((self.symbol, self.timeframe, self.signal_type, self.timestamp))
+
+    def __repr__(self):
+        return f"Signal({self.symbol} {self.timeframe} {self.signal_type!r} q={self.quality_score})"
+
+    # Sözlük arayüzü
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _FIELD_SET:
+            if key in ('symbol', 'timeframe', 'signal_type'):
+                value = sys.intern(value)
+            setattr(self, key, value)
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        # Sabit alanlar değeri None olsa da her zaman vardır (signal[key] KeyError vermez)
+        if key in _FIELD_SET:
+            return True
+        return self.extra is not None and key in self.extra
+
+    def get(self, key, default=None):
+        """Alan değeri (yoksa default)"""
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def keys(self):
+        """Değeri olan alan adları"""
+        return [key for key, _ in self.items()]
+
+    def items(self):
+        """(alan, değer) çiftleri; değeri None olan sabit alanlar atlanır"""
+        pairs = [(key, getattr(self, key)) for key in SIGNAL_FIELDS if getattr(self, key) is not None]
+        if self.extra:
+            pairs.extend(self.extra.items())
+        return pairs
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    # Serileştirme
+
+    def extra_dict(self):
+        """Sabit alanlar dışındaki alanlar (iç içe sinyaller sözlüğe çevrilir)"""
+        if not self.extra:
+            return {}
+        return {
+            key: [alt.to_dict() if isinstance(alt, Signal) else alt for alt in value]
+            if key == 'alternative_signals' else value
+            for key, value in self.extra.items()
+        }
+
+    def to_dict(self):
+        """
+        Sinyali düz sözlüğe çevirir
+
+        Returns:
+            dict: Sinyal alanları (alternatif sinyaller de sözlük olarak)
+        """
+        data = {key: getattr(self, key) for key in SIGNAL_FIELDS if getattr(self, key) is not None}
+        data.update(self.extra_dict())
+        return data
+
+    def to_json(self):
+        """Sinyali tek satır JSON olarak serileştirir"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'), default=str)
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        to_json çıktısından sinyal oluşturur (zaman damgaları pandas.Timestamp'e çevrilir)
+
+        Args:
+            data (str | dict): JSON metni veya çözülmüş sözlük
+
+        Returns:
+            Signal: Sinyal kaydı
+        """
+        fields = json.loads(data) if isinstance(data, str) else dict(data)
+        if fields.get('timestamp') is not None:
+            fields['timestamp'] = pd.Timestamp(fields['timestamp'])
+        if 'alternative_signals' in fields:
+            fields['alternative_signals'] = [cls.from_json(alt) for alt in fields['alternative_signals']]
+        return cls(**fields)
+
+def dedupe(signals):
+    """
+    Tekrarlanan sinyalleri sırayı koruyarak ayıklar
+
+    Args:
+        signals (list): Sinyaller
+
+    Returns:
+        list: Her kimlikten ilk sinyal
+    """
+    seen = set()
+    unique = []
+    for signal in signals:
+        key = signal.key
+        if key not in seen:
+            seen.add(key)
+            unique.append(signal)
+    return unique
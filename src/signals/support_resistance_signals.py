@@ -3,6 +3,8 @@
 Kripto Teknik Analiz Botu - Destek ve Direnç Sinyalleri Modülü
 """
 from signals.base_signal import BaseSignal
+from signals.signal_record import Signal
+from support_resistance import LEVEL_LOOKBACK
 from utils.logger import setup_logger
 
 # Logger kurulumu
@@ -11,6 +13,9 @@ logger = setup_logger("sr_signals")
 class SupportResistanceSignals(BaseSignal):
     """Destek ve direnç tabanlı sinyalleri tespit eden sınıf"""
     
+    # Seviyeler son LEVEL_LOOKBACK mumdan bulunur
+    lookback = LEVEL_LOOKBACK
+    
     def __init__(self, config):
         """Destek ve direnç sinyal tespit parametrelerini ayarlar"""
         super().__init__(config)
@@ -74,17 +79,17 @@ class SupportResistanceSignals(BaseSignal):
                     if df['volume'].iloc[-1] > df['volume'].iloc[-2]:
                         quality += 10
                     
-                    signals.append({
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'signal_type': 'Support Level Test',
-                        'entry': entry,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'timestamp': df.index[-1],
-                        'quality_score': quality,
-                        'description': f'Fiyat {level:.2f} destek seviyesine yaklaştı. Olası bir yükseliş sinyali.'
-                    })
+                    signals.append(Signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_type='Support Level Test',
+                        entry=entry,
+                        stop_loss=stop_loss,
+                        take_profit=take_profit,
+                        timestamp=df.index[-1],
+                        quality_score=quality,
+                        description=f'Fiyat {level:.2f} destek seviyesine yaklaştı. Olası bir yükseliş sinyali.'
+                    ))
             
             # Direnç seviyelerine yakınlık kontrolü
             for level in levels['resistance']:
@@ -108,19 +113,19 @@ class SupportResistanceSignals(BaseSignal):
                     if df['volume'].iloc[-1] > df['volume'].iloc[-2]:
                         quality += 10
                     
-                    signals.append({
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'signal_type': 'Resistance Level Test',
-                        'entry': entry,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'timestamp': df.index[-1],
-                        'quality_score': quality,
-                        'description': f'Fiyat {level:.2f} direnç seviyesine yaklaştı. Olası bir düşüş sinyali.'
-                    })
+                    signals.append(Signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_type='Resistance Level Test',
+                        entry=entry,
+                        stop_loss=stop_loss,
+                        take_profit=take_profit,
+                        timestamp=df.index[-1],
+                        quality_score=quality,
+                        description=f'Fiyat {level:.2f} direnç seviyesine yaklaştı. Olası bir düşüş sinyali.'
+                    ))
         
         except Exception as e:
-            logger.error(f"Destek/direnç kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Destek/direnç kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
\ No newline at end of file
@@ -2,7 +2,10 @@
 """
 Kripto Teknik Analiz Botu - Trend Sinyalleri Modülü
 """
+import numpy as np
 from signals.base_signal import BaseSignal
+from signals.signal_record import Signal
+from support_resistance import LEVEL_LOOKBACK
 from utils.logger import setup_logger
 
 # Logger kurulumu
@@ -11,12 +14,23 @@ logger = setup_logger("trend_signals")
 class TrendSignals(BaseSignal):
     """Trend tabanlı sinyalleri tespit eden sınıf"""
     
+    required_columns = ('ema_short', 'ema_long', 'psar', 'adx', 'plus_di', 'minus_di')
+    
     def __init__(self, config):
         """Trend sinyal tespit parametrelerini ayarlar"""
         super().__init__(config)
         self.name = "Trend Signals"
         logger.info("Trend sinyal modülü başlatıldı")
     
+    def min_history(self, indicators):
+        """Alt kontrollerin ihtiyaçlarının en büyüğü (yatay seviyeler indikatör gerektirmez)"""
+        return max(
+            max(50, 6 + indicators.warmup_bars(('ema_short', 'ema_long'))),   # Trend değişimi
+            2 + indicators.warmup_bars(('psar',)),                             # Parabolic SAR
+            5 + indicators.warmup_bars(('adx', 'plus_di', 'minus_di')),        # ADX
+            LEVEL_LOOKBACK,                                                    # Yatay destek/direnç
+        )
+    
     def check_signals(self, symbol, timeframe, df):
         """
         Trend tabanlı tüm sinyalleri kontrol eder
@@ -82,17 +96,17 @@ class TrendSignals(BaseSignal):
                     if df['volume'].iloc[-1] > df['volume'].iloc[-5:].mean() * 1.5:
                         quality += 10
                     
-                    signals.append({
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'signal_type': 'Yükselen Trend Başlangıcı',
-                        'entry': entry,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'timestamp': df.index[-1],
-                        'quality_score': quality,
-                        'description': 'Yükselen trend başlangıcı tespit edildi. Kısa dönem EMA uzun dönem EMA\'yı yukarı kesti.'
-                    })
+                    signals.append(Signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_type='Yükselen Trend Başlangıcı',
+                        entry=entry,
+                        stop_loss=stop_loss,
+                        take_profit=take_profit,
+                        timestamp=df.index[-1],
+                        quality_score=quality,
+                        description='Yükselen trend başlangıcı tespit edildi. Kısa dönem EMA uzun dönem EMA\'yı yukarı kesti.'
+                    ))
                 # Düşen trend başlangıcı
                 else:
                     # Entry, Stop Loss ve Take Profit hesapla
@@ -107,20 +121,20 @@ class TrendSignals(BaseSignal):
                     if df['volume'].iloc[-1] > df['volume'].iloc[-5:].mean() * 1.5:
                         quality += 10
                     
-                    signals.append({
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'signal_type': 'Düşen Trend Başlangıcı',
-                        'entry': entry,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'timestamp': df.index[-1],
-                        'quality_score': quality,
-                        'description': 'Düşen trend başlangıcı tespit edildi. Kısa dönem EMA uzun dönem EMA\'yı aşağı kesti.'
-                    })
+                    signals.append(Signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_type='Düşen Trend Başlangıcı',
+                        entry=entry,
+                        stop_loss=stop_loss,
+                        take_profit=take_profit,
+                        timestamp=df.index[-1],
+                        quality_score=quality,
+                        description='Düşen trend başlangıcı tespit edildi. Kısa dönem EMA uzun dönem EMA\'yı aşağı kesti.'
+                    ))
         
         except Exception as e:
-            logger.error(f"Trend değişimi kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Trend değişimi kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
     
@@ -149,17 +163,17 @@ class TrendSignals(BaseSignal):
                     # Sinyal kalitesini hesapla
                     quality = self.calculate_signal_quality(df, is_bullish=True)
                     
-                    signals.append({
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'signal_type': 'Parabolic SAR Yükseliş',
-                        'entry': entry,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'timestamp': df.index[-1],
-                        'quality_score': quality,
-                        'description': 'Parabolic SAR mumun altına geçti. Olası bir yükseliş sinyali.'
-                    })
+                    signals.append(Signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_type='Parabolic SAR Yükseliş',
+                        entry=entry,
+                        stop_loss=stop_loss,
+                        take_profit=take_profit,
+                        timestamp=df.index[-1],
+                        quality_score=quality,
+                        description='Parabolic SAR mumun altına geçti. Olası bir yükseliş sinyali.'
+                    ))
                 # Düşen trend başlangıcı (PSAR mumun üstüne geçti)
                 else:
                     # Entry, Stop Loss ve Take Profit hesapla
@@ -170,20 +184,20 @@ class TrendSignals(BaseSignal):
                     # Sinyal kalitesini hesapla
                     quality = self.calculate_signal_quality(df, is_bullish=False)
                     
-                    signals.append({
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'signal_type': 'Parabolic SAR Düşüş',
-                        'entry': entry,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'timestamp': df.index[-1],
-                        'quality_score': quality,
-                        'description': 'Parabolic SAR mumun üstüne geçti. Olası bir düşüş sinyali.'
-                    })
+                    signals.append(Signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_type='Parabolic SAR Düşüş',
+                        entry=entry,
+                        stop_loss=stop_loss,
+                        take_profit=take_profit,
+                        timestamp=df.index[-1],
+                        quality_score=quality,
+                        description='Parabolic SAR mumun üstüne geçti. Olası bir düşüş sinyali.'
+                    ))
         
         except Exception as e:
-            logger.error(f"Parabolic SAR kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Parabolic SAR kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
     
@@ -220,17 +234,17 @@ class TrendSignals(BaseSignal):
                         # Sinyal kalitesini hesapla
                         quality = self.calculate_signal_quality(df, is_bullish=True)
                         
-                        signals.append({
-                            'symbol': symbol,
-                            'timeframe': timeframe,
-                            'signal_type': 'Güçlü Yükselen Trend (ADX)',
-                            'entry': entry,
-                            'stop_loss': stop_loss,
-                            'take_profit': take_profit,
-                            'timestamp': df.index[-1],
-                            'quality_score': quality,
-                            'description': f'ADX {last_adx:.1f} ile güçlü bir yükselen trend başlangıcı gösteriyor.'
-                        })
+                        signals.append(Signal(
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            signal_type='Güçlü Yükselen Trend (ADX)',
+                            entry=entry,
+                            stop_loss=stop_loss,
+                            take_profit=take_profit,
+                            timestamp=df.index[-1],
+                            quality_score=quality,
+                            description=f'ADX {last_adx:.1f} ile güçlü bir yükselen trend başlangıcı gösteriyor.'
+                        ))
                     else:
                         stop_loss = max(df['high'].iloc[-5:]) * 1.02  # Son 5 mumun en yükseğinin %2 üstü
                         take_profit = entry - (stop_loss - entry) * 2  # 1:2 risk-ödül oranı
@@ -238,17 +252,17 @@ class TrendSignals(BaseSignal):
                         # Sinyal kalitesini hesapla
                         quality = self.calculate_signal_quality(df, is_bullish=False)
                         
-                        signals.append({
-                            'symbol': symbol,
-                            'timeframe': timeframe,
-                            'signal_type': 'Güçlü Düşen Trend (ADX)',
-                            'entry': entry,
-                            'stop_loss': stop_loss,
-                            'take_profit': take_profit,
-                            'timestamp': df.index[-1],
-                            'quality_score': quality,
-                            'description': f'ADX {last_adx:.1f} ile güçlü bir düşen trend başlangıcı gösteriyor.'
-                        })
+                        signals.append(Signal(
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            signal_type='Güçlü Düşen Trend (ADX)',
+                            entry=entry,
+                            stop_loss=stop_loss,
+                            take_profit=take_profit,
+                            timestamp=df.index[-1],
+                            quality_score=quality,
+                            description=f'ADX {last_adx:.1f} ile güçlü bir düşen trend başlangıcı gösteriyor.'
+                        ))
                 
                 # Çok güçlü trend (ADX 40'ın üzerinde)
                 elif last_adx > very_strong_trend:
@@ -263,17 +277,17 @@ class TrendSignals(BaseSignal):
                         quality = self.calculate_signal_quality(df, is_bullish=True)
                         quality += 15  # Çok güçlü trend için bonus
                         
-                        signals.append({
-                            'symbol': symbol,
-                            'timeframe': timeframe,
-                            'signal_type': 'Çok Güçlü Yükselen Trend (ADX)',
-                            'entry': entry,
-                            'stop_loss': stop_loss,
-                            'take_profit': take_profit,
-                            'timestamp': df.index[-1],
-                            'quality_score': quality,
-                            'description': f'ADX {last_adx:.1f} ile çok güçlü bir yükselen trend gösteriyor. Trend takibi için uygun.'
-                        })
+                        signals.append(Signal(
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            signal_type='Çok Güçlü Yükselen Trend (ADX)',
+                            entry=entry,
+                            stop_loss=stop_loss,
+                            take_profit=take_profit,
+                            timestamp=df.index[-1],
+                            quality_score=quality,
+                            description=f'ADX {last_adx:.1f} ile çok güçlü bir yükselen trend gösteriyor. Trend takibi için uygun.'
+                        ))
                     else:
                         stop_loss = max(df['high'].iloc[-5:]) * 1.02  # Son 5 mumun en yükseğinin %2 üstü
                         take_profit = entry - (stop_loss - entry) * 2  # 1:2 risk-ödül oranı
@@ -282,20 +296,20 @@ class TrendSignals(BaseSignal):
                         quality = self.calculate_signal_quality(df, is_bullish=False)
                         quality += 15  # Çok güçlü trend için bonus
                         
-                        signals.append({
-                            'symbol': symbol,
-                            'timeframe': timeframe,
-                            'signal_type': 'Çok Güçlü Düşen Trend (ADX)',
-                            'entry': entry,
-                            'stop_loss': stop_loss,
-                            'take_profit': take_profit,
-                            'timestamp': df.index[-1],
-                            'quality_score': quality,
-                            'description': f'ADX {last_adx:.1f} ile çok güçlü bir düşen trend gösteriyor. Trend takibi için uygun.'
-                        })
+                        signals.append(Signal(
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            signal_type='Çok Güçlü Düşen Trend (ADX)',
+                            entry=entry,
+                            stop_loss=stop_loss,
+                            take_profit=take_profit,
+                            timestamp=df.index[-1],
+                            quality_score=quality,
+                            description=f'ADX {last_adx:.1f} ile çok güçlü bir düşen trend gösteriyor. Trend takibi için uygun.'
+                        ))
         
         except Exception as e:
-            logger.error(f"ADX kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("ADX kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
     
@@ -316,15 +330,16 @@ class TrendSignals(BaseSignal):
             # Son kapanış fiyatı
             last_close = df['close'].iloc[-1]
             
+            # Seviye testleri için son 20 mumun en düşük / en yüksek değerleri
+            recent_lows = df['low'].to_numpy(dtype=float)[-20:]
+            recent_highs = df['high'].to_numpy(dtype=float)[-20:]
+            
             # Yatay destek kontrolü
             for level in levels['support']:
                 # Fiyat destek seviyesine %1 yakınsa
                 if 0.99 * last_close <= level <= 1.01 * last_close:
                     # Son 20 mumda bu seviyenin test edilip edilmediğini kontrol et
-                    test_count = 0
-                    for i in range(-20, 0):
-                        if 0.99 * level <= df['low'].iloc[i] <= 1.01 * level:
-                            test_count += 1
+                    test_count = np.count_nonzero((recent_lows >= 0.99 * level) & (recent_lows <= 1.01 * level))
                     
                     # En az 2 kez test edilmişse, yatay destek olarak kabul et
                     if test_count >= 2:
@@ -337,27 +352,24 @@ class TrendSignals(BaseSignal):
                         quality = self.calculate_signal_quality(df, is_bullish=True)
                         quality += 10  # Yatay destek için bonus
                         
-                        signals.append({
-                            'symbol': symbol,
-                            'timeframe': timeframe,
-                            'signal_type': 'Yatay Destek Bölgesi',
-                            'entry': entry,
-                            'stop_loss': stop_loss,
-                            'take_profit': take_profit,
-                            'timestamp': df.index[-1],
-                            'quality_score': quality,
-                            'description': f'Fiyat {level:.8g} seviyesindeki yatay destek bölgesine yaklaştı. Bu seviye son dönemde birkaç kez test edildi.'
-                        })
+                        signals.append(Signal(
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            signal_type='Yatay Destek Bölgesi',
+                            entry=entry,
+                            stop_loss=stop_loss,
+                            take_profit=take_profit,
+                            timestamp=df.index[-1],
+                            quality_score=quality,
+                            description=f'Fiyat {level:.8g} seviyesindeki yatay destek bölgesine yaklaştı. Bu seviye son dönemde birkaç kez test edildi.'
+                        ))
             
             # Yatay direnç kontrolü
             for level in levels['resistance']:
                 # Fiyat direnç seviyesine %1 yakınsa
                 if 0.99 * level <= last_close <= 1.01 * level:
                     # Son 20 mumda bu seviyenin test edilip edilmediğini kontrol et
-                    test_count = 0
-                    for i in range(-20, 0):
-                        if 0.99 * level <= df['high'].iloc[i] <= 1.01 * level:
-                            test_count += 1
+                    test_count = np.count_nonzero((recent_highs >= 0.99 * level) & (recent_highs <= 1.01 * level))
                     
                     # En az 2 kez test edilmişse, yatay direnç olarak kabul et
                     if test_count >= 2:
@@ -370,19 +382,19 @@ class TrendSignals(BaseSignal):
                         quality = self.calculate_signal_quality(df, is_bullish=False)
                         quality += 10  # Yatay direnç için bonus
                         
-                        signals.append({
-                            'symbol': symbol,
-                            'timeframe': timeframe,
-                            'signal_type': 'Yatay Direnç Bölgesi',
-                            'entry': entry,
-                            'stop_loss': stop_loss,
-                            'take_profit': take_profit,
-                            'timestamp': df.index[-1],
-                            'quality_score': quality,
-                            'description': f'Fiyat {level:.8g} seviyesindeki yatay direnç bölgesine yaklaştı. Bu seviye son dönemde birkaç kez test edildi.'
-                        })
+                        signals.append(Signal(
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            signal_type='Yatay Direnç Bölgesi',
+                            entry=entry,
+                            stop_loss=stop_loss,
+                            take_profit=take_profit,
+                            timestamp=df.index[-1],
+                            quality_score=quality,
+                            description=f'Fiyat {level:.8g} seviyesindeki yatay direnç bölgesine yaklaştı. Bu seviye son dönemde birkaç kez test edildi.'
+                        ))
         
         except Exception as e:
-            logger.error(f"Yatay destek/direnç kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("Yatay destek/direnç kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
\ No newline at end of file
@@ -5,6 +5,7 @@ Kripto Teknik Analiz Botu - Volatilite Sinyalleri Modülü
 import numpy as np
 import pandas as pd
 from signals.base_signal import BaseSignal
+from signals.signal_record import Signal
 from utils.logger import setup_logger
 
 # Logger kurulumu
@@ -13,6 +14,9 @@ logger = setup_logger("volatility_signals")
 class VolatilitySignals(BaseSignal):
     """Volatilite tabanlı sinyalleri tespit eden sınıf"""
     
+    # Son 100 mumun 20 periyotluk ATR ortalaması
+    lookback = 120
+    
     def __init__(self, config):
         """Volatilite sinyal tespit parametrelerini ayarlar"""
         super().__init__(config)
@@ -71,19 +75,19 @@ class VolatilitySignals(BaseSignal):
                     stop_loss = None
                     take_profit = None
                     
-                    signals.append({
-                        'symbol': 'BTCUSDT',
-                        'timeframe': timeframe,
-                        'signal_type': 'BTC Volatility Alert',
-                        'entry': entry,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'timestamp': df.index[-1],
-                        'quality_score': 90,  # Yüksek öncelikli bir uyarı
-                        'description': f'BTC\'de anormal volatilite tespit edildi. ATR: {last_atr:.2f}, Ortalama ATR: {avg_atr_100:.2f}. Dikkatli olun!'
-                    })
+                    signals.append(Signal(
+                        symbol='BTCUSDT',
+                        timeframe=timeframe,
+                        signal_type='BTC Volatility Alert',
+                        entry=entry,
+                        stop_loss=stop_loss,
+                        take_profit=take_profit,
+                        timestamp=df.index[-1],
+                        quality_score=90,  # Yüksek öncelikli bir uyarı
+                        description=f'BTC\'de anormal volatilite tespit edildi. ATR: {last_atr:.2f}, Ortalama ATR: {avg_atr_100:.2f}. Dikkatli olun!'
+                    ))
         
         except Exception as e:
-            logger.error(f"BTC volatilite kontrolü sırasında hata: {str(e)}", exc_info=True)
+            logger.error("BTC volatilite kontrolü sırasında hata: %s", e, exc_info=True)
         
         return signals
\ No newline at end of file
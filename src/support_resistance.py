@@ -4,11 +4,49 @@ Kripto Teknik Analiz Botu - Destek ve Direnç Seviyeleri Modülü
 """
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from utils.logger import setup_logger
+from utils.instrumentation import timed
 
 # Logger kurulumu
 logger = setup_logger("support_resistance")
 
+# Seviyelerin arandığı son mum sayısı
+LEVEL_LOOKBACK = 200
+
+def local_extrema(values, window, find_max=True):
+    """
+    Önceki ve sonraki window değerin hepsinden kesin olarak büyük (küçük) noktaları bulur
+    
+    Her nokta için iki pencerenin uç değeri kayan pencere üzerinde tek bir NumPy
+    indirgemesiyle hesaplanır. NaN değerler pandas'taki gibi yok sayılır;
+    NaN olan nokta uç nokta sayılmaz.
+    
+    Args:
+        values (array-like): Değerler
+        window (int): Her iki yandaki pencere boyutu
+        find_max (bool): True ise tepe, False ise dip noktaları
+        
+    Returns:
+        numpy.ndarray: Uç noktaların indeksleri (artan sırada)
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2 * window + 1:
+        return np.empty(0, dtype=np.intp)
+    
+    # extremes[j] = values[j:j+window] içindeki uç değer
+    reduce = np.fmax if find_max else np.fmin
+    extremes = reduce.reduce(sliding_window_view(values, window), axis=1)
+    
+    centers = np.arange(window, len(values) - window)
+    center_values = values[centers]
+    previous, following = extremes[centers - window], extremes[centers + 1]
+    if find_max:
+        mask = (center_values > previous) & (center_values > following)
+    else:
+        mask = (center_values < previous) & (center_values < following)
+    return centers[mask]
+
 class SupportResistance:
     """Destek ve direnç seviyelerini tespit eden sınıf"""
     
@@ -17,6 +55,7 @@ class SupportResistance:
         self.config = config
         logger.info("Destek ve direnç modülü başlatıldı")
     
+    @timed("support_resistance.find_levels")
     def find_levels(self, df, window=20, threshold=0.01):
         """
         Destek ve direnç seviyelerini tespit eder
@@ -30,8 +69,8 @@ class SupportResistance:
             dict: Destek ve direnç seviyeleri
         """
         try:
-            # Son 200 mumu kontrol et (veya mevcut tüm verileri)
-            lookback = min(200, len(df))
+            # Son LEVEL_LOOKBACK mumu kontrol et (veya mevcut tüm verileri)
+            lookback = min(LEVEL_LOOKBACK, len(df))
             df_subset = df.iloc[-lookback:]
             
             # Yerel minimum ve maksimumları bul
@@ -55,7 +94,7 @@ class SupportResistance:
             support_levels = sorted(support_levels, reverse=True)  # Fiyata en yakın olanlar önce
             resistance_levels = sorted(resistance_levels)  # Fiyata en yakın olanlar önce
             
-            logger.info(f"{len(support_levels)} destek ve {len(resistance_levels)} direnç seviyesi tespit edildi")
+            logger.info("%s destek ve %s direnç seviyesi tespit edildi", len(support_levels), len(resistance_levels))
             
             return {
                 'support': support_levels,
@@ -63,7 +102,7 @@ class SupportResistance:
             }
             
         except Exception as e:
-            logger.error(f"Destek ve direnç seviyeleri tespit edilirken hata: {str(e)}", exc_info=True)
+            logger.error("Destek ve direnç seviyeleri tespit edilirken hata: %s", e, exc_info=True)
             return {'support': [], 'resistance': []}
     
     def _find_local_maxima(self, df, window):
@@ -77,23 +116,13 @@ class SupportResistance:
         Returns:
             list: Yerel maksimum fiyatları
         """
-        highs = []
-        
         try:
-            for i in range(window, len(df) - window):
-                # Önceki ve sonraki penceredeki en yüksek değerler
-                prev_max = df['high'].iloc[i-window:i].max()
-                next_max = df['high'].iloc[i+1:i+window+1].max()
-                
-                # Eğer mevcut mum her iki penceredeki en yüksek değerlerden daha yüksekse
-                if df['high'].iloc[i] > prev_max and df['high'].iloc[i] > next_max:
-                    highs.append(df['high'].iloc[i])
-            
-            return highs
+            highs = df['high'].to_numpy(dtype=float)
+            return highs[local_extrema(highs, window, find_max=True)].tolist()
             
         except Exception as e:
-            logger.error(f"Yerel maksimumlar tespit edilirken hata: {str(e)}", exc_info=True)
-            return highs
+            logger.error("Yerel maksimumlar tespit edilirken hata: %s", e, exc_info=True)
+            return []
     
     def _find_local_minima(self, df, window):
         """
@@ -106,23 +135,13 @@ class SupportResistance:
         Returns:
             list: Yerel minimum fiyatları
         """
-        lows = []
-        
         try:
-            for i in range(window, len(df) - window):
-                # Önceki ve sonraki penceredeki en düşük değerler
-                prev_min = df['low'].iloc[i-window:i].min()
-                next_min = df['low'].iloc[i+1:i+window+1].min()
-                
-                # Eğer mevcut mum her iki penceredeki en düşük değerlerden daha düşükse
-                if df['low'].iloc[i] < prev_min and df['low'].iloc[i] < next_min:
-                    lows.append(df['low'].iloc[i])
-            
-            return lows
+            lows = df['low'].to_numpy(dtype=float)
+            return lows[local_extrema(lows, window, find_max=False)].tolist()
             
         except Exception as e:
-            logger.error(f"Yerel minimumlar tespit edilirken hata: {str(e)}", exc_info=True)
-            return lows
+            logger.error("Yerel minimumlar tespit edilirken hata: %s", e, exc_info=True)
+            return []
     
     def _merge_levels(self, levels, threshold):
         """
@@ -165,5 +184,5 @@ class SupportResistance:
             return merged_levels
             
         except Exception as e:
-            logger.error(f"Seviyeler birleştirilirken hata: {str(e)}", exc_info=True)
+            logger.error("Seviyeler birleştirilirken hata: %s", e, exc_info=True)
             return levels
\ No newline at end of file
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sembol Evreni Modülü
+
+Taranacak sembolleri sabit bir liste yerine borsadan keşfeder. Borsa bilgisi
+(exchangeInfo) seyrek çekilir ve data/exchange_info.json dosyasında
+önbelleklenir; işlemdeki spot USDT çiftleri tek bir toplu 24 saatlik ticker
+isteğiyle hacme göre sıralanır ve hacim eşiğinin altındakiler atılır.
+
+Sıralanan semboller katmanlara bölünür (örn. ilk 20 sembol her taramada,
+uzun kuyruk dört taramada bir). Seyrek taranan katmanlarda her sembol,
+adının özetine göre sabit bir tarama dilimine düşer; böylece her tarama
+katmanın eşit bir payını tarar ve sıralama yenilense de sembolün dilimi
+değişmez. Yüzlerce çift izlenirken tarama başına API çağrısı ve işlem
+maliyeti yalnızca o taramaya düşen sembollerle orantılıdır; hacim kontrolü
+de sembol başına ticker isteği yerine toplu ticker verisinden yapılır.
+"""
+import os
+import json
+import time
+import zlib
+import threading
+from utils.logger import setup_logger
+from utils.journal import journal
+from utils.metrics import UNIVERSE_SYMBOLS
+
+# Logger kurulumu
+logger = setup_logger("symbol_universe")
+
+def tier_slot(symbol, every):
+    """
+    Sembolün katman içindeki tarama dilimi
+
+    Args:
+        symbol (str): Kripto para sembolü
+        every (int): Katmanın tarama aralığı
+
+    Returns:
+        int: 0 ile every - 1 arası dilim (süreçten bağımsız)
+    """
+    return zlib.crc32(symbol.encode('utf-8')) % every if every > 1 else 0
+
+class SymbolUniverse:
+    """Borsadaki sembolleri keşfeden, hacme göre sıralayıp katmanlara ayıran sınıf"""
+
+    def __init__(self, config, data_fetcher, cache_path=None):
+        """
+        Args:
+            config (Config): Bot konfigürasyonu
+            data_fetcher (BinanceDataFetcher): Borsa bilgisi ve toplu ticker verisinin çekileceği veri çekici
+            cache_path (str, optional): Borsa bilgisi önbelleği. Belirtilmezse data/exchange_info.json kullanılır.
+        """
+        self.config = config
+        self.data_fetcher = data_fetcher
+        self.settings = config.SYMBOL_UNIVERSE
+        self.enabled = self.settings.get('enabled', False)
+        self.quote_asset = self.settings.get('quote_asset', 'USDT')
+
+        if cache_path is None:
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+            cache_path = self.settings.get('cache_path') or os.path.join(data_dir, 'exchange_info.json')
+        self.cache_path = cache_path
+
+        # İşlemdeki semboller (borsa bilgisi önbelleğinden)
+        self._listed = []
+        self._listed_at = 0
+        # Toplu ticker hacimleri: symbol -> 24 saatlik hacim
+        self._volumes = None
+        self._volumes_at = 0
+        # Katmanlar: (ad, tarama aralığı, semboller) - hacim sırasıyla
+        self._tiers = []
+        self._ranked_at = 0
+
+        self.scan_count = 0
+        self._lock = threading.RLock()
+
+        if self.enabled:
+            self._load_cache()
+            logger.info("Sembol evreni etkin: %s çiftleri (önbellek: %s)", self.quote_asset, self.cache_path)
+
+    @property
+    def tiers(self):
+        """Son sıralamadaki katmanlar: (ad, tarama aralığı, semboller) listesi"""
+        return list(self._tiers)
+
+    def _load_cache(self):
+        """Borsa bilgisi önbelleğini dosyadan yükler"""
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+            if cache.get('quote_asset') != self.quote_asset:
+                return
+            self._listed = list(cache.get('symbols', []))
+            self._listed_at = float(cache.get('fetched_at', 0))
+        except Exception as e:
+            logger.warning("Borsa bilgisi önbelleği yüklenemedi: %s", e)
+
+    def _save_cache(self):
+        """Borsa bilgisi önbelleğini dosyaya atomik olarak yazar"""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            tmp_file = f"{self.cache_path}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({'fetched_at': self._listed_at, 'quote_asset': self.quote_asset,
+                           'symbols': self._listed}, f)
+            os.replace(tmp_file, self.cache_path)
+        except Exception as e:
+            logger.warning("Borsa bilgisi önbelleği kaydedilemedi: %s", e)
+
+    def _is_eligible(self, item):
+        """Borsa bilgisindeki sembolün taranabilir olup olmadığı"""
+        return (item.get('status') == 'TRADING'
+                and item.get('quoteAsset') == self.quote_asset
+                and item.get('isSpotTradingAllowed', True)
+                and item.get('baseAsset') not in self.settings.get('exclude_bases', ()))
+
+    def listed_symbols(self, now=None):
+        """
+        İşlemdeki spot çiftler; önbellek exchange_info_ttl süresinden eskiyse yenilenir
+
+        Args:
+            now (float, optional): Şu anki zaman (saniye)
+
+        Returns:
+            list: Sembol adları (yenileme başarısızsa eski önbellek)
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            if self._listed and now - self._listed_at < self.settings.get('exchange_info_ttl', 24 * 3600):
+                return self._listed
+
+            symbols = self.data_fetcher.get_exchange_info()
+            if symbols is None:
+                if self._listed:
+                    logger.warning("Borsa bilgisi yenilenemedi, önbellekteki %s sembol kullanılıyor", len(self._listed))
+                return self._listed
+
+            self._listed = sorted(item['symbol'] for item in symbols if self._is_eligible(item))
+            self._listed_at = now
+            self._save_cache()
+            logger.info("Borsa bilgisi yenilendi: %s işlemdeki %s çifti", len(self._listed), self.quote_asset)
+            return self._listed
+
+    def volumes(self, now=None):
+        """
+        Tüm sembollerin 24 saatlik hacimleri; veri volume_ttl süresinden eskiyse tek istekte yenilenir
+
+        Args:
+            now (float, optional): Şu anki zaman (saniye)
+
+        Returns:
+            dict: Sembol -> 24 saatlik hacim (hiç alınamadıysa None)
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            if self._volumes is not None and now - self._volumes_at < self.settings.get('volume_ttl', 15 * 60):
+                return self._volumes
+
+            volumes = self.data_fetcher.get_all_24h_volumes()
+            if volumes is not None:
+                self._volumes = volumes
+                self._volumes_at = now
+            elif self._volumes is not None:
+                logger.warning("Toplu hacim verisi yenilenemedi, önceki veri kullanılıyor")
+            return self._volumes
+
+    def volume(self, symbol):
+        """
+        Sembolün 24 saatlik hacmi (toplu ticker verisinden)
+
+        Args:
+            symbol (str): Kripto para sembolü
+
+        Returns:
+            float: 24 saatlik hacim; evren devre dışıysa veya veri yoksa None
+        """
+        if not self.enabled:
+            return None
+        volumes = self.volumes()
+        if volumes is None:
+            return None
+        return volumes.get(symbol, 0.0)
+
+    def rank(self, now=None, force=False):
+        """
+        Sembolleri hacme göre sıralar ve katmanlara böler; sıralama ranking_ttl süresince tutulur
+
+        Args:
+            now (float, optional): Şu anki zaman (saniye)
+            force (bool): Süre dolmadan yeniden sırala
+
+        Returns:
+            list: (ad, tarama aralığı, semboller) katmanları (veri alınamadıysa boş)
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            if not force and self._tiers and now - self._ranked_at < self.settings.get('ranking_ttl', 6 * 3600):
+                return self._tiers
+
+            listed = self.listed_symbols(now)
+            volumes = self.volumes(now)
+            if not listed or volumes is None:
+                return self._tiers
+
+            threshold = self.config.MIN_VOLUME_THRESHOLD
+            ranked = sorted((symbol for symbol in listed if volumes.get(symbol, 0.0) >= threshold),
+                            key=lambda symbol: (-volumes[symbol], symbol))
+            ranked = ranked[:self.settings.get('max_symbols') or None]
+
+            tiers = []
+            start = 0
+            for tier in self.settings.get('tiers', []):
+                size = tier.get('size')
+                end = len(ranked) if size is None else min(len(ranked), start + size)
+                tiers.append((tier['name'], max(1, int(tier.get('every', 1))), ranked[start:end]))
+                start = end
+            # Katmanlara sığmayan semboller son katmana eklenir
+            if start < len(ranked):
+                if tiers:
+                    name, every, symbols = tiers[-1]
+                    tiers[-1] = (name, every, symbols + ranked[start:])
+                else:
+                    tiers.append(("all", 1, ranked[start:]))
+
+            self._tiers = tiers
+            self._ranked_at = now
+
+            for name, every, symbols in tiers:
+                UNIVERSE_SYMBOLS.labels(name).set(len(symbols))
+            logger.info("Sembol evreni sıralandı: %s/%s çift hacim eşiğinin üstünde (%s)", len(ranked), len(listed),
+                        ", ".join(f"{name}: {len(symbols)}/{every}" for name, every, symbols in tiers))
+            return self._tiers
+
+    def symbols_for_scan(self, scan_number=None):
+        """
+        Bu taramada taranacak semboller
+
+        Args:
+            scan_number (int, optional): Tarama sırası. Belirtilmezse iç sayaç kullanılır ve artırılır.
+
+        Returns:
+            list: Semboller (hacim sırasıyla); evren devre dışıysa veya keşfedilemediyse config.SYMBOLS
+        """
+        if not self.enabled:
+            return list(self.config.SYMBOLS)
+
+        if scan_number is None:
+            scan_number = self.scan_count
+            self.scan_count += 1
+
+        stage_start = time.perf_counter()
+        tiers = self.rank()
+        if not tiers:
+            logger.warning("[X] Sembol evreni keşfedilemedi, sabit sembol listesi kullanılıyor")
+            journal.event("universe", duration=time.perf_counter() - stage_start, outcome="fallback")
+            return list(self.config.SYMBOLS)
+
+        symbols = []
+        for name, every, tier_symbols in tiers:
+            slot = scan_number % every
+            symbols.extend(symbol for symbol in tier_symbols if tier_slot(symbol, every) == slot)
+
+        journal.event("universe", duration=time.perf_counter() - stage_start, symbols=len(symbols),
+                      universe=sum(len(tier_symbols) for _, _, tier_symbols in tiers), scan_number=scan_number)
+        logger.info("[SCAN] Sembol evreninden %s sembol bu taramada taranacak (tarama #%s)", len(symbols), scan_number)
+        return symbols
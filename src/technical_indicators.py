@@ -2,13 +2,53 @@
 """
 Kripto Teknik Analiz Botu - Teknik İndikatörler Modülü
 """
+import math
 import numpy as np
 import pandas as pd
 from utils.logger import setup_logger
+from utils.instrumentation import timed
 
 # Logger kurulumu
 logger = setup_logger("technical_indicators")
 
+# İndikatör kaydı: her indikatörün eklediği sütunlar ve okuduğu sütunlar.
+# Okunan sütun başka bir indikatörün çıktısıysa o indikatör önce hesaplanır.
+INDICATOR_COLUMNS = {
+    'rsi': ('rsi',),
+    'ema_short': ('ema_short',),
+    'ema_medium': ('ema_medium',),
+    'ema_long': ('ema_long',),
+    'macd': ('macd', 'macd_signal', 'macd_hist'),
+    'bollinger': ('bb_middle', 'bb_std', 'bb_upper', 'bb_lower'),
+    'ichimoku': ('ichimoku_tenkan', 'ichimoku_kijun', 'ichimoku_senkou_span_a', 'ichimoku_senkou_span_b', 'ichimoku_chikou'),
+    'psar': ('psar',),
+    'adx': ('adx', 'plus_di', 'minus_di', 'atr', 'dx', 'tr', 'plus_dm', 'minus_dm'),
+    'obv': ('obv',),
+}
+
+INDICATOR_INPUTS = {
+    'rsi': ('close',),
+    'ema_short': ('close',),
+    'ema_medium': ('close',),
+    'ema_long': ('close',),
+    'macd': ('close',),
+    'bollinger': ('close',),
+    'ichimoku': ('high', 'low', 'close'),
+    'psar': ('high', 'low'),
+    'adx': ('high', 'low', 'close'),
+    'obv': ('close', 'volume'),
+}
+
+ALL_INDICATOR_COLUMNS = tuple(column for columns in INDICATOR_COLUMNS.values() for column in columns)
+
+_COLUMN_INDICATORS = {column: name for name, columns in INDICATOR_COLUMNS.items() for column in columns}
+
+# Parabolic SAR geçmişe bağlıdır; ilk trend dönüşünden sonra başlangıç değerinin etkisi kalmaz
+PSAR_WARMUP = 50
+
+# ADX için varsayılan periyot (add_all_indicators ile aynı)
+ADX_PERIOD = 14
+
 class TechnicalIndicators:
     """Teknik indikatörleri hesaplayan sınıf"""
     
@@ -16,53 +56,135 @@ class TechnicalIndicators:
         """Teknik indikatör parametrelerini ayarlar"""
         self.config = config
         self.params = config.TA_PARAMS
+        self.warmup_tolerance = config.HISTORY.get('warmup_tolerance', 0.001)
         logger.info("Teknik indikatörler modülü başlatıldı")
     
-    def add_all_indicators(self, df):
+    def _ema_warmup(self, span, tolerance=None):
+        """EMA'nın başlangıç değeri etkisinin tolerans altına inmesi için gereken mum sayısı"""
+        alpha = 2 / (span + 1)
+        return math.ceil(math.log(tolerance or self.warmup_tolerance) / math.log(1 - alpha))
+    
+    def warmup_bars(self, columns=None, tolerance=None):
         """
-        Tüm teknik indikatörleri hesaplar ve DataFrame'e ekler
+        Sütunların son değerlerinin tam geçmişle hesaplanmış gibi olması için gereken ısınma mum sayısı
+        
+        Pencereli indikatörler (RSI, Bollinger, Ichimoku, ADX) pencere uzunluğu kadar,
+        EMA tabanlı indikatörler (EMA, MACD) başlangıç etkisi warmup_tolerance altına
+        inene kadar mum gerektirir.
         
         Args:
-            df (pandas.DataFrame): Fiyat verileri
+            columns (iterable, optional): İndikatör sütunları. Belirtilmezse tüm indikatörler.
+            tolerance (float, optional): EMA başlangıç etkisi toleransı. Belirtilmezse warmup_tolerance.
             
         Returns:
-            pandas.DataFrame: İndikatörler eklenmiş DataFrame
+            int: Isınma mum sayısı (ham fiyat sütunları için 0)
         """
-        try:
-            # RSI
-            df = self.add_rsi(df, self.params['rsi_period'])
-            
-            # EMA'lar
-            df = self.add_ema(df, self.params['ema_short'], 'ema_short')
-            df = self.add_ema(df, self.params['ema_medium'], 'ema_medium')
-            df = self.add_ema(df, self.params['ema_long'], 'ema_long')
-            
-            # MACD
-            df = self.add_macd(df, self.params['macd_fast'], self.params['macd_slow'], self.params['macd_signal'])
-            
-            # Bollinger Bantları
-            df = self.add_bollinger_bands(df, self.params['bb_period'], self.params['bb_std'])
-            
-            # Ichimoku Bulutu
-            df = self.add_ichimoku(df, self.params['ichimoku_tenkan'], self.params['ichimoku_kijun'], self.params['ichimoku_senkou_span_b'])
-            
-            # Parabolic SAR
-            df = self.add_parabolic_sar(df)
-            
-            # ADX (Average Directional Index)
-            df = self.add_adx(df)
-            
-            # OBV (On-Balance Volume)
-            df = self.add_obv(df)
+        p = self.params
+        warmups = {
+            'rsi': p['rsi_period'] + 1,
+            'ema_short': self._ema_warmup(p['ema_short'], tolerance),
+            'ema_medium': self._ema_warmup(p['ema_medium'], tolerance),
+            'ema_long': self._ema_warmup(p['ema_long'], tolerance),
+            'macd': self._ema_warmup(p['macd_slow'], tolerance) + self._ema_warmup(p['macd_signal'], tolerance),
+            'bollinger': p['bb_period'],
+            'ichimoku': p['ichimoku_senkou_span_b'] + p['ichimoku_kijun'],
+            'psar': PSAR_WARMUP,
+            'adx': 2 * ADX_PERIOD + 1,
+            'obv': 1,
+        }
+        
+        if columns is None:
+            return max(warmups.values())
+        
+        return max((warmups[name] for name in self.required_indicators(columns)), default=0)
+    
+    def required_indicators(self, columns):
+        """
+        Sütunları üretmek için hesaplanması gereken indikatörler (bağımlılıklar dahil)
+        
+        Args:
+            columns (iterable): İstenen sütunlar
             
-            logger.info("Tüm teknik indikatörler hesaplandı")
+        Returns:
+            list: İndikatör adları, bağımlılıklar önce gelecek şekilde
+        """
+        ordered = []
+        
+        def visit(name):
+            if name in ordered:
+                return
+            for column in INDICATOR_INPUTS[name]:
+                if column in _COLUMN_INDICATORS:
+                    visit(_COLUMN_INDICATORS[column])
+            ordered.append(name)
+        
+        names = {_COLUMN_INDICATORS[column] for column in columns if column in _COLUMN_INDICATORS}
+        for name in INDICATOR_COLUMNS:
+            if name in names:
+                visit(name)
+        return ordered
+    
+    def _add_indicator(self, df, name):
+        """Tek bir kayıtlı indikatörü varsayılan parametreleriyle hesaplar"""
+        p = self.params
+        if name == 'rsi':
+            return self.add_rsi(df, p['rsi_period'])
+        if name in ('ema_short', 'ema_medium', 'ema_long'):
+            return self.add_ema(df, p[name], name)
+        if name == 'macd':
+            return self.add_macd(df, p['macd_fast'], p['macd_slow'], p['macd_signal'])
+        if name == 'bollinger':
+            return self.add_bollinger_bands(df, p['bb_period'], p['bb_std'])
+        if name == 'ichimoku':
+            return self.add_ichimoku(df, p['ichimoku_tenkan'], p['ichimoku_kijun'], p['ichimoku_senkou_span_b'])
+        if name == 'psar':
+            return self.add_parabolic_sar(df)
+        if name == 'adx':
+            return self.add_adx(df, ADX_PERIOD)
+        return self.add_obv(df)
+    
+    @timed("indicators.ensure")
+    def ensure(self, df, columns):
+        """
+        İstenen indikatör sütunlarını yalnızca eksikse hesaplar
+        
+        Sütunları zaten DataFrame'de bulunan indikatörler tekrar hesaplanmaz;
+        böylece aynı veri için birden fazla tüketici çağırsa da her indikatör
+        en fazla bir kez hesaplanır.
+        
+        Args:
+            df (pandas.DataFrame): Fiyat verileri
+            columns (iterable): Gereken sütunlar (indikatör olmayanlar yok sayılır)
             
+        Returns:
+            pandas.DataFrame: İstenen sütunlar eklenmiş DataFrame
+        """
+        try:
+            for name in self.required_indicators(columns):
+                if not all(column in df.columns for column in INDICATOR_COLUMNS[name]):
+                    df = self._add_indicator(df, name)
             return df
             
         except Exception as e:
-            logger.error(f"İndikatörler hesaplanırken hata: {str(e)}", exc_info=True)
+            logger.error("İndikatörler hesaplanırken hata: %s", e, exc_info=True)
             return df
     
+    @timed("indicators.all")
+    def add_all_indicators(self, df):
+        """
+        Tüm teknik indikatörleri hesaplar ve DataFrame'e ekler
+        
+        Args:
+            df (pandas.DataFrame): Fiyat verileri
+            
+        Returns:
+            pandas.DataFrame: İndikatörler eklenmiş DataFrame
+        """
+        df = self.ensure(df, ALL_INDICATOR_COLUMNS)
+        logger.info("Tüm teknik indikatörler hesaplandı")
+        return df
+    
+    @timed("indicator.rsi")
     def add_rsi(self, df, period=14):
         """
         Relative Strength Index (RSI) hesaplar
@@ -75,7 +197,7 @@ class TechnicalIndicators:
             pandas.DataFrame: RSI eklenmiş DataFrame
         """
         try:
-            logger.info(f"RSI hesaplanıyor (periyot: {period})...")
+            logger.info("RSI hesaplanıyor (periyot: %s)...", period)
             
             # Fiyat değişimlerini hesapla
             delta = df['close'].diff()
@@ -103,26 +225,27 @@ class TechnicalIndicators:
             else:
                 # Son RSI değerini logla
                 last_rsi = df['rsi'].iloc[-1]
-                logger.info(f"RSI hesaplandı. Son değer: {last_rsi:.2f}")
+                logger.info("RSI hesaplandı. Son değer: %.2f", last_rsi)
                 
                 # NaN değerleri kontrol et
                 nan_count = df['rsi'].isnull().sum()
                 if nan_count > 0:
-                    logger.warning(f"RSI'da {nan_count} adet NaN değer var")
+                    logger.warning("RSI'da %s adet NaN değer var", nan_count)
                 
                 # Aşırı alım/satım bölgelerini kontrol et
                 if last_rsi < self.params['rsi_oversold']:
-                    logger.info(f"RSI aşırı satım bölgesinde: {last_rsi:.2f} < {self.params['rsi_oversold']}")
+                    logger.info("RSI aşırı satım bölgesinde: %.2f < %s", last_rsi, self.params['rsi_oversold'])
                 elif last_rsi > self.params['rsi_overbought']:
-                    logger.info(f"RSI aşırı alım bölgesinde: {last_rsi:.2f} > {self.params['rsi_overbought']}")
+                    logger.info("RSI aşırı alım bölgesinde: %.2f > %s", last_rsi, self.params['rsi_overbought'])
             
             return df
             
         except Exception as e:
-            logger.error(f"RSI hesaplanırken hata: {str(e)}", exc_info=True)
+            logger.error("RSI hesaplanırken hata: %s", e, exc_info=True)
             df['rsi'] = np.nan
             return df
     
+    @timed("indicator.ema")
     def add_ema(self, df, period, column_name):
         """
         Exponential Moving Average (EMA) hesaplar
@@ -140,10 +263,11 @@ class TechnicalIndicators:
             return df
             
         except Exception as e:
-            logger.error(f"{column_name} hesaplanırken hata: {str(e)}", exc_info=True)
+            logger.error("%s hesaplanırken hata: %s", column_name, e, exc_info=True)
             df[column_name] = np.nan
             return df
     
+    @timed("indicator.macd")
     def add_macd(self, df, fast_period=12, slow_period=26, signal_period=9):
         """
         Moving Average Convergence Divergence (MACD) hesaplar
@@ -174,12 +298,13 @@ class TechnicalIndicators:
             return df
             
         except Exception as e:
-            logger.error(f"MACD hesaplanırken hata: {str(e)}", exc_info=True)
+            logger.error("MACD hesaplanırken hata: %s", e, exc_info=True)
             df['macd'] = np.nan
             df['macd_signal'] = np.nan
             df['macd_hist'] = np.nan
             return df
     
+    @timed("indicator.bollinger_bands")
     def add_bollinger_bands(self, df, period=20, std_dev=2):
         """
         Bollinger Bantlarını hesaplar
@@ -206,12 +331,13 @@ class TechnicalIndicators:
             return df
             
         except Exception as e:
-            logger.error(f"Bollinger Bantları hesaplanırken hata: {str(e)}", exc_info=True)
+            logger.error("Bollinger Bantları hesaplanırken hata: %s", e, exc_info=True)
             df['bb_middle'] = np.nan
             df['bb_upper'] = np.nan
             df['bb_lower'] = np.nan
             return df
     
+    @timed("indicator.ichimoku")
     def add_ichimoku(self, df, tenkan_period=9, kijun_period=26, senkou_span_b_period=52):
         """
         Ichimoku Bulutunu hesaplar
@@ -250,7 +376,7 @@ class TechnicalIndicators:
             return df
             
         except Exception as e:
-            logger.error(f"Ichimoku Bulutu hesaplanırken hata: {str(e)}", exc_info=True)
+            logger.error("Ichimoku Bulutu hesaplanırken hata: %s", e, exc_info=True)
             df['ichimoku_tenkan'] = np.nan
             df['ichimoku_kijun'] = np.nan
             df['ichimoku_senkou_span_a'] = np.nan
@@ -258,6 +384,7 @@ class TechnicalIndicators:
             df['ichimoku_chikou'] = np.nan
             return df
     
+    @timed("indicator.parabolic_sar")
     def add_parabolic_sar(self, df, af_start=0.02, af_increment=0.02, af_max=0.2):
         """
         Parabolic SAR hesaplar
@@ -335,10 +462,11 @@ class TechnicalIndicators:
             return df
             
         except Exception as e:
-            logger.error(f"Parabolic SAR hesaplanırken hata: {str(e)}", exc_info=True)
+            logger.error("Parabolic SAR hesaplanırken hata: %s", e, exc_info=True)
             df['psar'] = np.nan
             return df
     
+    @timed("indicator.adx")
     def add_adx(self, df, period=14):
         """
         Average Directional Index (ADX) hesaplar
@@ -384,12 +512,13 @@ class TechnicalIndicators:
             return df
             
         except Exception as e:
-            logger.error(f"ADX hesaplanırken hata: {str(e)}", exc_info=True)
+            logger.error("ADX hesaplanırken hata: %s", e, exc_info=True)
             df['adx'] = np.nan
             df['plus_di'] = np.nan
             df['minus_di'] = np.nan
             return df
     
+    @timed("indicator.obv")
     def add_obv(self, df):
         """
         On-Balance Volume (OBV) hesaplar
@@ -426,6 +555,6 @@ class TechnicalIndicators:
             return df
             
         except Exception as e:
-            logger.error(f"OBV hesaplanırken hata: {str(e)}", exc_info=True)
+            logger.error("OBV hesaplanırken hata: %s", e, exc_info=True)
             df['obv'] = np.nan
             return df
\ No newline at end of file
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Yerel Telegram Bot API Sahte Sunucusu
+
+api.telegram.org yerine kullanılabilen, getMe, sendMessage, sendPhoto ve
+sendMediaGroup metodlarını taklit eden yerel HTTP sunucusu. Gecikme, 429
+(flood kontrolü) ve hata enjeksiyonu ile TelegramSender'ın gönderim hızı ve
+yeniden deneme davranışı internete çıkmadan ölçülebilir.
+
+Kullanım:
+    python src/telegram_stub_server.py --port 8081 --latency-ms 80 --rate-429 0.05
+    TELEGRAM_API_BASE_URL=http://127.0.0.1:8081 python src/main.py
+
+Yük testi:
+    python src/telegram_stub_server.py --load-test 40 --chats 8 --enforce-limits --rate-429 0.05
+"""
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("telegram_stub_server")
+
+class TelegramStubServer:
+    """Telegram Bot API'yi taklit eden yerel sunucu"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, jitter_ms=0, rate_429=0.0,
+                 retry_after=1, failure_rate=0.0, enforce_limits=False, seed=None):
+        """
+        Args:
+            host (str): Dinlenecek adres
+            port (int): Dinlenecek port (0 ise boş bir port seçilir)
+            latency_ms (float): Her yanıta eklenecek ortalama gecikme
+            jitter_ms (float): Gecikmeye eklenecek rastgele sapma
+            rate_429 (float): Rastgele 429 yanıtı döndürme olasılığı (0-1)
+            retry_after (int): 429 yanıtlarında bildirilecek bekleme süresi (saniye)
+            failure_rate (float): Rastgele 500 yanıtı döndürme olasılığı (0-1)
+            enforce_limits (bool): Telegram'ın sohbet bazlı hız sınırlarını uygula
+            seed (int, optional): Tekrarlanabilir enjeksiyon için rastgele tohum
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.failure_rate = failure_rate
+        self.enforce_limits = enforce_limits
+        self.random = random.Random(seed)
+
+        self._lock = threading.Lock()
+        self._message_id = 0
+        self._file_ids = set()
+        self._chat_history = {}  # chat_id -> son gönderim zamanları
+        self.stats = {
+            'requests': {},
+            'responses_429': 0,
+            'responses_5xx': 0,
+            'responses_4xx': 0,
+            'bytes_received': 0,
+            'photos_uploaded': 0,
+            'photos_by_file_id': 0,
+        }
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        """Sunucunun temel adresi (TELEGRAM_API_BASE_URL olarak kullanılır)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Sunucuyu arka plan iş parçacığında başlatır"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="telegram-stub", daemon=True)
+        self._thread.start()
+        logger.info("Telegram sahte sunucusu başlatıldı: %s", self.url)
+        return self
+
+    def stop(self):
+        """Sunucuyu durdurur"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        logger.info("Telegram sahte sunucusu durduruldu")
+
+    def serve_forever(self):
+        """Sunucuyu ön planda çalıştırır"""
+        logger.info("Telegram sahte sunucusu dinleniyor: %s", self.url)
+        self.httpd.serve_forever()
+
+    def get_stats(self):
+        """İstatistiklerin kopyasını döndürür"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['requests'] = dict(self.stats['requests'])
+            return stats
+
+    def _make_handler(self):
+        """Sunucu örneğine bağlı istek işleyiciyi oluşturur"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._handle(self)
+
+            def do_POST(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _handle(self, handler):
+        """Gelen isteği ilgili API metoduna yönlendirir"""
+        parsed = urlparse(handler.path)
+        length = int(handler.headers.get('Content-Length', 0) or 0)
+        body = handler.rfile.read(length) if length else b''
+
+        if parsed.path == '/stats':
+            self._respond(handler, 200, self.get_stats())
+            return
+
+        # /bot<token>/<metod>
+        parts = parsed.path.strip('/').split('/')
+        if len(parts) != 2 or not parts[0].startswith('bot'):
+            self._respond(handler, 404, {"ok": False, "error_code": 404, "description": "Not Found"})
+            return
+
+        method = parts[1]
+        fields, files = self._parse_body(handler.headers.get('Content-Type', ''), body)
+        for key, values in parse_qs(parsed.query).items():
+            fields.setdefault(key, values[0])
+
+        with self._lock:
+            self.stats['requests'][method] = self.stats['requests'].get(method, 0) + 1
+            self.stats['bytes_received'] += len(body)
+
+        # Gecikme enjeksiyonu
+        delay = self.latency_ms + (self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+        # Hata enjeksiyonu
+        roll = self.random.random()
+        if roll < self.failure_rate:
+            self._count('responses_5xx')
+            self._respond(handler, 500, {"ok": False, "error_code": 500, "description": "Internal Server Error"})
+            return
+        if roll < self.failure_rate + self.rate_429:
+            self._respond_429(handler, self.retry_after)
+            return
+
+        chat_id = fields.get('chat_id')
+        if self.enforce_limits and chat_id and method != 'getMe':
+            retry_after = self._check_chat_limit(str(chat_id))
+            if retry_after:
+                self._respond_429(handler, retry_after)
+                return
+
+        routes = {
+            'getMe': self._get_me,
+            'sendMessage': self._send_message,
+            'sendPhoto': self._send_photo,
+            'sendMediaGroup': self._send_media_group,
+        }
+        route = routes.get(method)
+        if route is None:
+            self._count('responses_4xx')
+            self._respond(handler, 404, {"ok": False, "error_code": 404, "description": "Not Found: method not found"})
+            return
+
+        status, payload = route(fields, files)
+        if status >= 400:
+            self._count('responses_4xx')
+        self._respond(handler, status, payload)
+
+    def _check_chat_limit(self, chat_id):
+        """
+        Telegram'ın sohbet bazlı sınırlarını uygular
+
+        Returns:
+            int: Aşım varsa retry_after süresi, yoksa 0
+        """
+        now = time.monotonic()
+        is_group = chat_id.startswith('-') or chat_id.startswith('@')
+        window, limit = (60.0, 20) if is_group else (1.0, 1)
+        # Ağ gecikmesindeki küçük sapmalar için %10 tolerans
+        window *= 0.9
+
+        with self._lock:
+            history = [t for t in self._chat_history.get(chat_id, []) if now - t < window]
+            if len(history) >= limit:
+                self._chat_history[chat_id] = history
+                return max(1, int(window - (now - history[0])) + 1)
+            history.append(now)
+            self._chat_history[chat_id] = history
+            return 0
+
+    def _get_me(self, fields, files):
+        return 200, {"ok": True, "result": {
+            "id": 1, "is_bot": True, "first_name": "Stub Bot", "username": "stub_bot"}}
+
+    def _send_message(self, fields, files):
+        if not fields.get('chat_id') or not fields.get('text'):
+            return 400, {"ok": False, "error_code": 400, "description": "Bad Request: message text is empty"}
+        return 200, {"ok": True, "result": dict(self._message(fields['chat_id']), text=fields['text'])}
+
+    def _send_photo(self, fields, files):
+        if not fields.get('chat_id'):
+            return 400, {"ok": False, "error_code": 400, "description": "Bad Request: chat not found"}
+
+        file_id = self._resolve_media(fields.get('photo'), files.get('photo'))
+        if file_id is None:
+            return 400, {"ok": False, "error_code": 400, "description": "Bad Request: wrong file identifier/HTTP URL specified"}
+
+        result = self._message(fields['chat_id'])
+        result['photo'] = [
+            {"file_id": f"{file_id}-s", "file_unique_id": f"{file_id}-s", "width": 320, "height": 240},
+            {"file_id": file_id, "file_unique_id": file_id, "width": 1280, "height": 960},
+        ]
+        if fields.get('caption'):
+            result['caption'] = fields['caption']
+        return 200, {"ok": True, "result": result}
+
+    def _send_media_group(self, fields, files):
+        if not fields.get('chat_id'):
+            return 400, {"ok": False, "error_code": 400, "description": "Bad Request: chat not found"}
+        try:
+            media = json.loads(fields.get('media', '[]'))
+        except ValueError:
+            return 400, {"ok": False, "error_code": 400, "description": "Bad Request: can't parse media JSON object"}
+        if not 2 <= len(media) <= 10:
+            return 400, {"ok": False, "error_code": 400, "description": "Bad Request: wrong number of media specified"}
+
+        messages = []
+        for item in media:
+            reference = item.get('media', '')
+            upload = None
+            if reference.startswith('attach://'):
+                upload = files.get(reference[len('attach://'):])
+                reference = None
+            file_id = self._resolve_media(reference, upload)
+            if file_id is None:
+                return 400, {"ok": False, "error_code": 400, "description": "Bad Request: wrong file identifier/HTTP URL specified"}
+            message = self._message(fields['chat_id'])
+            message['photo'] = [{"file_id": file_id, "file_unique_id": file_id, "width": 1280, "height": 960}]
+            messages.append(message)
+
+        return 200, {"ok": True, "result": messages}
+
+    def _resolve_media(self, reference, upload):
+        """Yüklenen dosya veya file_id için geçerli bir file_id döndürür"""
+        with self._lock:
+            if upload is not None:
+                file_id = "stub-" + hashlib.sha1(upload).hexdigest()[:24]
+                self._file_ids.add(file_id)
+                self.stats['photos_uploaded'] += 1
+                return file_id
+            if reference and reference in self._file_ids:
+                self.stats['photos_by_file_id'] += 1
+                return reference
+        return None
+
+    def _message(self, chat_id):
+        """Yeni bir mesaj nesnesi oluşturur"""
+        with self._lock:
+            self._message_id += 1
+            message_id = self._message_id
+        return {"message_id": message_id, "date": int(time.time()), "chat": {"id": chat_id}}
+
+    def _parse_body(self, content_type, body):
+        """Form verilerini (urlencoded veya multipart) ayrıştırır"""
+        fields, files = {}, {}
+        if not body:
+            return fields, files
+
+        if content_type.startswith('multipart/form-data'):
+            message = BytesParser(policy=HTTP).parsebytes(
+                b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body)
+            for part in message.iter_parts():
+                name = part.get_param('name', header='content-disposition')
+                payload = part.get_payload(decode=True) or b''
+                if part.get_filename() is not None:
+                    files[name] = payload
+                else:
+                    fields[name] = payload.decode('utf-8')
+        else:
+            for key, values in parse_qs(body.decode('utf-8')).items():
+                fields[key] = values[0]
+
+        return fields, files
+
+    def _respond_429(self, handler, retry_after):
+        """Flood kontrolü yanıtı gönderir"""
+        self._count('responses_429')
+        self._respond(handler, 429, {
+            "ok": False,
+            "error_code": 429,
+            "description": f"Too Many Requests: retry after {retry_after}",
+            "parameters": {"retry_after": retry_after}
+        })
+
+    def _respond(self, handler, status, payload):
+        """JSON yanıtı gönderir"""
+        data = json.dumps(payload).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+def run_load_test(server, message_count, chat_count):
+    """
+    TelegramSender'ı sahte sunucuya yönlendirip gönderim hızını ölçer
+
+    Args:
+        server (TelegramStubServer): Çalışan sahte sunucu
+        message_count (int): Gönderilecek toplam mesaj
+        chat_count (int): Mesajların dağıtılacağı özel sohbet sayısı
+
+    Returns:
+        dict: Ölçüm sonuçları
+    """
+    from config import Config
+    from signal_sender import TelegramSender
+    from message_queue import gather_results
+
+    config = Config()
+    config.TELEGRAM_API_BASE_URL = server.url
+    config.TELEGRAM_BOT_TOKEN = "stub-token"
+    config.TELEGRAM_CHAT_ID = "-1000000000001"
+    config.TELEGRAM_SIGNALS_CHAT_ID = ""
+    config.TELEGRAM_TEST_ON_START = False
+
+    sender = TelegramSender(config)
+    chats = [str(100000 + i) for i in range(chat_count)]
+
+    start = time.perf_counter()
+    futures = []
+    for i in range(message_count):
+        chat_id = chats[i % chat_count]
+        futures.append(sender.delivery_queue.submit(
+            chat_id, sender._send_text_message, f"Yük testi mesajı #{i}", chat_id))
+    success = gather_results(futures).result()
+    elapsed = time.perf_counter() - start
+
+    sender.delivery_queue.shutdown()
+
+    delivered = sum(1 for f in futures if not f.exception() and f.result())
+    return {
+        'messages': message_count,
+        'chats': chat_count,
+        'delivered': delivered,
+        'all_delivered': success,
+        'elapsed_seconds': round(elapsed, 3),
+        'messages_per_second': round(delivered / elapsed, 2) if elapsed > 0 else None,
+        'server': server.get_stats(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel Telegram Bot API sahte sunucusu")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--rate-429', type=float, default=0.0, help="Rastgele 429 olasılığı (0-1)")
+    parser.add_argument('--retry-after', type=int, default=1)
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="Rastgele 500 olasılığı (0-1)")
+    parser.add_argument('--enforce-limits', action='store_true', help="Sohbet bazlı hız sınırlarını uygula")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--load-test', type=int, default=0, metavar='N', help="N mesajlık yük testi çalıştır ve çık")
+    parser.add_argument('--chats', type=int, default=4, help="Yük testinde kullanılacak sohbet sayısı")
+    args = parser.parse_args()
+
+    server = TelegramStubServer(
+        host=args.host,
+        port=0 if args.load_test else args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_429=args.rate_429,
+        retry_after=args.retry_after,
+        failure_rate=args.failure_rate,
+        enforce_limits=args.enforce_limits,
+        seed=args.seed
+    )
+
+    if args.load_test:
+        server.start()
+        try:
+            result = run_load_test(server, args.load_test, args.chats)
+        finally:
+            server.stop()
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return 0 if result['all_delivered'] else 1
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
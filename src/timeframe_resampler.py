@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Zaman Dilimi Dönüştürme Modülü
+
+Her sembol için tek bir temel çözünürlük (örn. 4h) çeker ve üst zaman
+dilimlerini (örn. 1d) yerelde OHLCV birleştirmesiyle türetir. Mum sınırları
+Binance ile aynıdır (UTC, haftalık mumlar pazartesi başlar); birleştirme
+kesindir: açılış ilk mumun açılışı, kapanış son mumun kapanışı, en yüksek /
+en düşük uç değerler, hacimler toplam. Son (henüz kapanmamış) mum Binance'te
+olduğu gibi o ana kadarki mumlardan oluşur; baştaki eksik mum atılır.
+
+Üst zaman dilimleri türetilecekse temel veri, temel zaman diliminin kendisi
+istendiğinde bile türetme için gereken derinlikte bir kez çekilir ve tarama
+süresince önbellekte tutulur; temel zaman dilimi analizi bu verinin son
+mumlarını kullanır, aynı sembol için üst zaman dilimleri istendiğinde API
+çağrısı yapılmaz. Türetme gerekmiyorsa yalnızca istenen kadar mum çekilir.
+"""
+import threading
+import numpy as np
+import pandas as pd
+from data_fetcher import history_limit
+from utils.logger import setup_logger
+from utils.instrumentation import profiler
+
+# Logger kurulumu
+logger = setup_logger("timeframe_resampler")
+
+# Binance zaman dilimlerinin milisaniye karşılıkları (1M takvim ayı olduğu için türetilemez)
+TIMEFRAME_MS = {
+    "1m": 60_000, "3m": 180_000, "5m": 300_000, "15m": 900_000, "30m": 1_800_000,
+    "1h": 3_600_000, "2h": 7_200_000, "4h": 14_400_000, "6h": 21_600_000,
+    "8h": 28_800_000, "12h": 43_200_000, "1d": 86_400_000, "3d": 259_200_000,
+    "1w": 604_800_000,
+}
+
+# Mum sınırlarının başlangıç noktası (haftalık mumlar 1970-01-05 pazartesi)
+_ORIGIN_MS = {"1w": 4 * 86_400_000}
+
+# Toplanarak birleştirilen sütunlar
+_SUM_COLUMNS = ('volume', 'quote_asset_volume', 'number_of_trades',
+                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume')
+
+def can_derive(base_timeframe, timeframe):
+    """
+    Zaman diliminin temel çözünürlükten türetilip türetilemeyeceği
+
+    Args:
+        base_timeframe (str): Temel zaman dilimi
+        timeframe (str): İstenen zaman dilimi
+
+    Returns:
+        bool: Türetilebilirse True
+    """
+    base_ms, target_ms = TIMEFRAME_MS.get(base_timeframe), TIMEFRAME_MS.get(timeframe)
+    if base_ms is None or target_ms is None or target_ms < base_ms:
+        return False
+    return target_ms % base_ms == 0 and _ORIGIN_MS.get(timeframe, 0) % base_ms == 0
+
+def resample_ohlcv(df, base_timeframe, timeframe):
+    """
+    Mum verilerini üst zaman dilimine birleştirir
+
+    Args:
+        df (pandas.DataFrame): Temel zaman dilimindeki mum verileri (zaman damgası indeksli)
+        base_timeframe (str): Verilerin zaman dilimi
+        timeframe (str): Hedef zaman dilimi
+
+    Returns:
+        pandas.DataFrame: Hedef zaman dilimindeki mum verileri (aynı sütunlar)
+    """
+    if timeframe == base_timeframe or df.empty:
+        return df
+
+    period = TIMEFRAME_MS[timeframe]
+    origin = _ORIGIN_MS.get(timeframe, 0)
+
+    times = df.index.as_unit('ms').asi8
+    bucket = (times - origin) // period
+
+    # Baştaki mum eksik başlıyorsa (veri mum ortasından başlıyorsa) at
+    if times[0] != bucket[0] * period + origin:
+        first = np.searchsorted(bucket, bucket[0], side='right')
+        df, bucket = df.iloc[first:], bucket[first:]
+        if df.empty:
+            return df
+
+    starts = np.flatnonzero(np.concatenate(([True], bucket[1:] != bucket[:-1])))
+    ends = np.concatenate((starts[1:], [len(bucket)])) - 1
+
+    result = {
+        'open': df['open'].to_numpy(dtype=float)[starts],
+        'high': np.maximum.reduceat(df['high'].to_numpy(dtype=float), starts),
+        'low': np.minimum.reduceat(df['low'].to_numpy(dtype=float), starts),
+        'close': df['close'].to_numpy(dtype=float)[ends],
+    }
+    for column in _SUM_COLUMNS:
+        if column in df.columns:
+            values = pd.to_numeric(df[column]).to_numpy()
+            result[column] = np.add.reduceat(values, starts)
+    for column in df.columns:
+        if column not in result:
+            result[column] = df[column].to_numpy()[ends]
+
+    index = pd.to_datetime(bucket[starts] * period + origin, unit='ms')
+    index.name = df.index.name
+    return pd.DataFrame(result, index=index)[list(df.columns)]
+
+class TimeframeResampler:
+    """Temel çözünürlükten üst zaman dilimlerini türeten veri katmanı"""
+
+    def __init__(self, config, data_fetcher):
+        """
+        Args:
+            config (Config): Bot konfigürasyonu
+            data_fetcher (BinanceDataFetcher): Temel verinin çekileceği veri çekici
+        """
+        self.config = config
+        self.data_fetcher = data_fetcher
+        self.settings = config.MULTI_TIMEFRAME
+        self.enabled = self.settings.get('enabled', True)
+        self.base_timeframe = self.settings['base_timeframe']
+
+        # Zaman dilimi -> gereken mum sayısı (temel limit bunlardan hesaplanır)
+        self._required = {}
+
+        # Tarama süresince temel veriler: symbol -> (çekilen limit, DataFrame)
+        self._base = {}
+        self._lock = threading.Lock()
+        self._depth_warned = False
+
+    def require(self, timeframe, bars):
+        """
+        Bir zaman dilimi için gereken mum sayısını bildirir
+
+        Args:
+            timeframe (str): Zaman dilimi
+            bars (int): Gereken en az mum sayısı
+        """
+        self._required[timeframe] = max(bars, self._required.get(timeframe, 0))
+
+    @property
+    def base_limit(self):
+        """Temel çözünürlükte çekilecek mum sayısı"""
+        if self.settings.get('base_limit'):
+            return self.settings['base_limit']
+
+        required = self.required_base_bars()
+        limit = history_limit(self.config, required or self.config.HISTORY['default_limit'])
+        if required > limit and not self._depth_warned:
+            # Binance tek istekte max_limit mumdan fazlasını döndürmez; üst zaman
+            # dilimlerinin ısınması bu durumda sağlanamaz
+            self._depth_warned = True
+            logger.warning("Üst zaman dilimleri için %s adet %s mumu gerekiyor, istek %s mumla sınırlı; "
+                           "üst zaman dilimi ısınması sağlanamıyor (BASE_TIMEFRAME veya CONFLUENCE_TIMEFRAMES değiştirilmeli)",
+                           required, self.base_timeframe, limit)
+        return limit
+
+    def required_base_bars(self):
+        """Üst zaman dilimlerini türetmek için gereken temel mum sayısı (sınırlamadan önce)"""
+        base_ms = TIMEFRAME_MS[self.base_timeframe]
+        required = 0
+        for timeframe, bars in self._required.items():
+            if timeframe != self.base_timeframe and can_derive(self.base_timeframe, timeframe):
+                ratio = TIMEFRAME_MS[timeframe] // base_ms
+                # Baştaki eksik mum atıldığı için bir üst mum kadar fazlası
+                required = max(required, bars * ratio + ratio - 1)
+        return required
+
+    def start_scan(self):
+        """Önceki taramanın önbelleğini temizler"""
+        with self._lock:
+            self._base = {}
+
+    def _get_base(self, symbol, limit):
+        """Temel veriyi önbellekten döndürür; önbellekteki veri limitten kısaysa yeniden çeker"""
+        with self._lock:
+            cached = self._base.get(symbol)
+            if cached is not None and cached[0] >= limit:
+                profiler.count("resample.cache_hits")
+                return cached[1]
+
+        df = self.data_fetcher.get_klines(symbol, self.base_timeframe, limit)
+        with self._lock:
+            self._base[symbol] = (limit, df)
+        return df
+
+    def get_klines(self, symbol, timeframe, limit=500):
+        """
+        Mum verilerini döndürür; türetilebilen zaman dilimleri için API çağrısı yapılmaz
+
+        Args:
+            symbol (str): Kripto para sembolü
+            timeframe (str): Zaman dilimi
+            limit (int): En fazla mum sayısı
+
+        Returns:
+            pandas.DataFrame: Mum verileri (hata durumunda None)
+        """
+        if not self.enabled or not can_derive(self.base_timeframe, timeframe):
+            return self.data_fetcher.get_klines(symbol, timeframe, limit)
+
+        # Temel zaman dilimi: üst zaman dilimleri türetilecekse veri bir kez türetme
+        # derinliğinde çekilir (sonraki türetmeler önbellekten), analiz son mumlarla yapılır
+        if timeframe == self.base_timeframe:
+            depth = max(limit, self.base_limit) if self.required_base_bars() else limit
+            df = self._get_base(symbol, depth)
+            return df if df is None else df.tail(limit)
+
+        df = self._get_base(symbol, self.base_limit)
+        if df is None or df.empty:
+            return df
+
+        try:
+            with profiler.stage("resample"):
+                df = resample_ohlcv(df, self.base_timeframe, timeframe)
+            return df.tail(limit)
+        except Exception as e:
+            logger.error("%s %s verisi türetilirken hata: %s", symbol, timeframe, e, exc_info=True)
+            return None
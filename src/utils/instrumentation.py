@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Performans Ölçüm Modülü
+
+Tarama hattının aşamaları (veri çekme, indikatörler, sinyal modülleri, grafik,
+Telegram) için süre, çağrı sayısı ve giriş/çıkış bayt ölçümlerini tarama
+bazında toplar. Her tarama sonunda tek satırlık bir özet loglanır ve son
+taramaların özetleri bellekte tutulur.
+
+Ölçüm kapalıyken stage() paylaşılan boş bir context manager döndürür ve
+timed() ile sarılan fonksiyonlar doğrudan çağrılır; ek maliyet tek bir
+bayrak kontrolüdür.
+"""
+import time
+import threading
+import functools
+from collections import deque
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("instrumentation")
+
+class _NullStage:
+    """Ölçüm kapalıyken kullanılan boş context manager"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NULL_STAGE = _NullStage()
+
+class _Stage:
+    """Bir aşamanın süresini ölçen context manager"""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+class ScanProfiler:
+    """Tarama bazında aşama ölçümlerini toplayan profil çıkarıcı"""
+
+    def __init__(self, enabled=False, history_size=50, summary_stages=8):
+        """
+        Args:
+            enabled (bool): Ölçüm açık mı?
+            history_size (int): Bellekte tutulacak tarama özeti sayısı
+            summary_stages (int): Özet satırında gösterilecek en yavaş aşama sayısı
+        """
+        self.enabled = enabled
+        self.summary_stages = summary_stages
+        self.history = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self._scan_id = 0
+        self._scan_start = None
+        self._reset()
+
+    def configure(self, config):
+        """
+        Ayarları konfigürasyondan yükler
+
+        Args:
+            config (Config): Bot konfigürasyonu
+        """
+        settings = config.PROFILING
+        self.enabled = settings.get('enabled', False)
+        self.summary_stages = settings.get('summary_stages', 8)
+        history_size = settings.get('history_size', 50)
+        if history_size != self.history.maxlen:
+            self.history = deque(self.history, maxlen=history_size)
+
+    def _reset(self):
+        """Tarama sayaçlarını sıfırlar"""
+        # aşama -> [toplam süre, çağrı sayısı, en uzun süre]
+        self._timings = {}
+        # sayaç -> değer
+        self._counts = {}
+        # kanal -> [giriş bayt, çıkış bayt]
+        self._bytes = {}
+
+    def stage(self, name):
+        """
+        Aşama süresini ölçen context manager döndürür
+
+        Args:
+            name (str): Aşama adı (örn. indicator.add_rsi, signal.RSISignals)
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name, elapsed):
+        """Aşama süresini ekler"""
+        with self._lock:
+            entry = self._timings.get(name)
+            if entry is None:
+                self._timings[name] = [elapsed, 1, elapsed]
+            else:
+                entry[0] += elapsed
+                entry[1] += 1
+                if elapsed > entry[2]:
+                    entry[2] = elapsed
+
+    def count(self, name, value=1):
+        """
+        Sayaç değerini artırır
+
+        Args:
+            name (str): Sayaç adı
+            value (int): Artış miktarı
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + value
+
+    def add_bytes(self, name, bytes_in=0, bytes_out=0):
+        """
+        Kanal için alınan ve gönderilen bayt sayısını ekler
+
+        Args:
+            name (str): Kanal adı (örn. binance, telegram, chart)
+            bytes_in (int): Alınan bayt
+            bytes_out (int): Gönderilen bayt
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._bytes.setdefault(name, [0, 0])
+            entry[0] += bytes_in
+            entry[1] += bytes_out
+
+    def start_scan(self):
+        """Yeni tarama için sayaçları sıfırlar"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._scan_id += 1
+            self._scan_start = time.perf_counter()
+            self._reset()
+
+    def end_scan(self):
+        """
+        Taramayı kapatır, özet satırını loglar ve geçmişe ekler
+
+        Returns:
+            dict: Tarama özeti (ölçüm kapalıysa None)
+        """
+        if not self.enabled or self._scan_start is None:
+            return None
+
+        with self._lock:
+            summary = {
+                'scan_id': self._scan_id,
+                'finished_at': time.time(),
+                'duration': time.perf_counter() - self._scan_start,
+                'stages': {
+                    name: {'total': total, 'calls': calls, 'max': longest}
+                    for name, (total, calls, longest) in self._timings.items()
+                },
+                'counts': dict(self._counts),
+                'bytes': {name: {'in': b_in, 'out': b_out} for name, (b_in, b_out) in self._bytes.items()},
+            }
+            self._scan_start = None
+            self.history.append(summary)
+
+        logger.info(self.format_summary(summary))
+        return summary
+
+    def format_summary(self, summary):
+        """
+        Tarama özetini tek satırlık metne dönüştürür
+
+        Args:
+            summary (dict): end_scan tarafından üretilen özet
+
+        Returns:
+            str: Özet satırı
+        """
+        slowest = sorted(summary['stages'].items(), key=lambda item: item[1]['total'], reverse=True)
+        stages = " ".join(
+            f"{name}={stats['total']:.2f}s/{stats['calls']}"
+            for name, stats in slowest[:self.summary_stages]
+        )
+        counts = " ".join(f"{name}={value}" for name, value in sorted(summary['counts'].items()))
+        traffic = " ".join(
+            f"{name}={stats['in'] / 1024:.0f}K/{stats['out'] / 1024:.0f}K"
+            for name, stats in sorted(summary['bytes'].items())
+        )
+
+        parts = [f"[PROFILE] scan={summary['scan_id']} total={summary['duration']:.2f}s", stages]
+        if counts:
+            parts.append(counts)
+        if traffic:
+            parts.append(f"bytes(in/out) {traffic}")
+        return " | ".join(parts)
+
+    def get_history(self):
+        """Son taramaların özetlerini döndürür (eskiden yeniye)"""
+        with self._lock:
+            return list(self.history)
+
+# Tüm modüllerin paylaştığı profil çıkarıcı
+profiler = ScanProfiler()
+
+def timed(name):
+    """
+    Fonksiyon süresini verilen aşama adıyla ölçen dekoratör
+
+    Args:
+        name (str): Aşama adı
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
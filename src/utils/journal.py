@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Tarama Günlüğü Modülü
+
+Her tarama olayını (hacim kontrolü, veri çekme, analiz, seçim, gönderim)
+tek bir JSON-lines dosyasına yapılandırılmış kayıt olarak ekler. Kayıtlar
+bellekte toplanıp toplu halde yazılır ve dosya boyuta göre döndürülür.
+
+Kayıt alanları:
+    ts, scan_id, stage, symbol, timeframe, duration_ms, outcome ve olaya özel ek alanlar
+
+Analiz için:
+    from utils.journal import load_journal
+    df = load_journal("logs/scan_journal.jsonl")
+    df[df.stage == "analyze"].groupby("symbol", observed=True).duration_ms.median()
+"""
+import os
+import json
+import time
+import uuid
+import threading
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("journal")
+
+class ScanJournal:
+    """Tampon kullanan, boyuta göre dönen JSON-lines olay günlüğü"""
+
+    def __init__(self, path=None, max_bytes=50 * 1024 * 1024, backup_count=5,
+                 buffer_events=256, flush_interval=2.0, enabled=True):
+        """
+        Args:
+            path (str): Günlük dosyası yolu
+            max_bytes (int): Döndürme öncesi en büyük dosya boyutu
+            backup_count (int): Tutulacak eski dosya sayısı (.1, .2, ...)
+            buffer_events (int): Bu kadar olay biriktiğinde diske yazılır
+            flush_interval (float): Tampondaki olayların en geç yazılma süresi (saniye)
+            enabled (bool): Günlük açık mı?
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.buffer_events = buffer_events
+        self.flush_interval = flush_interval
+        self.enabled = enabled and path is not None
+        self.scan_id = None
+
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher = None
+
+    def configure(self, config):
+        """
+        Ayarları konfigürasyondan yükler ve arka plan yazıcısını başlatır
+
+        Args:
+            config (Config): Bot konfigürasyonu
+        """
+        settings = config.JOURNAL
+        self.flush()
+        self.path = settings.get('path')
+        self.max_bytes = settings.get('max_bytes', self.max_bytes)
+        self.backup_count = settings.get('backup_count', self.backup_count)
+        self.buffer_events = settings.get('buffer_events', self.buffer_events)
+        self.flush_interval = settings.get('flush_interval', self.flush_interval)
+        self.enabled = settings.get('enabled', True) and bool(self.path)
+
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._start_flusher()
+            logger.info("Tarama günlüğü: %s", self.path)
+
+    def _start_flusher(self):
+        """Tamponu düzenli aralıklarla yazan iş parçacığını başlatır"""
+        if self._flusher is not None:
+            return
+        self._flusher = threading.Thread(target=self._flush_loop, name="scan-journal", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def start_scan(self, scan_id=None):
+        """
+        Yeni tarama kimliği üretir; sonraki olaylar bu kimlikle yazılır
+
+        Args:
+            scan_id (str, optional): Kullanılacak kimlik (parçalı taramada toplayıcının kimliği)
+
+        Returns:
+            str: Tarama kimliği
+        """
+        self.scan_id = scan_id or f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        return self.scan_id
+
+    def event(self, stage, symbol=None, timeframe=None, duration=None, outcome="ok", **fields):
+        """
+        Olay ekler
+
+        Args:
+            stage (str): Aşama adı (örn. fetch, analyze, send)
+            symbol (str, optional): Sembol
+            timeframe (str, optional): Zaman dilimi
+            duration (float, optional): Süre (saniye)
+            outcome (str): Sonuç (ok, skip, error ...)
+            **fields: Olaya özel ek alanlar
+        """
+        if not self.enabled:
+            return
+
+        record = {
+            'ts': round(time.time(), 3),
+            'scan_id': self.scan_id,
+            'stage': stage,
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'duration_ms': round(duration * 1000.0, 3) if duration is not None else None,
+            'outcome': outcome,
+        }
+        if fields:
+            record.update(fields)
+
+        line = json.dumps(record, ensure_ascii=False, default=str)
+
+        with self._lock:
+            self._buffer.append(line)
+            full = len(self._buffer) >= self.buffer_events
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Tampondaki olayları tek yazma işlemiyle diske ekler"""
+        with self._lock:
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+
+        data = "\n".join(lines) + "\n"
+
+        with self._write_lock:
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(data)
+                    size = f.tell()
+                if size >= self.max_bytes:
+                    self._rotate()
+            except OSError as e:
+                logger.error("Tarama günlüğü yazılamadı: %s", e)
+
+    def _rotate(self):
+        """Dosyayı path.1, path.2 ... şeklinde döndürür"""
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def close(self):
+        """Yazıcıyı durdurur ve kalan olayları yazar"""
+        self._stop.set()
+        self.flush()
+
+# Tüm modüllerin paylaştığı tarama günlüğü
+journal = ScanJournal(enabled=False)
+
+def load_journal(path, include_rotated=True):
+    """
+    Tarama günlüğünü pandas DataFrame olarak yükler
+
+    Args:
+        path (str): Günlük dosyası
+        include_rotated (bool): Döndürülmüş eski dosyaları da oku
+
+    Returns:
+        pandas.DataFrame: Her satırı bir olay olan tablo (ts sütunu datetime)
+    """
+    import pandas as pd
+
+    paths = [path]
+    if include_rotated:
+        i = 1
+        while os.path.exists(f"{path}.{i}"):
+            paths.append(f"{path}.{i}")
+            i += 1
+
+    frames = [pd.read_json(p, lines=True) for p in reversed(paths) if os.path.exists(p) and os.path.getsize(p)]
+    if not frames:
+        return pd.DataFrame(columns=['ts', 'scan_id', 'stage', 'symbol', 'timeframe', 'duration_ms', 'outcome'])
+
+    df = pd.concat(frames, ignore_index=True)
+    df['ts'] = pd.to_datetime(df['ts'], unit='s')
+    for column in ('stage', 'outcome', 'symbol', 'timeframe'):
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
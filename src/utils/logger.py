@@ -1,67 +1,158 @@
 #!/usr/bin/env python3
 """
 Kripto Teknik Analiz Botu - Loglama Modülü
+
+Logger'lar kayıtları doğrudan dosyaya veya konsola yazmaz; kayıtlar bir kuyruğa
+bırakılır ve tek bir arka plan iş parçacığı (QueueListener) biçimlendirip yazar.
+Mesajlar kuyruğa biçimlendirilmeden konur, bu nedenle %-stili argümanlar
+(logger.info("%s için %d sinyal", symbol, count)) yazıcı iş parçacığında ve
+yalnızca kayıt seviyeyi geçtiyse biçimlendirilir. Argüman olarak sonradan
+değişebilecek nesneler yerine değerlerin kendisi verilmelidir.
+
+Tüm modüller logs/ altındaki tek bir dönen dosyaya yazar (LOG_FILE); hangi
+kaydın hangi modülden geldiği satırdaki logger adından anlaşılır. Tarama
+olaylarının yapılandırılmış kaydı için utils.journal modülüne bakın.
+
+Seviyeler ortam değişkenleriyle ayarlanabilir:
+    LOG_LEVEL=INFO                                  Varsayılan seviye
+    LOG_LEVELS=rsi_signals=WARNING,main=DEBUG       Modül bazında seviye
 """
 import os
-import logging
+import re
 import sys
-from logging.handlers import RotatingFileHandler
+import queue
+import atexit
+import logging
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Log dizini
+LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
+
+# Tüm logger'ların paylaştığı kuyruk ve yazıcı
+_log_queue = queue.SimpleQueue()
+_listener = None
+_setup_lock = threading.Lock()
+
+def _parse_level(value, default=logging.INFO):
+    """Seviye adını veya sayısını logging seviyesine dönüştürür"""
+    if isinstance(value, int):
+        return value
+    level = logging.getLevelName(str(value).strip().upper())
+    return level if isinstance(level, int) else default
+
+def _parse_module_levels(value):
+    """'modül=SEVİYE,modül=SEVİYE' biçimindeki metni sözlüğe dönüştürür"""
+    levels = {}
+    for item in (value or "").split(','):
+        if '=' in item:
+            name, level = item.split('=', 1)
+            levels[name.strip()] = _parse_level(level)
+    return levels
+
+_default_level = _parse_level(os.getenv("LOG_LEVEL", "INFO"))
+_module_levels = _parse_module_levels(os.getenv("LOG_LEVELS", ""))
+_log_file = os.getenv("LOG_FILE", "kripto_motoru.log")
+
+class _DeferredQueueHandler(QueueHandler):
+    """Kaydı biçimlendirmeden kuyruğa bırakan handler"""
+
+    def prepare(self, record):
+        # Biçimlendirme yazıcı iş parçacığında yapılır
+        return record
+
+def _start_listener():
+    """Arka plan yazıcısını bir kez başlatır"""
+    global _listener
+
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    # Dosya handler'ı - tüm modüller tek dosyaya, kayıtlarda logger adı yer alır
+    file_handler = RotatingFileHandler(
+        os.path.join(LOG_DIR, _log_file),
+        maxBytes=10*1024*1024,  # 10 MB
+        backupCount=5,
+        encoding='utf-8'  # UTF-8 encoding kullan
+    )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    # Konsol handler'ı - Emoji'leri kaldıran özel formatter ile
+    console_handler = logging.StreamHandler(sys.stdout)  # stdout kullan
+    console_handler.setFormatter(EmojiSafeFormatter(LOG_FORMAT))
+
+    _listener = QueueListener(_log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+def shutdown_logging():
+    """Kuyrukta bekleyen kayıtları yazar ve yazıcıyı durdurur"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
 
-def setup_logger(name, log_file=None, level=logging.INFO):
+def setup_logger(name, level=None):
     """
     Belirtilen isimde bir logger oluşturur
-    
+
     Args:
         name (str): Logger adı
-        log_file (str, optional): Log dosyası yolu. Belirtilmezse varsayılan dosya kullanılır.
-        level (int, optional): Log seviyesi. Varsayılan INFO.
-        
+        level (int, optional): Log seviyesi. Belirtilmezse LOG_LEVELS/LOG_LEVEL ayarı kullanılır.
+
     Returns:
         logging.Logger: Oluşturulan logger
     """
-    # Log dizinini oluştur
-    log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Log dosyasını belirle
-    if log_file is None:
-        log_file = os.path.join(log_dir, f"{name}.log")
-    else:
-        log_file = os.path.join(log_dir, log_file)
-    
     # Logger oluştur
     logger = logging.getLogger(name)
-    
+
     # Eğer logger zaten yapılandırılmışsa, mevcut logger'ı döndür
     if logger.handlers:
         return logger
-    
+
+    with _setup_lock:
+        if _listener is None:
+            _start_listener()
+
+    if level is None:
+        level = _module_levels.get(name, _default_level)
     logger.setLevel(level)
-    
-    # Dosya handler'ı - UTF-8 encoding ile
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=10*1024*1024,  # 10 MB
-        backupCount=5,
-        encoding='utf-8'  # UTF-8 encoding kullan
-    )
-    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(file_formatter)
-    
-    # Konsol handler'ı - Emoji'leri kaldıran özel formatter ile
-    console_handler = logging.StreamHandler(sys.stdout)  # stdout kullan
-    console_formatter = EmojiSafeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(console_formatter)
-    
-    # Handler'ları logger'a ekle
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    logger.addHandler(_DeferredQueueHandler(_log_queue))
+    logger.propagate = False
+
     return logger
 
+def configure_logging(config):
+    """
+    Konfigürasyondaki log dosyasını, varsayılan ve modül bazındaki log seviyelerini uygular
+
+    Args:
+        config (Config): Bot konfigürasyonu (LOG_FILE, LOG_LEVEL, LOG_LEVELS)
+    """
+    global _default_level, _log_file
+
+    # Dosya değiştiyse yazıcıyı yeni dosyayla yeniden başlat
+    if config.LOG_FILE != _log_file:
+        shutdown_logging()
+        with _setup_lock:
+            _log_file = config.LOG_FILE
+            _start_listener()
+
+    _default_level = _parse_level(config.LOG_LEVEL)
+    _module_levels.update({name: _parse_level(level) for name, level in config.LOG_LEVELS.items()})
+
+    # Daha önce oluşturulmuş logger'ları güncelle
+    for name, logger in list(logging.Logger.manager.loggerDict.items()):
+        if isinstance(logger, logging.Logger) and any(isinstance(h, _DeferredQueueHandler) for h in logger.handlers):
+            logger.setLevel(_module_levels.get(name, _default_level))
+
 class EmojiSafeFormatter(logging.Formatter):
     """Emoji karakterlerini güvenli karakterlerle değiştiren formatter"""
-    
+
     def __init__(self, fmt=None, datefmt=None, style='%'):
         super().__init__(fmt, datefmt, style)
         # Emoji yerine kullanılacak karakterler
@@ -75,13 +166,18 @@ class EmojiSafeFormatter(logging.Formatter):
             '⛔': '[STOP]',
             '🔄': '[REFRESH]'
         }
-    
+        # Tüm emojileri tek geçişte değiştiren desen (uzun olanlar önce)
+        self._pattern = re.compile("|".join(
+            re.escape(emoji) for emoji in sorted(self.replacements, key=len, reverse=True)
+        ))
+
     def format(self, record):
         # Önce standart formatlamayı yap
         formatted_message = super().format(record)
-        
+
+        # ASCII mesajlarda emoji olamaz
+        if formatted_message.isascii():
+            return formatted_message
+
         # Emoji'leri değiştir
-        for emoji, replacement in self.replacements.items():
-            formatted_message = formatted_message.replace(emoji, replacement)
-        
-        return formatted_message
\ No newline at end of file
+        return self._pattern.sub(lambda match: self.replacements[match.group(0)], formatted_message)
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Metrik Modülü
+
+Uzun süre çalışan bot için Prometheus metin biçiminde metrikler. Harici bağımlılık
+gerektirmeyen küçük Counter, Gauge ve Histogram sınıfları içerir. Metrikler
+yerel bir HTTP /metrics uç noktasından sunulabilir veya node_exporter textfile
+collector'ı için her tarama sonunda dosyaya yazılabilir.
+"""
+import os
+import math
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from utils.logger import setup_logger
+
+# Logger kurulumu
+logger = setup_logger("metrics")
+
+# Süre histogramları için varsayılan kova sınırları (saniye)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Histogramın son (sonsuz) kovasının etiketi
+INF_BUCKET_LABEL = 'le="+Inf"'
+
+def _format_value(value):
+    """Değeri Prometheus metin biçimine dönüştürür"""
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+def _escape(value):
+    """Etiket değerindeki özel karakterleri kaçırır"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(names, values, extra=None):
+    """Etiketleri {ad="değer"} biçiminde döndürür"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class _Metric:
+    """Tüm metrik türleri için temel sınıf"""
+
+    type_name = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        Args:
+            name (str): Metrik adı
+            documentation (str): HELP açıklaması
+            labelnames (tuple): Etiket adları
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """
+        Etiket değerlerine bağlı alt metriği döndürür
+
+        Args:
+            *values: Etiket değerleri (labelnames sırasıyla)
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} için {len(self.labelnames)} etiket değeri bekleniyor")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        """Etiketsiz metriğin alt metriğini döndürür"""
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def collect(self):
+        """
+        Metriği Prometheus metin satırları olarak döndürür
+
+        Returns:
+            list: Metin satırları
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(child.collect(self.name, self.labelnames, values))
+        return lines
+
+class _CounterChild:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        """Sayacı artırır"""
+        if amount < 0:
+            raise ValueError("Sayaç yalnızca artırılabilir")
+        with self._lock:
+            self.value += amount
+
+    def collect(self, name, labelnames, values):
+        return [f"{name}{_format_labels(labelnames, values)} {_format_value(self.value)}"]
+
+class Counter(_Metric):
+    """Yalnızca artan sayaç"""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1):
+        """Etiketsiz sayacı artırır"""
+        self._default().inc(amount)
+
+class _GaugeChild:
+    __slots__ = ('value', 'function', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self.function = None
+        self._lock = threading.Lock()
+
+    def set(self, value):
+        """Değeri ayarlar"""
+        with self._lock:
+            self.value = float(value)
+
+    def inc(self, amount=1):
+        """Değeri artırır"""
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        """Değeri azaltır"""
+        with self._lock:
+            self.value -= amount
+
+    def set_function(self, function):
+        """Değerin okunma anında fonksiyondan alınmasını sağlar"""
+        self.function = function
+
+    def collect(self, name, labelnames, values):
+        value = self.value
+        if self.function is not None:
+            try:
+                value = float(self.function())
+            except Exception as e:
+                logger.warning("%s metriği okunamadı: %s", name, e)
+                return []
+        return [f"{name}{_format_labels(labelnames, values)} {_format_value(value)}"]
+
+class Gauge(_Metric):
+    """Artıp azalabilen anlık değer"""
+
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value):
+        self._default().set(value)
+
+    def inc(self, amount=1):
+        self._default().inc(amount)
+
+    def dec(self, amount=1):
+        self._default().dec(amount)
+
+    def set_function(self, function):
+        self._default().set_function(function)
+
+class _Timer:
+    """Histograma süre ekleyen context manager"""
+
+    __slots__ = ('child', 'start')
+
+    def __init__(self, child):
+        self.child = child
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.child.observe(time.perf_counter() - self.start)
+        return False
+
+class _HistogramChild:
+    __slots__ = ('buckets', 'counts', 'total', 'count', '_lock')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        """Gözlem ekler"""
+        with self._lock:
+            self.total += value
+            self.count += 1
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+
+    def time(self):
+        """Süreyi ölçüp gözlem olarak ekleyen context manager döndürür"""
+        return _Timer(self)
+
+    def collect(self, name, labelnames, values):
+        lines = []
+        cumulative = 0
+        with self._lock:
+            counts, total, count = list(self.counts), self.total, self.count
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            le = f'le="{_format_value(float(bound))}"'
+            lines.append(f"{name}_bucket{_format_labels(labelnames, values, le)} {cumulative}")
+        lines.append(f"{name}_bucket{_format_labels(labelnames, values, INF_BUCKET_LABEL)} {count}")
+        lines.append(f"{name}_sum{_format_labels(labelnames, values)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labelnames, values)} {count}")
+        return lines
+
+class Histogram(_Metric):
+    """Gözlemleri kovalara dağıtan histogram"""
+
+    type_name = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value):
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+class MetricsRegistry:
+    """Metrikleri kaydeden ve metin biçiminde sunan kayıt"""
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        """Metriği kaydeder ve geri döndürür"""
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        """
+        Tüm metrikleri Prometheus metin biçiminde döndürür
+
+        Returns:
+            str: Metin çıktısı
+        """
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """
+        Metrikleri textfile collector için dosyaya atomik olarak yazar
+
+        Args:
+            path (str): Hedef .prom dosyası
+        """
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+def read_rss_bytes():
+    """
+    Sürecin yerleşik bellek (RSS) kullanımını döndürür
+
+    Returns:
+        float: Bayt cinsinden RSS
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return float(pages * os.sysconf('SC_PAGE_SIZE'))
+    except (OSError, ValueError, IndexError):
+        # /proc olmayan sistemlerde en yüksek RSS değeri kullanılır
+        import resource
+        import sys
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return float(max_rss if sys.platform == 'darwin' else max_rss * 1024)
+
+# Tüm modüllerin paylaştığı kayıt ve metrikler
+registry = MetricsRegistry()
+
+SCAN_DURATION = registry.histogram(
+    "kripto_scan_duration_seconds", "Tam tarama süresi",
+    buckets=(5, 10, 20, 30, 60, 120, 300, 600, 1200))
+SCANS = registry.counter("kripto_scans_total", "Tamamlanan tarama sayısı", ("outcome",))
+API_REQUESTS = registry.counter(
+    "kripto_api_requests_total", "Harici API istek sayısı", ("api", "endpoint", "status"))
+BINANCE_USED_WEIGHT = registry.gauge(
+    "kripto_binance_used_weight_1m", "Binance'in bildirdiği son dakikalık kullanılan istek ağırlığı")
+RATE_LIMIT_WAIT = registry.counter(
+    "kripto_rate_limit_wait_seconds_total", "Rate limit nedeniyle beklenen toplam süre", ("api",))
+STAGE_DURATION = registry.histogram(
+    "kripto_stage_duration_seconds", "Tarama aşaması süresi (indikatörler, grafik vb.)", ("stage",))
+SIGNAL_MODULE_TIMEOUTS = registry.counter(
+    "kripto_signal_module_timeouts_total", "Zaman aşımına uğrayan sinyal modülü çalıştırmaları", ("module",))
+UNIVERSE_SYMBOLS = registry.gauge(
+    "kripto_universe_symbols", "Sembol evreni katmanlarındaki sembol sayısı", ("tier",))
+QUEUE_DEPTH = registry.gauge("kripto_telegram_queue_depth", "Gönderim kuyruğunda bekleyen mesaj sayısı")
+SIGNALS_EMITTED = registry.counter(
+    "kripto_signals_emitted_total", "Analizde tespit edilen en iyi sinyaller", ("signal_type", "timeframe"))
+SIGNALS_SENT = registry.counter("kripto_signals_sent_total", "Telegram'a gönderilen sinyaller", ("outcome",))
+PROCESS_RSS = registry.gauge("kripto_process_resident_memory_bytes", "Sürecin yerleşik bellek kullanımı")
+PROCESS_RSS.set_function(read_rss_bytes)
+
+class MetricsServer:
+    """Metrikleri /metrics adresinden sunan küçük HTTP sunucusu"""
+
+    def __init__(self, host="127.0.0.1", port=9108, metrics_registry=None):
+        """
+        Args:
+            host (str): Dinlenecek adres
+            port (int): Dinlenecek port
+            metrics_registry (MetricsRegistry, optional): Sunulacak kayıt
+        """
+        self.registry = metrics_registry or registry
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = server.registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        """Sunucuyu arka plan iş parçacığında başlatır"""
+        threading.Thread(target=self.httpd.serve_forever, name="metrics-http", daemon=True).start()
+        logger.info("Metrik sunucusu başlatıldı: %s", self.url)
+        return self
+
+    def stop(self):
+        """Sunucuyu durdurur"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def start_metrics(config):
+    """
+    Konfigürasyona göre metrik sunucusunu başlatır
+
+    Args:
+        config (Config): Bot konfigürasyonu
+
+    Returns:
+        MetricsServer: Başlatılan sunucu (HTTP kapalıysa None)
+    """
+    settings = config.METRICS
+    if not settings.get('enabled') or not settings.get('http_port'):
+        return None
+    try:
+        return MetricsServer(settings.get('host', '127.0.0.1'), settings['http_port']).start()
+    except OSError as e:
+        logger.error("Metrik sunucusu başlatılamadı: %s", e)
+        return None
+
+def export_textfile(config):
+    """
+    Textfile collector dosyası ayarlıysa metrikleri yazar
+
+    Args:
+        config (Config): Bot konfigürasyonu
+    """
+    settings = config.METRICS
+    path = settings.get('textfile')
+    if not settings.get('enabled') or not path:
+        return
+    try:
+        registry.write_textfile(path)
+    except OSError as e:
+        logger.error("Metrik dosyası yazılamadı: %s", e)
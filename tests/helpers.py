@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Test Yardımcıları
+
+Testler src/ ve benchmarks/ dizinlerini içe aktarma yoluna ekler ve sentetik
+OHLCV verisini (benchmarks.synthetic_data) veri çekicinin ürettiği biçimde
+DataFrame'e çevirir. Ağ, Telegram ve Binance erişimi gerekmez.
+
+Kullanım:
+    python -m unittest discover -s tests
+"""
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TESTS_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'benchmarks'))
+
+# Testlerde yalnızca hatalar loglansın (beklenen NaN uyarıları çıktıyı kirletmesin)
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+import pandas as pd
+from synthetic_data import generate_klines
+
+def synthetic_frame(bars=500, seed=0, timeframe='4h', start_price=100.0):
+    """
+    Sentetik mum verilerini BinanceDataFetcher.get_klines çıktısıyla aynı biçimde döndürür
+
+    Args:
+        bars (int): Mum sayısı
+        seed (int): Rastgele sayı üreteci tohumu
+        timeframe (str): Zaman dilimi
+        start_price (float): Başlangıç fiyatı
+
+    Returns:
+        pandas.DataFrame: Zaman damgası indeksli mum verileri
+    """
+    klines = generate_klines(bars, timeframe, seed=seed, start_price=start_price)
+    df = pd.DataFrame([row[:6] for row in klines],
+                      columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    for column in ('open', 'high', 'low', 'close', 'volume'):
+        df[column] = df[column].astype(float)
+    return df.set_index('timestamp')
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Grafik Önbelleği Testleri
+"""
+import os
+import time
+import tempfile
+import unittest
+import pandas as pd
+
+import helpers  # noqa: F401 - src içe aktarma yolu
+from config import Config
+from chart_cache import ChartCache, closed_candle_time
+
+class ClosedCandleTimeTest(unittest.TestCase):
+    """Açık mum kapanana kadar anahtar son kapanmış muma dayanmalı"""
+
+    def test_open_candle_maps_to_previous(self):
+        candle = pd.Timestamp('2024-01-01 04:00')
+        for now in ('2024-01-01 04:00', '2024-01-01 06:30', '2024-01-01 07:59:59'):
+            self.assertEqual(closed_candle_time(candle, '4h', pd.Timestamp(now)), pd.Timestamp('2024-01-01 00:00'))
+
+    def test_closed_candle_is_kept(self):
+        candle = pd.Timestamp('2024-01-01 04:00')
+        self.assertEqual(closed_candle_time(candle, '4h', pd.Timestamp('2024-01-01 08:00')), candle)
+        self.assertEqual(closed_candle_time(candle, '1h', pd.Timestamp('2024-01-01 06:30')), candle)
+
+    def test_unknown_inputs_pass_through(self):
+        self.assertIsNone(closed_candle_time(None, '4h'))
+        candle = pd.Timestamp('2024-01-01')
+        self.assertEqual(closed_candle_time(candle, '1M', pd.Timestamp('2024-01-01 01:00')), candle)
+
+class ChartCacheTest(unittest.TestCase):
+    """Anahtar girdilere bağlı olmalı; bellek ve disk sınırları eski kayıtları çıkarmalı"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = Config()
+        self.config.CHART_CACHE = dict(self.config.CHART_CACHE, memory_max_entries=2, memory_max_bytes=1000,
+                                       disk_max_bytes=2500, max_age=3600)
+        self.cache_dir = os.path.join(self.tmp.name, 'chart_cache')
+        self.cache = ChartCache(self.config, self.cache_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def key(self, symbol='BTCUSDT', candle='2024-01-01 00:00', timeframe='4h', signal_type='EMA Golden Cross'):
+        return self.cache.make_key(symbol, timeframe, pd.Timestamp(candle), signal_type)
+
+    def disk_files(self):
+        return sorted(name for name in os.listdir(self.cache_dir) if name.endswith('.png'))
+
+    def test_key_depends_on_inputs(self):
+        base = self.key()
+        self.assertEqual(base, self.key())
+        self.assertEqual(len({base, self.key(symbol='ETHUSDT'), self.key(candle='2024-01-01 04:00'),
+                              self.key(timeframe='1h'), self.key(signal_type='MACD Bullish Crossover')}), 5)
+        self.assertIsNone(self.cache.make_key('BTCUSDT', '4h', None, 'EMA Golden Cross'))
+
+        # Grafik ve indikatör ayarları değişince eski görüntüler kullanılmaz
+        self.config.TA_PARAMS = dict(self.config.TA_PARAMS, ema_short=12)
+        self.assertNotEqual(self.key(), base)
+
+    def test_open_candle_shares_key_until_close(self):
+        candle = pd.Timestamp('2024-01-01 04:00')
+        keys = {self.key(candle=closed_candle_time(candle, '4h', pd.Timestamp(now)))
+                for now in ('2024-01-01 04:05', '2024-01-01 07:55')}
+        self.assertEqual(len(keys), 1)
+        self.assertNotEqual(self.key(candle=closed_candle_time(candle, '4h', pd.Timestamp('2024-01-01 08:00'))),
+                            keys.pop())
+
+    def test_memory_lru_by_entries(self):
+        first, second, third = self.key(), self.key(symbol='ETHUSDT'), self.key(symbol='SOLUSDT')
+        self.cache.put(first, b'1' * 100)
+        self.cache.put(second, b'2' * 100)
+        # Okunan kayıt en yeni olur; sınır aşılınca en eski (second) çıkar
+        self.assertEqual(self.cache.get(first), b'1' * 100)
+        self.cache.put(third, b'3' * 100)
+        self.assertEqual(list(self.cache._memory), [first, third])
+        self.assertEqual(self.cache._memory_bytes, 200)
+
+        # Bellekten çıkan kayıt diskten okunur
+        self.assertEqual(self.cache.get(second), b'2' * 100)
+
+    def test_memory_limit_by_bytes(self):
+        first, second = self.key(), self.key(symbol='ETHUSDT')
+        self.cache.put(first, b'1' * 600)
+        self.cache.put(second, b'2' * 600)
+        self.assertEqual(list(self.cache._memory), [second])
+        self.assertEqual(self.cache._memory_bytes, 600)
+
+        # Bellek sınırından büyük görüntü yalnızca diskte tutulur
+        large = self.key(symbol='SOLUSDT')
+        self.cache.put(large, b'3' * 1200)
+        self.assertNotIn(large, self.cache._memory)
+        self.assertEqual(self.cache.get(large), b'3' * 1200)
+
+    def test_disk_eviction_removes_oldest(self):
+        keys = [self.key(symbol=f"SYM{i}USDT") for i in range(3)]
+        now = time.time()
+        for age, key in zip((300, 200, 100), keys):
+            self.cache.put(key, b'x' * 800)
+            path = self.cache._disk_path(key)
+            os.utime(path, (now - age, now - age))
+        self.assertEqual(self.disk_files(), sorted(f"{key}.png" for key in keys))
+
+        # Dördüncü görüntü sınırı (2500 bayt) aşar: en eski iki dosya silinir
+        newest = self.key(symbol='NEWUSDT')
+        self.cache.put(newest, b'y' * 1000)
+        self.assertEqual(self.disk_files(), sorted([f"{keys[2]}.png", f"{newest}.png"]))
+
+    def test_expired_entries_are_not_returned(self):
+        key = self.key()
+        self.cache.put(key, b'png')
+        old = time.time() - 7200
+        self.cache._memory[key] = (b'png', old)
+        os.utime(self.cache._disk_path(key), (old, old))
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual(self.disk_files(), [])
+        self.assertEqual(self.cache._memory_bytes, 0)
+
+    def test_disabled_cache(self):
+        self.config.CHART_CACHE = dict(self.config.CHART_CACHE, enabled=False)
+        cache = ChartCache(self.config, os.path.join(self.tmp.name, 'disabled'))
+        key = self.key()
+        cache.put(key, b'png')
+        self.assertIsNone(cache.get(key))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, 'disabled')))
+
+if __name__ == '__main__':
+    unittest.main()
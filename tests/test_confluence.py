@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Çoklu Zaman Dilimi Uyum Testleri
+"""
+import unittest
+import pandas as pd
+
+from helpers import synthetic_frame
+from config import Config
+from confluence import ConfluenceAnalyzer, TREND_BULLISH, TREND_BEARISH, TREND_NEUTRAL
+from timeframe_resampler import TimeframeResampler, resample_ohlcv
+
+class ConfluenceWarmupTest(unittest.TestCase):
+    """Varsayılan 4h -> 1d eşleşmesi tek istekte çekilebilen veriyle trend kararı vermeli"""
+
+    def setUp(self):
+        self.config = Config()
+        self.config.MULTI_TIMEFRAME = dict(self.config.MULTI_TIMEFRAME, enabled=True)
+        self.analyzer = ConfluenceAnalyzer(self.config)
+        self.resampler = TimeframeResampler(self.config, data_fetcher=None)
+        self.resampler.require('1d', self.analyzer.min_history())
+
+    def test_default_pair_fits_one_request(self):
+        self.assertEqual(self.analyzer.higher_timeframes('4h'), ['1d'])
+        self.assertLessEqual(self.resampler.required_base_bars(), self.config.HISTORY['max_limit'])
+        self.assertEqual(self.resampler.base_limit, self.resampler.required_base_bars())
+
+    def test_base_frame_yields_trend(self):
+        df = synthetic_frame(bars=self.resampler.base_limit, seed=0)
+        daily = resample_ohlcv(df, '4h', '1d')
+        self.assertGreaterEqual(len(daily), self.analyzer.min_history())
+        self.assertEqual(self.analyzer.trend(daily), TREND_BULLISH)
+
+    def test_short_history_is_neutral(self):
+        daily = resample_ohlcv(synthetic_frame(bars=600, seed=0), '4h', '1d')
+        self.assertEqual(self.analyzer.trend(daily), TREND_NEUTRAL)
+
+    def test_two_of_three_votes_decide(self):
+        # Son mumdaki geri çekilme MACD histogramını eksiye çevirir: EMA'lar ve kapanış yükselişte
+        closes = [100.0] * 200 + [100.0 + i for i in range(1, 41)] + [130.0]
+        df = pd.DataFrame({'close': closes}, index=pd.date_range('2023-01-01', periods=len(closes), freq='D'))
+        self.assertEqual(self.analyzer.trend(df), TREND_BULLISH)
+        self.assertEqual(self.analyzer.trend(200 - df), TREND_BEARISH)
+
+    def test_analyze_annotates_aligned_signal(self):
+        daily = resample_ohlcv(synthetic_frame(bars=self.resampler.base_limit, seed=0), '4h', '1d')
+        long_signal = {'signal_type': 'EMA Golden Cross', 'entry': 100.0, 'stop_loss': 95.0,
+                       'take_profit': 110.0, 'quality_score': 60}
+        short_signal = {'signal_type': 'EMA Death Cross', 'entry': 100.0, 'stop_loss': 105.0,
+                        'take_profit': 90.0, 'quality_score': 60}
+
+        annotated = self.analyzer.analyze('BTCUSDT', '4h', [long_signal, short_signal], {'1d': daily})
+        self.assertEqual(annotated, 1)
+        self.assertEqual(long_signal['confluence'], {'1d': 'Yükseliş'})
+        self.assertEqual(long_signal['quality_score'], 70)
+        self.assertNotIn('confluence', short_signal)
+        self.assertEqual(short_signal['quality_score'], 60)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Bekleme Süresi Deposu Testleri
+"""
+import os
+import json
+import time
+import sqlite3
+import tempfile
+import unittest
+
+import helpers  # noqa: F401 - src içe aktarma yolu
+from config import Config
+from cooldown_store import CooldownStore
+
+class CooldownStoreMigrationTest(unittest.TestCase):
+    """Eski sent_signals.json kayıtları veritabanına bir kez aktarılmalı"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = Config()
+        self.legacy_file = os.path.join(self.tmp.name, 'sent_signals.json')
+        self.config.COOLDOWN_STORE = dict(self.config.COOLDOWN_STORE, legacy_json=self.legacy_file)
+        self.db_path = os.path.join(self.tmp.name, 'cooldowns.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_legacy(self, sent_signals):
+        with open(self.legacy_file, 'w') as f:
+            json.dump(sent_signals, f)
+
+    def test_migrates_and_renames_json(self):
+        now = time.time()
+        self.write_legacy({
+            "BTCUSDT_EMA Golden Cross": now - 60,
+            "ETHUSDT_Bollinger Band Bounce (Lower)": now - 3600,
+            "SOLUSDT_MACD Bullish Crossover": now - self.config.SIGNAL_COOLDOWN - 10,
+        })
+
+        store = CooldownStore(self.config, self.db_path)
+        try:
+            self.assertFalse(os.path.exists(self.legacy_file))
+            self.assertTrue(os.path.exists(self.legacy_file + '.migrated'))
+            self.assertAlmostEqual(store.last_sent("BTCUSDT", "EMA Golden Cross"), now - 60)
+            self.assertTrue(store.is_cooling_down("ETHUSDT", "Bollinger Band Bounce (Lower)", now=now))
+            # Süresi dolmuş kayıt aktarıldıktan sonra temizlenir
+            self.assertIsNone(store.last_sent("SOLUSDT", "MACD Bullish Crossover"))
+            self.assertEqual(len(store), 2)
+        finally:
+            store.close()
+
+        # Yeniden açıldığında kayıtlar veritabanından okunur, dosya tekrar aktarılmaz
+        store = CooldownStore(self.config, self.db_path)
+        try:
+            self.assertEqual(len(store), 2)
+            self.assertAlmostEqual(store.last_sent("BTCUSDT", "EMA Golden Cross"), now - 60)
+        finally:
+            store.close()
+
+    def test_migration_keeps_newer_database_entry(self):
+        now = time.time()
+        store = CooldownStore(self.config, self.db_path)
+        store.mark_sent("BTCUSDT", "EMA Golden Cross", sent_at=now - 10)
+        store.close()
+
+        self.write_legacy({"BTCUSDT_EMA Golden Cross": now - 600, "ETHUSDT_EMA Death Cross": now - 600})
+        store = CooldownStore(self.config, self.db_path)
+        try:
+            self.assertAlmostEqual(store.last_sent("BTCUSDT", "EMA Golden Cross"), now - 10)
+            self.assertAlmostEqual(store.last_sent("ETHUSDT", "EMA Death Cross"), now - 600)
+        finally:
+            store.close()
+
+    def test_unreadable_json_is_left_in_place(self):
+        with open(self.legacy_file, 'w') as f:
+            f.write("{not json")
+        store = CooldownStore(self.config, self.db_path)
+        try:
+            self.assertEqual(len(store), 0)
+            self.assertTrue(os.path.exists(self.legacy_file))
+        finally:
+            store.close()
+
+    def test_list_of_pairs_and_malformed_rows(self):
+        now = time.time()
+        self.write_legacy([
+            ["BTCUSDT_EMA Golden Cross", now - 60],
+            ["ETHUSDT_EMA Death Cross", "not a time"],
+            ["no-separator", now - 60],
+            [None, now - 60],
+            ["SOLUSDT_MACD Bullish Crossover"],
+            "XRPUSDT_EMA Golden Cross",
+            ["ADAUSDT_EMA Golden Cross", float('nan')],
+            ["BNBUSDT_EMA Death Cross", str(now - 120)],
+        ])
+        store = CooldownStore(self.config, self.db_path)
+        try:
+            self.assertEqual(len(store), 2)
+            self.assertAlmostEqual(store.last_sent("BTCUSDT", "EMA Golden Cross"), now - 60)
+            self.assertAlmostEqual(store.last_sent("BNBUSDT", "EMA Death Cross"), now - 120)
+            self.assertTrue(os.path.exists(self.legacy_file + '.migrated'))
+        finally:
+            store.close()
+
+    def test_malformed_dict_values_are_skipped(self):
+        now = time.time()
+        self.write_legacy({"BTCUSDT_EMA Golden Cross": now - 60, "ETHUSDT_EMA Death Cross": None,
+                           "SOLUSDT_MACD Bullish Crossover": {"sent_at": now}})
+        store = CooldownStore(self.config, self.db_path)
+        try:
+            self.assertEqual(len(store), 1)
+        finally:
+            store.close()
+
+    def test_unknown_json_shape_is_left_in_place(self):
+        self.write_legacy(42)
+        store = CooldownStore(self.config, self.db_path)
+        try:
+            self.assertEqual(len(store), 0)
+            self.assertTrue(os.path.exists(self.legacy_file))
+        finally:
+            store.close()
+
+    def test_database_error_rolls_back_and_does_not_stop_startup(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(
+            "CREATE TABLE cooldowns (key TEXT PRIMARY KEY, symbol TEXT NOT NULL, signal_type TEXT NOT NULL,"
+            " sent_at REAL NOT NULL);"
+            "CREATE TRIGGER reject BEFORE INSERT ON cooldowns WHEN NEW.symbol = 'ETHUSDT'"
+            " BEGIN SELECT RAISE(ABORT, 'rejected'); END;"
+        )
+        conn.close()
+
+        now = time.time()
+        self.write_legacy({"BTCUSDT_EMA Golden Cross": now - 60, "ETHUSDT_EMA Death Cross": now - 60})
+        store = CooldownStore(self.config, self.db_path)
+        try:
+            # İlk satır da geri alınır, dosya bir sonraki başlangıç için yerinde kalır
+            self.assertEqual(len(store), 0)
+            self.assertTrue(os.path.exists(self.legacy_file))
+            store.mark_sent("SOLUSDT", "MACD Bullish Crossover", sent_at=now)
+            self.assertEqual(len(store), 1)
+        finally:
+            store.close()
+
+if __name__ == '__main__':
+    unittest.main()
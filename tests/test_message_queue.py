@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Mesaj Gönderim Kuyruğu Testleri
+"""
+import time
+import threading
+import unittest
+from concurrent.futures import Future
+
+import helpers  # noqa: F401 - src içe aktarma yolu
+from config import Config
+from message_queue import DeliveryQueue, gather_results, PRIORITY_ALERT, PRIORITY_SIGNAL
+
+def completed(result=None, exception=None):
+    """Sonucu veya hatası yazılmış future"""
+    future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+class DeliveryQueueTest(unittest.TestCase):
+    """Kuyruk öncelik sırasına uymalı ve aynı sohbete aynı anda tek mesaj göndermeli"""
+
+    def setUp(self):
+        config = Config()
+        # Hız sınırları testleri yavaşlatmasın
+        config.TELEGRAM_RATE_LIMITS = dict(config.TELEGRAM_RATE_LIMITS, global_per_second=1000,
+                                           private_chat_per_second=1000, workers=4)
+        self.queue = DeliveryQueue(config)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.queue.shutdown(wait=False)
+
+    def block(self):
+        """Sohbeti meşgul tutan iş: sonraki işler kuyrukta birikir"""
+        self.started.set()
+        self.assertTrue(self.release.wait(5))
+        return True
+
+    def test_priority_then_submission_order(self):
+        order = []
+        blocker = self.queue.submit('111', self.block)
+        self.assertTrue(self.started.wait(5))
+        futures = [
+            self.queue.submit('111', order.append, 'signal-1'),
+            self.queue.submit('111', order.append, 'alert-1', priority=PRIORITY_ALERT),
+            self.queue.submit('111', order.append, 'signal-2', priority=PRIORITY_SIGNAL),
+            self.queue.submit('111', order.append, 'alert-2', priority=PRIORITY_ALERT),
+        ]
+        self.release.set()
+        blocker.result(timeout=5)
+        for future in futures:
+            future.result(timeout=5)
+        self.assertEqual(order, ['alert-1', 'alert-2', 'signal-1', 'signal-2'])
+
+    def test_one_message_at_a_time_per_chat(self):
+        lock = threading.Lock()
+        active = {}
+        peak = {'chat': 0, 'total': 0}
+
+        def send(chat_id):
+            with lock:
+                active[chat_id] = active.get(chat_id, 0) + 1
+                peak['chat'] = max(peak['chat'], active[chat_id])
+                peak['total'] = max(peak['total'], sum(active.values()))
+            time.sleep(0.02)
+            with lock:
+                active[chat_id] -= 1
+            return True
+
+        futures = [self.queue.submit(chat_id, send, chat_id) for _ in range(5) for chat_id in ('111', '222', '333')]
+        self.assertTrue(all(future.result(timeout=5) for future in futures))
+        self.assertEqual(peak['chat'], 1)
+        # Farklı sohbetler eşzamanlı gönderilir
+        self.assertGreater(peak['total'], 1)
+
+    def test_failed_job_sets_exception(self):
+        future = self.queue.submit('111', lambda: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            future.result(timeout=5)
+
+    def test_shutdown_without_wait_fails_pending_jobs(self):
+        blocker = self.queue.submit('111', self.block)
+        self.assertTrue(self.started.wait(5))
+        pending = [self.queue.submit('111', lambda: True) for _ in range(3)]
+        cancelled = self.queue.submit('111', lambda: True)
+        cancelled.cancel()
+
+        self.queue.shutdown(wait=False)
+        for future in pending:
+            with self.assertRaises(RuntimeError):
+                future.result(timeout=1)
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(self.queue.pending_count(), 0)
+        with self.assertRaises(RuntimeError):
+            self.queue.submit('111', lambda: True)
+
+        # Çalışmakta olan iş tamamlanır
+        self.release.set()
+        self.assertTrue(blocker.result(timeout=5))
+
+class GatherResultsTest(unittest.TestCase):
+    """Toplu sonuç ancak tüm gönderimler başarılıysa True olmalı"""
+
+    def test_results(self):
+        self.assertTrue(gather_results([]).result(timeout=1))
+        self.assertTrue(gather_results([completed(True), completed(True)]).result(timeout=1))
+        self.assertFalse(gather_results([completed(True), completed(False)]).result(timeout=1))
+        self.assertFalse(gather_results([completed(True), completed(exception=RuntimeError())]).result(timeout=1))
+
+    def test_cancelled_future_counts_as_failure(self):
+        pending = Future()
+        combined = gather_results([completed(True), pending])
+        self.assertFalse(combined.done())
+        pending.cancel()
+        self.assertFalse(combined.result(timeout=1))
+
+    def test_cancelling_combined_cancels_pending(self):
+        pending = Future()
+        combined = gather_results([completed(True), pending])
+        self.assertTrue(combined.cancel())
+        self.assertTrue(pending.cancelled())
+
+if __name__ == '__main__':
+    unittest.main()
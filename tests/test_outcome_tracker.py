@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sinyal Sonuç Takip Testleri
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+import helpers  # noqa: F401 - src içe aktarma yolu
+from config import Config
+from signal_history import SignalHistory
+from signals.signal_record import Signal
+from outcome_tracker import (OutcomeTracker, resolve_outcomes,
+                             OUTCOME_TAKE_PROFIT, OUTCOME_STOP_LOSS, OUTCOME_EXPIRED)
+
+NAN = float('nan')
+
+class ResolveOutcomesTest(unittest.TestCase):
+    """TP/SL kararı sinyal mumunun tespit sonrası kısmına ve sonraki mumlara bakmalı"""
+
+    TIMES = np.array([0, 1, 2, 3, 4])
+    HIGHS = np.array([100.0, 112.0, 104.0, 111.0, 103.0])
+    LOWS = np.array([98.0, 97.0, 95.0, 85.0, 96.0])
+
+    def resolve(self, start, is_long, stop_loss, take_profit, start_high=None, start_low=None, max_bars=120):
+        def column(values):
+            return None if values is None else np.array(values, dtype=float)
+        return resolve_outcomes(self.TIMES, self.HIGHS, self.LOWS, np.array(start), np.array(is_long),
+                                column(stop_loss), column(take_profit), max_bars,
+                                column(start_high), column(start_low))
+
+    def test_own_candle_counts_only_beyond_detection_range(self):
+        # Birinci sinyal tespitten sonra 112'ye çıkan mumda TP'yi görür; ikincisi
+        # 112'yi tespit anında zaten görmüştü, sonuç sonraki mumlardan çözülür
+        outcomes, hit_bar, bars = self.resolve([1, 1], [True, True], [90, 90], [110, 110],
+                                               start_high=[105, 112], start_low=[97, 97])
+        self.assertEqual(list(outcomes), [OUTCOME_TAKE_PROFIT, OUTCOME_STOP_LOSS])
+        self.assertEqual(list(hit_bar), [1, 3])
+        self.assertEqual(list(bars), [0, 2])
+
+    def test_unknown_detection_range_skips_own_candle(self):
+        outcomes, hit_bar, bars = self.resolve([1], [True], [97.5], [200], start_high=[NAN], start_low=[NAN])
+        self.assertEqual(list(outcomes), [OUTCOME_STOP_LOSS])
+        self.assertEqual(list(hit_bar), [2])
+
+    def test_without_detection_range_own_candle_is_skipped(self):
+        outcomes, hit_bar, _ = self.resolve([1], [True], [97.5], [200])
+        self.assertEqual(list(outcomes), [OUTCOME_STOP_LOSS])
+        self.assertEqual(list(hit_bar), [2])
+
+    def test_short_signal(self):
+        outcomes, hit_bar, bars = self.resolve([0], [False], [120], [96], start_high=[NAN], start_low=[NAN])
+        self.assertEqual(list(outcomes), [OUTCOME_TAKE_PROFIT])
+        self.assertEqual(list(hit_bar), [2])
+        self.assertEqual(list(bars), [2])
+
+    def test_tp_and_sl_on_same_bar_is_stop_loss(self):
+        outcomes, hit_bar, _ = self.resolve([2], [True], [90], [110])
+        self.assertEqual(list(outcomes), [OUTCOME_STOP_LOSS])
+        self.assertEqual(list(hit_bar), [3])
+
+    def test_expiry(self):
+        outcomes, _, bars = self.resolve([2, 3], [True, True], [50, 50], [200, 200], max_bars=2)
+        self.assertEqual(list(outcomes), [OUTCOME_EXPIRED, None])
+        self.assertEqual(list(bars), [2, 1])
+
+    def test_empty_inputs(self):
+        outcomes, _, _ = self.resolve([], [], [], [])
+        self.assertEqual(len(outcomes), 0)
+
+class OutcomeTrackerIndexTest(unittest.TestCase):
+    """Gönderilen sinyaller veritabanı yeniden okunmadan indekse eklenmeli"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = Config()
+        self.config.OUTCOME_TRACKER = dict(self.config.OUTCOME_TRACKER, background=False)
+        self.db_path = os.path.join(self.tmp.name, 'signal_history.db')
+        self.history = SignalHistory(self.config, self.db_path)
+        self.tracker = OutcomeTracker(self.config, self.history)
+        self.index = pd.date_range('2024-01-01', periods=4, freq='4h')
+
+    def tearDown(self):
+        self.history.close()
+        self.tmp.cleanup()
+
+    def signal(self, symbol, stop_loss, take_profit):
+        return Signal(symbol, '4h', 'EMA Golden Cross', entry=100.0, stop_loss=stop_loss, take_profit=take_profit,
+                      timestamp=self.index[0], quality_score=70, candle_high=101.0, candle_low=99.0)
+
+    def candles(self, highs, lows):
+        return pd.DataFrame({'high': highs, 'low': lows}, index=self.index)
+
+    def test_add_indexes_only_sent_signals(self):
+        sent = [self.signal('BTCUSDT', 95.0, 110.0), self.signal('BTCUSDT', 90.0, 120.0)]
+        detected = sent + [self.signal('ETHUSDT', 95.0, 110.0)]
+        self.history.record_signals(detected, 'scan-1', sent)
+
+        with mock.patch.object(self.history, 'get_open_signals') as get_open_signals:
+            self.assertEqual(self.tracker.add(sent), 2)
+        get_open_signals.assert_not_called()
+        self.assertEqual(self.tracker.open_count(), 2)
+
+        # Sonraki taramanın mumlarıyla yalnızca ilk sinyal sonuçlanır
+        resolved = self.tracker.update('BTCUSDT', '4h', self.candles([101, 105, 111, 104], [99, 98, 97, 96]))
+        self.assertEqual(resolved, 1)
+        self.assertEqual(self.tracker.open_count(), 1)
+        outcomes = self.history.query("SELECT outcome, bars_to_resolution FROM signals ORDER BY id")
+        self.assertEqual(outcomes['outcome'].iloc[0], OUTCOME_TAKE_PROFIT)
+        self.assertTrue(outcomes['outcome'].iloc[1:].isna().all())
+        self.assertEqual(outcomes['bars_to_resolution'].iloc[0], 2)
+
+    def test_add_matches_reload(self):
+        sent = [self.signal('BTCUSDT', 95.0, 110.0), self.signal('ETHUSDT', 105.0, 90.0)]
+        self.history.record_signals(sent, 'scan-1', sent)
+        self.tracker.add(sent)
+        added = dict(self.tracker._open)
+        self.tracker.reload()
+        self.assertEqual(added.keys(), self.tracker._open.keys())
+        for key, entry in added.items():
+            for name, values in entry.items():
+                np.testing.assert_array_equal(values, self.tracker._open[key][name])
+
+    def test_refresh_reads_only_newer_signals(self):
+        first = [self.signal('BTCUSDT', 95.0, 110.0)]
+        self.history.record_signals(first, 'scan-1', first)
+        self.tracker.add(first)
+
+        # Başka bir süreç (toplayıcı) aynı veritabanına yeni sinyal yazar
+        other = SignalHistory(self.config, self.db_path)
+        try:
+            second = [self.signal('ETHUSDT', 95.0, 110.0)]
+            other.record_signals(second, 'scan-2', second)
+        finally:
+            other.close()
+
+        self.assertEqual(self.tracker.refresh(), 1)
+        self.assertEqual(self.tracker.refresh(), 0)
+        self.assertEqual(self.tracker.open_count(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
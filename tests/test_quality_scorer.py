@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sinyal Kalite Puanlama Testleri
+"""
+import unittest
+import numpy as np
+
+from helpers import synthetic_frame
+from config import Config
+from technical_indicators import TechnicalIndicators
+from signals.quality_scorer import (QUALITY_COLUMNS, CONDITION_COLUMNS, CONDITION_BITS, REQUIRED_COLUMNS,
+                                    add_quality_scores, condition_flags, score_arrays)
+
+def scalar_quality(df, is_bullish):
+    """Eski skaler puanlama (BaseSignal.calculate_signal_quality, son mum)"""
+    quality = 50
+    last = df.iloc[-1]
+
+    if is_bullish:
+        quality += 10 if last['ema_short'] > last['ema_long'] else -10
+        if last['rsi'] < 30:
+            quality += 15
+        elif last['rsi'] < 50:
+            quality += 5
+        if last['macd'] > last['macd_signal']:
+            quality += 10
+        if last['close'] < last['bb_lower']:
+            quality += 10
+    else:
+        quality += 10 if last['ema_short'] < last['ema_long'] else -10
+        if last['rsi'] > 70:
+            quality += 15
+        elif last['rsi'] > 50:
+            quality += 5
+        if last['macd'] < last['macd_signal']:
+            quality += 10
+        if last['close'] > last['bb_upper']:
+            quality += 10
+
+    avg_volume = df['volume'].iloc[-5:].mean()
+    if last['volume'] > 1.5 * avg_volume:
+        quality += 10
+
+    return max(0, min(100, quality))
+
+class QualityScorerTest(unittest.TestCase):
+    """Dizi puanlaması her mumda eski skaler puanlamayla aynı olmalı"""
+
+    @classmethod
+    def setUpClass(cls):
+        indicators = TechnicalIndicators(Config())
+        cls.frames = [indicators.ensure(synthetic_frame(bars=300, seed=seed), REQUIRED_COLUMNS)
+                      for seed in (0, 1, 2)]
+
+    def test_scores_match_scalar_on_every_bar(self):
+        for seed, df in enumerate(self.frames):
+            bullish, bearish = score_arrays(df)
+            for end in range(1, len(df) + 1):
+                window = df.iloc[:end]
+                with self.subTest(seed=seed, bar=end - 1):
+                    self.assertEqual(bullish[end - 1], scalar_quality(window, True))
+                    self.assertEqual(bearish[end - 1], scalar_quality(window, False))
+
+    def test_condition_codes_decode_to_flags(self):
+        df = add_quality_scores(self.frames[0].copy())
+        flags = condition_flags(df)
+        for is_bullish in (True, False):
+            codes = df[CONDITION_COLUMNS[is_bullish]].to_numpy()
+            for bit, name in enumerate(CONDITION_BITS):
+                np.testing.assert_array_equal((codes >> bit) & 1 == 1, flags[is_bullish][name])
+
+    def test_add_quality_scores_writes_in_place(self):
+        df = self.frames[1].copy()
+        result = add_quality_scores(df)
+        self.assertIs(result, df)
+        bullish, bearish = score_arrays(df)
+        np.testing.assert_array_equal(df[QUALITY_COLUMNS[True]].to_numpy(), bullish)
+        np.testing.assert_array_equal(df[QUALITY_COLUMNS[False]].to_numpy(), bearish)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Parçalı Tarama Testleri
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import helpers  # noqa: F401 - src içe aktarma yolu
+from config import Config
+from sharding import HashRing, ScanQueue
+
+SYMBOLS = [f"SYM{i:04d}USDT" for i in range(2000)]
+
+class HashRingTest(unittest.TestCase):
+    """İşçi eklenip çıkarıldığında yalnızca o işçinin sembolleri yer değiştirmeli"""
+
+    def owners(self, ring):
+        return {symbol: ring.node_for(symbol) for symbol in SYMBOLS}
+
+    def test_adding_a_node_only_moves_keys_to_it(self):
+        ring = HashRing(['w1', 'w2', 'w3'])
+        before = self.owners(ring)
+        ring.add('w4')
+        after = self.owners(ring)
+
+        moved = [symbol for symbol in SYMBOLS if before[symbol] != after[symbol]]
+        self.assertTrue(moved)
+        self.assertTrue(all(after[symbol] == 'w4' for symbol in moved))
+        # Yeni işçi yaklaşık 1/4 pay almalı
+        self.assertLess(abs(len(moved) / len(SYMBOLS) - 0.25), 0.08)
+
+    def test_removing_a_node_only_moves_its_keys(self):
+        ring = HashRing(['w1', 'w2', 'w3', 'w4'])
+        before = self.owners(ring)
+        ring.remove('w2')
+        after = self.owners(ring)
+        for symbol in SYMBOLS:
+            if before[symbol] != 'w2':
+                self.assertEqual(after[symbol], before[symbol])
+            else:
+                self.assertNotEqual(after[symbol], 'w2')
+
+    def test_assignment_is_independent_of_insertion_order(self):
+        self.assertEqual(HashRing(['w1', 'w2', 'w3']).assign(SYMBOLS),
+                         HashRing(['w3', 'w1', 'w2']).assign(SYMBOLS))
+
+    def test_assign_keeps_input_order_and_covers_all_keys(self):
+        shards = HashRing(['w1', 'w2']).assign(SYMBOLS)
+        self.assertEqual(sorted(symbol for shard in shards.values() for symbol in shard), sorted(SYMBOLS))
+        for shard in shards.values():
+            self.assertEqual(shard, sorted(shard, key=SYMBOLS.index))
+
+    def test_empty_ring(self):
+        self.assertIsNone(HashRing().node_for('BTCUSDT'))
+        self.assertEqual(HashRing().assign(['BTCUSDT']), {})
+
+class ScanQueueLeaseTest(unittest.TestCase):
+    """Kiralaması dolan parçayı canlı başka bir işçi devralabilmeli"""
+
+    LEASE = 30
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'scan_queue.db')
+        self.queue = ScanQueue(Config(), self.db_path)
+        self.queue.publish_scan('scan-1', ['BTCUSDT', 'ETHUSDT'], ['w1', 'w2'])
+        self.now = sqlite3.connect(self.db_path).execute("SELECT created_at FROM scans").fetchone()[0]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def pending(self, worker, offset):
+        return [(scan_id, shard) for scan_id, _, _, shard in
+                self.queue.pending_shards(worker, 600, self.LEASE, now=self.now + offset)]
+
+    def test_own_shard_first_and_claimed_once(self):
+        self.assertEqual(self.pending('w1', 1), [('scan-1', 'w1')])
+        self.assertTrue(self.queue.claim('scan-1', 'w1', 'w1', self.LEASE, now=self.now + 1))
+        self.assertFalse(self.queue.claim('scan-1', 'w1', 'w2', self.LEASE, now=self.now + 2))
+        self.assertEqual(self.pending('w1', 2), [])
+
+    def test_expired_lease_is_taken_over(self):
+        self.queue.claim('scan-1', 'w1', 'w1', self.LEASE, now=self.now + 1)
+        self.queue.claim('scan-1', 'w2', 'w2', self.LEASE, now=self.now + 1)
+        self.assertEqual(self.pending('w2', 20), [])
+
+        # w1 çöktü: kiralaması yenilenmiyor
+        self.queue.renew_leases('w2', self.LEASE, now=self.now + 20)
+        self.assertEqual(self.pending('w2', 40), [('scan-1', 'w1')])
+        self.assertTrue(self.queue.claim('scan-1', 'w1', 'w2', self.LEASE, now=self.now + 40))
+
+        self.queue.submit_results('scan-1', 'w1', [])
+        self.queue.submit_results('scan-1', 'w2', [])
+        self.assertEqual(self.queue.wait_results('scan-1', ['w1', 'w2'], timeout=1), {'w1': [], 'w2': []})
+
+    def test_renewed_lease_is_not_taken_over(self):
+        self.queue.claim('scan-1', 'w1', 'w1', self.LEASE, now=self.now + 1)
+        self.queue.renew_leases('w1', self.LEASE, now=self.now + 25)
+        self.assertEqual(self.pending('w2', 40), [('scan-1', 'w2')])
+        self.assertFalse(self.queue.claim('scan-1', 'w1', 'w2', self.LEASE, now=self.now + 40))
+
+    def test_unclaimed_shard_is_taken_over_after_lease(self):
+        self.assertEqual(self.pending('w2', 10), [('scan-1', 'w2')])
+        self.assertEqual(self.pending('w2', self.LEASE + 1), [('scan-1', 'w2'), ('scan-1', 'w1')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sinyal Kaydı Testleri
+"""
+import unittest
+import pandas as pd
+
+import helpers  # noqa: F401 - src içe aktarma yolu
+from signals.signal_record import Signal, dedupe, signal_direction
+
+TIMESTAMP = pd.Timestamp('2024-01-01 04:00')
+
+def make_signal(**fields):
+    """Varsayılan alanlarla sinyal"""
+    values = dict(symbol='BTCUSDT', timeframe='4h', signal_type='EMA Golden Cross', entry=100.0,
+                  stop_loss=95.0, take_profit=110.0, timestamp=TIMESTAMP, quality_score=70,
+                  description='Kısa EMA uzun EMA\'yı yukarı kesti.')
+    values.update(fields)
+    return Signal(**values)
+
+class SignalIdentityTest(unittest.TestCase):
+    """Eşitlik seviyelere bakmalı, hash seviyeler değiştiğinde sabit kalmalı"""
+
+    def test_equality_uses_identity_fields(self):
+        self.assertEqual(make_signal(), make_signal(quality_score=40, entry=101.0, description=None))
+        self.assertNotEqual(make_signal(), make_signal(stop_loss=94.0))
+        self.assertNotEqual(make_signal(), make_signal(timestamp=TIMESTAMP + pd.Timedelta('4h')))
+        self.assertNotEqual(make_signal(), make_signal(signal_type='MACD Bullish Crossover'))
+        self.assertNotEqual(make_signal(), make_signal().to_dict())
+
+    def test_equal_signals_hash_equal(self):
+        self.assertEqual(hash(make_signal()), hash(make_signal(quality_score=10)))
+
+    def test_hash_survives_level_changes(self):
+        signal = make_signal()
+        signals = {signal}
+        signal['stop_loss'] = 90.0
+        signal['take_profit'] = 120.0
+        self.assertIn(signal, signals)
+        self.assertEqual(len({signal, make_signal(stop_loss=90.0, take_profit=120.0)}), 1)
+
+    def test_dedupe_keeps_first(self):
+        first, duplicate, other = make_signal(), make_signal(quality_score=10), make_signal(stop_loss=94.0)
+        unique = dedupe([first, duplicate, other])
+        self.assertEqual(len(unique), 2)
+        self.assertIs(unique[0], first)
+        self.assertIs(unique[1], other)
+
+    def test_direction(self):
+        self.assertTrue(signal_direction(make_signal()))
+        self.assertFalse(signal_direction(make_signal(stop_loss=105.0, take_profit=90.0)))
+        self.assertIsNone(signal_direction(make_signal(stop_loss=None)))
+        self.assertIsNone(signal_direction(make_signal(take_profit=float('nan'))))
+
+class SignalMappingTest(unittest.TestCase):
+    """Sözlük arayüzü eski sözlük sinyalleriyle aynı davranmalı"""
+
+    def test_fields_and_extras(self):
+        signal = make_signal(is_pattern=True)
+        self.assertEqual(signal['entry'], 100.0)
+        self.assertTrue(signal.get('is_pattern'))
+        self.assertIn('is_pattern', signal)
+        self.assertNotIn('support_levels', signal)
+        self.assertEqual(signal.get('support_levels', []), [])
+        with self.assertRaises(KeyError):
+            signal['support_levels']
+
+        signal['support_levels'] = [90.0]
+        self.assertEqual(signal['support_levels'], [90.0])
+
+    def test_slot_fields_are_always_present(self):
+        signal = make_signal(description=None)
+        self.assertIn('description', signal)
+        self.assertIsNone(signal['description'])
+        self.assertEqual(signal.get('description', '-'), '-')
+        self.assertNotIn('description', signal.keys())
+
+class SignalSerializationTest(unittest.TestCase):
+    """to_json / from_json gidiş dönüşü sinyali değiştirmemeli"""
+
+    def test_round_trip(self):
+        alternative = make_signal(signal_type='RSI Oversold', quality_score=55)
+        signal = make_signal(alternative_signals=[alternative], support_levels=[90.0, 85.0],
+                             confluence={'1d': 'Yükseliş'})
+        restored = Signal.from_json(signal.to_json())
+
+        self.assertEqual(restored, signal)
+        self.assertEqual(restored.to_dict(), signal.to_dict())
+        self.assertIsInstance(restored['timestamp'], pd.Timestamp)
+        self.assertIsInstance(restored['alternative_signals'][0], Signal)
+        self.assertEqual(restored['alternative_signals'][0], alternative)
+
+    def test_to_dict_omits_empty_fields(self):
+        data = make_signal(description=None).to_dict()
+        self.assertNotIn('description', data)
+        self.assertEqual(Signal.from_dict(data), make_signal())
+
+    def test_from_dict(self):
+        signal = make_signal()
+        self.assertIs(Signal.from_dict(signal), signal)
+        restored = Signal.from_dict({'symbol': 'BTCUSDT', 'timeframe': '4h', 'signal_type': 'EMA Golden Cross',
+                                     'timestamp': TIMESTAMP, 'stop_loss': 95.0, 'take_profit': 110.0,
+                                     'alternative_signals': [make_signal().to_dict()]})
+        self.assertEqual(restored, signal)
+        self.assertIsInstance(restored['alternative_signals'][0], Signal)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sinyal Kuralı Testleri
+
+Config.SIGNAL_RULES ile tanımlanan EMA, MACD, Ichimoku ve Bollinger modülleri
+kural motorundan önceki elle yazılmış kontrollerle aynı sinyalleri üretmeli.
+"""
+import unittest
+
+from helpers import synthetic_frame
+from config import Config
+from technical_indicators import TechnicalIndicators
+from signals.quality_scorer import REQUIRED_COLUMNS as QUALITY_COLUMNS, add_quality_scores
+from signals.rule_engine import evaluate_rules
+from signals.moving_average_signals import MovingAverageSignals
+from signals.macd_signals import MACDSignals
+from signals.ichimoku_signals import IchimokuSignals
+from signals.bollinger_signals import BollingerSignals
+from test_quality_scorer import scalar_quality
+
+def crossover_signals(symbol, timeframe, df, fast, slow, names, descriptions, boosts):
+    """Eski kesişim kontrolü (EMA, MACD ve Ichimoku modülleri aynı kalıbı kullanıyordu)"""
+    signals = []
+    if len(df) < 3:
+        return signals
+    entry = df['close'].iloc[-1]
+
+    if df[fast].iloc[-2] <= df[slow].iloc[-2] and df[fast].iloc[-1] > df[slow].iloc[-1]:
+        stop_loss = min(df['low'].iloc[-5:]) * 0.99
+        quality = scalar_quality(df, True) + boosts[0](df)
+        signals.append({'symbol': symbol, 'timeframe': timeframe, 'signal_type': names[0], 'entry': entry,
+                        'stop_loss': stop_loss, 'take_profit': entry + (entry - stop_loss) * 2,
+                        'timestamp': df.index[-1], 'quality_score': quality, 'description': descriptions[0]})
+
+    if df[fast].iloc[-2] >= df[slow].iloc[-2] and df[fast].iloc[-1] < df[slow].iloc[-1]:
+        stop_loss = max(df['high'].iloc[-5:]) * 1.01
+        quality = scalar_quality(df, False) + boosts[1](df)
+        signals.append({'symbol': symbol, 'timeframe': timeframe, 'signal_type': names[1], 'entry': entry,
+                        'stop_loss': stop_loss, 'take_profit': entry - (stop_loss - entry) * 2,
+                        'timestamp': df.index[-1], 'quality_score': quality, 'description': descriptions[1]})
+    return signals
+
+def legacy_moving_average(module, symbol, timeframe, df):
+    """Eski MovingAverageSignals.check_ema_crossovers"""
+    p = module.config.TA_PARAMS
+    return crossover_signals(
+        symbol, timeframe, df, 'ema_short', 'ema_long',
+        ('EMA Golden Cross', 'EMA Death Cross'),
+        (f"Kısa EMA ({p['ema_short']}) uzun EMA'yı ({p['ema_long']}) yukarı kesti. Olası bir yükseliş sinyali.",
+         f"Kısa EMA ({p['ema_short']}) uzun EMA'yı ({p['ema_long']}) aşağı kesti. Olası bir düşüş sinyali."),
+        (lambda df: 0, lambda df: 0))
+
+def legacy_macd(module, symbol, timeframe, df):
+    """Eski MACDSignals.check_macd_crossovers"""
+    return crossover_signals(
+        symbol, timeframe, df, 'macd', 'macd_signal',
+        ('MACD Bullish Crossover', 'MACD Bearish Crossover'),
+        ('MACD çizgisi sinyal çizgisini yukarı kesti. Olası bir yükseliş sinyali.',
+         'MACD çizgisi sinyal çizgisini aşağı kesti. Olası bir düşüş sinyali.'),
+        (lambda df: 10 if df['macd_hist'].iloc[-2] < 0 and df['macd_hist'].iloc[-1] > 0 else 0,
+         lambda df: 10 if df['macd_hist'].iloc[-2] > 0 and df['macd_hist'].iloc[-1] < 0 else 0))
+
+def legacy_ichimoku(module, symbol, timeframe, df):
+    """Eski IchimokuSignals.check_ichimoku_cloud"""
+    def cloud(df, reduce):
+        return reduce(df['ichimoku_senkou_span_a'].iloc[-1], df['ichimoku_senkou_span_b'].iloc[-1])
+
+    return crossover_signals(
+        symbol, timeframe, df, 'ichimoku_tenkan', 'ichimoku_kijun',
+        ('Ichimoku TK Cross (Bullish)', 'Ichimoku TK Cross (Bearish)'),
+        ("Tenkan-sen Kijun-sen'i yukarı kesti. Olası bir yükseliş sinyali.",
+         "Tenkan-sen Kijun-sen'i aşağı kesti. Olası bir düşüş sinyali."),
+        (lambda df: 15 if df['close'].iloc[-1] > cloud(df, max) else 0,
+         lambda df: 15 if df['close'].iloc[-1] < cloud(df, min) else 0))
+
+def legacy_bollinger(module, symbol, timeframe, df):
+    """Eski BollingerSignals.check_bollinger_bands"""
+    signals = []
+    if len(df) < 4:
+        return signals
+    p = module.config.TA_PARAMS
+    entry = df['close'].iloc[-1]
+
+    if df['low'].iloc[-2] < df['bb_lower'].iloc[-2] and df['close'].iloc[-1] > df['bb_lower'].iloc[-1]:
+        quality = scalar_quality(df, True)
+        if df['rsi'].iloc[-1] < p['rsi_oversold']:
+            quality += 15
+        signals.append({'symbol': symbol, 'timeframe': timeframe, 'signal_type': 'Bollinger Band Bounce (Lower)',
+                        'entry': entry, 'stop_loss': min(df['low'].iloc[-3:]) * 0.99,
+                        'take_profit': df['bb_middle'].iloc[-1], 'timestamp': df.index[-1], 'quality_score': quality,
+                        'description': 'Fiyat alt Bollinger bandından sekti. Olası bir yükseliş sinyali.'})
+
+    if df['high'].iloc[-2] > df['bb_upper'].iloc[-2] and df['close'].iloc[-1] < df['bb_upper'].iloc[-1]:
+        quality = scalar_quality(df, False)
+        if df['rsi'].iloc[-1] > p['rsi_overbought']:
+            quality += 15
+        signals.append({'symbol': symbol, 'timeframe': timeframe, 'signal_type': 'Bollinger Band Bounce (Upper)',
+                        'entry': entry, 'stop_loss': max(df['high'].iloc[-3:]) * 1.01,
+                        'take_profit': df['bb_middle'].iloc[-1], 'timestamp': df.index[-1], 'quality_score': quality,
+                        'description': 'Fiyat üst Bollinger bandından sekti. Olası bir düşüş sinyali.'})
+    return signals
+
+class SignalRulesTest(unittest.TestCase):
+    """Kural tabanlı modüller eski sınıflarla birebir aynı sinyalleri üretmeli"""
+
+    MODULES = (
+        (MovingAverageSignals, legacy_moving_average),
+        (MACDSignals, legacy_macd),
+        (IchimokuSignals, legacy_ichimoku),
+        (BollingerSignals, legacy_bollinger),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config = Config()
+        cls.modules = [(module_class(cls.config), legacy) for module_class, legacy in cls.MODULES]
+        columns = set(QUALITY_COLUMNS).union(*(module.required_columns for module, _ in cls.modules))
+        indicators = TechnicalIndicators(cls.config)
+        cls.frames = [add_quality_scores(indicators.ensure(synthetic_frame(bars=400, seed=seed), columns))
+                      for seed in (0, 4, 9)]
+
+    def test_rules_match_legacy_modules_on_every_bar(self):
+        fired = 0
+        for module, legacy in self.modules:
+            for seed, df in enumerate(self.frames):
+                for end in range(module.lookback + 1, len(df) + 1):
+                    window = df.iloc[:end]
+                    with self.subTest(module=module.name, seed=seed, bar=end - 1):
+                        expected = legacy(module, "BTCUSDT", "4h", window)
+                        actual = [signal.to_dict() for signal in module.check_signals("BTCUSDT", "4h", window)]
+                        self.assertEqual(actual, expected)
+                        fired += len(expected)
+        # Karşılaştırma boş sonuçlarla geçmemeli
+        self.assertGreater(fired, 20)
+
+    def test_backtest_evaluation_matches_live_path(self):
+        for module, _ in self.modules:
+            df = self.frames[0]
+            # Canlı yol ilk lookback mumunda çalışmaz; karşılaştırma tam pencereli mumlarla yapılır
+            history = evaluate_rules(module.rules, df)
+            history = history[history.index >= df.index[module.lookback]]
+            live = [(signal['timestamp'], signal['signal_type'], signal['entry'], signal['stop_loss'], signal['take_profit'])
+                    for end in range(module.lookback + 1, len(df) + 1)
+                    for signal in module.check_signals("BTCUSDT", "4h", df.iloc[:end])]
+            backtest = [(timestamp, row.signal_type, row.entry, row.stop_loss, row.take_profit)
+                        for timestamp, row in zip(history.index, history.itertuples())]
+            with self.subTest(module=module.name):
+                self.assertEqual(sorted(backtest), sorted(live))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Telegram Gönderici Testleri
+"""
+import unittest
+from unittest import mock
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+import helpers  # noqa: F401 - src içe aktarma yolu
+from config import Config
+from signal_sender import TelegramSender, is_idempotent, request_not_sent
+
+def connection_error(reason):
+    """requests'in bağlantı havuzundan gelen hatayı nasıl sardığını taklit eder"""
+    return requests.ConnectionError(MaxRetryError(None, "https://api.telegram.org", reason=reason))
+
+def response(status_code):
+    """Yalnızca durum kodu ve içeriği olan yanıt"""
+    result = requests.Response()
+    result.status_code = status_code
+    result._content = b'{"ok": true}'
+    return result
+
+class IdempotencyTest(unittest.TestCase):
+    """Gönderim metotları yalnızca istek sunucuya ulaşmadıysa yeniden denenmeli"""
+
+    def test_is_idempotent(self):
+        self.assertTrue(is_idempotent("getMe"))
+        self.assertTrue(is_idempotent("getFile"))
+        self.assertFalse(is_idempotent("sendMessage"))
+        self.assertFalse(is_idempotent("sendPhoto"))
+
+    def test_request_not_sent(self):
+        self.assertTrue(request_not_sent(requests.ConnectTimeout()))
+        self.assertTrue(request_not_sent(connection_error(NewConnectionError(None, "refused"))))
+        self.assertFalse(request_not_sent(requests.ReadTimeout()))
+        self.assertFalse(request_not_sent(connection_error(ProtocolError("Connection aborted"))))
+        self.assertFalse(request_not_sent(requests.ConnectionError()))
+
+class ApiRequestRetryTest(unittest.TestCase):
+    """_api_request yeniden denemeyi metoda ve hatanın türüne göre seçmeli"""
+
+    def setUp(self):
+        config = Config()
+        config.TELEGRAM_HTTP = dict(config.TELEGRAM_HTTP, backoff_factor=0, max_retries=2)
+        self.sender = TelegramSender(config)
+        self.sender.session = mock.Mock()
+
+    def tearDown(self):
+        self.sender.delivery_queue.shutdown(wait=False)
+
+    def request(self, api_method, *outcomes):
+        self.sender.session.request.side_effect = list(outcomes)
+        return self.sender._api_request(api_method, data={'chat_id': '111'})
+
+    def test_send_is_not_retried_after_read_timeout(self):
+        with self.assertRaises(requests.ReadTimeout):
+            self.request("sendMessage", requests.ReadTimeout(), response(200))
+        self.assertEqual(self.sender.session.request.call_count, 1)
+
+    def test_send_is_not_retried_after_dropped_connection(self):
+        with self.assertRaises(requests.ConnectionError):
+            self.request("sendMessage", connection_error(ProtocolError("Connection aborted")), response(200))
+        self.assertEqual(self.sender.session.request.call_count, 1)
+
+    def test_send_is_retried_when_request_never_left(self):
+        result = self.request("sendPhoto", requests.ConnectTimeout(),
+                              connection_error(NewConnectionError(None, "refused")), response(200))
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(self.sender.session.request.call_count, 3)
+
+    def test_send_is_not_retried_on_server_error(self):
+        self.assertEqual(self.request("sendMessage", response(502), response(200)).status_code, 502)
+        self.assertEqual(self.sender.session.request.call_count, 1)
+
+    def test_read_method_is_retried(self):
+        result = self.request("getMe", requests.ReadTimeout(), response(502), response(200))
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(self.sender.session.request.call_count, 3)
+
+    def test_retries_are_bounded(self):
+        with self.assertRaises(requests.ConnectTimeout):
+            self.request("sendMessage", *(requests.ConnectTimeout() for _ in range(4)))
+        self.assertEqual(self.sender.session.request.call_count, 3)
+
+if __name__ == '__main__':
+    unittest.main()
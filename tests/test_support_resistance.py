@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Destek ve Direnç Testleri
+"""
+import unittest
+import numpy as np
+import pandas as pd
+
+from helpers import synthetic_frame
+from support_resistance import local_extrema
+
+def loop_extrema(values, window, find_max=True):
+    """Eski mum mum pandas döngüsü (SupportResistance._find_local_maxima/_minima)"""
+    series = pd.Series(values, dtype=float)
+    found = []
+    for i in range(window, len(series) - window):
+        if find_max:
+            previous = series.iloc[i - window:i].max()
+            following = series.iloc[i + 1:i + window + 1].max()
+            if series.iloc[i] > previous and series.iloc[i] > following:
+                found.append(i)
+        else:
+            previous = series.iloc[i - window:i].min()
+            following = series.iloc[i + 1:i + window + 1].min()
+            if series.iloc[i] < previous and series.iloc[i] < following:
+                found.append(i)
+    return found
+
+class LocalExtremaTest(unittest.TestCase):
+    """local_extrema eski döngüyle aynı indeksleri bulmalı"""
+
+    def assert_matches_loop(self, values, windows=(1, 2, 5, 20)):
+        for window in windows:
+            for find_max in (True, False):
+                with self.subTest(window=window, find_max=find_max):
+                    self.assertEqual(local_extrema(values, window, find_max).tolist(),
+                                     loop_extrema(values, window, find_max))
+
+    def test_synthetic_prices(self):
+        df = synthetic_frame(bars=300, seed=3)
+        self.assert_matches_loop(df['high'].to_numpy())
+        self.assert_matches_loop(df['low'].to_numpy())
+
+    def test_ties_are_not_extrema(self):
+        # Tamsayı değerlerde eşitlikler sık; eşit komşusu olan nokta uç nokta sayılmaz
+        values = np.random.default_rng(7).integers(0, 6, size=200).astype(float)
+        self.assert_matches_loop(values)
+
+    def test_nan_values_are_skipped(self):
+        values = synthetic_frame(bars=200, seed=5)['close'].to_numpy(copy=True)
+        values[[0, 10, 11, 57, 120, 199]] = np.nan
+        self.assert_matches_loop(values)
+
+    def test_short_series(self):
+        for length in range(0, 12):
+            values = np.arange(length, dtype=float)
+            self.assert_matches_loop(values, windows=(1, 5))
+
+if __name__ == '__main__':
+    unittest.main()
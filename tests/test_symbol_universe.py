@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Sembol Evreni Testleri
+"""
+import os
+import tempfile
+import unittest
+
+import helpers  # noqa: F401 - src içe aktarma yolu
+from config import Config
+from symbol_universe import SymbolUniverse, tier_slot
+
+class FakeFetcher:
+    """Borsa bilgisini ve toplu hacimleri sabit verilerden döndüren veri çekici"""
+
+    def __init__(self, listed, volumes):
+        self.listed = listed
+        self.volumes = volumes
+        self.calls = {'exchange_info': 0, 'volumes': 0}
+
+    def get_exchange_info(self):
+        self.calls['exchange_info'] += 1
+        return self.listed
+
+    def get_all_24h_volumes(self):
+        self.calls['volumes'] += 1
+        return self.volumes
+
+def listing(symbol, base, quote='USDT', status='TRADING', spot=True):
+    """exchangeInfo sembol kaydı"""
+    return {'symbol': symbol, 'baseAsset': base, 'quoteAsset': quote, 'status': status,
+            'isSpotTradingAllowed': spot}
+
+class SymbolUniverseRankTest(unittest.TestCase):
+    """Semboller hacme göre sıralanıp katmanlara bölünmeli"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = Config()
+        self.config.MIN_VOLUME_THRESHOLD = 1000
+        self.config.SYMBOL_UNIVERSE = dict(self.config.SYMBOL_UNIVERSE, enabled=True, max_symbols=None, tiers=[
+            {"name": "core", "size": 2, "every": 1},
+            {"name": "mid", "size": 3, "every": 2},
+            {"name": "tail", "size": None, "every": 4},
+        ])
+        self.coins = [f"C{i:02d}" for i in range(10)]
+        listed = [listing(f"{coin}USDT", coin) for coin in self.coins] + [
+            listing("USDCUSDT", "USDC"),
+            listing("C00BTC", "C00", quote='BTC'),
+            listing("HALTUSDT", "HALT", status='BREAK'),
+            listing("MARGINUSDT", "MARGIN", spot=False),
+            listing("DUSTUSDT", "DUST"),
+        ]
+        # C09 en yüksek hacimli, C00 en düşük; eşit hacimler ada göre sıralanır
+        volumes = {f"{coin}USDT": 10_000 * (i + 1) for i, coin in enumerate(self.coins)}
+        volumes.update({"C08USDT": volumes["C09USDT"], "USDCUSDT": 10 ** 9, "HALTUSDT": 10 ** 9,
+                        "MARGINUSDT": 10 ** 9, "C00BTC": 10 ** 9, "DUSTUSDT": 999})
+        self.fetcher = FakeFetcher(listed, volumes)
+        self.cache_path = os.path.join(self.tmp.name, 'exchange_info.json')
+        self.universe = SymbolUniverse(self.config, self.fetcher, self.cache_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rank_tiers_by_volume(self):
+        tiers = self.universe.rank(now=1000)
+        self.assertEqual([(name, every) for name, every, _ in tiers], [('core', 1), ('mid', 2), ('tail', 4)])
+        self.assertEqual(tiers[0][2], ['C08USDT', 'C09USDT'])
+        self.assertEqual(tiers[1][2], ['C07USDT', 'C06USDT', 'C05USDT'])
+        self.assertEqual(tiers[2][2], ['C04USDT', 'C03USDT', 'C02USDT', 'C01USDT', 'C00USDT'])
+
+    def test_max_symbols_and_overflow_into_last_tier(self):
+        self.config.SYMBOL_UNIVERSE.update(max_symbols=6, tiers=[{"name": "core", "size": 2, "every": 1},
+                                                                 {"name": "mid", "size": 2, "every": 2}])
+        tiers = self.universe.rank(now=1000)
+        self.assertEqual(tiers[0][2], ['C08USDT', 'C09USDT'])
+        self.assertEqual(tiers[1][2], ['C07USDT', 'C06USDT', 'C05USDT', 'C04USDT'])
+
+    def test_ranking_is_cached_until_ttl(self):
+        self.universe.rank(now=1000)
+        self.universe.rank(now=1000 + 60)
+        self.assertEqual(self.fetcher.calls, {'exchange_info': 1, 'volumes': 1})
+        self.universe.rank(now=1000 + self.config.SYMBOL_UNIVERSE['ranking_ttl'])
+        # Borsa bilgisi daha uzun süre önbellekte kalır, hacimler yenilenir
+        self.assertEqual(self.fetcher.calls, {'exchange_info': 1, 'volumes': 2})
+
+    def test_exchange_info_cache_survives_restart(self):
+        self.universe.rank(now=1000)
+        self.fetcher.listed = None
+        universe = SymbolUniverse(self.config, self.fetcher, self.cache_path)
+        self.assertEqual(len(universe.listed_symbols(now=1000 + 60)), 11)
+        self.assertEqual(self.fetcher.calls['exchange_info'], 1)
+
+    def test_scans_cover_every_tier_symbol_once_per_cycle(self):
+        tiers = self.universe.rank(now=1000)
+        for name, every, symbols in tiers:
+            with self.subTest(tier=name):
+                scanned = [symbol for scan in range(every) for symbol in self.universe.symbols_for_scan(scan)
+                           if symbol in symbols]
+                self.assertEqual(sorted(scanned), sorted(symbols))
+        # İlk katman her taramada taranır
+        for scan in range(4):
+            self.assertEqual(self.universe.symbols_for_scan(scan)[:2], ['C08USDT', 'C09USDT'])
+
+    def test_fallback_to_fixed_symbols(self):
+        self.fetcher.listed = None
+        self.assertEqual(self.universe.symbols_for_scan(0), list(self.config.SYMBOLS))
+
+class TierSlotTest(unittest.TestCase):
+    """Tarama dilimi sembol adından hesaplanmalı ve katmana eşit dağılmalı"""
+
+    def test_stable_and_in_range(self):
+        self.assertEqual(tier_slot('BTCUSDT', 4), tier_slot('BTCUSDT', 4))
+        self.assertEqual(tier_slot('BTCUSDT', 1), 0)
+        self.assertEqual(tier_slot('BTCUSDT', 0), 0)
+        for symbol in ('BTCUSDT', 'ETHUSDT', 'SOLUSDT'):
+            self.assertIn(tier_slot(symbol, 4), range(4))
+
+    def test_slots_are_balanced(self):
+        counts = [0] * 4
+        for i in range(4000):
+            counts[tier_slot(f"SYM{i}USDT", 4)] += 1
+        self.assertTrue(all(abs(count - 1000) < 120 for count in counts), counts)
+
+if __name__ == '__main__':
+    unittest.main()
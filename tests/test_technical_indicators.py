@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Teknik İndikatör Testleri
+"""
+import unittest
+from unittest import mock
+import pandas as pd
+
+from helpers import synthetic_frame
+from config import Config
+import technical_indicators
+from technical_indicators import INDICATOR_COLUMNS, TechnicalIndicators
+
+class EnsureTest(unittest.TestCase):
+    """ensure yalnızca eksik indikatörleri, bağımlılıklarından sonra hesaplamalı"""
+
+    def setUp(self):
+        self.indicators = TechnicalIndicators(Config())
+
+    def test_required_indicators_follow_registry_order(self):
+        self.assertEqual(self.indicators.required_indicators(['macd_signal', 'rsi', 'close', 'ema_short']),
+                         ['rsi', 'ema_short', 'macd'])
+        self.assertEqual(self.indicators.required_indicators(['open', 'volume']), [])
+
+    def test_dependencies_come_first(self):
+        # OBV'nin RSI ve ADX çıktısını okuduğunu varsay: ikisi de OBV'den önce hesaplanmalı
+        inputs = dict(technical_indicators.INDICATOR_INPUTS, obv=('close', 'rsi', 'atr'))
+        with mock.patch.object(technical_indicators, 'INDICATOR_INPUTS', inputs):
+            ordered = self.indicators.required_indicators(['obv', 'ema_long'])
+        self.assertEqual(sorted(ordered), ['adx', 'ema_long', 'obv', 'rsi'])
+        self.assertLess(ordered.index('rsi'), ordered.index('obv'))
+        self.assertLess(ordered.index('adx'), ordered.index('obv'))
+
+    def test_ensure_computes_in_dependency_order(self):
+        inputs = dict(technical_indicators.INDICATOR_INPUTS, obv=('close', 'rsi'))
+        calls = []
+        original = TechnicalIndicators._add_indicator
+
+        def record(indicators, df, name):
+            # Okunan indikatör sütunları hesaplanmış olmalı
+            for column in inputs[name]:
+                self.assertIn(column, df.columns)
+            calls.append(name)
+            return original(indicators, df, name)
+
+        with mock.patch.object(technical_indicators, 'INDICATOR_INPUTS', inputs), \
+                mock.patch.object(TechnicalIndicators, '_add_indicator', record):
+            self.indicators.ensure(synthetic_frame(bars=120), ['obv'])
+        self.assertEqual(calls, ['rsi', 'obv'])
+
+    def test_ensure_matches_add_all_indicators(self):
+        full = self.indicators.add_all_indicators(synthetic_frame(bars=300, seed=2))
+        for name, columns in INDICATOR_COLUMNS.items():
+            with self.subTest(indicator=name):
+                df = self.indicators.ensure(synthetic_frame(bars=300, seed=2), columns)
+                self.assertEqual(set(df.columns) - {'open', 'high', 'low', 'close', 'volume'}, set(columns))
+                pd.testing.assert_frame_equal(df[list(columns)], full[list(columns)])
+
+    def test_existing_columns_are_not_recomputed(self):
+        df = self.indicators.ensure(synthetic_frame(bars=120), ['rsi', 'ema_short'])
+        with mock.patch.object(TechnicalIndicators, '_add_indicator') as add_indicator:
+            self.indicators.ensure(df, ['rsi', 'ema_short'])
+        add_indicator.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Kripto Teknik Analiz Botu - Zaman Dilimi Dönüştürme Testleri
+"""
+import unittest
+import pandas as pd
+
+from helpers import synthetic_frame
+from config import Config
+from confluence import ConfluenceAnalyzer
+from timeframe_resampler import TimeframeResampler, can_derive, resample_ohlcv
+
+def hourly_frame(start, hours):
+    """Her mumun açılışı saat numarası, hacmi 1 olan 1h mum verileri"""
+    index = pd.date_range(start, periods=hours, freq='h')
+    values = pd.Series(range(hours), index=index, dtype=float)
+    return pd.DataFrame({'open': values, 'high': values + 0.5, 'low': values - 0.5,
+                         'close': values + 0.25, 'volume': 1.0}, index=index)
+
+class ResampleTest(unittest.TestCase):
+    """Birleştirme Binance mum sınırlarıyla birebir olmalı"""
+
+    def test_can_derive(self):
+        self.assertTrue(can_derive('4h', '1d'))
+        self.assertTrue(can_derive('1h', '1w'))
+        self.assertFalse(can_derive('1d', '4h'))
+        self.assertFalse(can_derive('4h', '6h'))
+        # Haftalık mumlar pazartesi başladığından 3d mumlar hafta sınırına oturmaz
+        self.assertFalse(can_derive('3d', '1w'))
+        self.assertFalse(can_derive('4h', '1M'))
+
+    def test_partial_first_bar_is_dropped(self):
+        df = hourly_frame('2024-01-01 02:00', 30)
+        daily = resample_ohlcv(df, '1h', '1d')
+        self.assertEqual(list(daily.index), [pd.Timestamp('2024-01-02')])
+        row = daily.iloc[0]
+        self.assertEqual(row['open'], 22.0)
+        self.assertEqual(row['high'], 29.5)
+        self.assertEqual(row['low'], 21.5)
+        self.assertEqual(row['close'], 29.25)
+        # Son (kapanmamış) mum o ana kadarki mumlardan oluşur
+        self.assertEqual(row['volume'], 8.0)
+        self.assertEqual(list(daily.columns), list(df.columns))
+
+    def test_aligned_data_keeps_first_bar(self):
+        daily = resample_ohlcv(hourly_frame('2024-01-01', 48), '1h', '1d')
+        self.assertEqual(list(daily['open']), [0.0, 24.0])
+        self.assertEqual(list(daily['volume']), [24.0, 24.0])
+
+    def test_weekly_bars_start_on_monday(self):
+        # 2024-01-03 çarşamba: ilk eksik hafta atılır, haftalar pazartesi başlar
+        weekly = resample_ohlcv(hourly_frame('2024-01-03', 24 * 14), '1h', '1w')
+        self.assertEqual(list(weekly.index), [pd.Timestamp('2024-01-08'), pd.Timestamp('2024-01-15')])
+        self.assertEqual(weekly['volume'].iloc[0], 24 * 7)
+        self.assertEqual(weekly['open'].iloc[0], 5 * 24)
+
+    def test_synthetic_4h_matches_pandas_resample(self):
+        df = synthetic_frame(bars=300, seed=3)
+        daily = resample_ohlcv(df, '4h', '1d')
+        expected = df.resample('1D').agg({'open': 'first', 'high': 'max', 'low': 'min',
+                                          'close': 'last', 'volume': 'sum'})
+        expected = expected[expected.index >= daily.index[0]]
+        pd.testing.assert_frame_equal(daily, expected, check_freq=False, check_names=False)
+
+class CountingFetcher:
+    """Çağrıları sayan sahte veri çekici"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_klines(self, symbol, timeframe, limit=500):
+        self.calls.append((symbol, timeframe, limit))
+        return synthetic_frame(bars=limit, seed=len(self.calls))
+
+class SingleFetchTest(unittest.TestCase):
+    """Uyum açıkken sembol başına temel veri bir kez, türetme derinliğinde çekilmeli"""
+
+    def setUp(self):
+        self.config = Config()
+        self.config.MULTI_TIMEFRAME = dict(self.config.MULTI_TIMEFRAME, enabled=True)
+        self.fetcher = CountingFetcher()
+        self.resampler = TimeframeResampler(self.config, self.fetcher)
+        self.confluence = ConfluenceAnalyzer(self.config)
+        self.resampler.require('4h', 200)
+        self.resampler.require('1d', self.confluence.min_history())
+
+    def test_base_and_derived_share_one_request(self):
+        for symbol in ('BTCUSDT', 'ETHUSDT'):
+            base = self.resampler.get_klines(symbol, '4h', 200)
+            daily = self.resampler.get_klines(symbol, '1d', self.confluence.min_history())
+            self.assertEqual(len(base), 200)
+            self.assertEqual(len(daily), self.confluence.min_history())
+        self.assertEqual(self.fetcher.calls, [('BTCUSDT', '4h', self.resampler.base_limit),
+                                              ('ETHUSDT', '4h', self.resampler.base_limit)])
+
+    def test_analysis_uses_tail_of_base_data(self):
+        base = self.resampler.get_klines('BTCUSDT', '4h', 200)
+        full = synthetic_frame(bars=self.resampler.base_limit, seed=1)
+        pd.testing.assert_frame_equal(base, full.tail(200))
+
+    def test_new_scan_refetches(self):
+        self.resampler.get_klines('BTCUSDT', '4h', 200)
+        self.resampler.start_scan()
+        self.resampler.get_klines('BTCUSDT', '4h', 200)
+        self.assertEqual(len(self.fetcher.calls), 2)
+
+    def test_only_requested_bars_without_derivation(self):
+        resampler = TimeframeResampler(self.config, self.fetcher)
+        resampler.require('4h', 200)
+        resampler.get_klines('BTCUSDT', '4h', 200)
+        self.assertEqual(self.fetcher.calls, [('BTCUSDT', '4h', 200)])
+
+if __name__ == '__main__':
+    unittest.main()